@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException
 from sqlalchemy.orm import Session, joinedload
 from db.session import get_db
 from models.user import User
@@ -16,6 +16,8 @@ from models.student_profile import StudentProfile, StudentResume
 from models.notification import Notification
 from models.credit import CreditRequest
 from utils.email import send_application_accepted_email
+from utils.settings import settings
+from services.catalog_publisher import catalog_payload, publish_internship
 from sqlalchemy import func
 from pydantic import BaseModel
 from datetime import datetime
@@ -464,6 +466,7 @@ def update_employer_profile(
 @router.post("/internships", response_model=InternshipOut)
 def create_internship(
         internship_in: InternshipCreate,
+        background_tasks: BackgroundTasks,
         current_user: User = Depends(require_verified_employer),
         db: Session = Depends(get_db)
 ):
@@ -493,6 +496,10 @@ def create_internship(
     db.commit()
     db.refresh(new_internship)
 
+    # Make the posting matchable right away (runs after the response)
+    if settings.AI_MATCHING_URL:
+        background_tasks.add_task(publish_internship, catalog_payload(new_internship))
+
     return new_internship
 
 
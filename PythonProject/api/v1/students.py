@@ -30,7 +30,9 @@ from models.notification import Notification
 from datetime import datetime
 from services.resume_parser_client import (
     ResumeParserServiceError,
+    get_parse_job,
     parse_resume_via_service,
+    submit_parse_job,
 )
 
 router = APIRouter()
@@ -86,6 +88,114 @@ def get_internship(
         
     return result
 
+def _save_resume_upload(user_id: int, filename: str, file_content: bytes) -> str:
+    """Write an uploaded resume PDF under secure_uploads/resumes; returns its path."""
+    upload_dir = "secure_uploads/resumes"
+    os.makedirs(upload_dir, exist_ok=True)
+    file_ext = os.path.splitext(filename)[1] or ".pdf"
+    saved_filename = f"{user_id}_{uuid.uuid4().hex}{file_ext}"
+    saved_path = os.path.join(upload_dir, saved_filename)
+    with open(saved_path, "wb") as f:
+        f.write(file_content)
+    return saved_path
+
+
+def _get_or_create_resume(db: Session, current_user: User):
+    """The student's (profile, resume) rows, created empty if missing."""
+    profile = db.query(StudentProfile).filter(
+        StudentProfile.user_id == current_user.id
+    ).first()
+    if not profile:
+        profile = StudentProfile(user_id=current_user.id)
+        db.add(profile)
+        db.flush()  # Get profile.id
+
+    resume = db.query(StudentResume).filter(
+        StudentResume.student_id == profile.id
+    ).first()
+    if not resume:
+        resume = StudentResume(student_id=profile.id)
+        db.add(resume)
+        db.flush()
+    return profile, resume
+
+
+def _apply_parsed_resume(
+    db: Session,
+    current_user: User,
+    parsed_data: dict,
+    *,
+    saved_path: str,
+    filename: str,
+    file_size: int,
+) -> None:
+    """
+    Store parsed resume fields on the student's profile and resume and commit.
+    Only empty fields are filled.  The upload becomes the current resume, so
+    any parse job still pending for an older one won't be applied.
+    """
+    profile, resume = _get_or_create_resume(db, current_user)
+
+    # Update profile with parsed basic fields (only if currently empty)
+    first_name = parsed_data.get("first_name", "")
+    last_name = parsed_data.get("last_name", "")
+    phone_number = parsed_data.get("phone_number", "")
+    parsed_skills = parsed_data.get("skills", [])
+
+    if first_name and not profile.first_name:
+        profile.first_name = first_name
+    if last_name and not profile.last_name:
+        profile.last_name = last_name
+    if phone_number and not getattr(current_user, "phone_number", None):
+        # Clean phone to digits only, last 10
+        clean_phone = ''.join(c for c in phone_number if c.isdigit())[-10:]
+        if clean_phone:
+            current_user.phone_number = clean_phone
+    if parsed_skills and not profile.skills:
+        profile.skills = ", ".join(parsed_skills) if isinstance(parsed_skills, list) else str(parsed_skills)
+
+    # Set full_name if not set
+    if (first_name or last_name) and not profile.full_name:
+        profile.full_name = f"{first_name} {last_name}".strip()
+
+    # Save parsed fields to resume (only if currently empty)
+    resume.resume_file_path = saved_path
+    resume.resume_filename = filename
+    resume.resume_file_size = file_size
+    resume.parse_job_id = None
+
+    # Save work experience
+    experience = parsed_data.get("experience", [])
+    if experience and not resume.work_experience:
+        resume.work_experience = json.dumps(experience)
+
+    # Save projects
+    projects = parsed_data.get("projects", [])
+    if projects and not resume.projects:
+        resume.projects = json.dumps(projects)
+
+    # Save certifications
+    certifications = parsed_data.get("certifications", [])
+    if certifications and not resume.certifications:
+        resume.certifications = json.dumps(certifications)
+
+    # Save education entries
+    education = parsed_data.get("education_entries", []) or parsed_data.get("education", [])
+    if education and not resume.education_entries:
+        resume.education_entries = json.dumps(education)
+
+    # Save skills categorized
+    if parsed_skills and not resume.skills_categorized:
+        skills_cat = {
+            "technical": [{"name": s, "level": 70} for s in parsed_skills],
+            "soft": [],
+            "languages": []
+        }
+        resume.skills_categorized = json.dumps(skills_cat)
+
+    db.commit()
+
+
 @router.post("/me/parse-resume")
 async def parse_my_resume(
     file: UploadFile = File(...),
@@ -120,91 +230,15 @@ async def parse_my_resume(
 
         # --- Persist parsed data to DB ---
         try:
-            parsed_data = result.get("data", {})
-
-            # 1. Save the uploaded PDF file
-            upload_dir = "secure_uploads/resumes"
-            os.makedirs(upload_dir, exist_ok=True)
-            file_ext = os.path.splitext(file.filename)[1] or ".pdf"
-            saved_filename = f"{current_user.id}_{uuid.uuid4().hex}{file_ext}"
-            saved_path = os.path.join(upload_dir, saved_filename)
-            with open(saved_path, "wb") as f:
-                f.write(file_content)
-
-            # 2. Get or create student profile
-            profile = db.query(StudentProfile).filter(
-                StudentProfile.user_id == current_user.id
-            ).first()
-            if not profile:
-                profile = StudentProfile(user_id=current_user.id)
-                db.add(profile)
-                db.flush()  # Get profile.id
-
-            # 3. Update profile with parsed basic fields (only if currently empty)
-            first_name = parsed_data.get("first_name", "")
-            last_name = parsed_data.get("last_name", "")
-            phone_number = parsed_data.get("phone_number", "")
-            parsed_skills = parsed_data.get("skills", [])
-
-            if first_name and not profile.first_name:
-                profile.first_name = first_name
-            if last_name and not profile.last_name:
-                profile.last_name = last_name
-            if phone_number and not getattr(current_user, "phone_number", None):
-                # Clean phone to digits only, last 10
-                clean_phone = ''.join(c for c in phone_number if c.isdigit())[-10:]
-                if clean_phone:
-                    current_user.phone_number = clean_phone
-            if parsed_skills and not profile.skills:
-                profile.skills = ", ".join(parsed_skills) if isinstance(parsed_skills, list) else str(parsed_skills)
-
-            # Set full_name if not set
-            if (first_name or last_name) and not profile.full_name:
-                profile.full_name = f"{first_name} {last_name}".strip()
-
-            # 4. Get or create student resume
-            resume = db.query(StudentResume).filter(
-                StudentResume.student_id == profile.id
-            ).first()
-            if not resume:
-                resume = StudentResume(student_id=profile.id)
-                db.add(resume)
-
-            # 5. Save parsed fields to resume (only if currently empty)
-            resume.resume_file_path = saved_path
-            resume.resume_filename = file.filename
-            resume.resume_file_size = len(file_content)
-
-            # Save work experience
-            experience = parsed_data.get("experience", [])
-            if experience and not resume.work_experience:
-                resume.work_experience = json.dumps(experience)
-
-            # Save projects
-            projects = parsed_data.get("projects", [])
-            if projects and not resume.projects:
-                resume.projects = json.dumps(projects)
-
-            # Save certifications
-            certifications = parsed_data.get("certifications", [])
-            if certifications and not resume.certifications:
-                resume.certifications = json.dumps(certifications)
-
-            # Save education entries
-            education = parsed_data.get("education_entries", []) or parsed_data.get("education", [])
-            if education and not resume.education_entries:
-                resume.education_entries = json.dumps(education)
-
-            # Save skills categorized
-            if parsed_skills and not resume.skills_categorized:
-                skills_cat = {
-                    "technical": [{"name": s, "level": 70} for s in parsed_skills],
-                    "soft": [],
-                    "languages": []
-                }
-                resume.skills_categorized = json.dumps(skills_cat)
-
-            db.commit()
+            saved_path = _save_resume_upload(current_user.id, file.filename, file_content)
+            _apply_parsed_resume(
+                db,
+                current_user,
+                result.get("data", {}),
+                saved_path=saved_path,
+                filename=file.filename,
+                file_size=len(file_content),
+            )
             print(f"Successfully saved parsed resume data for user {current_user.id}")
 
         except Exception as save_err:
@@ -227,6 +261,115 @@ async def parse_my_resume(
         raise HTTPException(status_code=500, detail="Failed to parse resume")
 
 
+@router.post("/me/parse-resume/jobs", status_code=202)
+async def submit_my_resume_parse(
+    file: UploadFile = File(...),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """
+    Queue a resume for parsing and return at once with a job id.
+
+    The file is saved now; the profile is filled in when the frontend polls
+    GET /me/parse-resume/jobs/{job_id} and the job is done.  Use this when
+    /me/parse-resume would come close to the parser timeout.
+    """
+    if current_user.role != "student":
+        raise HTTPException(status_code=403, detail="Only students can parse resumes")
+    if not file.filename or not file.filename.lower().endswith('.pdf'):
+        raise HTTPException(status_code=400, detail="Only PDF resumes are supported for parsing")
+
+    file_content = await file.read()
+    if not file_content:
+        raise HTTPException(status_code=400, detail="Uploaded file is empty")
+
+    saved_path = _save_resume_upload(current_user.id, file.filename, file_content)
+    # Handed back with the job, so the poll knows whose upload it was
+    client_ref = json.dumps({
+        "user_id": current_user.id,
+        "saved_path": saved_path,
+        "filename": file.filename,
+        "file_size": len(file_content),
+    })
+    try:
+        job_id = await submit_parse_job(
+            file_name=file.filename,
+            file_content=file_content,
+            content_type=file.content_type,
+            client_ref=client_ref,
+        )
+    except ResumeParserServiceError as e:
+        raise HTTPException(status_code=e.status_code, detail=e.message)
+
+    # The job the profile now waits for; a later upload or job replaces it
+    _, resume = _get_or_create_resume(db, current_user)
+    resume.parse_job_id = job_id
+    db.commit()
+    return {"job_id": job_id, "status": "queued"}
+
+
+@router.get("/me/parse-resume/jobs/{job_id}")
+async def get_my_resume_parse(
+    job_id: str,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """
+    Poll a queued resume parse.  While it runs: {"job_id", "status"}.  Once
+    done, the parsed data is returned in /me/parse-resume's shape, plus
+    job_id and status.  The first poll that sees it done also saves it like
+    /me/parse-resume does, unless a newer upload or job replaced it.
+    """
+    if current_user.role != "student":
+        raise HTTPException(status_code=403, detail="Only students can parse resumes")
+
+    try:
+        job = await get_parse_job(job_id, current_user)
+    except ResumeParserServiceError as e:
+        raise HTTPException(status_code=e.status_code, detail=e.message)
+
+    try:
+        upload = json.loads(job.get("client_ref") or "{}")
+    except ValueError:
+        upload = {}
+    if upload.get("user_id") != current_user.id:
+        raise HTTPException(status_code=404, detail="Parse job not found")
+
+    if job["status"] == "failed":
+        raise HTTPException(status_code=422, detail=job.get("error") or "Failed to parse resume")
+    if job["status"] != "done":
+        return {"job_id": job_id, "status": job["status"]}
+
+    result = job["result"]
+    try:
+        _, resume = _get_or_create_resume(db, current_user)
+        # Claim the job: only one poll gets rowcount 1, and only while this
+        # job is still the one the profile waits for
+        claimed = db.query(StudentResume).filter(
+            StudentResume.id == resume.id,
+            StudentResume.parse_job_id == job_id,
+        ).update({StudentResume.parse_job_id: None}, synchronize_session=False)
+        if claimed:
+            _apply_parsed_resume(
+                db,
+                current_user,
+                result.get("data", {}),
+                saved_path=upload["saved_path"],
+                filename=upload["filename"],
+                file_size=upload["file_size"],
+            )
+        else:
+            db.rollback()
+    except Exception as save_err:
+        print(f"Warning: Failed to save parsed data to DB: {save_err}")
+        try:
+            db.rollback()
+        except Exception:
+            pass
+
+    return {"job_id": job_id, "status": "done", **result}
+
+
 @router.get("/internships/metadata")
 def get_internship_metadata(
     db: Session = Depends(get_db)
@@ -164,7 +164,8 @@ def ensure_optional_columns():
         ("resume_file_path", "VARCHAR(500)"),
         ("resume_filename", "VARCHAR(255)"),
         ("resume_file_size", "INTEGER"),
-        ("resume_uploaded_at", "TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP")
+        ("resume_uploaded_at", "TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP"),
+        ("parse_job_id", "VARCHAR(64)")
     ]
     for name, sqltype in resume_cols:
         if not has_column("student_resumes", name):
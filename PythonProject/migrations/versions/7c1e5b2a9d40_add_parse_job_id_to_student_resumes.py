@@ -0,0 +1,29 @@
+"""add parse_job_id to student_resumes
+
+Revision ID: 7c1e5b2a9d40
+Revises: edc1164dfbad
+Create Date: 2026-10-19 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7c1e5b2a9d40'
+down_revision: Union[str, Sequence[str], None] = 'edc1164dfbad'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('student_resumes', sa.Column('parse_job_id', sa.String(length=64), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('student_resumes') as batch_op:
+        batch_op.drop_column('parse_job_id')
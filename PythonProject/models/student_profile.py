@@ -76,6 +76,8 @@ class StudentResume(Base):
     resume_filename = Column(String, nullable=True)
     resume_file_size = Column(Integer, nullable=True) # In bytes
     resume_uploaded_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    # Parse job (POST /me/parse-resume/jobs) whose result is still to be applied
+    parse_job_id = Column(String(64), nullable=True)
     
     # Additional fields used by frontend resume builder
     education_entries = Column(Text, nullable=True)  # JSON string
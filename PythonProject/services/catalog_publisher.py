@@ -0,0 +1,54 @@
+"""
+Catalog Publisher
+Pushes new internships to the live ai_matching catalog (PUT /internships/{id})
+"""
+import logging
+from typing import Any, Dict, List
+
+import httpx
+
+from utils.settings import settings
+
+logger = logging.getLogger(__name__)
+
+# Postings don't carry per-skill levels; 1 keeps level gating from
+# rejecting every student before the skill is even compared.
+DEFAULT_SKILL_LEVEL = 1
+DEFAULT_MIN_YEAR = 1
+
+
+def _node_urls() -> List[str]:
+    # Comma-separated so a sharded deployment can list every node;
+    # each node keeps only the internships its shard owns.
+    raw = settings.AI_MATCHING_URL or ""
+    return [u.strip().rstrip("/") for u in raw.split(",") if u.strip()]
+
+
+def catalog_payload(internship) -> Dict[str, Any]:
+    """ai_matching InternshipSchema body for a backend Internship row."""
+    skills = [s.strip() for s in (internship.skills or "").split(",") if s.strip()]
+    return {
+        "id": internship.id,
+        "required_skills": {s: DEFAULT_SKILL_LEVEL for s in skills},
+        "min_year": DEFAULT_MIN_YEAR,
+        "location": internship.location or "",
+        "is_remote": internship.mode == "remote",
+    }
+
+
+def _send(method: str, path: str, payload: Dict[str, Any] = None) -> None:
+    for base_url in _node_urls():
+        try:
+            response = httpx.request(
+                method, f"{base_url}{path}", json=payload,
+                timeout=settings.AI_MATCHING_TIMEOUT_SECONDS,
+            )
+            response.raise_for_status()
+        except httpx.HTTPError as e:
+            # Best effort: the posting is saved either way
+            logger.warning(f"Catalog publish {method} {path} to {base_url} failed: {e}")
+
+
+def publish_internship(payload: Dict[str, Any]) -> None:
+    """Upsert one internship on every configured ai_matching node."""
+    _send("PUT", f"/internships/{payload['id']}", payload)
@@ -0,0 +1,101 @@
+"""
+Encode Batcher
+Groups concurrent single-text embedding requests into batched model calls
+"""
+import asyncio
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Callable, List, Optional, Sequence
+
+
+class EncodeBatcher:
+    """
+    Micro-batching front end for ``SentenceTransformer.encode``.
+
+    Requests arriving within ``max_wait_ms`` of each other (up to
+    ``max_batch_size``) are encoded in one forward pass by a background
+    thread. Usable from threads (``encode``) and coroutines (``encode_async``).
+    """
+
+    def __init__(
+        self,
+        encode_batch: Callable[[List[str]], Sequence],
+        max_batch_size: int = 32,
+        max_wait_ms: float = 5.0,
+    ):
+        self._encode_batch = encode_batch
+        self.max_batch_size = max_batch_size
+        self.max_wait_ms = max_wait_ms
+        self._queue: "queue.Queue" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def submit(self, text: str) -> Future:
+        """
+        Queue a text for encoding
+
+        Args:
+            text: Input text
+
+        Returns:
+            Future resolving to the embedding vector
+        """
+        if self._thread is None or not self._thread.is_alive():
+            with self._lock:
+                if self._thread is None or not self._thread.is_alive():
+                    self._thread = threading.Thread(target=self._run, daemon=True)
+                    self._thread.start()
+        future: Future = Future()
+        self._queue.put((text, future))
+        return future
+
+    def encode(self, text: str):
+        """Blocking encode (threadpool / sync callers)"""
+        return self.submit(text).result()
+
+    async def encode_async(self, text: str):
+        """Awaitable encode (async callers)"""
+        return await asyncio.wrap_future(self.submit(text))
+
+    def _run(self):
+        last_batch_size = 0
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < self.max_batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            # Hold the window open only under concurrent load
+            if len(batch) > 1 or last_batch_size > 1:
+                deadline = time.monotonic() + self.max_wait_ms / 1000
+                while len(batch) < self.max_batch_size:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    try:
+                        batch.append(self._queue.get(timeout=remaining))
+                    except queue.Empty:
+                        break
+            last_batch_size = len(batch)
+
+            # Drop callers that gave up (cancelled encode_async); the rest
+            # can't be cancelled any more, so set_result below can't raise
+            batch = [(text, future) for text, future in batch if future.set_running_or_notify_cancel()]
+            if not batch:
+                continue
+
+            texts = list(dict.fromkeys(text for text, _ in batch))
+            try:
+                vectors = dict(zip(texts, self._encode_batch(texts)))
+                results = [vectors[text] for text, _ in batch]
+            except Exception as e:
+                for _, future in batch:
+                    future.set_exception(e)
+                continue
+
+            for (_, future), vector in zip(batch, results):
+                future.set_result(vector)
@@ -0,0 +1,73 @@
+"""
+Model Server Client
+Thin client for the shared local model server (ai_matching/app/model_server)
+"""
+import base64
+import logging
+import time
+from typing import List, Optional
+
+import httpx
+import numpy as np
+
+from utils.settings import settings
+
+logger = logging.getLogger(__name__)
+
+RETRY_AFTER_SECONDS = 30.0
+
+
+class ModelServerUnavailable(Exception):
+    """Raised when the model server cannot be reached or errors"""
+
+
+class ModelServerClient:
+    """
+    Calls POST /encode on the model server.
+
+    Configured via MODEL_SERVER_URL or MODEL_SERVER_SOCKET. After a failure
+    the server is skipped for RETRY_AFTER_SECONDS so callers fall back to
+    their in-process model without paying a timeout on every request.
+    """
+
+    def __init__(self, base_url: Optional[str] = None, socket_path: Optional[str] = None):
+        transport = httpx.HTTPTransport(uds=socket_path) if socket_path else None
+        self._http = httpx.Client(
+            base_url=base_url or "http://model-server",
+            transport=transport,
+            timeout=settings.MODEL_SERVER_TIMEOUT_SECONDS,
+        )
+        self._down_until = 0.0
+
+    @property
+    def available(self) -> bool:
+        return time.monotonic() >= self._down_until
+
+    def encode(self, model: str, texts: List[str], normalize: bool = False) -> np.ndarray:
+        """
+        Encode texts on the shared server
+
+        Returns:
+            float32 matrix, one row per text
+        """
+        try:
+            resp = self._http.post(
+                "/encode",
+                json={"model": model, "texts": texts, "normalize": normalize},
+            )
+            resp.raise_for_status()
+            payload = resp.json()["embeddings"]
+        except (httpx.HTTPError, KeyError, ValueError) as e:
+            self._down_until = time.monotonic() + RETRY_AFTER_SECONDS
+            logger.warning(f"Model server unavailable ({e}); using in-process model")
+            raise ModelServerUnavailable(str(e)) from e
+
+        raw = bytearray(base64.b64decode(payload["data"]))
+        return np.frombuffer(raw, dtype=payload["dtype"]).reshape(payload["shape"])
+
+
+def get_model_server_client() -> Optional[ModelServerClient]:
+    """Client for the configured model server, or None if not configured"""
+    if not settings.MODEL_SERVER_URL and not settings.MODEL_SERVER_SOCKET:
+        return None
+    return ModelServerClient(settings.MODEL_SERVER_URL, settings.MODEL_SERVER_SOCKET)
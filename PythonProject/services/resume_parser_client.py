@@ -8,6 +8,8 @@ This module keeps the backend decoupled from parser internals:
 
 from __future__ import annotations
 
+import hashlib
+import logging
 import re
 from typing import Any, Dict, List, Tuple
 
@@ -15,6 +17,8 @@ import httpx
 
 from utils.settings import settings
 
+logger = logging.getLogger(__name__)
+
 
 class ResumeParserServiceError(Exception):
     """Raised when parser service call fails or returns unusable payload."""
@@ -200,53 +204,34 @@ def _build_prefill_payload(parsed_data: Dict[str, Any], current_user: Any) -> Di
     }
 
 
-async def parse_resume_via_service(
-    *,
-    file_name: str,
-    file_content: bytes,
-    content_type: str | None,
-    current_user: Any,
-) -> Dict[str, Any]:
-    """
-    Call external parser service and normalize output for profile prefill.
-    """
+async def _lookup_cached_parse(
+    client: httpx.AsyncClient, service_url: str, digest: str, headers: Dict[str, str]
+) -> httpx.Response | None:
+    """Parser's cached result for this file hash, or None (miss or any error)."""
+    try:
+        response = await client.get(f"{service_url}/parse/cached/{digest}", headers=headers)
+    except httpx.HTTPError as exc:
+        logger.info(f"Parse cache lookup failed, uploading instead: {exc}")
+        return None
+    return response if response.status_code == 200 else None
+
+
+def _service_config() -> Tuple[str, float, Dict[str, str]]:
+    """(service URL, timeout, auth headers) from settings."""
     service_url = _safe_str(settings.PARSER_SERVICE_URL).rstrip("/")
     if not service_url:
         raise ResumeParserServiceError(
             "Resume parser service is not configured. Set PARSER_SERVICE_URL.",
             status_code=503,
         )
-
-    endpoint = f"{service_url}/parse"
-    timeout_seconds = float(settings.PARSER_SERVICE_TIMEOUT_SECONDS)
     headers: Dict[str, str] = {}
     if settings.PARSER_SERVICE_API_KEY:
         headers["X-API-Key"] = settings.PARSER_SERVICE_API_KEY
+    return service_url, float(settings.PARSER_SERVICE_TIMEOUT_SECONDS), headers
 
-    try:
-        async with httpx.AsyncClient(timeout=timeout_seconds) as client:
-            response = await client.post(
-                endpoint,
-                files={
-                    "file": (
-                        file_name,
-                        file_content,
-                        content_type or "application/pdf",
-                    )
-                },
-                headers=headers,
-            )
-    except httpx.TimeoutException as exc:
-        raise ResumeParserServiceError(
-            "Resume parser timed out. Please try again.",
-            status_code=504,
-        ) from exc
-    except httpx.RequestError as exc:
-        raise ResumeParserServiceError(
-            "Resume parser service is unreachable.",
-            status_code=503,
-        ) from exc
 
+def _read_payload(response: httpx.Response) -> Any:
+    """Response JSON; raises ResumeParserServiceError for error statuses."""
     try:
         payload = response.json()
     except ValueError as exc:
@@ -261,7 +246,11 @@ async def parse_resume_via_service(
         )
         status_code = response.status_code if response.status_code < 500 else 502
         raise ResumeParserServiceError(message, status_code=status_code)
+    return payload
+
 
+def _prefill_from_parse_response(payload: Any, current_user: Any) -> Dict[str, Any]:
+    """A parser ParseResponse (from /parse or a finished job) -> prefill result."""
     if isinstance(payload, dict) and payload.get("success") is False:
         message = _extract_service_error_message(payload, "Resume parser could not parse this file.")
         raise ResumeParserServiceError(message, status_code=422)
@@ -275,5 +264,126 @@ async def parse_resume_via_service(
 
     return {
         "success": True,
+        "cached": bool(payload.get("cached")),
         "data": _build_prefill_payload(parsed_data, current_user),
     }
+
+
+async def parse_resume_via_service(
+    *,
+    file_name: str,
+    file_content: bytes,
+    content_type: str | None,
+    current_user: Any,
+) -> Dict[str, Any]:
+    """
+    Call external parser service and normalize output for profile prefill.
+
+    The file's SHA-256 is looked up first; a re-uploaded resume the parser
+    has already seen is answered from its cache without sending the bytes.
+    """
+    service_url, timeout_seconds, headers = _service_config()
+    endpoint = f"{service_url}/parse"
+    digest = hashlib.sha256(file_content).hexdigest()
+
+    try:
+        async with httpx.AsyncClient(timeout=timeout_seconds) as client:
+            response = await _lookup_cached_parse(client, service_url, digest, headers)
+            if response is None:
+                response = await client.post(
+                    endpoint,
+                    files={
+                        "file": (
+                            file_name,
+                            file_content,
+                            content_type or "application/pdf",
+                        )
+                    },
+                    headers=headers,
+                )
+    except httpx.TimeoutException as exc:
+        raise ResumeParserServiceError(
+            "Resume parser timed out. Please try again.",
+            status_code=504,
+        ) from exc
+    except httpx.RequestError as exc:
+        raise ResumeParserServiceError(
+            "Resume parser service is unreachable.",
+            status_code=503,
+        ) from exc
+
+    return _prefill_from_parse_response(_read_payload(response), current_user)
+
+
+async def submit_parse_job(
+    *,
+    file_name: str,
+    file_content: bytes,
+    content_type: str | None,
+    client_ref: str | None = None,
+    callback_url: str | None = None,
+) -> str:
+    """
+    Queue the resume on the parser's job API and return the job id.
+
+    Only the upload is waited for, not the parse; poll get_parse_job.
+    """
+    service_url, timeout_seconds, headers = _service_config()
+    form = {key: value for key, value in (("client_ref", client_ref), ("callback_url", callback_url)) if value}
+
+    try:
+        async with httpx.AsyncClient(timeout=timeout_seconds) as client:
+            response = await client.post(
+                f"{service_url}/parse/jobs",
+                files={"file": (file_name, file_content, content_type or "application/pdf")},
+                data=form,
+                headers=headers,
+            )
+    except httpx.RequestError as exc:
+        raise ResumeParserServiceError(
+            "Resume parser service is unreachable.",
+            status_code=503,
+        ) from exc
+
+    payload = _read_payload(response)
+    job_id = payload.get("job_id") if isinstance(payload, dict) else None
+    if not job_id:
+        raise ResumeParserServiceError("Resume parser did not return a job id.", status_code=502)
+    return job_id
+
+
+async def get_parse_job(job_id: str, current_user: Any) -> Dict[str, Any]:
+    """
+    Status of a parse job: {"job_id", "status", "client_ref"}, plus the
+    parse_resume_via_service result under "result" once the job is done,
+    or "error" when it failed (including a parse that found no data).
+    """
+    service_url, timeout_seconds, headers = _service_config()
+
+    try:
+        async with httpx.AsyncClient(timeout=timeout_seconds) as client:
+            response = await client.get(f"{service_url}/parse/jobs/{job_id}", headers=headers)
+    except httpx.RequestError as exc:
+        raise ResumeParserServiceError(
+            "Resume parser service is unreachable.",
+            status_code=503,
+        ) from exc
+
+    payload = _read_payload(response)
+    if not isinstance(payload, dict) or "status" not in payload:
+        raise ResumeParserServiceError("Resume parser returned invalid response format.", status_code=502)
+
+    job: Dict[str, Any] = {
+        "job_id": job_id,
+        "status": payload["status"],
+        "client_ref": payload.get("client_ref"),
+    }
+    if payload["status"] == "failed":
+        job["error"] = _extract_service_error_message(payload, "Resume parser could not process this file.")
+    elif payload["status"] == "done":
+        try:
+            job["result"] = _prefill_from_parse_response(payload.get("result"), current_user)
+        except ResumeParserServiceError as exc:
+            job["status"] = "failed"
+            job["error"] = exc.message
+    return job
@@ -5,6 +5,9 @@ Generates skill embeddings using Sentence Transformers
 from typing import List, Optional
 import numpy as np
 
+from .encode_batcher import EncodeBatcher
+from .model_client import ModelServerUnavailable, get_model_server_client
+
 
 class Vectorizer:
     """Service for generating skill embeddings"""
@@ -14,6 +17,8 @@ class Vectorizer:
     
     def __init__(self):
         self._model = None
+        self._batcher = None
+        self._model_server = get_model_server_client()
     
     @property
     def model(self):
@@ -28,6 +33,22 @@ class Vectorizer:
                     "Install with: pip install sentence-transformers"
                 )
         return self._model
+
+    @property
+    def batcher(self) -> EncodeBatcher:
+        """Shared micro-batcher so concurrent requests encode together"""
+        if self._batcher is None:
+            self._batcher = EncodeBatcher(self._encode_batch)
+        return self._batcher
+
+    def _encode_batch(self, texts: List[str]):
+        """Encode on the shared model server if configured, else in-process"""
+        if self._model_server is not None and self._model_server.available:
+            try:
+                return self._model_server.encode(self.MODEL_NAME, texts)
+            except ModelServerUnavailable:
+                pass
+        return self.model.encode(texts)
     
     def generate_skill_vector(self, skills: List[str]) -> List[float]:
         """
@@ -46,7 +67,7 @@ class Vectorizer:
         skill_text = " ".join(skills)
         
         # Generate embedding
-        vector = self.model.encode(skill_text)
+        vector = self.batcher.encode(skill_text)
         
         return vector.tolist()
     
@@ -63,7 +84,7 @@ class Vectorizer:
         if not text or not text.strip():
             return [0.0] * self.VECTOR_DIM
         
-        vector = self.model.encode(text)
+        vector = self.batcher.encode(text)
         return vector.tolist()
     
     def compute_similarity(
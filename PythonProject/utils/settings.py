@@ -29,6 +29,15 @@ class Settings(BaseSettings):
     PARSER_SERVICE_TIMEOUT_SECONDS: int = 45
     PARSER_SERVICE_API_KEY: Optional[str] = None
 
+    # Shared local model server (ai_matching/app/model_server); unset = in-process
+    MODEL_SERVER_URL: Optional[str] = None
+    MODEL_SERVER_SOCKET: Optional[str] = None
+    MODEL_SERVER_TIMEOUT_SECONDS: int = 10
+
+    # ai_matching node(s) to publish internship changes to (comma-separated); unset = off
+    AI_MATCHING_URL: Optional[str] = None
+    AI_MATCHING_TIMEOUT_SECONDS: int = 5
+
     # Optional settings for future use
     REDIS_URL: Optional[str] = None
     AWS_S3_BUCKET: Optional[str] = None
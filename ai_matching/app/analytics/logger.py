@@ -1,4 +1,6 @@
 import json
+import threading
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
 
@@ -7,6 +9,9 @@ LOG_DIR.mkdir(exist_ok=True)
 
 MATCH_LOG_FILE = LOG_DIR / "match_decisions.jsonl"
 
+# Set while a batched_match_log() block is active on this thread
+_batch = threading.local()
+
 
 def log_match_decision(
     student_id: int,
@@ -28,5 +33,32 @@ def log_match_decision(
         "details": details
     }
 
+    line = json.dumps(record) + "\n"
+    buffer = getattr(_batch, "lines", None)
+    if buffer is not None:
+        buffer.append(line)
+        return
+
     with open(MATCH_LOG_FILE, "a", encoding="utf-8") as f:
-        f.write(json.dumps(record) + "\n")
+        f.write(line)
+
+
+@contextmanager
+def batched_match_log():
+    """
+    Buffer log_match_decision() calls on this thread and write them with
+    one append at the end (batch scoring logs thousands of decisions).
+    """
+    if getattr(_batch, "lines", None) is not None:
+        # Nested: the outer block flushes
+        yield
+        return
+
+    _batch.lines = []
+    try:
+        yield
+    finally:
+        lines, _batch.lines = _batch.lines, None
+        if lines:
+            with open(MATCH_LOG_FILE, "a", encoding="utf-8") as f:
+                f.write("".join(lines))
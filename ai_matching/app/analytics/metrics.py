@@ -3,6 +3,10 @@ from collections import Counter
 # In-memory counters (v1)
 rejection_reasons = Counter()
 matched_skills_counter = Counter()
+rerank_paths = Counter()
+rerank_budget = Counter()
+shadow_events = Counter()
+inference_events = Counter()
 
 
 def record_rejection(reasons):
@@ -15,8 +19,30 @@ def record_matched_skills(skills):
         matched_skills_counter[skill] += 1
 
 
+def record_rerank(path: str, budget_exceeded: bool):
+    rerank_paths[path] += 1
+    rerank_budget["exceeded" if budget_exceeded else "within"] += 1
+
+
+def record_shadow(event: str):
+    shadow_events[event] += 1
+
+
+def record_inference(event: str):
+    inference_events[event] += 1
+
+
 def get_metrics_snapshot():
+    total_reranks = sum(rerank_budget.values())
     return {
         "top_rejection_reasons": rejection_reasons.most_common(5),
-        "top_matched_skills": matched_skills_counter.most_common(5)
+        "top_matched_skills": matched_skills_counter.most_common(5),
+        "rerank_paths": dict(rerank_paths),
+        "rerank_budget_exceeded": rerank_budget["exceeded"],
+        "rerank_budget_exceeded_rate": (
+            round(rerank_budget["exceeded"] / total_reranks, 4)
+            if total_reranks else 0.0
+        ),
+        "shadow": dict(shadow_events),
+        "inference": dict(inference_events),
     }
@@ -0,0 +1,92 @@
+"""
+Response shaping for the match / recommendation endpoints.
+
+Two knobs, both opt-in so existing callers see no change:
+
+  fields=internship_id,final_score
+      keep only these keys of every returned item (the envelope --
+      student_id, count, rerank ... -- is always kept)
+
+  Accept: application/msgpack
+      msgpack body instead of JSON (falls back to JSON if msgpack
+      isn't installed)
+
+JSON is written with orjson when available.  Either way the body is built
+here and returned as a raw Response, skipping FastAPI's jsonable_encoder
+walk over the nested explanation dicts.  The time spent is reported in a
+``Server-Timing: serialize;dur=<ms>`` header.
+"""
+
+import json
+import time
+from typing import Any, Iterable, List, Optional
+
+from fastapi import Request, Response
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - exercised only without msgpack
+    msgpack = None
+
+MEDIA_JSON = "application/json"
+MEDIA_MSGPACK = "application/msgpack"
+_MSGPACK_TYPES = (MEDIA_MSGPACK, "application/x-msgpack")
+
+
+def parse_fields(fields: Optional[str]) -> Optional[List[str]]:
+    """'a, b,c' -> ['a', 'b', 'c']; None / blank -> None (all fields)."""
+    if not fields:
+        return None
+    names = [f.strip() for f in fields.split(",") if f.strip()]
+    return names or None
+
+
+def select_fields(items: Iterable[dict], fields: Optional[List[str]]) -> List[dict]:
+    """Project every item onto *fields* (missing keys are skipped)."""
+    if not fields:
+        return list(items)
+    return [{k: item[k] for k in fields if k in item} for item in items]
+
+
+def negotiate(accept: Optional[str]) -> str:
+    """Media type to answer with for an Accept header."""
+    if msgpack is not None and accept:
+        for part in accept.split(","):
+            if part.split(";")[0].strip().lower() in _MSGPACK_TYPES:
+                return MEDIA_MSGPACK
+    return MEDIA_JSON
+
+
+def _default(obj: Any):
+    # numpy scalars / arrays that slipped into a payload
+    if hasattr(obj, "tolist"):
+        return obj.tolist()
+    raise TypeError(f"Cannot serialize {type(obj).__name__}")
+
+
+def encode(payload: Any, media_type: str = MEDIA_JSON) -> bytes:
+    if media_type == MEDIA_MSGPACK:
+        return msgpack.packb(payload, default=_default, use_bin_type=True)
+    if orjson is not None:
+        return orjson.dumps(
+            payload, default=_default, option=orjson.OPT_SERIALIZE_NUMPY
+        )
+    return json.dumps(payload, default=_default, separators=(",", ":")).encode()
+
+
+def render(request: Request, payload: Any) -> Response:
+    """Encode *payload* for *request*'s Accept header."""
+    media_type = negotiate(request.headers.get("accept"))
+    start = time.perf_counter()
+    body = encode(payload, media_type)
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    return Response(
+        content=body,
+        media_type=media_type,
+        headers={"Server-Timing": f"serialize;dur={elapsed_ms:.3f}"},
+    )
@@ -1,10 +1,16 @@
-from fastapi import APIRouter
+from typing import Optional
+
+from fastapi import APIRouter, HTTPException, Request
+from app.api.encoding import parse_fields, render, select_fields
+from app.inference import inference
 from app.api.schemas import (
+    BatchMatchRequest,
     MatchRequest,
     RecommendRequest
 )
 from app.models.students import Student
 from app.models.internship import Internship
+from app.matching.batch import BatchTooLarge, UnknownPairId, score_pairs
 from app.matching.matcher import match_student_to_internship
 from app.matching.recommender import recommend_top_internships
 
@@ -12,29 +18,79 @@ router = APIRouter()
 
 
 @router.post("/match")
-def match_endpoint(request: MatchRequest):
+async def match_endpoint(
+    request: MatchRequest, http_request: Request, fields: Optional[str] = None,
+):
     student = Student(**request.student.dict())
     internship = Internship(**request.internship.dict())
 
-    result = match_student_to_internship(student, internship)
-    return result
+    result = await inference.run(match_student_to_internship, student, internship)
+    return render(http_request, select_fields([result], parse_fields(fields))[0])
+
+
+@router.post("/match/batch")
+async def match_batch_endpoint(
+    request: BatchMatchRequest, http_request: Request, fields: Optional[str] = None,
+):
+    """
+    Score many pairs in one call.
+
+    output=matrix: scores[i][j] for students[i] x internships[j]
+    (null when rejected or not requested).  output=pairs: one match
+    result per pair, trimmed with fields= if given.
+    """
+    students = [Student(**s.dict()) for s in request.students]
+    internships = [Internship(**i.dict()) for i in request.internships]
+
+    try:
+        results = await inference.run(
+            score_pairs, students, internships, request.pairs
+        )
+    except UnknownPairId as e:
+        raise HTTPException(status_code=400, detail=f"Unknown id in pairs: {e}")
+    except BatchTooLarge as e:
+        raise HTTPException(status_code=413, detail=str(e))
+
+    if request.output == "pairs":
+        items = [
+            {
+                "student_id": students[si].id,
+                "internship_id": internships[ii].id,
+                **result,
+            }
+            for (si, ii), result in results.items()
+        ]
+        return render(http_request, {
+            "count": len(items),
+            "pairs": select_fields(items, parse_fields(fields)),
+        })
+
+    scores = [[None] * len(internships) for _ in students]
+    for (si, ii), result in results.items():
+        if result["status"] == "MATCHED":
+            scores[si][ii] = result["final_score"]
+    return render(http_request, {
+        "student_ids": [s.id for s in students],
+        "internship_ids": [i.id for i in internships],
+        "scores": scores,
+    })
 
 
 @router.post("/recommend")
-def recommend_endpoint(request: RecommendRequest):
+async def recommend_endpoint(
+    request: RecommendRequest, http_request: Request, fields: Optional[str] = None,
+):
     student = Student(**request.student.dict())
     internships = [
         Internship(**internship.dict())
         for internship in request.internships
     ]
 
-    results = recommend_top_internships(
-        student=student,
-        internships=internships,
-        top_n=request.top_n
+    results = await inference.run(
+        recommend_top_internships, student, internships, request.top_n
     )
 
-    return {
+    return render(http_request, {
         "count": len(results),
-        "recommendations": results
-    }
+        "recommendations": select_fields(results, parse_fields(fields)),
+    })
@@ -1,5 +1,7 @@
-from typing import Dict, List
-from pydantic import BaseModel
+from typing import Dict, List, Literal, Optional, Tuple
+from pydantic import BaseModel, Field
+
+from app.matching.batch import MAX_BATCH_PAIRS
 
 
 class StudentSchema(BaseModel):
@@ -27,3 +29,12 @@ class RecommendRequest(BaseModel):
     student: StudentSchema
     internships: List[InternshipSchema]
     top_n: int = 5
+
+
+class BatchMatchRequest(BaseModel):
+    # Capped so an oversized request is rejected before it is scored
+    students: List[StudentSchema] = Field(max_length=MAX_BATCH_PAIRS)
+    internships: List[InternshipSchema] = Field(max_length=MAX_BATCH_PAIRS)
+    # (student_id, internship_id); omit to score every combination
+    pairs: Optional[List[Tuple[int, int]]] = Field(None, max_length=MAX_BATCH_PAIRS)
+    output: Literal["matrix", "pairs"] = "matrix"
@@ -0,0 +1,201 @@
+"""
+Live internship catalog with copy-on-write updates.
+
+The catalog starts from ``app/data/internships.json`` and is changed at
+runtime through upsert / delete (the backend publishes new postings via
+``PUT /internships/{id}``).  Every change builds a new CatalogSnapshot --
+internship list, id -> row map, normalised skills and the CSR skill
+matrix -- sharing everything it didn't touch with the previous one; only
+the changed matrix row is re-vectorised.  Requests grab ``current()`` once
+and keep a consistent view even if an update lands mid-request.
+
+Changes are appended to a JSONL journal (CATALOG_JOURNAL) before they are
+applied, and every worker tails that journal, so all gunicorn workers --
+and restarts -- converge on the same catalog in journal order.
+"""
+
+import json
+import os
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from app.data_loader import DATA_DIR
+from app.models.internship import Internship
+from app.sharding.partition import ShardConfig, internship_shard_key, shard_for_key
+from app.skills.taxonomy import SkillTaxonomy
+from app.skills.vectorizer import SkillMatrix, get_skill_space
+
+CATALOG_JOURNAL = Path(os.getenv(
+    "CATALOG_JOURNAL", DATA_DIR / "internship_updates.jsonl"
+))
+# How often a worker looks for journal entries written by its siblings
+CATALOG_CHECK_S = float(os.getenv("CATALOG_CHECK_S", "1"))
+
+OP_UPSERT = "upsert"
+OP_DELETE = "delete"
+
+
+@dataclass(frozen=True)
+class CatalogSnapshot:
+    version: int
+    internships: Tuple[Internship, ...]
+    positions: Dict[int, int]              # internship id -> row
+    skills: Tuple[Dict[str, int], ...]     # normalised required_skills per row
+    skill_matrix: SkillMatrix
+
+    def __len__(self) -> int:
+        return len(self.internships)
+
+    def get(self, internship_id: int) -> Optional[Internship]:
+        pos = self.positions.get(internship_id)
+        return None if pos is None else self.internships[pos]
+
+
+def build_snapshot(internships: List[Internship], version: int = 0) -> CatalogSnapshot:
+    taxonomy = SkillTaxonomy()
+    skills = tuple(taxonomy.normalize_skills(i.required_skills) for i in internships)
+    return CatalogSnapshot(
+        version=version,
+        internships=tuple(internships),
+        positions={i.id: row for row, i in enumerate(internships)},
+        skills=skills,
+        skill_matrix=get_skill_space().matrix(list(skills)),
+    )
+
+
+def _splice(
+    snap: CatalogSnapshot, start: int, stop: int, new: List[Internship],
+) -> CatalogSnapshot:
+    """*snap* with rows [start, stop) replaced by *new* (which may be empty)."""
+    new_skills = tuple(SkillTaxonomy().normalize_skills(i.required_skills) for i in new)
+    internships = snap.internships[:start] + tuple(new) + snap.internships[stop:]
+    if stop - start == len(new):
+        # Same row count: only the replaced ids change position
+        positions = dict(snap.positions)
+        for row, i in enumerate(new, start):
+            positions[i.id] = row
+    else:
+        positions = {i.id: row for row, i in enumerate(internships)}
+    return CatalogSnapshot(
+        version=snap.version + 1,
+        internships=internships,
+        positions=positions,
+        skills=snap.skills[:start] + new_skills + snap.skills[stop:],
+        skill_matrix=snap.skill_matrix.space.splice(
+            snap.skill_matrix, start, stop, list(new_skills)
+        ),
+    )
+
+
+def _to_record(internship: Internship) -> dict:
+    return {
+        "id": internship.id,
+        "required_skills": internship.required_skills,
+        "min_year": internship.min_year,
+        "location": internship.location,
+        "is_remote": internship.is_remote,
+    }
+
+
+class Catalog:
+    """Holder of the current CatalogSnapshot; writers swap it atomically."""
+
+    def __init__(
+        self,
+        internships: List[Internship],
+        shard_config: Optional[ShardConfig] = None,
+        journal: Optional[Path] = None,
+    ) -> None:
+        self.shard_config = shard_config or ShardConfig()
+        self.journal = Path(journal or CATALOG_JOURNAL)
+        self._write_lock = threading.Lock()
+        self._journal_offset = 0
+        self._next_check = 0.0
+        self._snapshot = build_snapshot(
+            [i for i in internships if self.owns(i)]
+        )
+        self.refresh(force=True)
+
+    # ---------- readers ----------
+
+    def current(self) -> CatalogSnapshot:
+        """Latest snapshot (picks up sibling-worker changes and taxonomy reloads)."""
+        self.refresh()
+        snap = self._snapshot
+        if snap.skill_matrix.space is not get_skill_space():
+            with self._write_lock:
+                snap = self._snapshot
+                if snap.skill_matrix.space is not get_skill_space():
+                    snap = build_snapshot(list(snap.internships), snap.version + 1)
+                    self._snapshot = snap
+        return snap
+
+    def owns(self, internship: Internship) -> bool:
+        config = self.shard_config
+        if not config.enabled:
+            return True
+        key = internship_shard_key(internship, config.strategy)
+        return shard_for_key(key, config.count) == config.index
+
+    # ---------- writers ----------
+
+    def upsert(self, internship: Internship) -> CatalogSnapshot:
+        return self._publish({"op": OP_UPSERT, "internship": _to_record(internship)})
+
+    def delete(self, internship_id: int) -> CatalogSnapshot:
+        return self._publish({"op": OP_DELETE, "id": internship_id})
+
+    def _publish(self, entry: dict) -> CatalogSnapshot:
+        # Journal first, then apply everything up to and including our
+        # line, so every worker applies changes in the same order.
+        line = json.dumps(entry, separators=(",", ":")) + "\n"
+        self.journal.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.journal, "a", encoding="utf-8") as f:
+            f.write(line)
+        self.refresh(force=True)
+        return self._snapshot
+
+    def refresh(self, force: bool = False) -> None:
+        """Apply journal entries appended since the last check."""
+        now = time.monotonic()
+        if not force and now < self._next_check:
+            return
+        self._next_check = now + CATALOG_CHECK_S
+        try:
+            if self.journal.stat().st_size <= self._journal_offset:
+                return
+        except FileNotFoundError:
+            return
+
+        with self._write_lock:
+            with open(self.journal, "rb") as f:
+                f.seek(self._journal_offset)
+                chunk = f.read()
+            # Leave a partially written last line for the next pass
+            end = chunk.rfind(b"\n") + 1
+            snap = self._snapshot
+            for raw in chunk[:end].splitlines():
+                if raw.strip():
+                    snap = self._apply(snap, json.loads(raw))
+            self._journal_offset += end
+            self._snapshot = snap
+
+    def _apply(self, snap: CatalogSnapshot, entry: dict) -> CatalogSnapshot:
+        if entry["op"] == OP_DELETE:
+            internship_id, internship = entry["id"], None
+        else:
+            internship = Internship(**entry["internship"])
+            internship_id = internship.id
+            if not self.owns(internship):
+                # Moved to another shard (or never ours): drop any local copy
+                internship = None
+
+        pos = snap.positions.get(internship_id)
+        if internship is None:
+            return snap if pos is None else _splice(snap, pos, pos + 1, [])
+        if pos is None:
+            return _splice(snap, len(snap), len(snap), [internship])
+        return _splice(snap, pos, pos + 1, [internship])
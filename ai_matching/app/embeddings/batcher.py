@@ -0,0 +1,151 @@
+"""
+Dynamic micro-batching for sentence-transformer encode calls.
+
+Concurrent requests each want one embedding.  Running them one by one means
+many batch-of-one forward passes; instead callers drop their text into a
+queue and a single worker thread collects whatever arrives within a short
+window (or until the batch is full), runs ONE batched ``encode`` call, and
+hands each caller its own row.  The window is only held open while traffic
+is concurrent, so a single sequential caller sees no added latency.
+
+Works for both threaded callers (``encode``) and async callers
+(``encode_async``) -- the latter awaits the same future without blocking
+the event loop.
+"""
+
+import asyncio
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Callable, List, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_BATCH_SIZE = 32
+DEFAULT_MAX_WAIT_MS = 5.0
+
+
+class EncodeBatcher:
+    """
+    Collects single-text encode requests into batched forward passes.
+
+    Args:
+        encode_batch: function mapping a list of texts to a sequence of
+            vectors (e.g. ``lambda t: model.encode(t)``).
+        max_batch_size: flush as soon as this many requests are queued.
+        max_wait_ms: flush at most this long after the first request.
+    """
+
+    def __init__(
+        self,
+        encode_batch: Callable[[List[str]], Sequence],
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        max_wait_ms: float = DEFAULT_MAX_WAIT_MS,
+    ) -> None:
+        self._encode_batch = encode_batch
+        self.max_batch_size = max_batch_size
+        self.max_wait_ms = max_wait_ms
+
+        self._queue: "queue.Queue" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+
+        self._last_batch_size = 0
+        self.batches_run = 0
+        self.items_encoded = 0
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def submit(self, text: str) -> Future:
+        """Queue *text* and return a Future resolving to its vector."""
+        self._ensure_worker()
+        future: Future = Future()
+        self._queue.put((text, future))
+        return future
+
+    def encode(self, text: str, timeout: Optional[float] = None):
+        """Blocking encode for threaded callers."""
+        return self.submit(text).result(timeout=timeout)
+
+    async def encode_async(self, text: str):
+        """Non-blocking encode for coroutines."""
+        return await asyncio.wrap_future(self.submit(text))
+
+    # ------------------------------------------------------------------
+    # Worker
+    # ------------------------------------------------------------------
+
+    def _ensure_worker(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._start_lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run, name="encode-batcher", daemon=True
+                )
+                self._thread.start()
+
+    def _collect(self) -> list:
+        batch = [self._queue.get()]
+
+        # Take whatever is already waiting without blocking.
+        while len(batch) < self.max_batch_size:
+            try:
+                batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+
+        # Only hold the window open when traffic is actually concurrent;
+        # a lone caller shouldn't pay max_wait_ms on every request.
+        if len(batch) == 1 and self._last_batch_size <= 1:
+            return batch
+
+        deadline = time.monotonic() + self.max_wait_ms / 1000
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+
+    def _run(self) -> None:
+        while True:
+            try:
+                self._run_batch(self._collect())
+            except Exception:
+                # Never let one bad batch end the worker: every later
+                # caller would wait on a future nobody resolves.
+                logger.exception("Encode batch failed")
+
+    def _run_batch(self, batch: list) -> None:
+        self._last_batch_size = len(batch)
+
+        # Callers that gave up (e.g. a cancelled encode_async) are dropped
+        # here; the rest can no longer be cancelled, so set_result is safe.
+        batch = [(text, future) for text, future in batch if future.set_running_or_notify_cancel()]
+        if not batch:
+            return
+
+        # Identical texts in one window share a single row.
+        unique: List[str] = list(dict.fromkeys(text for text, _ in batch))
+        try:
+            vectors = self._encode_batch(unique)
+            by_text = dict(zip(unique, vectors))
+            results = [by_text[text] for text, _ in batch]
+        except Exception as exc:
+            for _, future in batch:
+                future.set_exception(exc)
+            return
+
+        for (_, future), vector in zip(batch, results):
+            future.set_result(vector)
+
+        self.batches_run += 1
+        self.items_encoded += len(batch)
@@ -1,20 +1,32 @@
-from sentence_transformers import SentenceTransformer, util
+from functools import lru_cache
+
 import numpy as np
 
+from app.embeddings.batcher import EncodeBatcher
+from app.model_server.client import SharedSentenceEncoder
+
 class EmbeddingModel:
     def __init__(self):
         # 🔥 Better than basic SBERT
-        self.model = SentenceTransformer("all-mpnet-base-v2")
+        # Served by the shared model server when MODEL_SERVER_URL is set
+        self.model = SharedSentenceEncoder("all-mpnet-base-v2", normalize=True)
+        # Concurrent requests share batched forward passes
+        self.batcher = EncodeBatcher(self.model.encode)
+        # Internship skill sets repeat on every request -- encode them once
+        self._encode_text = lru_cache(maxsize=4096)(self.batcher.encode)
 
     def encode_skills(self, skills: list[str]) -> np.ndarray:
         """
         Convert list of skills into a single embedding
         """
         text = " ".join(skills)
-        return self.model.encode(text, normalize_embeddings=True)
+        return self._encode_text(text)
 
     def similarity(self, emb1: np.ndarray, emb2: np.ndarray) -> float:
         """
         Cosine similarity between two embeddings (0–1)
         """
-        return float(util.cos_sim(emb1, emb2))
+        denom = np.linalg.norm(emb1) * np.linalg.norm(emb2)
+        if denom == 0:
+            return 0.0
+        return float(np.dot(emb1, emb2) / denom)
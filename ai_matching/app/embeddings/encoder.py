@@ -1,6 +1,8 @@
-from sentence_transformers import SentenceTransformer
 from typing import List
 
+from app.embeddings.batcher import EncodeBatcher
+from app.model_server.client import SharedSentenceEncoder
+
 
 class SkillTextEncoder:
     """
@@ -9,7 +11,8 @@ class SkillTextEncoder:
     """
 
     def __init__(self):
-        self.model = SentenceTransformer("all-MiniLM-L6-v2")
+        self.model = SharedSentenceEncoder("all-MiniLM-L6-v2")
+        self.batcher = EncodeBatcher(self.model.encode)
 
     @staticmethod
     def skills_to_text(skills: List[str]) -> str:
@@ -22,4 +25,4 @@ class SkillTextEncoder:
         """
         Generate embedding for given text.
         """
-        return self.model.encode(text)
+        return self.batcher.encode(text)
@@ -2,6 +2,8 @@ from collections import defaultdict
 from datetime import datetime
 from typing import List, Tuple
 
+from app.feedback.trending import trending
+
 # feedback_events[(student_id, internship_id)] = [(score, timestamp), ...]
 feedback_events = defaultdict(list)
 
@@ -20,6 +22,7 @@ def record_feedback(student_id: int, internship_id: int, action: str):
     score = ACTION_WEIGHTS[action]
     timestamp = datetime.utcnow()
     feedback_events[(student_id, internship_id)].append((score, timestamp))
+    trending.record(internship_id, score)
 
 
 def get_feedback_events(student_id: int, internship_id: int) -> List[Tuple[int, datetime]]:
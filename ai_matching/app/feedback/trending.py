@@ -0,0 +1,80 @@
+"""
+Decayed popularity ("trending") score per internship.
+
+Each feedback event adds its action weight to the internship's counter, and
+every counter halves every TRENDING_HALF_LIFE_HOURS.  Instead of decaying
+all counters on a timer, weights are stored pre-scaled against a fixed
+landmark time:
+
+    stored  += weight * 2 ** ((t_event - landmark) / half_life)
+    current  = stored  * 2 ** ((landmark - now) / half_life)
+
+so an update or a lookup is O(1), and scoring the whole catalog is one
+array multiply by a single scalar.  The landmark is moved forward (all
+counters rescaled once) before the scale factor could overflow.
+"""
+
+import heapq
+import math
+import os
+import threading
+import time
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+TRENDING_HALF_LIFE_HOURS = float(os.getenv("TRENDING_HALF_LIFE_HOURS", "24"))
+# Rebase once the pre-scale factor reaches 2**_REBASE_HALF_LIVES
+_REBASE_HALF_LIVES = 512
+
+
+class TrendingCounter:
+    def __init__(self, half_life_s: float = TRENDING_HALF_LIFE_HOURS * 3600) -> None:
+        self.half_life_s = half_life_s
+        self._landmark = time.time()
+        self._scores: Dict[int, float] = {}
+        self._lock = threading.Lock()
+
+    def _halvings(self, t: float) -> float:
+        return (t - self._landmark) / self.half_life_s
+
+    def record(self, internship_id: int, weight: float, t: Optional[float] = None) -> None:
+        t = time.time() if t is None else t
+        with self._lock:
+            if self._halvings(t) > _REBASE_HALF_LIVES:
+                self._rebase(t)
+            scaled = weight * math.pow(2.0, self._halvings(t))
+            self._scores[internship_id] = self._scores.get(internship_id, 0.0) + scaled
+
+    def _rebase(self, t: float) -> None:
+        factor = math.pow(2.0, -self._halvings(t))
+        self._scores = {k: v * factor for k, v in self._scores.items()}
+        self._landmark = t
+
+    def _decay(self, now: Optional[float]) -> float:
+        now = time.time() if now is None else now
+        return math.pow(2.0, -self._halvings(now))
+
+    def score(self, internship_id: int, now: Optional[float] = None) -> float:
+        """Current decayed score of one internship (0 if never seen)."""
+        return self._scores.get(internship_id, 0.0) * self._decay(now)
+
+    def scores(self, internship_ids: Iterable[int], now: Optional[float] = None) -> np.ndarray:
+        """Current scores for many internships, in the given order."""
+        get = self._scores.get
+        raw = np.fromiter((get(i, 0.0) for i in internship_ids), dtype=np.float64)
+        return raw * self._decay(now)
+
+    def top(self, n: int, now: Optional[float] = None) -> List[Tuple[int, float]]:
+        """The *n* highest-scoring internships seen so far."""
+        decay = self._decay(now)
+        items = heapq.nlargest(n, self._scores.items(), key=lambda kv: kv[1])
+        return [(k, v * decay) for k, v in items]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._scores.clear()
+            self._landmark = time.time()
+
+
+trending = TrendingCounter()
@@ -0,0 +1,103 @@
+"""
+Dedicated, bounded executor for matching / model work.
+
+Handlers are ``async def`` and hand their CPU- and model-bound part to
+``inference.run(...)`` instead of running on FastAPI's shared threadpool,
+so a burst of /recommend/hybrid calls can't starve health checks or other
+cheap endpoints.
+
+  - at most INFERENCE_WORKERS jobs run at once, INFERENCE_QUEUE_SIZE more
+    may wait; past that ``InferenceOverloaded`` is raised and the app
+    answers 503 with Retry-After instead of queueing without bound
+  - calls with the same ``key`` that overlap share one computation
+    (singleflight): a student refreshing twice costs one match pass
+"""
+
+import asyncio
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Hashable, Optional
+
+from app.analytics.metrics import record_inference
+
+INFERENCE_WORKERS = int(os.getenv("INFERENCE_WORKERS", "4"))
+INFERENCE_QUEUE_SIZE = int(os.getenv("INFERENCE_QUEUE_SIZE", "16"))
+INFERENCE_RETRY_AFTER_S = int(os.getenv("INFERENCE_RETRY_AFTER_S", "2"))
+
+
+class InferenceOverloaded(Exception):
+    def __init__(self, retry_after: int = INFERENCE_RETRY_AFTER_S) -> None:
+        super().__init__("Inference queue is full")
+        self.retry_after = retry_after
+
+
+class InferenceExecutor:
+    def __init__(
+        self,
+        max_workers: int = INFERENCE_WORKERS,
+        max_queue: int = INFERENCE_QUEUE_SIZE,
+        retry_after: int = INFERENCE_RETRY_AFTER_S,
+    ) -> None:
+        self._pool = ThreadPoolExecutor(max_workers, thread_name_prefix="inference")
+        self.max_workers = max_workers
+        self._limit = max_workers + max_queue
+        self.retry_after = retry_after
+        self._pending = 0
+        self._lock = threading.Lock()
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+
+    @property
+    def pending(self) -> int:
+        """Jobs running or waiting."""
+        return self._pending
+
+    @property
+    def queued(self) -> int:
+        """Jobs waiting for a worker (the backlog; running jobs excluded)."""
+        return max(0, self._pending - self.max_workers)
+
+    async def run(self, fn: Callable[..., Any], *args, key: Optional[Hashable] = None):
+        """
+        Run ``fn(*args)`` on the executor and await the result.
+
+        With a *key*, a call that overlaps an in-flight one for the same
+        key awaits that one instead of starting its own.
+        """
+        if key is not None:
+            shared = self._inflight.get(key)
+            if shared is not None:
+                record_inference("coalesced")
+                return await asyncio.shield(shared)
+
+        with self._lock:
+            if self._pending >= self._limit:
+                record_inference("rejected")
+                raise InferenceOverloaded(self.retry_after)
+            self._pending += 1
+
+        loop = asyncio.get_running_loop()
+        try:
+            future = loop.run_in_executor(self._pool, fn, *args)
+        except BaseException:
+            self._release(None)
+            raise
+        future.add_done_callback(self._release)
+        record_inference("executed")
+
+        if key is not None:
+            self._inflight[key] = future
+            future.add_done_callback(lambda f: self._forget(key, f))
+        # Shielded: a caller that disconnects doesn't cancel the shared job
+        return await asyncio.shield(future)
+
+    def _release(self, _future) -> None:
+        with self._lock:
+            self._pending -= 1
+
+    def _forget(self, key: Hashable, future: asyncio.Future) -> None:
+        if self._inflight.get(key) is future:
+            del self._inflight[key]
+
+
+inference = InferenceExecutor()
@@ -1,12 +1,28 @@
-from fastapi import FastAPI, HTTPException
+from typing import Optional
+
+import numpy as np
+
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.responses import JSONResponse
+from app.api.encoding import parse_fields, render, select_fields
 from app.api.routes import router
 from app.matching.reranker import ReRanker
 from app.feedback.feedback_engine import compute_feedback_boost
+from app.feedback.trending import trending
+from app.matching.rerank_budget import RERANK_DEFAULT_BUDGET_MS
+from app.analytics.metrics import record_rerank, get_metrics_snapshot
 
 reranker = ReRanker()
 
+from app.api.schemas import InternshipSchema
+from app.catalog import Catalog
+from app.inference import InferenceOverloaded, inference
 from app.data_loader import load_students, load_internships
+from app.models.internship import Internship
+from app.sharding.partition import ShardConfig
 from app.matching.matcher import match_student_to_internship
+from app.skills.skill_graph import get_skill_graph, reload_skill_graph
+from app.skills.taxonomy import SkillTaxonomy
 app = FastAPI(
     title="AI Matching Module (Phase-1)",
     description="Student ↔ Internship Matching API",
@@ -16,54 +32,100 @@ app = FastAPI(
 app.include_router(router)
 
 
+@app.exception_handler(InferenceOverloaded)
+async def inference_overloaded(request: Request, exc: InferenceOverloaded):
+    return JSONResponse(
+        status_code=503,
+        content={"detail": "Matching is overloaded, retry shortly"},
+        headers={"Retry-After": str(exc.retry_after)},
+    )
+
+
 @app.get("/")
-def root():
+async def root():
     return {"status": "AI Matching API is running"}
 
+shard_config = ShardConfig.from_env()
 students_db = load_students()
-internships_db = load_internships()
+# Internships (this shard's) + their skill matrix, updated live via
+# PUT/DELETE /internships; /recommend scores against it in one product
+catalog = Catalog(load_internships(), shard_config)
 
 print(f"Loaded {len(students_db)} students")
-print(f"Loaded {len(internships_db)} internships")
-
-@app.get("/recommend")
-def recommend_internships(student_id: int, top_n: int = 5):
-    if student_id not in students_db:
-        raise HTTPException(status_code=404, detail="Student not found")
-
-    student = students_db[student_id]
+print(f"Loaded {len(catalog.current())} internships")
+if shard_config.enabled:
+    print(
+        f"Serving shard {shard_config.index}/{shard_config.count} "
+        f"(by {shard_config.strategy})"
+    )
 
+def _rule_recommendations(student, top_n: int) -> list:
     results = []
 
-    for internship in internships_db:
-        result = match_student_to_internship(student, internship)
+    student_skills = SkillTaxonomy().normalize_skills(student.skills)
+    snapshot = catalog.current()
+    skill_matrix = snapshot.skill_matrix
+    similarities = skill_matrix.space.similarities(student_skills, skill_matrix)
+    trend = trending.scores(i.id for i in snapshot.internships)
+
+    for internship, similarity, trend_score in zip(
+        snapshot.internships, similarities, trend
+    ):
+        result = match_student_to_internship(
+            student, internship, similarity=float(similarity)
+        )
 
         if result["status"] == "MATCHED":
             results.append({
                 "internship_id": internship.id,
                 "score": result["final_score"],
-                "explanation": result["explanation"]
+                "explanation": result["explanation"],
+                "_trend": trend_score,
             })
 
-    results.sort(key=lambda x: x["score"], reverse=True)
+    # Equal scores: currently popular internships first
+    results.sort(key=lambda x: (x["score"], x["_trend"]), reverse=True)
+    top = results[:top_n]
+    for r in top:
+        del r["_trend"]
+    return top
 
-    return {
+
+@app.get("/recommend")
+async def recommend_internships(
+    request: Request, student_id: int, top_n: int = 5, fields: Optional[str] = None,
+):
+    if student_id not in students_db:
+        raise HTTPException(status_code=404, detail="Student not found")
+
+    recommendations = await inference.run(
+        _rule_recommendations, students_db[student_id], top_n,
+        key=("recommend", student_id, top_n),
+    )
+    return render(request, {
         "student_id": student_id,
-        "recommendations": results[:top_n]
-    }
+        "recommendations": select_fields(recommendations, parse_fields(fields)),
+    })
 from app.matching.hybrid_matcher import HybridMatcher
+from app.matching.shadow import get_shadow_scorer
 
 matcher = HybridMatcher()
-@app.get("/recommend/hybrid")
-def recommend_hybrid(student_id: int, top_n: int = 5):
-    if student_id not in students_db:
-        return {"error": "Student not found"}
+shadow_scorer = get_shadow_scorer()
 
-    student = students_db[student_id]
+
+def _hybrid_recommendations(student, top_n: int, budget_ms: float):
+    """
+    Returns (final results, rerank info).
+
+    Runs once per coalesced computation, so the shadow job is queued here
+    rather than by each caller that shares the result.
+    """
     results = []
+    internships = catalog.current().internships
+    trend = trending.scores(i.id for i in internships)
 
     # --------- 1. HYBRID MATCHING + FEEDBACK DECAY ----------
-    for internship in internships_db:
+    for internship, trend_score in zip(internships, trend):
         match_result = matcher.match(student, internship)
 
         if match_result["status"] == "MATCHED":
@@ -82,15 +144,22 @@ def recommend_hybrid(student_id: int, top_n: int = 5):
                 "final_score": final_score,
                 "base_score": match_result["final_score"],
                 "feedback_boost": feedback_boost,
+                "trending_score": float(trend_score),
                 "explanation": match_result["explanation"]
             })
 
-    # sort by hybrid + feedback score
-    results.sort(key=lambda x: x["final_score"], reverse=True)
+    # sort by hybrid + feedback score, trending breaks ties
+    results.sort(key=lambda x: (x["final_score"], x["trending_score"]), reverse=True)
+
+    # --------- 2. CROSS-ENCODER RE-RANKING (ADAPTIVE DEPTH) ----------
+    reranked, rerank_info = reranker.rerank_within_budget(
+        student, results, top_n=top_n, budget_ms=budget_ms,
+        queue_depth=inference.queued,
+    )
+    record_rerank(rerank_info["path"], rerank_info["budget_exceeded"])
 
-    # --------- 2. CROSS-ENCODER RE-RANKING (TOP 10 ONLY) ----------
-    top_candidates = results[:10]
-    reranked = reranker.rerank(student, top_candidates)
+    # Re-score under candidate configs off the request path
+    shadow_scorer.submit_hybrid(student, results, top_n)
 
     # --------- 3. CLEAN FINAL RESPONSE ----------
     final_results = [
@@ -99,15 +168,110 @@ def recommend_hybrid(student_id: int, top_n: int = 5):
             "final_score": r["final_score"],
             "base_score": r["base_score"],
             "feedback_boost": r["feedback_boost"],
-            "cross_encoder_score": r["cross_encoder_score"],
+            "cross_encoder_score": r.get("cross_encoder_score"),
+            "rerank_score": r.get("rerank_score"),
+            "trending_score": r.get("trending_score"),
             "explanation": r["explanation"]
         }
-        for r in reranked
+        for r in reranked[:top_n]
     ]
+    return final_results, rerank_info
 
-    return {
+
+@app.get("/recommend/hybrid")
+async def recommend_hybrid(
+    request: Request,
+    student_id: int,
+    top_n: int = 5,
+    budget_ms: float = RERANK_DEFAULT_BUDGET_MS,
+    fields: Optional[str] = None,
+):
+    if student_id not in students_db:
+        return {"error": "Student not found"}
+
+    student = students_db[student_id]
+    final_results, rerank_info = await inference.run(
+        _hybrid_recommendations, student, top_n, budget_ms,
+        key=("hybrid", student_id, top_n, budget_ms),
+    )
+
+    return render(request, {
         "student_id": student_id,
-        "recommendations": final_results[:top_n]
+        "recommendations": select_fields(final_results, parse_fields(fields)),
+        "rerank": rerank_info
+    })
+
+
+@app.get("/trending")
+def trending_internships(top_n: int = 10):
+    """
+    Catalog internships ranked by recent feedback activity.
+
+    Needs no student profile, so it doubles as the cold-start list.
+    """
+    internships = catalog.current().internships
+    scores = trending.scores(i.id for i in internships)
+    top = np.argsort(-scores, kind="stable")[:top_n]
+    return {
+        "half_life_hours": trending.half_life_s / 3600,
+        "internships": [
+            {"internship_id": internships[i].id, "trending_score": round(float(scores[i]), 4)}
+            for i in top
+            if scores[i] > 0
+        ],
+    }
+
+
+@app.get("/metrics")
+async def metrics():
+    return get_metrics_snapshot()
+
+
+@app.post("/skills/reload")
+def reload_skills():
+    """
+    Re-read the skill taxonomy and swap the graph in atomically.
+
+    Other workers pick the change up from the file within
+    SKILL_TAXONOMY_CHECK_S seconds.
+    """
+    previous = get_skill_graph().content_hash
+    try:
+        graph = reload_skill_graph()
+    except (OSError, ValueError) as e:
+        raise HTTPException(status_code=400, detail=f"Taxonomy not reloaded: {e}")
+    catalog.current()
+    return {
+        "previous_hash": previous,
+        "content_hash": graph.content_hash,
+        "skills": len(graph.all_canonical_skills()),
+        "changed": previous != graph.content_hash,
+    }
+
+@app.put("/internships/{internship_id}")
+def upsert_internship(internship_id: int, internship: InternshipSchema):
+    """Add or replace one internship in the live catalog (no restart)."""
+    if internship.id != internship_id:
+        raise HTTPException(status_code=400, detail="Body id does not match path")
+    item = Internship(**internship.dict())
+    snapshot = catalog.upsert(item)
+    return {
+        "internship_id": internship_id,
+        "owned": snapshot.get(internship_id) is not None,
+        "version": snapshot.version,
+        "count": len(snapshot),
+    }
+
+
+@app.delete("/internships/{internship_id}")
+def delete_internship(internship_id: int):
+    existed = catalog.current().get(internship_id) is not None
+    snapshot = catalog.delete(internship_id)
+    return {
+        "internship_id": internship_id,
+        "deleted": existed,
+        "version": snapshot.version,
+        "count": len(snapshot),
     }
 
 from app.feedback.feedback_model import FeedbackEvent
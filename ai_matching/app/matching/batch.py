@@ -0,0 +1,84 @@
+"""
+Batch pair scoring: many students x many internships in one call.
+
+Skill similarity for every pair comes from one sparse product
+(``SkillSpace.similarity_matrix``), or for explicit pairs from row-wise
+dot products of just those pairs (``SkillSpace.pair_similarities``); the
+rule part of
+``match_student_to_internship`` then runs per pair with that similarity
+passed in, and the decision log is written with one append for the batch.
+"""
+
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from app.analytics.logger import batched_match_log
+from app.matching.matcher import match_student_to_internship
+from app.matching.recommender import catalog_skill_matrix
+from app.models.internship import Internship
+from app.models.students import Student
+from app.skills.taxonomy import SkillTaxonomy
+from app.skills.vectorizer import get_skill_space
+
+MAX_BATCH_PAIRS = 20_000
+
+
+class BatchTooLarge(ValueError):
+    pass
+
+
+class UnknownPairId(KeyError):
+    """A (student_id, internship_id) pair names an id not in the batch."""
+
+
+def score_pairs(
+    students: List[Student],
+    internships: List[Internship],
+    pairs: Optional[Sequence[Tuple[int, int]]] = None,
+) -> Dict[Tuple[int, int], dict]:
+    """
+    Match results keyed by (student index, internship index).
+
+    Without *pairs* every student is scored against every internship;
+    otherwise only the given (student_id, internship_id) pairs are.
+    Raises UnknownPairId for ids not in the batch and BatchTooLarge past
+    MAX_BATCH_PAIRS, both before any scoring work.
+    """
+    requested = len(students) * len(internships) if pairs is None else len(pairs)
+    if requested > MAX_BATCH_PAIRS:
+        raise BatchTooLarge(
+            f"{requested} pairs requested, limit is {MAX_BATCH_PAIRS}"
+        )
+
+    if pairs is None:
+        cells = [
+            (si, ii) for si in range(len(students)) for ii in range(len(internships))
+        ]
+    else:
+        student_pos = {s.id: i for i, s in enumerate(students)}
+        internship_pos = {p.id: i for i, p in enumerate(internships)}
+        for sid, iid in pairs:
+            if sid not in student_pos or iid not in internship_pos:
+                raise UnknownPairId((sid, iid))
+        cells = list(dict.fromkeys(
+            (student_pos[sid], internship_pos[iid]) for sid, iid in pairs
+        ))
+
+    space = get_skill_space()
+    taxonomy = SkillTaxonomy()
+    student_matrix = space.matrix(
+        [taxonomy.normalize_skills(s.skills) for s in students]
+    )
+    internship_matrix = catalog_skill_matrix(internships)
+    if pairs is None:
+        dense = space.similarity_matrix(student_matrix, internship_matrix)
+        similarities = [dense[si, ii] for si, ii in cells]
+    else:
+        similarities = space.pair_similarities(student_matrix, internship_matrix, cells)
+
+    results: Dict[Tuple[int, int], dict] = {}
+    with batched_match_log():
+        for (si, ii), similarity in zip(cells, similarities):
+            results[(si, ii)] = match_student_to_internship(
+                students[si], internships[ii], similarity=float(similarity),
+            )
+    return results
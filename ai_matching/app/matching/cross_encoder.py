@@ -1,9 +1,9 @@
-from sentence_transformers import CrossEncoder
+from app.model_server.client import SharedCrossEncoder
 
 class CrossEncoderModel:
     def __init__(self):
         # 🔥 Job-matching friendly model
-        self.model = CrossEncoder(
+        self.model = SharedCrossEncoder(
             "cross-encoder/ms-marco-MiniLM-L-6-v2"
         )
 
@@ -16,3 +16,11 @@ class CrossEncoderModel:
         )[0]
 
         return float(score)
+
+    def score_batch(self, pairs: list) -> list:
+        """
+        Score many (student_text, internship_text) pairs in one forward pass.
+        """
+        if not pairs:
+            return []
+        return [float(s) for s in self.model.predict(pairs)]
@@ -39,8 +39,19 @@ class HybridMatcher:
         partial_matches: list[dict] = []
         missing_skills: list[str] = []
 
+        bits = self.taxonomy.graph.bit_index
+        student_mask = bits.mask(student_skill_names, normalized=True, grow=False)
+        exact_mask = student_mask & bits.mask(
+            required_skill_names, normalized=True, grow=False,
+        )
+
         total_credit = 0.0
         for req in required_skill_names:
+            if bits.has(exact_mask, req):
+                total_credit += 1.0
+                exact_matches.append(req)
+                continue
+
             best_credit = 0.0
             best_source = None
             for stu in student_skill_names:
@@ -84,7 +95,7 @@ class HybridMatcher:
         final_score = min(100.0, max(0.0, final_score))
 
         # ---------- 6. TECH STACKS ----------
-        detected_stacks = self.taxonomy.detect_stacks(student_skill_names)
+        detected_stacks = bits.detect_stacks(student_mask)
 
         # ---------- 7. EXPLAINABILITY ----------
         explanation = {
@@ -1,27 +1,39 @@
+from typing import Optional
+
 from app.models.students import Student
 from app.models.internship import Internship
 from app.rules.eligibility import check_eligibility
 from app.skills.taxonomy import SkillTaxonomy
-from app.skills.vectorizer import SkillVectorizer
-from app.matching.similarity import cosine_similarity
+from app.skills.vectorizer import get_skill_space
 
 from app.analytics.logger import log_match_decision
 from app.analytics.metrics import record_rejection, record_matched_skills
 
 
-def _compute_hierarchy_coverage(taxonomy, student_skills, internship_skills):
+def _compute_hierarchy_coverage(
+    taxonomy, student_skills, internship_skills, exact_mask: int = 0,
+):
     """
     For every required skill, find the best partial credit the student earns
     via exact, child, sibling, parent, or domain match.
 
+    *exact_mask* (student bitmap & required bitmap) lets exact hits skip the
+    per-student-skill credit scan.
+
     Returns (weighted_coverage, exact_matches, partial_matches, details).
     """
     exact_matches: list[str] = []
     partial_matches: list[dict] = []
 
     total_credit = 0.0
+    bits = taxonomy.graph.bit_index
 
     for req_skill in internship_skills:
+        if bits.has(exact_mask, req_skill):
+            total_credit += 1.0
+            exact_matches.append(req_skill)
+            continue
+
         best_credit = 0.0
         best_source = None
 
@@ -48,7 +60,8 @@ def _compute_hierarchy_coverage(taxonomy, student_skills, internship_skills):
 
 def match_student_to_internship(
     student: Student,
-    internship: Internship
+    internship: Internship,
+    similarity: Optional[float] = None,
 ) -> dict:
     """
     Product-grade matching function (v2.0)
@@ -60,6 +73,9 @@ def match_student_to_internship(
     - Tech-stack detection
     - Penalties
     - Logging & analytics hooks
+
+    *similarity* may be passed in when the caller already scored the student
+    against the whole catalog with ``SkillSpace.similarities``.
     """
 
     eligible, reasons = check_eligibility(student, internship)
@@ -84,18 +100,20 @@ def match_student_to_internship(
     internship_skills = taxonomy.normalize_skills(internship.required_skills)
 
     # --- Vector similarity (50 pts) ---
-    skill_index = SkillVectorizer.build_index(student_skills, internship_skills)
-    vectorizer = SkillVectorizer(skill_index)
-
-    student_vector = vectorizer.vectorize(student_skills)
-    internship_vector = vectorizer.vectorize(internship_skills)
-
-    similarity = cosine_similarity(student_vector, internship_vector)
+    if similarity is None:
+        similarity = get_skill_space().similarity(student_skills, internship_skills)
     similarity_score = similarity * 50
 
     # --- Hierarchy-aware coverage (20 pts) ---
+    # grow=False: free-text skills from a request must not claim permanent
+    # bits; an unknown required skill just falls through to the credit scan.
+    bits = taxonomy.graph.bit_index
+    student_mask = bits.mask(student_skills, normalized=True, grow=False)
+    required_mask = bits.mask(internship_skills, normalized=True, grow=False)
+
     coverage, exact_matches, partial_matches = _compute_hierarchy_coverage(
         taxonomy, student_skills, internship_skills,
+        exact_mask=student_mask & required_mask,
     )
     coverage_score = coverage * 20
 
@@ -103,7 +121,7 @@ def match_student_to_internship(
     # Rewards partial/domain/stack overlap beyond strict coverage.
     hierarchy_bonus = min(len(partial_matches) * 2.0, 10.0)
 
-    detected_stacks = taxonomy.detect_stacks(set(student_skills.keys()))
+    detected_stacks = bits.detect_stacks(student_mask)
     if detected_stacks:
         hierarchy_bonus = min(hierarchy_bonus + 2.0, 10.0)
 
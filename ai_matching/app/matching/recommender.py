@@ -1,22 +1,43 @@
-from typing import List, Dict
+from typing import List, Dict, Optional
 from app.models.students import Student
 from app.models.internship import Internship
 from app.matching.matcher import match_student_to_internship
+from app.skills.taxonomy import SkillTaxonomy
+from app.skills.vectorizer import SkillMatrix, get_skill_space
+
+
+def catalog_skill_matrix(internships: List[Internship]) -> SkillMatrix:
+    """CSR skill rows for *internships*, in the same order."""
+    taxonomy = SkillTaxonomy()
+    return get_skill_space().matrix([
+        taxonomy.normalize_skills(i.required_skills) for i in internships
+    ])
 
 
 def recommend_top_internships(
     student: Student,
     internships: List[Internship],
-    top_n: int = 5
+    top_n: int = 5,
+    skill_matrix: Optional[SkillMatrix] = None,
 ) -> List[Dict]:
     """
     Recommend top N internships for a student based on match score.
+
+    Skill similarity for every internship is computed up front with one
+    sparse product; pass a prebuilt *skill_matrix* to skip building it.
     """
 
     results: List[Dict] = []
 
-    for internship in internships:
-        match_result = match_student_to_internship(student, internship)
+    if skill_matrix is None:
+        skill_matrix = catalog_skill_matrix(internships)
+    student_skills = SkillTaxonomy().normalize_skills(student.skills)
+    similarities = skill_matrix.space.similarities(student_skills, skill_matrix)
+
+    for internship, similarity in zip(internships, similarities):
+        match_result = match_student_to_internship(
+            student, internship, similarity=float(similarity)
+        )
 
         if match_result["status"] == "MATCHED":
             results.append({
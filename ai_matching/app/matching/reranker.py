@@ -1,4 +1,14 @@
+import threading
+import time
+from typing import Optional
+
 from app.matching.cross_encoder import CrossEncoderModel
+from app.matching.rerank_budget import (
+    CE_SCORE_CAP,
+    INITIAL_PAIR_COST_MS,
+    RERANK_DEFAULT_BUDGET_MS,
+    plan_rerank,
+)
 from app.matching.text_builder import (
     build_student_text,
     build_internship_text
@@ -6,38 +16,121 @@ from app.matching.text_builder import (
 
 CROSS_ENCODER_WEIGHT = 0.3  # keep hybrid dominant
 
+# Smoothing for the per-pair latency estimate (EWMA).
+PAIR_COST_ALPHA = 0.2
+
+
+def _blend(hybrid_score: float, ce_score: float) -> float:
+    ce_score = max(-CE_SCORE_CAP, min(CE_SCORE_CAP, ce_score))
+    return round(
+        (1 - CROSS_ENCODER_WEIGHT) * hybrid_score
+        + CROSS_ENCODER_WEIGHT * ce_score,
+        2
+    )
+
 
 class ReRanker:
     def __init__(self):
         self.cross_encoder = CrossEncoderModel()
+        self._pair_cost_ms = INITIAL_PAIR_COST_MS
+        self._in_flight = 0
+        self._lock = threading.Lock()
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of rerank calls currently waiting on the cross-encoder."""
+        return self._in_flight
 
     def rerank(self, student, ranked_results: list) -> list:
         """
         ranked_results: list of dicts with internship + score
         """
-        student_text = build_student_text(student)
+        self._score_and_blend(student, ranked_results)
 
-        for item in ranked_results:
-            internship = item["internship"]
-            internship_text = build_internship_text(internship)
+        ranked_results.sort(
+            key=lambda x: x["rerank_score"],
+            reverse=True
+        )
 
-            ce_score = self.cross_encoder.score(
-                student_text,
-                internship_text
-            )
+        return ranked_results
 
-            # combine scores
-            item["final_score"] = round(
-                (1 - CROSS_ENCODER_WEIGHT) * item["final_score"]
-                + CROSS_ENCODER_WEIGHT * ce_score,
-                2
-            )
+    def rerank_within_budget(
+        self,
+        student,
+        ranked_results: list,
+        top_n: int,
+        budget_ms: float = RERANK_DEFAULT_BUDGET_MS,
+        queue_depth: Optional[int] = None,
+    ) -> tuple:
+        """
+        Adaptive-depth rerank of *ranked_results* (already sorted by hybrid
+        score).  Only the planned prefix goes through the cross-encoder and
+        is reordered by its blended ``rerank_score``; the tail keeps its
+        hybrid order and ``rerank_score`` None.  ``final_score`` stays the
+        hybrid score on every item, so it means the same thing whichever
+        path a request took.
 
-            item["cross_encoder_score"] = round(ce_score, 2)
+        *queue_depth* is the inference backlog (queued + running jobs);
+        it defaults to this reranker's own in-flight cross-encoder calls.
 
-        ranked_results.sort(
-            key=lambda x: x["final_score"],
-            reverse=True
+        Returns (results, info) where *info* describes the path taken.
+        """
+        plan = plan_rerank(
+            [r["final_score"] for r in ranked_results],
+            top_n=top_n,
+            budget_ms=budget_ms,
+            queue_depth=self.queue_depth if queue_depth is None else queue_depth,
+            pair_cost_ms=self._pair_cost_ms,
+            weight=CROSS_ENCODER_WEIGHT,
         )
 
-        return ranked_results
+        head = ranked_results[:plan.depth]
+        tail = ranked_results[plan.depth:]
+
+        start = time.perf_counter()
+        if head:
+            self._score_and_blend(student, head)
+            head.sort(key=lambda x: x["rerank_score"], reverse=True)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+
+        for item in tail:
+            item.setdefault("cross_encoder_score", None)
+            item.setdefault("rerank_score", None)
+
+        info = {
+            "path": plan.path,
+            "depth": plan.depth,
+            "budget_ms": plan.budget_ms,
+            "estimated_ms": plan.estimated_ms,
+            "elapsed_ms": round(elapsed_ms, 2),
+            "budget_exceeded": elapsed_ms > plan.budget_ms,
+        }
+        return head + tail, info
+
+    def _score_and_blend(self, student, items: list) -> None:
+        student_text = build_student_text(student)
+        pairs = [
+            (student_text, build_internship_text(item["internship"]))
+            for item in items
+        ]
+
+        with self._lock:
+            self._in_flight += 1
+        start = time.perf_counter()
+        try:
+            ce_scores = self.cross_encoder.score_batch(pairs)
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+
+        if pairs:
+            per_pair = (time.perf_counter() - start) * 1000 / len(pairs)
+            self._pair_cost_ms = (
+                (1 - PAIR_COST_ALPHA) * self._pair_cost_ms
+                + PAIR_COST_ALPHA * per_pair
+            )
+
+        for item, ce_score in zip(items, ce_scores):
+            # blended score orders the reranked head only
+            item["rerank_score"] = _blend(item["final_score"], ce_score)
+            item["cross_encoder_score"] = round(ce_score, 2)
@@ -0,0 +1,325 @@
+"""
+Shadow scoring of alternative hybrid configs, off the request path.
+
+``/recommend/hybrid`` hands its candidate list to the ShadowScorer from a
+background task (i.e. after the response is sent).  A worker thread then
+re-ranks the same candidates under every configured ShadowConfig -- other
+RULE_WEIGHT / EMBEDDING_WEIGHT values and hierarchy credits -- and appends
+one compact rank-diff record per config to ``logs/shadow_scores.jsonl``.
+
+Only the rule score depends on the config; embedding scores and feedback
+boosts are carried over from the live request, so re-scoring is a pass
+over a (student skill x required skill) relation table, never a model call.
+Diffs are taken against the same inputs re-scored with the live constants,
+so they measure the config change alone (cross-encoder re-ranking is not
+replayed).
+
+Shadow work never competes with live traffic: the queue is bounded, and a
+job is dropped instead of queued when it is full or the host load average
+is above SHADOW_MAX_LOAD per CPU.
+
+Configs come from SHADOW_CONFIGS, either inline JSON or a path to a JSON
+file:
+
+    [{"name": "rule-heavy", "rule_weight": 0.7, "embedding_weight": 0.3,
+      "credits": {"child": 0.8, "sibling": 0.4}}]
+"""
+
+import json
+import logging
+import os
+import queue
+import random
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+from app.analytics.metrics import record_shadow
+from app.matching import hybrid_matcher
+from app.skills import skill_graph
+from app.skills.skill_graph import RELATION_EXACT, SkillGraph
+from app.skills.taxonomy import SkillTaxonomy
+
+logger = logging.getLogger(__name__)
+
+SHADOW_LOG_FILE = Path("logs") / "shadow_scores.jsonl"
+SHADOW_QUEUE_SIZE = int(os.getenv("SHADOW_QUEUE_SIZE", "32"))
+SHADOW_MAX_LOAD = float(os.getenv("SHADOW_MAX_LOAD", "0.75"))
+SHADOW_SAMPLE_RATE = float(os.getenv("SHADOW_SAMPLE_RATE", "1.0"))
+# Rank moves are only logged inside this window (union of both top-k)
+SHADOW_TOP_K = 20
+
+
+@dataclass
+class ShadowConfig:
+    name: str
+    rule_weight: float = field(default_factory=lambda: hybrid_matcher.RULE_WEIGHT)
+    embedding_weight: float = field(
+        default_factory=lambda: hybrid_matcher.EMBEDDING_WEIGHT
+    )
+    credits: Dict[str, float] = field(
+        default_factory=lambda: dict(skill_graph.RELATION_CREDITS)
+    )
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "ShadowConfig":
+        credits = dict(skill_graph.RELATION_CREDITS)
+        unknown = set(data.get("credits", {})) - set(credits)
+        if unknown:
+            raise ValueError(f"Unknown credit relations: {sorted(unknown)}")
+        credits.update(data.get("credits", {}))
+        return cls(
+            name=data["name"],
+            rule_weight=data.get("rule_weight", hybrid_matcher.RULE_WEIGHT),
+            embedding_weight=data.get(
+                "embedding_weight", hybrid_matcher.EMBEDDING_WEIGHT
+            ),
+            credits=credits,
+        )
+
+
+def load_shadow_configs(spec: Optional[str] = None) -> List[ShadowConfig]:
+    """Parse SHADOW_CONFIGS (inline JSON or a file path); empty if unset."""
+    spec = spec if spec is not None else os.getenv("SHADOW_CONFIGS", "")
+    spec = spec.strip()
+    if not spec:
+        return []
+    if not spec.startswith("["):
+        spec = Path(spec).read_text(encoding="utf-8")
+    return [ShadowConfig.from_dict(d) for d in json.loads(spec)]
+
+
+@dataclass
+class ShadowCandidate:
+    internship_id: int
+    required_skills: List[str]
+    embedding_score: float
+    feedback_boost: float
+
+
+@dataclass
+class ShadowJob:
+    student_id: int
+    student_skills: List[str]
+    candidates: List[ShadowCandidate]
+    top_n: int
+
+
+# ---------- scoring ----------
+
+def _relation_table(
+    graph: SkillGraph, student: Sequence[str], candidates: List[ShadowCandidate],
+) -> List[List[List[Optional[str]]]]:
+    """relations[candidate][required][student] -- shared by every config."""
+    taxonomy = SkillTaxonomy()
+    student_names = sorted({taxonomy.normalize(s) for s in student})
+    cache: Dict[tuple, Optional[str]] = {}
+    table = []
+    for c in candidates:
+        rows = []
+        for req in sorted({taxonomy.normalize(s) for s in c.required_skills}):
+            row = []
+            for stu in student_names:
+                key = (stu, req)
+                if key not in cache:
+                    cache[key] = graph.relation(stu, req)
+                row.append(cache[key])
+            rows.append(row)
+        table.append(rows)
+    return table
+
+
+def _rank(
+    config: ShadowConfig,
+    candidates: List[ShadowCandidate],
+    relations: List[List[List[Optional[str]]]],
+) -> List[int]:
+    """Candidate ids ordered the way HybridMatcher + feedback would order them."""
+    credits = config.credits
+    scored = []
+    for c, rows in zip(candidates, relations):
+        total = 0.0
+        for row in rows:
+            if RELATION_EXACT in row:
+                # Exact hits score 1.0 in the live matcher regardless of config
+                total += 1.0
+            else:
+                total += max((credits[r] for r in row if r), default=0.0)
+        rule_score = total / len(rows) * 100 if rows else 0
+        score = config.rule_weight * rule_score + config.embedding_weight * c.embedding_score
+        score = round(min(100.0, max(0.0, score)), 2)
+        scored.append((round(score + c.feedback_boost, 2), c.internship_id))
+    # Stable on ties, like the live sort
+    order = sorted(range(len(scored)), key=lambda i: scored[i][0], reverse=True)
+    return [scored[i][1] for i in order]
+
+
+def rank_diff(
+    baseline: List[int], shadow: List[int], top_n: int, window: int = SHADOW_TOP_K,
+) -> dict:
+    """Compact comparison of two rankings of the same ids."""
+    base_pos = {cid: i for i, cid in enumerate(baseline)}
+    shadow_pos = {cid: i for i, cid in enumerate(shadow)}
+    watched = set(baseline[:window]) | set(shadow[:window])
+    moves = sorted(
+        [cid, base_pos[cid], shadow_pos[cid]]
+        for cid in watched if base_pos[cid] != shadow_pos[cid]
+    )
+    return {
+        "top_n_overlap": len(set(baseline[:top_n]) & set(shadow[:top_n])),
+        "top_n_changed": baseline[:top_n] != shadow[:top_n],
+        "max_move": max((abs(b - s) for _, b, s in moves), default=0),
+        "moves": moves,
+    }
+
+
+# ---------- scorer ----------
+
+class ShadowScorer:
+    """Bounded, load-shedding background re-scorer."""
+
+    def __init__(
+        self,
+        configs: Optional[List[ShadowConfig]] = None,
+        log_file: Path = SHADOW_LOG_FILE,
+        maxsize: int = SHADOW_QUEUE_SIZE,
+        max_load: float = SHADOW_MAX_LOAD,
+        sample_rate: float = SHADOW_SAMPLE_RATE,
+    ) -> None:
+        if configs is None:
+            try:
+                configs = load_shadow_configs()
+            except (OSError, ValueError, KeyError) as e:
+                # A bad experiment config must not take the service down
+                logger.error(f"Shadow scoring disabled, bad SHADOW_CONFIGS: {e}")
+                configs = []
+        self.configs = configs
+        self.log_file = Path(log_file)
+        self.max_load = max_load
+        self.sample_rate = sample_rate
+        self._queue: "queue.Queue[ShadowJob]" = queue.Queue(maxsize=maxsize)
+        self._worker: Optional[threading.Thread] = None
+        self._worker_lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.configs)
+
+    # ---------- producer side (request thread) ----------
+
+    def submit_hybrid(self, student, results: List[dict], top_n: int) -> bool:
+        """Build a job from /recommend/hybrid results and enqueue it."""
+        if not self.enabled:
+            return False
+        job = ShadowJob(
+            student_id=student.id,
+            student_skills=list(student.skills),
+            candidates=[
+                ShadowCandidate(
+                    internship_id=r["internship_id"],
+                    required_skills=list(r["internship"].required_skills),
+                    embedding_score=r["explanation"]["embedding_score"],
+                    feedback_boost=r["feedback_boost"],
+                )
+                for r in results
+            ],
+            top_n=top_n,
+        )
+        return self.submit(job)
+
+    def submit(self, job: ShadowJob) -> bool:
+        """Enqueue *job*; False (and counted) if it was shed."""
+        if not self.enabled:
+            return False
+        if self.sample_rate < 1.0 and random.random() >= self.sample_rate:
+            record_shadow("sampled_out")
+            return False
+        if self._overloaded():
+            record_shadow("dropped_load")
+            return False
+        self._ensure_worker()
+        try:
+            self._queue.put_nowait(job)
+        except queue.Full:
+            record_shadow("dropped_full")
+            return False
+        record_shadow("queued")
+        return True
+
+    def _overloaded(self) -> bool:
+        try:
+            load_1m = os.getloadavg()[0]
+        except OSError:
+            return False
+        return load_1m / (os.cpu_count() or 1) > self.max_load
+
+    def _ensure_worker(self) -> None:
+        # Started lazily so every gunicorn worker gets its own after fork
+        if self._worker is None or not self._worker.is_alive():
+            with self._worker_lock:
+                if self._worker is None or not self._worker.is_alive():
+                    self._worker = threading.Thread(
+                        target=self._run, name="shadow-scorer", daemon=True
+                    )
+                    self._worker.start()
+
+    # ---------- consumer side (worker thread) ----------
+
+    def _run(self) -> None:
+        while True:
+            job = self._queue.get()
+            try:
+                self._append(self.score(job))
+                record_shadow("scored")
+            except Exception:
+                logger.exception("Shadow scoring failed")
+                record_shadow("failed")
+            finally:
+                self._queue.task_done()
+
+    def score(self, job: ShadowJob) -> List[dict]:
+        """One rank-diff record per config for *job*."""
+        graph = skill_graph.get_skill_graph()
+        relations = _relation_table(graph, job.student_skills, job.candidates)
+        baseline = _rank(ShadowConfig("live"), job.candidates, relations)
+        ts = datetime.utcnow().isoformat()
+        return [
+            {
+                "timestamp": ts,
+                "student_id": job.student_id,
+                "config": config.name,
+                "candidates": len(job.candidates),
+                "top_n": job.top_n,
+                **rank_diff(
+                    baseline, _rank(config, job.candidates, relations), job.top_n
+                ),
+            }
+            for config in self.configs
+        ]
+
+    def _append(self, records: List[dict]) -> None:
+        self.log_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.log_file, "a", encoding="utf-8") as f:
+            f.write("".join(json.dumps(r, separators=(",", ":")) + "\n" for r in records))
+
+    def join(self, timeout: float = 5.0) -> bool:
+        """Wait for queued jobs (tests / shutdown); False on timeout."""
+        deadline = time.monotonic() + timeout
+        while self._queue.unfinished_tasks:
+            if time.monotonic() > deadline:
+                return False
+            time.sleep(0.01)
+        return True
+
+
+_shadow_scorer: Optional[ShadowScorer] = None
+
+
+def get_shadow_scorer() -> ShadowScorer:
+    global _shadow_scorer
+    if _shadow_scorer is None:
+        _shadow_scorer = ShadowScorer()
+    return _shadow_scorer
@@ -0,0 +1,192 @@
+"""
+Thin client for the shared model server, with in-process fallback.
+
+Services opt in by setting one of:
+
+    MODEL_SERVER_URL=http://127.0.0.1:8010
+    MODEL_SERVER_SOCKET=/run/praktiki/models.sock
+
+``SharedSentenceEncoder`` / ``SharedCrossEncoder`` mirror the parts of the
+sentence-transformers API the codebase uses (``encode`` / ``predict``).
+When no server is configured, or it is unreachable, they load the model
+in-process instead -- the same behaviour as before the server existed.
+After a failure the server is retried once ``RETRY_AFTER_S`` has passed.
+"""
+
+import abc
+import logging
+import os
+import threading
+import time
+from typing import List, Optional, Sequence, Tuple
+
+import httpx
+import numpy as np
+
+from app.model_server.codec import decode_matrix
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TIMEOUT_S = 10.0
+RETRY_AFTER_S = 30.0
+
+
+class ModelServerUnavailable(Exception):
+    """The model server could not be reached or returned an error."""
+
+
+class ModelClient:
+    """Blocking HTTP client for /encode, /cross-encode and /health."""
+
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        socket_path: Optional[str] = None,
+        timeout: float = DEFAULT_TIMEOUT_S,
+        http_client: Optional[httpx.Client] = None,
+    ) -> None:
+        if http_client is not None:
+            self._http = http_client
+        else:
+            transport = httpx.HTTPTransport(uds=socket_path) if socket_path else None
+            self._http = httpx.Client(
+                base_url=base_url or "http://model-server",
+                transport=transport,
+                timeout=timeout,
+            )
+
+    def _post(self, path: str, payload: dict) -> dict:
+        try:
+            resp = self._http.post(path, json=payload)
+            resp.raise_for_status()
+            return resp.json()
+        except httpx.HTTPError as e:
+            raise ModelServerUnavailable(f"{path}: {e}") from e
+
+    def health(self) -> dict:
+        try:
+            resp = self._http.get("/health")
+            resp.raise_for_status()
+            return resp.json()
+        except httpx.HTTPError as e:
+            raise ModelServerUnavailable(f"/health: {e}") from e
+
+    def encode(self, model: str, texts: List[str], normalize: bool = False) -> np.ndarray:
+        data = self._post(
+            "/encode", {"model": model, "texts": texts, "normalize": normalize}
+        )
+        return decode_matrix(data["embeddings"])
+
+    def cross_encode(self, model: str, pairs: Sequence[Tuple[str, str]]) -> List[float]:
+        data = self._post(
+            "/cross-encode", {"model": model, "pairs": [list(p) for p in pairs]}
+        )
+        return data["scores"]
+
+
+_client: Optional[ModelClient] = None
+_client_lock = threading.Lock()
+
+
+def get_model_client() -> Optional[ModelClient]:
+    """Process-wide client, or None when no model server is configured."""
+    global _client
+    url = os.getenv("MODEL_SERVER_URL")
+    socket_path = os.getenv("MODEL_SERVER_SOCKET")
+    if not url and not socket_path:
+        return None
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = ModelClient(base_url=url, socket_path=socket_path)
+    return _client
+
+
+# ---------- Drop-in model wrappers ----------
+
+class _RemoteWithFallback(abc.ABC):
+    """Shared remote-first / local-fallback plumbing."""
+
+    def __init__(self, model_name: str, client: Optional[ModelClient]) -> None:
+        self.model_name = model_name
+        self._client = client
+        self._local = None
+        self._local_lock = threading.Lock()
+        self._remote_down_until = 0.0
+
+    def _remote_ok(self) -> bool:
+        return self._client is not None and time.monotonic() >= self._remote_down_until
+
+    def _mark_remote_down(self, exc: Exception) -> None:
+        logger.warning(
+            f"Model server unavailable for {self.model_name} ({exc}); "
+            f"using in-process model"
+        )
+        self._remote_down_until = time.monotonic() + RETRY_AFTER_S
+
+    @abc.abstractmethod
+    def _load_local(self):
+        """Load the sentence-transformers model in this process."""
+
+    @property
+    def local(self):
+        if self._local is None:
+            with self._local_lock:
+                if self._local is None:
+                    logger.info(f"Loading {self.model_name} in-process")
+                    self._local = self._load_local()
+        return self._local
+
+
+class SharedSentenceEncoder(_RemoteWithFallback):
+    """``SentenceTransformer.encode`` served by the model server when available."""
+
+    def __init__(
+        self,
+        model_name: str,
+        normalize: bool = False,
+        client: Optional[ModelClient] = None,
+    ) -> None:
+        super().__init__(model_name, client if client is not None else get_model_client())
+        self.normalize = normalize
+
+    def _load_local(self):
+        from sentence_transformers import SentenceTransformer
+        return SentenceTransformer(self.model_name)
+
+    def encode(self, texts):
+        single = isinstance(texts, str)
+        batch = [texts] if single else list(texts)
+
+        vectors = None
+        if self._remote_ok():
+            try:
+                vectors = self._client.encode(self.model_name, batch, self.normalize)
+            except ModelServerUnavailable as e:
+                self._mark_remote_down(e)
+        if vectors is None:
+            vectors = np.asarray(
+                self.local.encode(batch, normalize_embeddings=self.normalize),
+                dtype=np.float32,
+            )
+        return vectors[0] if single else vectors
+
+
+class SharedCrossEncoder(_RemoteWithFallback):
+    """``CrossEncoder.predict`` served by the model server when available."""
+
+    def __init__(self, model_name: str, client: Optional[ModelClient] = None) -> None:
+        super().__init__(model_name, client if client is not None else get_model_client())
+
+    def _load_local(self):
+        from sentence_transformers import CrossEncoder
+        return CrossEncoder(self.model_name)
+
+    def predict(self, pairs) -> np.ndarray:
+        pairs = [tuple(p) for p in pairs]
+        if self._remote_ok():
+            try:
+                return np.asarray(self._client.cross_encode(self.model_name, pairs))
+            except ModelServerUnavailable as e:
+                self._mark_remote_down(e)
+        return np.asarray(self.local.predict(pairs))
@@ -0,0 +1,23 @@
+"""
+Wire format for embedding matrices (base64 float32, ~4x smaller than JSON lists).
+"""
+
+import base64
+
+import numpy as np
+
+
+def encode_matrix(matrix: np.ndarray) -> dict:
+    """float32 matrix -> JSON-safe payload (base64 is ~4x smaller than lists)."""
+    matrix = np.ascontiguousarray(matrix, dtype=np.float32)
+    return {
+        "dtype": "float32",
+        "shape": list(matrix.shape),
+        "data": base64.b64encode(matrix.tobytes()).decode("ascii"),
+    }
+
+
+def decode_matrix(payload: dict) -> np.ndarray:
+    # bytearray keeps the result writable (faiss.normalize_L2 works in place)
+    raw = bytearray(base64.b64decode(payload["data"]))
+    return np.frombuffer(raw, dtype=payload["dtype"]).reshape(payload["shape"])
@@ -0,0 +1,184 @@
+"""
+Local model server shared by every Python service on the host.
+
+ai_matching workers, the resume parser and the backend each used to load
+their own copy of MiniLM (and ai_matching loaded mpnet + the cross-encoder
+per gunicorn worker).  This process hosts each model ONCE and exposes:
+
+    GET  /health          loaded models, batching counters, peak RSS
+    POST /encode          {"model", "texts", "normalize"} -> float32 matrix
+    POST /cross-encode    {"model", "pairs"}              -> scores
+
+Every model sits behind an EncodeBatcher, so single-text requests from
+different services are merged into the same forward pass.
+
+Run on localhost or a UNIX socket:
+
+    uvicorn app.model_server.server:app --host 127.0.0.1 --port 8010
+    uvicorn app.model_server.server:app --uds /run/praktiki/models.sock
+"""
+
+import asyncio
+import os
+import resource
+import threading
+from typing import Dict, List, Tuple
+
+import numpy as np
+from fastapi import FastAPI, HTTPException
+from pydantic import BaseModel
+
+from app.embeddings.batcher import EncodeBatcher
+from app.model_server.codec import encode_matrix
+
+# Models this server is willing to load (name -> kind)
+SENTENCE_MODELS = {"all-MiniLM-L6-v2", "all-mpnet-base-v2"}
+CROSS_ENCODER_MODELS = {"cross-encoder/ms-marco-MiniLM-L-6-v2"}
+
+MAX_TEXTS_PER_REQUEST = int(os.getenv("MODEL_SERVER_MAX_TEXTS", "1024"))
+
+# Comma-separated models to load at startup instead of on first request
+PRELOAD = [m for m in os.getenv("MODEL_SERVER_PRELOAD", "").split(",") if m]
+
+
+# ---------- Model registry ----------
+
+def _load_sentence_model(name: str):
+    from sentence_transformers import SentenceTransformer
+    return SentenceTransformer(name)
+
+
+def _load_cross_encoder(name: str):
+    from sentence_transformers import CrossEncoder
+    return CrossEncoder(name)
+
+
+class ModelRegistry:
+    """Loads each model once, lazily, and keeps one batcher per (model, mode)."""
+
+    def __init__(self, sentence_loader=_load_sentence_model,
+                 cross_loader=_load_cross_encoder) -> None:
+        self._sentence_loader = sentence_loader
+        self._cross_loader = cross_loader
+        self._models: Dict[str, object] = {}
+        self._batchers: Dict[Tuple[str, str], EncodeBatcher] = {}
+        self._lock = threading.Lock()
+
+    def _model(self, name: str, loader):
+        if name not in self._models:
+            with self._lock:
+                if name not in self._models:
+                    self._models[name] = loader(name)
+        return self._models[name]
+
+    def encoder(self, name: str, normalize: bool) -> EncodeBatcher:
+        if name not in SENTENCE_MODELS:
+            raise KeyError(name)
+        key = (name, "normalized" if normalize else "raw")
+        if key not in self._batchers:
+            model = self._model(name, self._sentence_loader)
+            with self._lock:
+                self._batchers.setdefault(key, EncodeBatcher(
+                    lambda texts: model.encode(
+                        texts, normalize_embeddings=normalize
+                    )
+                ))
+        return self._batchers[key]
+
+    def cross_encoder(self, name: str) -> EncodeBatcher:
+        if name not in CROSS_ENCODER_MODELS:
+            raise KeyError(name)
+        key = (name, "pairs")
+        if key not in self._batchers:
+            model = self._model(name, self._cross_loader)
+            with self._lock:
+                self._batchers.setdefault(key, EncodeBatcher(
+                    lambda pairs: model.predict(pairs)
+                ))
+        return self._batchers[key]
+
+    def stats(self) -> dict:
+        return {
+            f"{name}:{mode}": {
+                "batches_run": b.batches_run,
+                "items_encoded": b.items_encoded,
+            }
+            for (name, mode), b in self._batchers.items()
+        }
+
+    @property
+    def loaded(self) -> List[str]:
+        return sorted(self._models)
+
+
+registry = ModelRegistry()
+
+
+# ---------- API ----------
+
+class EncodeRequest(BaseModel):
+    model: str
+    texts: List[str]
+    normalize: bool = False
+
+
+class CrossEncodeRequest(BaseModel):
+    model: str
+    pairs: List[Tuple[str, str]]
+
+
+app = FastAPI(title="Praktiki Model Server")
+
+
+@app.on_event("startup")
+def preload_models():
+    for name in PRELOAD:
+        if name in CROSS_ENCODER_MODELS:
+            registry.cross_encoder(name)
+        else:
+            registry.encoder(name, normalize=False)
+
+
+@app.get("/health")
+def health():
+    return {
+        "status": "ok",
+        "pid": os.getpid(),
+        "models_loaded": registry.loaded,
+        "batchers": registry.stats(),
+        "max_rss_mb": round(
+            resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1
+        ),
+    }
+
+
+@app.post("/encode")
+async def encode(req: EncodeRequest):
+    if len(req.texts) > MAX_TEXTS_PER_REQUEST:
+        raise HTTPException(413, f"At most {MAX_TEXTS_PER_REQUEST} texts per request")
+    try:
+        # First use loads the model; keep that off the event loop
+        batcher = await asyncio.to_thread(registry.encoder, req.model, req.normalize)
+    except KeyError:
+        raise HTTPException(404, f"Unknown sentence model: {req.model}")
+
+    if not req.texts:
+        return {"embeddings": encode_matrix(np.zeros((0, 0), dtype=np.float32))}
+
+    rows = await asyncio.gather(*(batcher.encode_async(t) for t in req.texts))
+    return {"embeddings": encode_matrix(np.vstack(rows))}
+
+
+@app.post("/cross-encode")
+async def cross_encode(req: CrossEncodeRequest):
+    if len(req.pairs) > MAX_TEXTS_PER_REQUEST:
+        raise HTTPException(413, f"At most {MAX_TEXTS_PER_REQUEST} pairs per request")
+    try:
+        batcher = await asyncio.to_thread(registry.cross_encoder, req.model)
+    except KeyError:
+        raise HTTPException(404, f"Unknown cross-encoder: {req.model}")
+
+    scores = await asyncio.gather(
+        *(batcher.encode_async(tuple(p)) for p in req.pairs)
+    )
+    return {"scores": [float(s) for s in scores]}
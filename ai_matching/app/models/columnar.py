@@ -0,0 +1,275 @@
+"""
+Columnar (struct-of-arrays) stores for students and internships.
+
+A ``Student`` / ``Internship`` dataclass costs an object, a ``__dict__``,
+a skills dict and a string per field -- roughly 2 KB per entity, which at
+a million students is gigabytes and leaves nothing to vectorize.  The
+stores here keep one numpy array per field instead:
+
+    ids, years / min_years, location codes, is_remote
+    skill_indptr, skill_ids, skill_levels      (CSR: entity row -> skills)
+
+with skill and location strings interned once per store.  Existing call
+sites keep working through ``StudentView`` / ``InternshipView``: two-slot
+objects that read their row on attribute access and expose the same
+attributes as the dataclasses (``skills`` / ``required_skills`` are built
+on first access and kept on the view, so treat them as read-only).
+
+``StudentStore`` is a read-only ``Mapping[id, StudentView]`` (a drop-in
+for the old ``students_db`` dict); ``InternshipStore`` is a
+``Sequence[InternshipView]`` in load order.
+"""
+
+from collections.abc import Mapping, Sequence
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+import numpy as np
+
+from app.models.internship import Internship
+from app.models.students import Student
+
+
+class _Interner:
+    """Bidirectional string <-> small int code table."""
+
+    def __init__(self) -> None:
+        self.names: List[str] = []
+        self._codes: Dict[str, int] = {}
+
+    def code(self, name: str) -> int:
+        code = self._codes.get(name)
+        if code is None:
+            code = self._codes[name] = len(self.names)
+            self.names.append(name)
+        return code
+
+    def lookup(self, name: str) -> int:
+        """Code for *name*, or -1 if it never occurred."""
+        return self._codes.get(name, -1)
+
+
+def _skills_to_csr(
+    rows: Iterable[Dict[str, int]], interner: _Interner
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    indptr, ids, levels = [0], [], []
+    for skills in rows:
+        for name, level in skills.items():
+            ids.append(interner.code(name))
+            levels.append(level)
+        indptr.append(len(ids))
+    return (
+        np.asarray(indptr, dtype=np.int64),
+        np.asarray(ids, dtype=np.int32),
+        np.asarray(levels, dtype=np.int8),
+    )
+
+
+class _ColumnarStore:
+    skill_indptr: np.ndarray
+    skill_ids: np.ndarray
+    skill_levels: np.ndarray
+
+    def __init__(self) -> None:
+        self._skills = _Interner()
+        self._locations = _Interner()
+
+    @property
+    def skill_names(self) -> List[str]:
+        return self._skills.names
+
+    @property
+    def location_names(self) -> List[str]:
+        return self._locations.names
+
+    def skill_code(self, name: str) -> int:
+        return self._skills.lookup(name)
+
+    def location_code(self, name: str) -> int:
+        return self._locations.lookup(name)
+
+    def skills_of(self, row: int) -> Dict[str, int]:
+        start, stop = self.skill_indptr[row], self.skill_indptr[row + 1]
+        names = self._skills.names
+        return {
+            names[code]: int(level)
+            for code, level in zip(
+                self.skill_ids[start:stop].tolist(), self.skill_levels[start:stop].tolist()
+            )
+        }
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the column arrays (interned strings excluded)."""
+        return sum(
+            v.nbytes for v in vars(self).values() if isinstance(v, np.ndarray)
+        )
+
+
+# ---------- Students ----------
+
+class StudentView:
+    """Row of a StudentStore with the ``Student`` attribute interface."""
+
+    __slots__ = ("_store", "_row", "_skills")
+
+    def __init__(self, store: "StudentStore", row: int) -> None:
+        self._store = store
+        self._row = row
+        self._skills = None
+
+    @property
+    def id(self) -> int:
+        return int(self._store.ids[self._row])
+
+    @property
+    def year(self) -> int:
+        return int(self._store.years[self._row])
+
+    @property
+    def location(self) -> str:
+        return self._store.location_names[self._store.location_codes[self._row]]
+
+    @property
+    def skills(self) -> Dict[str, int]:
+        # The matchers read skills many times per pair (has_skill, levels, ...)
+        if self._skills is None:
+            self._skills = self._store.skills_of(self._row)
+        return self._skills
+
+    @property
+    def preferences(self) -> Dict[str, str]:
+        return {}
+
+    _get_matching_skill_key = Student._get_matching_skill_key
+    has_skill = Student.has_skill
+    skill_level = Student.skill_level
+
+    def to_student(self) -> Student:
+        return Student(id=self.id, skills=self.skills, year=self.year, location=self.location)
+
+    def __repr__(self) -> str:
+        return f"StudentView(id={self.id}, year={self.year}, location={self.location!r})"
+
+
+class StudentStore(_ColumnarStore, Mapping):
+    """Read-only ``student_id -> StudentView`` mapping over column arrays."""
+
+    def __init__(self, records: Iterable[dict]) -> None:
+        super().__init__()
+        records = list(records)
+        self.ids = np.asarray([r["id"] for r in records], dtype=np.int64)
+        self.years = np.asarray([r["year"] for r in records], dtype=np.int16)
+        self.location_codes = np.asarray(
+            [self._locations.code(r["location"]) for r in records], dtype=np.int32
+        )
+        self.skill_indptr, self.skill_ids, self.skill_levels = _skills_to_csr(
+            (r["skills"] for r in records), self._skills
+        )
+        # id -> row via binary search; a dict of a million ints costs ~100 MB
+        self._order = np.argsort(self.ids, kind="stable")
+        self._sorted_ids = self.ids[self._order]
+
+    @classmethod
+    def from_students(cls, students: Iterable[Student]) -> "StudentStore":
+        return cls(
+            {"id": s.id, "skills": s.skills, "year": s.year, "location": s.location}
+            for s in students
+        )
+
+    def row_of(self, student_id: int) -> int:
+        """Row index of *student_id*, -1 if absent."""
+        pos = int(np.searchsorted(self._sorted_ids, student_id))
+        if pos < len(self._sorted_ids) and self._sorted_ids[pos] == student_id:
+            return int(self._order[pos])
+        return -1
+
+    def __getitem__(self, student_id: int) -> StudentView:
+        row = self.row_of(student_id)
+        if row < 0:
+            raise KeyError(student_id)
+        return StudentView(self, row)
+
+    def __contains__(self, student_id) -> bool:
+        return isinstance(student_id, (int, np.integer)) and self.row_of(student_id) >= 0
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self.ids.tolist())
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+
+# ---------- Internships ----------
+
+class InternshipView:
+    """Row of an InternshipStore with the ``Internship`` attribute interface."""
+
+    __slots__ = ("_store", "_row", "_skills")
+
+    def __init__(self, store: "InternshipStore", row: int) -> None:
+        self._store = store
+        self._row = row
+        self._skills = None
+
+    @property
+    def id(self) -> int:
+        return int(self._store.ids[self._row])
+
+    @property
+    def min_year(self) -> int:
+        return int(self._store.min_years[self._row])
+
+    @property
+    def location(self) -> str:
+        return self._store.location_names[self._store.location_codes[self._row]]
+
+    @property
+    def is_remote(self) -> bool:
+        return bool(self._store.is_remote[self._row])
+
+    @property
+    def required_skills(self) -> Dict[str, int]:
+        if self._skills is None:
+            self._skills = self._store.skills_of(self._row)
+        return self._skills
+
+    requires_skill = Internship.requires_skill
+    required_skill_level = Internship.required_skill_level
+
+    def to_internship(self) -> Internship:
+        return Internship(
+            id=self.id, required_skills=self.required_skills, min_year=self.min_year,
+            location=self.location, is_remote=self.is_remote,
+        )
+
+    def __repr__(self) -> str:
+        return f"InternshipView(id={self.id}, location={self.location!r})"
+
+
+class InternshipStore(_ColumnarStore, Sequence):
+    """Internships in load order as column arrays; items are InternshipViews."""
+
+    def __init__(self, records: Iterable[dict]) -> None:
+        super().__init__()
+        records = list(records)
+        self.ids = np.asarray([r["id"] for r in records], dtype=np.int64)
+        self.min_years = np.asarray([r["min_year"] for r in records], dtype=np.int16)
+        self.location_codes = np.asarray(
+            [self._locations.code(r["location"]) for r in records], dtype=np.int32
+        )
+        self.is_remote = np.asarray([r["is_remote"] for r in records], dtype=bool)
+        self.skill_indptr, self.skill_ids, self.skill_levels = _skills_to_csr(
+            (r["required_skills"] for r in records), self._skills
+        )
+
+    def __getitem__(self, row):
+        if isinstance(row, slice):
+            return [InternshipView(self, r) for r in range(*row.indices(len(self)))]
+        if row < 0:
+            row += len(self)
+        if not 0 <= row < len(self):
+            raise IndexError(row)
+        return InternshipView(self, row)
+
+    def __len__(self) -> int:
+        return len(self.ids)
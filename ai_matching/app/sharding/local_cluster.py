@@ -0,0 +1,77 @@
+"""
+Spin up a sharded matching cluster on one machine for testing.
+
+    python -m app.sharding.local_cluster --shards 3 --strategy location
+
+Starts one uvicorn process per shard (ports base_port+1 .. base_port+N),
+each loading only its partition of the catalog, plus the scatter-gather
+router on base_port.  Ctrl+C stops everything.
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+from app.sharding.partition import STRATEGY_DOMAIN, STRATEGY_LOCATION
+
+AI_MATCHING_ROOT = Path(__file__).resolve().parents[2]
+
+
+def _uvicorn(app_path: str, port: int, env: dict) -> subprocess.Popen:
+    return subprocess.Popen(
+        [
+            sys.executable, "-m", "uvicorn", app_path,
+            "--host", "127.0.0.1", "--port", str(port),
+        ],
+        cwd=AI_MATCHING_ROOT,
+        env=env,
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run a local sharded cluster")
+    parser.add_argument("--shards", type=int, default=2)
+    parser.add_argument(
+        "--strategy", choices=[STRATEGY_LOCATION, STRATEGY_DOMAIN],
+        default=STRATEGY_LOCATION,
+    )
+    parser.add_argument("--base-port", type=int, default=8100)
+    args = parser.parse_args()
+
+    procs = []
+    shard_urls = []
+    try:
+        for idx in range(args.shards):
+            port = args.base_port + idx + 1
+            env = dict(
+                os.environ,
+                SHARD_COUNT=str(args.shards),
+                SHARD_INDEX=str(idx),
+                SHARD_STRATEGY=args.strategy,
+            )
+            procs.append(_uvicorn("app.main:app", port, env))
+            shard_urls.append(f"http://127.0.0.1:{port}")
+
+        router_env = dict(
+            os.environ,
+            SHARD_URLS=",".join(shard_urls),
+            SHARD_STRATEGY=args.strategy,
+        )
+        procs.append(_uvicorn("app.sharding.router:app", args.base_port, router_env))
+
+        print(f"Router on http://127.0.0.1:{args.base_port} -> {shard_urls}")
+        for proc in procs:
+            proc.wait()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        for proc in procs:
+            proc.terminate()
+        for proc in procs:
+            proc.wait()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""
+Catalog partitioning for multi-node matching.
+
+Each ai_matching node can serve a single shard of the internship catalog.
+Internships are assigned to shards by a *shard key* -- either the dominant
+skill domain (via SkillGraph) or the location ("remote" for remote roles) --
+hashed with a stable CRC so every node and the router agree on placement
+without any coordination.
+
+A node picks its shard from the environment:
+
+    SHARD_COUNT=3 SHARD_INDEX=0 SHARD_STRATEGY=location uvicorn app.main:app
+
+With SHARD_COUNT unset (or 1) the node serves the whole catalog.
+"""
+
+import os
+import zlib
+from collections import Counter
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+from app.models.internship import Internship
+from app.models.students import Student
+from app.skills.skill_graph import get_skill_graph
+
+STRATEGY_LOCATION = "location"
+STRATEGY_DOMAIN = "domain"
+
+REMOTE_KEY = "remote"
+OTHER_DOMAIN_KEY = "other"
+
+
+@dataclass(frozen=True)
+class ShardConfig:
+    count: int = 1
+    index: int = 0
+    strategy: str = STRATEGY_LOCATION
+
+    @classmethod
+    def from_env(cls) -> "ShardConfig":
+        count = int(os.getenv("SHARD_COUNT", "1"))
+        index = int(os.getenv("SHARD_INDEX", "0"))
+        strategy = os.getenv("SHARD_STRATEGY", STRATEGY_LOCATION)
+        if strategy not in (STRATEGY_LOCATION, STRATEGY_DOMAIN):
+            raise ValueError(f"Unknown SHARD_STRATEGY: {strategy}")
+        if not 0 <= index < max(count, 1):
+            raise ValueError(f"SHARD_INDEX {index} out of range for {count} shards")
+        return cls(count=max(count, 1), index=index, strategy=strategy)
+
+    @property
+    def enabled(self) -> bool:
+        return self.count > 1
+
+
+def _dominant_domain(skills: Dict[str, int]) -> str:
+    graph = get_skill_graph()
+    domains = Counter(
+        d for d in (graph.get_domain(s) for s in skills) if d
+    )
+    if not domains:
+        return OTHER_DOMAIN_KEY
+    # Break ties alphabetically so the key doesn't depend on dict order.
+    top = max(domains.values())
+    return sorted(d for d, n in domains.items() if n == top)[0].lower()
+
+
+def internship_shard_key(internship: Internship, strategy: str) -> str:
+    if strategy == STRATEGY_DOMAIN:
+        return _dominant_domain(internship.required_skills)
+    if internship.is_remote:
+        return REMOTE_KEY
+    return internship.location.strip().lower()
+
+
+def shard_for_key(key: str, shard_count: int) -> int:
+    return zlib.crc32(key.encode("utf-8")) % shard_count
+
+
+def partition_internships(
+    internships: List[Internship],
+    shard_count: int,
+    strategy: str = STRATEGY_LOCATION,
+) -> Dict[int, List[Internship]]:
+    shards: Dict[int, List[Internship]] = {i: [] for i in range(shard_count)}
+    for internship in internships:
+        key = internship_shard_key(internship, strategy)
+        shards[shard_for_key(key, shard_count)].append(internship)
+    return shards
+
+
+def local_partition(
+    internships: List[Internship],
+    config: Optional[ShardConfig] = None,
+) -> List[Internship]:
+    """Internships owned by this node (all of them when sharding is off)."""
+    config = config or ShardConfig.from_env()
+    if not config.enabled:
+        return internships
+    return partition_internships(
+        internships, config.count, config.strategy
+    )[config.index]
+
+
+def shards_for_student(
+    student: Student,
+    shard_count: int,
+    strategy: str = STRATEGY_LOCATION,
+) -> List[int]:
+    """
+    Shards that can hold an eligible / relevant internship for *student*.
+
+    location: the student's city plus wherever remote roles live.
+    domain:   every domain the student has a skill in, plus the catch-all.
+    """
+    if strategy == STRATEGY_DOMAIN:
+        graph = get_skill_graph()
+        keys = {
+            d.lower() for d in (graph.get_domain(s) for s in student.skills) if d
+        }
+        keys.add(OTHER_DOMAIN_KEY)
+    else:
+        keys = {student.location.strip().lower(), REMOTE_KEY}
+
+    return sorted({shard_for_key(k, shard_count) for k in keys})
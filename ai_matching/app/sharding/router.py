@@ -0,0 +1,184 @@
+"""
+Scatter-gather router in front of sharded ai_matching nodes.
+
+Fans a recommendation request out to the relevant shards in parallel,
+waits up to a timeout, and merges whatever top-K lists came back.  Shards
+that fail or time out are reported and the response is marked partial
+instead of failing the whole request.
+
+Run with:
+
+    SHARD_URLS=http://127.0.0.1:8101,http://127.0.0.1:8102 \
+    SHARD_STRATEGY=location uvicorn app.sharding.router:app --port 8100
+"""
+
+import asyncio
+import heapq
+import itertools
+import os
+from typing import Dict, List, Optional
+
+import httpx
+from fastapi import FastAPI, HTTPException
+
+from app.data_loader import load_students
+from app.sharding.partition import STRATEGY_LOCATION, shards_for_student
+
+DEFAULT_SHARD_TIMEOUT_MS = 2000.0
+
+
+def merge_top_k(
+    shard_payloads: List[dict],
+    top_n: int,
+    score_key: str = "final_score",
+) -> List[dict]:
+    """
+    Merge per-shard ``recommendations`` lists into one global top-N.
+
+    *score_key* must mean the same on every shard: for /recommend/hybrid
+    that is ``final_score``, the hybrid score, which doesn't depend on the
+    rerank path a shard took.  A reranked shard's list is not sorted by
+    that score, so candidates are ranked by it across all shards rather
+    than merged as sorted runs; ties keep shard order.
+    """
+    candidates = itertools.chain.from_iterable(
+        payload.get("recommendations", []) for payload in shard_payloads
+    )
+    return heapq.nlargest(top_n, candidates, key=lambda r: r.get(score_key, 0))
+
+
+async def scatter_gather(
+    shard_urls: Dict[int, str],
+    path: str,
+    params: dict,
+    timeout_ms: float,
+    client: Optional[httpx.AsyncClient] = None,
+) -> dict:
+    """
+    GET *path* on every shard concurrently.
+
+    Returns {"payloads": [...], "failed": [...], "timed_out": [...]}.
+    """
+    owns_client = client is None
+    client = client or httpx.AsyncClient()
+    try:
+        tasks = {
+            asyncio.ensure_future(client.get(f"{url}{path}", params=params)): idx
+            for idx, url in shard_urls.items()
+        }
+        done, pending = await asyncio.wait(
+            tasks.keys(), timeout=timeout_ms / 1000
+        )
+        for task in pending:
+            task.cancel()
+
+        payloads, failed = [], []
+        for task in done:
+            idx = tasks[task]
+            try:
+                response = task.result()
+                response.raise_for_status()
+                payload = response.json()
+            except (httpx.HTTPError, ValueError):
+                failed.append(idx)
+                continue
+            if "error" in payload:
+                failed.append(idx)
+                continue
+            payloads.append(payload)
+
+        return {
+            "payloads": payloads,
+            "failed": sorted(failed),
+            "timed_out": sorted(tasks[t] for t in pending),
+        }
+    finally:
+        if owns_client:
+            await client.aclose()
+
+
+def _shard_urls_from_env() -> List[str]:
+    raw = os.getenv("SHARD_URLS", "")
+    return [u.strip().rstrip("/") for u in raw.split(",") if u.strip()]
+
+
+app = FastAPI(
+    title="AI Matching Shard Router",
+    description="Scatter-gather over sharded AI Matching nodes",
+    version="1.0"
+)
+
+shard_urls = _shard_urls_from_env()
+shard_strategy = os.getenv("SHARD_STRATEGY", STRATEGY_LOCATION)
+students_db = load_students()
+
+
+@app.get("/")
+def root():
+    return {"status": "Shard router is running", "shards": len(shard_urls)}
+
+
+async def _route(
+    path: str,
+    student_id: int,
+    top_n: int,
+    timeout_ms: float,
+    score_key: str,
+    fanout: str,
+    extra_params: Optional[dict] = None,
+):
+    if not shard_urls:
+        raise HTTPException(status_code=503, detail="No shards configured")
+    if student_id not in students_db:
+        raise HTTPException(status_code=404, detail="Student not found")
+
+    if fanout == "all":
+        targets = list(range(len(shard_urls)))
+    else:
+        targets = shards_for_student(
+            students_db[student_id], len(shard_urls), shard_strategy
+        )
+
+    params = {"student_id": student_id, "top_n": top_n, **(extra_params or {})}
+    gathered = await scatter_gather(
+        {i: shard_urls[i] for i in targets}, path, params, timeout_ms
+    )
+
+    return {
+        "student_id": student_id,
+        "recommendations": merge_top_k(gathered["payloads"], top_n, score_key),
+        "partial": bool(gathered["failed"] or gathered["timed_out"]),
+        "shards": {
+            "queried": targets,
+            "responded": len(gathered["payloads"]),
+            "failed": gathered["failed"],
+            "timed_out": gathered["timed_out"],
+        },
+    }
+
+
+@app.get("/recommend")
+async def recommend(
+    student_id: int,
+    top_n: int = 5,
+    timeout_ms: float = DEFAULT_SHARD_TIMEOUT_MS,
+    fanout: str = "relevant",
+):
+    return await _route(
+        "/recommend", student_id, top_n, timeout_ms, "score", fanout
+    )
+
+
+@app.get("/recommend/hybrid")
+async def recommend_hybrid(
+    student_id: int,
+    top_n: int = 5,
+    timeout_ms: float = DEFAULT_SHARD_TIMEOUT_MS,
+    fanout: str = "relevant",
+    budget_ms: Optional[float] = None,
+):
+    extra = {"budget_ms": budget_ms} if budget_ms is not None else None
+    return await _route(
+        "/recommend/hybrid", student_id, top_n, timeout_ms,
+        "final_score", fanout, extra,
+    )
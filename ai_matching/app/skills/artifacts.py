@@ -0,0 +1,158 @@
+"""
+Compiled SkillGraph artifacts, cached on disk by taxonomy content hash.
+
+Everything derived from the taxonomy is deterministic given its content,
+so it is built once and stored under
+
+    .cache/skill_graph/<content_hash>/
+        ids.json                  skill/category name -> row id
+        credit.npy                hierarchy_credit for every (student, required) pair
+        embeddings-<model>.npy    L2-normalised skill-name embeddings
+        faiss-<model>.index       FAISS inner-product index over those
+
+A restart with an unchanged taxonomy loads these instead of re-encoding.
+Editing the taxonomy changes the hash, so stale files are never reused.
+Writes go to a temp file + os.replace, so concurrent workers can't see a
+half-written artifact.
+"""
+
+import json
+import logging
+import os
+import re
+import threading
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+AI_MATCHING_ROOT = Path(__file__).resolve().parents[2]
+ARTIFACT_ROOT = Path(os.getenv(
+    "SKILL_ARTIFACT_DIR", AI_MATCHING_ROOT / ".cache" / "skill_graph"
+))
+
+
+def _save_npy(path: str, array: np.ndarray) -> None:
+    # np.save(path) would append ".npy" to the temp name
+    with open(path, "wb") as f:
+        np.save(f, array)
+
+
+def _slug(model_name: str) -> str:
+    return re.sub(r"[^A-Za-z0-9_.-]+", "_", model_name)
+
+
+class GraphArtifacts:
+    """Lazy, disk-cached artifacts for one SkillGraph."""
+
+    def __init__(self, graph, root: Optional[Path] = None) -> None:
+        self.graph = graph
+        self.dir = Path(root or ARTIFACT_ROOT) / graph.content_hash
+        self._lock = threading.Lock()
+        self._ids: Optional[Dict[str, int]] = None
+        self._credit: Optional[List[List[float]]] = None
+
+    # ---------- helpers ----------
+
+    def _write_atomic(self, path: Path, write: Callable[[str], None]) -> None:
+        try:
+            self.dir.mkdir(parents=True, exist_ok=True)
+            tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            write(tmp)
+            os.replace(tmp, path)
+        except OSError as e:
+            # Read-only checkout etc. -- the artifact still works in memory
+            logger.warning(f"Could not cache {path.name}: {e}")
+
+    # ---------- ID maps ----------
+
+    def ids(self) -> Dict[str, int]:
+        """Every canonical skill and category -> dense row id."""
+        if self._ids is None:
+            path = self.dir / "ids.json"
+            if path.exists():
+                ids = json.loads(path.read_text(encoding="utf-8"))
+            else:
+                names = set(self.graph.all_canonical_skills())
+                names |= {
+                    p for p in map(self.graph.get_parent, list(names)) if p
+                }
+                ids = {name: i for i, name in enumerate(sorted(names))}
+
+                def write(tmp):
+                    with open(tmp, "w", encoding="utf-8") as f:
+                        json.dump(ids, f)
+                self._write_atomic(path, write)
+            self._ids = ids
+        return self._ids
+
+    # ---------- Credit matrix ----------
+
+    def credit_matrix(self) -> List[List[float]]:
+        """
+        credit[student_id][required_id] for every known pair.
+
+        Kept as nested lists: scalar indexing is what the matcher does, and
+        that is faster on lists than on an ndarray.
+        """
+        if self._credit is None:
+            with self._lock:
+                if self._credit is None:
+                    self._credit = self._load_credit().tolist()
+        return self._credit
+
+    def _load_credit(self) -> np.ndarray:
+        path = self.dir / "credit.npy"
+        ids = self.ids()
+        if path.exists():
+            matrix = np.load(path)
+            if matrix.shape == (len(ids), len(ids)):
+                return matrix
+
+        names = sorted(ids, key=ids.get)
+        matrix = np.array(
+            [[self.graph.compute_credit(s, r) for r in names] for s in names],
+            dtype=np.float64,
+        )
+        self._write_atomic(path, lambda tmp: _save_npy(tmp, matrix))
+        return matrix
+
+    # ---------- Embeddings / FAISS ----------
+
+    def skill_embeddings(
+        self, model_name: str, skills: List[str], encode: Callable,
+    ) -> np.ndarray:
+        """
+        L2-normalised float32 embeddings of *skills* for *model_name*.
+
+        *encode* (list -> matrix) only runs on a cache miss.
+        """
+        path = self.dir / f"embeddings-{_slug(model_name)}.npy"
+        if path.exists():
+            cached = np.load(path)
+            if cached.shape[0] == len(skills):
+                return cached
+
+        logger.info(f"Encoding {len(skills)} skills with {model_name} (cache miss)")
+        vectors = np.asarray(encode(skills), dtype=np.float32)
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        vectors = vectors / np.maximum(norms, 1e-12)
+        self._write_atomic(path, lambda tmp: _save_npy(tmp, vectors))
+        return vectors
+
+    def faiss_index(self, model_name: str, embeddings: np.ndarray):
+        """Inner-product FAISS index over *embeddings*, cached on disk."""
+        import faiss
+
+        path = self.dir / f"faiss-{_slug(model_name)}.index"
+        if path.exists():
+            index = faiss.read_index(str(path))
+            if index.ntotal == embeddings.shape[0]:
+                return index
+
+        index = faiss.IndexFlatIP(embeddings.shape[1])
+        index.add(np.ascontiguousarray(embeddings, dtype=np.float32))
+        self._write_atomic(path, lambda tmp: faiss.write_index(index, tmp))
+        return index
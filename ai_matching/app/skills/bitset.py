@@ -0,0 +1,177 @@
+"""
+Skill sets as bitmaps.
+
+Every canonical skill gets a bit position, so a skill set is a Python int
+and the hot set operations become single bitwise ops:
+
+    stack detection     (mask & stack) == stack
+    exact overlap       (student & required).bit_count()
+    missing skills      required & ~student
+
+For many students at once the same masks are laid out as an (n, words)
+NumPy uint64 matrix and the checks run column-wise without a Python loop.
+"""
+
+import threading
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+
+from app.skills.skill_graph import SkillGraph, get_skill_graph
+
+WORD_BITS = 64
+
+
+def _popcount_rows(words: np.ndarray) -> np.ndarray:
+    """Set bits per row of a (n, words) uint64 matrix."""
+    if hasattr(np, "bitwise_count"):
+        return np.bitwise_count(words).sum(axis=1, dtype=np.int64)
+    as_bytes = np.ascontiguousarray(words).view(np.uint8)
+    return np.unpackbits(as_bytes, axis=1).sum(axis=1, dtype=np.int64)
+
+
+class SkillBitIndex:
+    """
+    Canonical skill -> bit position, plus precomputed stack masks.
+
+    Skills the graph doesn't know get the next free bit on first sight,
+    so overlap/missing stay exact for free-text skills too.  Bits are never
+    freed, so per-request callers pass grow=False.
+    """
+
+    def __init__(self, graph: Optional[SkillGraph] = None) -> None:
+        self.graph = graph or get_skill_graph()
+
+        stacks = self.graph.tech_stacks
+        names = set(self.graph.all_canonical_skills())
+        for members in stacks.values():
+            names |= members
+        self._bit: Dict[str, int] = {s: i for i, s in enumerate(sorted(names))}
+        self._names: List[str] = sorted(names)
+        self._lock = threading.Lock()
+
+        self.stack_names: List[str] = sorted(stacks)
+        self.stack_masks: List[int] = [
+            self.mask(stacks[name], normalized=True) for name in self.stack_names
+        ]
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    # ------------------------------------------------------------------
+    # Scalar (Python int) API
+    # ------------------------------------------------------------------
+
+    def bit(self, skill: str) -> int:
+        pos = self._bit.get(skill)
+        if pos is None:
+            with self._lock:
+                pos = self._bit.get(skill)
+                if pos is None:
+                    pos = len(self._names)
+                    self._names.append(skill)
+                    self._bit[skill] = pos
+        return pos
+
+    def mask(
+        self, skills: Iterable[str], normalized: bool = False, grow: bool = True,
+    ) -> int:
+        """
+        Bitmap for *skills*; pass normalized=True for canonical names.
+
+        With grow=False unknown skills are skipped instead of being given
+        a bit (enough for stack detection, which only uses known skills).
+        """
+        if not normalized:
+            skills = (self.graph.normalize(s) for s in skills)
+        m = 0
+        for skill in skills:
+            pos = self._bit.get(skill)
+            if pos is None:
+                if not grow:
+                    continue
+                pos = self.bit(skill)
+            m |= 1 << pos
+        return m
+
+    def names(self, mask: int) -> List[str]:
+        """Canonical names for every set bit, in bit order."""
+        out: List[str] = []
+        while mask:
+            low = mask & -mask
+            out.append(self._names[low.bit_length() - 1])
+            mask ^= low
+        return out
+
+    def has(self, mask: int, skill: str) -> bool:
+        pos = self._bit.get(skill)
+        return pos is not None and (mask >> pos) & 1 == 1
+
+    def detect_stacks(self, mask: int) -> List[str]:
+        """Stack names fully covered by *mask* (sorted, like SkillGraph)."""
+        return [
+            name for name, stack in zip(self.stack_names, self.stack_masks)
+            if mask & stack == stack
+        ]
+
+    @staticmethod
+    def overlap_count(a: int, b: int) -> int:
+        return (a & b).bit_count()
+
+    @staticmethod
+    def missing(student_mask: int, required_mask: int) -> int:
+        return required_mask & ~student_mask
+
+    # ------------------------------------------------------------------
+    # Vectorized (NumPy uint64) API
+    # ------------------------------------------------------------------
+
+    def words(self) -> int:
+        return (len(self._names) + WORD_BITS - 1) // WORD_BITS
+
+    def to_words(self, masks: List[int], n_words: Optional[int] = None) -> np.ndarray:
+        """Pack Python-int masks into an (n, words) uint64 matrix."""
+        n_words = n_words or self.words()
+        out = np.zeros((len(masks), n_words), dtype=np.uint64)
+        low = (1 << WORD_BITS) - 1
+        for row, m in enumerate(masks):
+            for w in range(n_words):
+                if not m:
+                    break
+                out[row, w] = m & low
+                m >>= WORD_BITS
+        return out
+
+    def stacks_matrix(self, student_words: np.ndarray) -> np.ndarray:
+        """(n_students, n_stacks) bool: which stacks each student covers."""
+        stacks = self.to_words(self.stack_masks, student_words.shape[1])
+        covered = (student_words[:, None, :] & stacks[None, :, :]) == stacks[None, :, :]
+        return covered.all(axis=2)
+
+    def detect_stacks_many(self, masks: List[int]) -> List[List[str]]:
+        covered = self.stacks_matrix(self.to_words(masks))
+        return [
+            [self.stack_names[j] for j in np.flatnonzero(row)] for row in covered
+        ]
+
+    def overlap_counts(self, student_words: np.ndarray, required_mask: int) -> np.ndarray:
+        """Exact-skill overlap of every student row with one requirement set."""
+        required = self.to_words([required_mask], student_words.shape[1])
+        return _popcount_rows(student_words & required)
+
+    def missing_counts(self, student_words: np.ndarray, required_mask: int) -> np.ndarray:
+        """How many required skills each student lacks."""
+        n_words = max(
+            student_words.shape[1],
+            (required_mask.bit_length() + WORD_BITS - 1) // WORD_BITS,
+        )
+        if n_words > student_words.shape[1]:
+            pad = n_words - student_words.shape[1]
+            student_words = np.pad(student_words, ((0, 0), (0, pad)))
+        required = self.to_words([required_mask], n_words)
+        return _popcount_rows(required & ~student_words)
+
+
+def get_skill_bit_index() -> SkillBitIndex:
+    """The bit index of the SkillGraph singleton."""
+    return get_skill_graph().bit_index
@@ -0,0 +1,257 @@
+"""
+Fallback resolution for skill names the taxonomy doesn't know verbatim.
+
+``SkillGraph.normalize`` only consults the exact/synonym map, so free text
+like "pyton" or "ReactJs developer" comes back unchanged and earns zero
+credit.  The resolver tries, in order:
+
+    1. exact / synonym map          (SkillGraph.lookup, plus category names)
+    2. rapidfuzz ratio              against every known variant
+    3. embedding nearest neighbour  against canonical skill embeddings
+
+Every answer -- including "no match" -- is memoised twice: a bounded
+in-process LRU, and a sqlite table shared by all workers and restarts.
+Both are keyed by the taxonomy content hash, so editing the taxonomy
+never serves stale resolutions.
+"""
+
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, Optional
+
+import numpy as np
+from rapidfuzz import fuzz, process as rfprocess
+
+from app.skills.artifacts import AI_MATCHING_ROOT
+from app.skills.skill_graph import SkillGraph, get_skill_graph
+
+logger = logging.getLogger(__name__)
+
+RESOLVER_DB_PATH = Path(os.getenv(
+    "SKILL_RESOLVER_DB", AI_MATCHING_ROOT / ".cache" / "skill_resolver.sqlite3"
+))
+RESOLVER_LRU_SIZE = 4096
+
+# Plain edit-distance ratio: catches typos and spacing ("pyton",
+# "postgre sql").  WRatio's partial matching is too loose here
+# ("solid.js" -> "js", "deep learning" -> "react native").
+FUZZY_SCORE_CUTOFF = 88
+FUZZY_MIN_LEN = 3
+EMBEDDING_MODEL = "all-MiniLM-L6-v2"
+EMBEDDING_THRESHOLD = 0.75  # same bar as the resume parser's FAISS stage
+# After an encoder error, skip the embedding stage this long before retrying
+EMBEDDING_RETRY_S = float(os.getenv("SKILL_RESOLVER_EMBEDDING_RETRY_S", "60"))
+
+SOURCE_EXACT = "exact"
+SOURCE_FUZZY = "fuzzy"
+SOURCE_EMBEDDING = "embedding"
+SOURCE_MISS = "miss"
+
+
+@dataclass(frozen=True)
+class Resolution:
+    raw: str
+    canonical: Optional[str]
+    source: str
+    score: float = 0.0
+
+
+class _ResolutionStore:
+    """sqlite-backed (taxonomy_hash, key) -> Resolution table."""
+
+    def __init__(self, path: Path) -> None:
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(path), timeout=5, check_same_thread=False)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS skill_resolutions ("
+                " taxonomy_hash TEXT NOT NULL,"
+                " raw_key TEXT NOT NULL,"
+                " canonical TEXT,"
+                " source TEXT NOT NULL,"
+                " score REAL NOT NULL,"
+                " PRIMARY KEY (taxonomy_hash, raw_key))"
+            )
+            self._conn.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"Skill resolver store disabled ({path}): {e}")
+            self._conn = None
+
+    def get(self, taxonomy_hash: str, key: str) -> Optional[Resolution]:
+        if self._conn is None:
+            return None
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT canonical, source, score FROM skill_resolutions"
+                " WHERE taxonomy_hash = ? AND raw_key = ?",
+                (taxonomy_hash, key),
+            ).fetchone()
+        if row is None:
+            return None
+        return Resolution(key, row[0], row[1], row[2])
+
+    def put(self, taxonomy_hash: str, key: str, res: Resolution) -> None:
+        if self._conn is None:
+            return
+        try:
+            with self._lock:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO skill_resolutions VALUES (?, ?, ?, ?, ?)",
+                    (taxonomy_hash, key, res.canonical, res.source, res.score),
+                )
+                self._conn.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"Could not persist skill resolution for {key!r}: {e}")
+
+
+class SkillResolver:
+    """Exact -> fuzzy -> embedding resolution with LRU + persistent memo."""
+
+    def __init__(
+        self,
+        graph: Optional[SkillGraph] = None,
+        db_path: Optional[Path] = None,
+        lru_size: int = RESOLVER_LRU_SIZE,
+        encode: Optional[Callable] = None,
+        use_embeddings: bool = True,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.graph = graph or get_skill_graph()
+        self._store = _ResolutionStore(Path(db_path or RESOLVER_DB_PATH))
+        self._lru: "OrderedDict[str, Resolution]" = OrderedDict()
+        self._lru_size = lru_size
+        self._lock = threading.Lock()
+
+        # Category / domain names are valid requirements too ("Deep Learning")
+        self._groups: Dict[str, str] = {
+            name.lower(): name
+            for name in self.graph.all_categories() | self.graph.all_domains()
+        }
+        self._variant_to_canon: Dict[str, str] = {
+            **self._groups, **self.graph.get_synonym_map()
+        }
+        self._variants = list(self._variant_to_canon)
+
+        self._encode = encode
+        self._use_embeddings = use_embeddings
+        self._clock = clock
+        self._embeddings_retry_at = 0.0
+        self._skills = self.graph.all_canonical_skills()
+        self._skill_vectors: Optional[np.ndarray] = None
+
+    # ---------- public API ----------
+
+    def resolve(self, raw: str) -> str:
+        """Canonical name for *raw*, or *raw* unchanged if nothing is close."""
+        exact = self._exact(raw)
+        if exact is not None:
+            return exact
+        return self.resolve_with_source(raw).canonical or raw
+
+    def resolve_with_source(self, raw: str) -> Resolution:
+        exact = self._exact(raw)
+        if exact is not None:
+            return Resolution(raw, exact, SOURCE_EXACT, 100.0)
+
+        key = " ".join(raw.lower().split())
+        with self._lock:
+            cached = self._lru.get(key)
+            if cached is not None:
+                self._lru.move_to_end(key)
+                return cached
+
+        res = self._store.get(self.graph.content_hash, key)
+        if res is None:
+            res = self._resolve_uncached(key)
+            # A miss without the embedding stage isn't final -- don't pin it
+            if res.source == SOURCE_MISS and not self._embeddings_on():
+                return res
+            self._store.put(self.graph.content_hash, key, res)
+
+        with self._lock:
+            self._lru[key] = res
+            if len(self._lru) > self._lru_size:
+                self._lru.popitem(last=False)
+        return res
+
+    # ---------- stages ----------
+
+    def _exact(self, raw: str) -> Optional[str]:
+        canon = self.graph.lookup(raw)
+        if canon is None:
+            canon = self._groups.get(raw.lower().strip())
+        return canon
+
+    def _resolve_uncached(self, key: str) -> Resolution:
+        if len(key) >= FUZZY_MIN_LEN:
+            match = rfprocess.extractOne(
+                key, self._variants, scorer=fuzz.ratio,
+                score_cutoff=FUZZY_SCORE_CUTOFF,
+            )
+            if match:
+                variant, score, _ = match
+                return Resolution(
+                    key, self._variant_to_canon[variant], SOURCE_FUZZY, float(score)
+                )
+
+        nearest = self._nearest_by_embedding(key)
+        if nearest is not None:
+            return nearest
+        return Resolution(key, None, SOURCE_MISS)
+
+    def _embeddings_on(self) -> bool:
+        return self._use_embeddings and self._clock() >= self._embeddings_retry_at
+
+    def _nearest_by_embedding(self, key: str) -> Optional[Resolution]:
+        if not self._embeddings_on():
+            return None
+        try:
+            vectors = self._canonical_vectors()
+            query = np.asarray(self._encoder()([key]), dtype=np.float32)[0]
+        except Exception as e:
+            # Model missing or model server down -- fuzzy-only for a while
+            logger.warning(
+                f"Embedding skill resolution off for {EMBEDDING_RETRY_S:.0f}s: {e}"
+            )
+            self._embeddings_retry_at = self._clock() + EMBEDDING_RETRY_S
+            return None
+
+        query = query / max(float(np.linalg.norm(query)), 1e-12)
+        sims = vectors @ query
+        best = int(np.argmax(sims))
+        if sims[best] < EMBEDDING_THRESHOLD:
+            return None
+        return Resolution(key, self._skills[best], SOURCE_EMBEDDING, float(sims[best]))
+
+    def _encoder(self) -> Callable:
+        if self._encode is None:
+            from app.model_server.client import SharedSentenceEncoder
+            self._encode = SharedSentenceEncoder(EMBEDDING_MODEL).encode
+        return self._encode
+
+    def _canonical_vectors(self) -> np.ndarray:
+        if self._skill_vectors is None:
+            self._skill_vectors = self.graph.artifacts.skill_embeddings(
+                EMBEDDING_MODEL, self._skills, self._encoder()
+            )
+        return self._skill_vectors
+
+
+_resolver: Optional[SkillResolver] = None
+
+
+def get_skill_resolver() -> SkillResolver:
+    """SkillResolver for the current SkillGraph (rebuilt after a reload)."""
+    global _resolver
+    graph = get_skill_graph()
+    if _resolver is None or _resolver.graph is not graph:
+        _resolver = SkillResolver(graph)
+    return _resolver
@@ -4,293 +4,72 @@ Unified Skill Graph -- single source of truth for the entire matching pipeline.
 Three-level hierarchy:  Domain -> Category -> Skill
 Also provides synonym resolution, tech stack detection, and hierarchy distance.
 
-Phase-1: Static / in-memory.  A DB-backed version can wrap this later.
+The taxonomy itself lives in ``data/taxonomy.json`` (override with
+SKILL_TAXONOMY_PATH).  Each graph carries a ``content_hash`` of that data;
+derived artifacts (ID maps, credit matrix, skill embeddings, FAISS index)
+are compiled once per hash and cached on disk -- see ``artifacts.py``.
+
+``reload_skill_graph()`` swaps in a freshly loaded graph atomically, and
+``get_skill_graph()`` notices when the taxonomy file changes, so every
+worker picks up an edit without a restart.
 """
 
 from __future__ import annotations
 
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
 from typing import Dict, FrozenSet, List, Optional, Set, Tuple
 
+logger = logging.getLogger(__name__)
 
-# ---------------------------------------------------------------------------
-# Hierarchy:  domain  ->  category  ->  [skills]
-# ---------------------------------------------------------------------------
+TAXONOMY_PATH = Path(os.getenv(
+    "SKILL_TAXONOMY_PATH",
+    Path(__file__).resolve().parent / "data" / "taxonomy.json",
+))
 
-DOMAIN_HIERARCHY: Dict[str, Dict[str, List[str]]] = {
-    "Web Development": {
-        "Frontend": [
-            "React", "Angular", "Vue", "Svelte", "Next.js", "Nuxt.js",
-            "HTML", "CSS", "SCSS", "SASS", "Tailwind CSS", "Bootstrap",
-            "jQuery", "Redux", "Webpack", "Vite",
-        ],
-        "Backend": [
-            "Node.js", "Express.js", "Django", "Flask", "FastAPI",
-            "Spring Boot", "ASP.NET", "Ruby on Rails", "Laravel",
-            "Symfony", "NestJS",
-        ],
-    },
-    "Data Science": {
-        "Machine Learning": [
-            "Scikit-learn", "XGBoost", "LightGBM",
-        ],
-        "Deep Learning": [
-            "TensorFlow", "PyTorch", "Keras",
-        ],
-        "NLP": [
-            "spaCy", "NLTK", "Hugging Face", "RAG", "LLM Fine-tuning",
-        ],
-        "Computer Vision": [
-            "OpenCV", "YOLO",
-        ],
-        "Data Analysis": [
-            "Pandas", "NumPy", "Matplotlib", "Statistics", "Data Analysis",
-        ],
-    },
-    "DevOps": {
-        "Containerization": [
-            "Docker", "Kubernetes", "Podman",
-        ],
-        "CI/CD": [
-            "Jenkins", "GitHub Actions", "GitLab CI", "CircleCI", "Travis CI",
-        ],
-        "Cloud": [
-            "AWS", "Azure", "Google Cloud", "Terraform", "Ansible",
-        ],
-    },
-    "Databases": {
-        "Relational": [
-            "PostgreSQL", "MySQL", "SQLite", "Oracle", "MariaDB",
-            "Microsoft SQL Server",
-        ],
-        "NoSQL": [
-            "MongoDB", "Redis", "Cassandra", "DynamoDB", "Firebase",
-        ],
-        "Search": [
-            "Elasticsearch",
-        ],
-    },
-    "Mobile Development": {
-        "Cross-Platform": [
-            "React Native", "Flutter", "Xamarin",
-        ],
-        "Native": [
-            "iOS", "Swift", "Android", "Kotlin",
-        ],
-    },
-    "Programming Languages": {
-        "Languages": [
-            "Python", "JavaScript", "TypeScript", "Java", "C++", "C#",
-            "Go", "Rust", "Ruby", "PHP", "Scala", "R", "MATLAB", "Perl",
-        ],
-    },
-    "Tools & Methodologies": {
-        "Version Control": [
-            "Git", "GitHub", "GitLab", "Bitbucket",
-        ],
-        "Project Management": [
-            "Jira", "Confluence", "Agile", "Scrum",
-        ],
-        "OS & Scripting": [
-            "Linux", "Unix", "Bash", "Shell Scripting",
-        ],
-        "Architecture": [
-            "REST API", "GraphQL", "Microservices", "CI/CD",
-            "Test-Driven Development", "Object-Oriented Programming",
-            "Functional Programming",
-        ],
-        "Servers": [
-            "Nginx", "Apache",
-        ],
-    },
-    "Design & Analytics": {
-        "Design": [
-            "Figma", "Sketch", "Photoshop",
-        ],
-        "Analytics": [
-            "Power BI", "Tableau", "Excel", "VBA",
-        ],
-        "Platforms": [
-            "WordPress", "Shopify", "Salesforce", "SAP",
-        ],
-    },
-}
+# How often get_skill_graph() checks the taxonomy file for edits
+RELOAD_CHECK_INTERVAL_S = float(os.getenv("SKILL_TAXONOMY_CHECK_S", "5"))
 
 
 # ---------------------------------------------------------------------------
-# Synonym map  (lowercased variant -> canonical name)
+# Taxonomy data
 # ---------------------------------------------------------------------------
 
-SYNONYMS: Dict[str, str] = {
-    # Python
-    "py": "Python",
-    "python3": "Python",
-    "python 3": "Python",
-    "cpython": "Python",
-    # JavaScript
-    "js": "JavaScript",
-    "es6": "JavaScript",
-    "es2015": "JavaScript",
-    "ecmascript": "JavaScript",
-    "vanilla js": "JavaScript",
-    # TypeScript
-    "ts": "TypeScript",
-    # Java
-    "java se": "Java",
-    "java ee": "Java",
-    "core java": "Java",
-    # C++
-    "cpp": "C++",
-    "c plus plus": "C++",
-    # C#
-    "csharp": "C#",
-    "c sharp": "C#",
-    # Go
-    "golang": "Go",
-    # Rust
-    "rustlang": "Rust",
-    # React
-    "react.js": "React",
-    "reactjs": "React",
-    "react js": "React",
-    # Angular
-    "angularjs": "Angular",
-    "angular.js": "Angular",
-    "angular js": "Angular",
-    # Vue
-    "vue.js": "Vue",
-    "vuejs": "Vue",
-    "vue js": "Vue",
-    # Svelte
-    "sveltejs": "Svelte",
-    "svelte.js": "Svelte",
-    # Next.js
-    "nextjs": "Next.js",
-    "next js": "Next.js",
-    "next.js": "Next.js",
-    # Nuxt.js
-    "nuxtjs": "Nuxt.js",
-    "nuxt js": "Nuxt.js",
-    "nuxt.js": "Nuxt.js",
-    # Node.js
-    "node": "Node.js",
-    "nodejs": "Node.js",
-    "node.js": "Node.js",
-    "node js": "Node.js",
-    # Express.js
-    "express": "Express.js",
-    "expressjs": "Express.js",
-    "express.js": "Express.js",
-    # NestJS
-    "nestjs": "NestJS",
-    "nest.js": "NestJS",
-    "nest js": "NestJS",
-    # Django
-    "django rest framework": "Django",
-    "drf": "Django",
-    # Flask
-    "flask api": "Flask",
-    # Spring Boot
-    "spring": "Spring Boot",
-    "spring framework": "Spring Boot",
-    # Databases
-    "postgres": "PostgreSQL",
-    "postgresql": "PostgreSQL",
-    "pg": "PostgreSQL",
-    "mysql db": "MySQL",
-    "mongo": "MongoDB",
-    "mongodb": "MongoDB",
-    "mongo db": "MongoDB",
-    "dynamodb": "DynamoDB",
-    "dynamo db": "DynamoDB",
-    "redis cache": "Redis",
-    "mssql": "Microsoft SQL Server",
-    "sql server": "Microsoft SQL Server",
-    "mariadb": "MariaDB",
-    "maria db": "MariaDB",
-    # DevOps / Cloud
-    "k8s": "Kubernetes",
-    "kube": "Kubernetes",
-    "aws ec2": "AWS",
-    "amazon web services": "AWS",
-    "azure cloud": "Azure",
-    "microsoft azure": "Azure",
-    "gcp": "Google Cloud",
-    "google cloud platform": "Google Cloud",
-    # ML / Data Science
-    "ml": "Machine Learning",
-    "ai": "Machine Learning",
-    "artificial intelligence": "Machine Learning",
-    "dl": "Deep Learning",
-    "deep neural network": "Deep Learning",
-    "dnn": "Deep Learning",
-    "tf": "TensorFlow",
-    "tensorflow 2": "TensorFlow",
-    "sklearn": "Scikit-learn",
-    "scikit learn": "Scikit-learn",
-    "sci-kit learn": "Scikit-learn",
-    "nlp": "NLP",
-    "natural language processing": "NLP",
-    "cv": "Computer Vision",
-    "computer vision": "Computer Vision",
-    "rag": "RAG",
-    "retrieval augmented generation": "RAG",
-    "llm": "LLM Fine-tuning",
-    "large language model": "LLM Fine-tuning",
-    "huggingface": "Hugging Face",
-    "hugging face": "Hugging Face",
-    "hf": "Hugging Face",
-    "xgb": "XGBoost",
-    "lgbm": "LightGBM",
-    "light gbm": "LightGBM",
-    # Frontend misc
-    "html5": "HTML",
-    "css3": "CSS",
-    "sass": "SASS",
-    "scss": "SCSS",
-    "tailwind": "Tailwind CSS",
-    "tailwindcss": "Tailwind CSS",
-    # Tools
-    "ci cd": "CI/CD",
-    "ci/cd": "CI/CD",
-    "github actions": "GitHub Actions",
-    "gh actions": "GitHub Actions",
-    "gitlab ci": "GitLab CI",
-    "gitlab ci/cd": "GitLab CI",
-    "tdd": "Test-Driven Development",
-    "oop": "Object-Oriented Programming",
-    "fp": "Functional Programming",
-    "rest": "REST API",
-    "restful": "REST API",
-    "restful api": "REST API",
-    "graphql api": "GraphQL",
-    # Mobile
-    "react native": "React Native",
-    "rn": "React Native",
-    "ios development": "iOS",
-    "android development": "Android",
-    # SQL (generic)
-    "sql": "SQL",
-}
+def load_taxonomy(path: Optional[Path] = None) -> dict:
+    """
+    Read and validate a taxonomy file.
 
+    Shape: {"domains": {domain: {category: [skills]}},
+            "synonyms": {variant: canonical},
+            "tech_stacks": {name: [skills]}}
+    """
+    with open(path or TAXONOMY_PATH, encoding="utf-8") as f:
+        data = json.load(f)
+    for key in ("domains", "synonyms", "tech_stacks"):
+        if not isinstance(data.get(key), dict):
+            raise ValueError(f"Taxonomy is missing the '{key}' mapping")
+    return data
 
-# ---------------------------------------------------------------------------
-# Tech stack bundles
-# ---------------------------------------------------------------------------
 
+def taxonomy_hash(taxonomy: dict) -> str:
+    """Stable content hash -- the cache key for compiled artifacts."""
+    canonical = json.dumps(taxonomy, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()[:16]
+
+
+_DEFAULT_TAXONOMY = load_taxonomy()
+
+# Module constants kept for existing imports (the default taxonomy)
+DOMAIN_HIERARCHY: Dict[str, Dict[str, List[str]]] = _DEFAULT_TAXONOMY["domains"]
+SYNONYMS: Dict[str, str] = _DEFAULT_TAXONOMY["synonyms"]
 TECH_STACKS: Dict[str, FrozenSet[str]] = {
-    "MERN": frozenset({"MongoDB", "Express.js", "React", "Node.js"}),
-    "MEAN": frozenset({"MongoDB", "Express.js", "Angular", "Node.js"}),
-    "MEVN": frozenset({"MongoDB", "Express.js", "Vue", "Node.js"}),
-    "LAMP": frozenset({"Linux", "Apache", "MySQL", "PHP"}),
-    "Django Stack": frozenset({"Python", "Django", "PostgreSQL"}),
-    "Flask Stack": frozenset({"Python", "Flask", "PostgreSQL"}),
-    "FastAPI Stack": frozenset({"Python", "FastAPI", "PostgreSQL"}),
-    "Spring Stack": frozenset({"Java", "Spring Boot", "PostgreSQL"}),
-    "Rails Stack": frozenset({"Ruby", "Ruby on Rails", "PostgreSQL"}),
-    "ML Stack": frozenset({"Python", "Scikit-learn", "Pandas", "NumPy"}),
-    "DL Stack": frozenset({"Python", "TensorFlow", "PyTorch", "NumPy"}),
-    "React Native Stack": frozenset({"JavaScript", "React Native", "Node.js"}),
-    "Flutter Stack": frozenset({"Flutter", "Dart"}),
+    name: frozenset(skills)
+    for name, skills in _DEFAULT_TAXONOMY["tech_stacks"].items()
 }
 
 
@@ -304,6 +83,22 @@ SIBLING_MATCH_CREDIT = 0.5 # same category, different skill
 PARENT_MATCH_CREDIT = 0.3  # student has parent/category, job wants child
 DOMAIN_MATCH_CREDIT = 0.2  # same domain, different category
 
+# How a student skill relates to a required one; credit is looked up per
+# relation so alternative weightings (e.g. shadow scoring) can reuse the walk.
+RELATION_EXACT = "exact"
+RELATION_CHILD = "child"
+RELATION_PARENT = "parent"
+RELATION_SIBLING = "sibling"
+RELATION_DOMAIN = "domain"
+
+RELATION_CREDITS: Dict[str, float] = {
+    RELATION_EXACT: EXACT_MATCH_CREDIT,
+    RELATION_CHILD: CHILD_MATCH_CREDIT,
+    RELATION_PARENT: PARENT_MATCH_CREDIT,
+    RELATION_SIBLING: SIBLING_MATCH_CREDIT,
+    RELATION_DOMAIN: DOMAIN_MATCH_CREDIT,
+}
+
 
 # ============================================================================
 # SkillGraph
@@ -311,7 +106,7 @@ DOMAIN_MATCH_CREDIT = 0.2  # same domain, different category
 
 class SkillGraph:
     """
-    In-memory skill graph built from the static hierarchy above.
+    In-memory skill graph built from a taxonomy dict (default: the file).
 
     Provides:
     - normalize(raw_name)           -> canonical skill name
@@ -325,7 +120,14 @@ class SkillGraph:
     - all_canonical_skills()        -> full set of canonical skill names
     """
 
-    def __init__(self) -> None:
+    def __init__(self, taxonomy: Optional[dict] = None) -> None:
+        taxonomy = taxonomy if taxonomy is not None else _DEFAULT_TAXONOMY
+        self.content_hash: str = taxonomy_hash(taxonomy)
+        self.tech_stacks: Dict[str, FrozenSet[str]] = {
+            name: frozenset(skills)
+            for name, skills in taxonomy["tech_stacks"].items()
+        }
+
         # skill (lower) -> canonical name
         self._canonical: Dict[str, str] = {}
         # canonical -> category
@@ -336,9 +138,12 @@ class SkillGraph:
         self._category_children: Dict[str, Set[str]] = {}
         # domain -> set of categories
         self._domain_categories: Dict[str, Set[str]] = {}
+        # SkillBitIndex / GraphArtifacts, built lazily
+        self._bit_index = None
+        self._artifacts = None
 
-        self._build(DOMAIN_HIERARCHY)
-        self._load_synonyms(SYNONYMS)
+        self._build(taxonomy["domains"])
+        self._load_synonyms(taxonomy["synonyms"])
 
     # ------------------------------------------------------------------
     # Construction
@@ -370,6 +175,10 @@ class SkillGraph:
         key = raw.lower().strip()
         return self._canonical.get(key, raw)
 
+    def lookup(self, raw: str) -> Optional[str]:
+        """Canonical name for *raw* from the exact/synonym map, or None."""
+        return self._canonical.get(raw.lower().strip())
+
     def get_parent(self, skill: str) -> Optional[str]:
         """Category that *skill* belongs to (or None)."""
         canon = self.normalize(skill)
@@ -394,12 +203,24 @@ class SkillGraph:
 
     def detect_stacks(self, skills: Set[str]) -> List[str]:
         """Return tech-stack names fully covered by *skills*."""
-        normalized = {self.normalize(s) for s in skills}
-        matched: List[str] = []
-        for stack_name, required in TECH_STACKS.items():
-            if required <= normalized:
-                matched.append(stack_name)
-        return sorted(matched)
+        bits = self.bit_index
+        return bits.detect_stacks(bits.mask(skills, grow=False))
+
+    @property
+    def artifacts(self):
+        """GraphArtifacts for this graph's content hash."""
+        if self._artifacts is None:
+            from app.skills.artifacts import GraphArtifacts
+            self._artifacts = GraphArtifacts(self)
+        return self._artifacts
+
+    @property
+    def bit_index(self):
+        """SkillBitIndex over this graph (built on first use)."""
+        if self._bit_index is None:
+            from app.skills.bitset import SkillBitIndex
+            self._bit_index = SkillBitIndex(self)
+        return self._bit_index
 
     def hierarchy_distance(self, a: str, b: str) -> int:
         """
@@ -429,8 +250,21 @@ class SkillGraph:
         cs = self.normalize(student_skill)
         cr = self.normalize(required_skill)
 
+        ids = self.artifacts.ids()
+        si, ri = ids.get(cs), ids.get(cr)
+        if si is not None and ri is not None:
+            return self.artifacts.credit_matrix()[si][ri]
+        return self.compute_credit(cs, cr)
+
+    def compute_credit(self, cs: str, cr: str) -> float:
+        """Credit for two canonical names, computed from the hierarchy."""
+        relation = self.relation(cs, cr)
+        return RELATION_CREDITS[relation] if relation else 0.0
+
+    def relation(self, cs: str, cr: str) -> Optional[str]:
+        """How canonical *cs* (student) relates to *cr* (required), or None."""
         if cs == cr:
-            return EXACT_MATCH_CREDIT
+            return RELATION_EXACT
 
         cat_s = self.get_parent(cs)
         cat_r = self.get_parent(cr)
@@ -438,23 +272,23 @@ class SkillGraph:
         # Student has a specific tool, job requires the category / broader
         # skill.  e.g. student: PyTorch, job: Deep Learning.
         if cat_s and cat_s == cr:
-            return CHILD_MATCH_CREDIT
+            return RELATION_CHILD
         # Student has a broad skill, job requires a specific tool.
         # e.g. student: Machine Learning, job: Scikit-learn
         if cat_r and cs == cat_r:
-            return PARENT_MATCH_CREDIT
+            return RELATION_PARENT
 
         # Sibling: same category, different skill.
         if cat_s and cat_s == cat_r:
-            return SIBLING_MATCH_CREDIT
+            return RELATION_SIBLING
 
         # Same domain but different categories.
         dom_s = self.get_domain(cs)
         dom_r = self.get_domain(cr)
         if dom_s and dom_s == dom_r:
-            return DOMAIN_MATCH_CREDIT
+            return RELATION_DOMAIN
 
-        return 0.0
+        return None
 
     def all_canonical_skills(self) -> List[str]:
         """Sorted list of every canonical skill name in the hierarchy."""
@@ -463,18 +297,79 @@ class SkillGraph:
             | set(self._skill_to_category.keys())
         )
 
+    def all_categories(self) -> Set[str]:
+        return set(self._category_children)
+
+    def all_domains(self) -> Set[str]:
+        return set(self._domain_categories)
+
     def get_synonym_map(self) -> Dict[str, str]:
         """Full lowered-variant -> canonical map (for resume parser compat)."""
         return dict(self._canonical)
 
 
-# Module-level singleton for convenience imports.
+# ============================================================================
+# Module-level singleton with hot reload
+# ============================================================================
+
 _graph: Optional[SkillGraph] = None
+_graph_lock = threading.Lock()
+_loaded_mtime: Optional[float] = None
+_next_check = 0.0
+
+
+def _taxonomy_mtime() -> Optional[float]:
+    try:
+        return TAXONOMY_PATH.stat().st_mtime
+    except OSError:
+        return None
+
+
+def reload_skill_graph(path: Optional[Path] = None) -> SkillGraph:
+    """
+    Load the taxonomy, build a new graph and swap it in.
+
+    The new graph is fully built (and its credit matrix compiled) before
+    the single reference assignment, so readers see either the old graph
+    or the new one -- never a partial one.  Invalid files raise and leave
+    the current graph in place.
+    """
+    global _graph, _loaded_mtime
+    with _graph_lock:
+        mtime = _taxonomy_mtime()
+        graph = SkillGraph(load_taxonomy(path))
+        graph.artifacts.credit_matrix()
+        _graph = graph
+        _loaded_mtime = mtime
+    logger.info(f"SkillGraph loaded (hash {graph.content_hash})")
+    return graph
+
+
+def _maybe_reload() -> None:
+    """Pick up taxonomy edits made by another worker or by hand."""
+    global _next_check, _loaded_mtime
+    now = time.monotonic()
+    if now < _next_check:
+        return
+    _next_check = now + RELOAD_CHECK_INTERVAL_S
+    mtime = _taxonomy_mtime()
+    if mtime is None or mtime == _loaded_mtime:
+        return
+    try:
+        reload_skill_graph()
+    except (OSError, ValueError) as e:
+        _loaded_mtime = mtime  # don't retry the same broken file
+        logger.error(f"Taxonomy reload failed, keeping current graph: {e}")
 
 
 def get_skill_graph() -> SkillGraph:
     """Return (or create) the module-level SkillGraph singleton."""
-    global _graph
+    global _graph, _loaded_mtime
     if _graph is None:
-        _graph = SkillGraph()
+        with _graph_lock:
+            if _graph is None:
+                _loaded_mtime = _taxonomy_mtime()
+                _graph = SkillGraph()
+        return _graph
+    _maybe_reload()
     return _graph
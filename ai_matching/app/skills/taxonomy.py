@@ -1,5 +1,6 @@
 from typing import Dict, List, Optional, Set
 
+from app.skills.resolver import get_skill_resolver
 from app.skills.skill_graph import SkillGraph, get_skill_graph
 
 
@@ -10,11 +11,14 @@ class SkillTaxonomy:
     Phase-1: Static taxonomy (no DB).
     """
 
-    def __init__(self) -> None:
-        self.graph: SkillGraph = get_skill_graph()
+    @property
+    def graph(self) -> SkillGraph:
+        # Always the current graph, so long-lived holders see hot reloads
+        return get_skill_graph()
 
     def normalize(self, skill_name: str) -> str:
-        return self.graph.normalize(skill_name)
+        # Exact map first; typos / variants fall back to fuzzy + embedding
+        return get_skill_resolver().resolve(skill_name)
 
     def normalize_skills(self, skills: Dict[str, int]) -> Dict[str, int]:
         normalized: Dict[str, int] = {}
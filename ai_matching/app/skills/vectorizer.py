@@ -1,7 +1,9 @@
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+
 import numpy as np
-from typing import Dict, List, Set
+from scipy import sparse
 
-from app.skills.skill_graph import get_skill_graph
+from app.skills.skill_graph import SkillGraph, get_skill_graph
 
 SIBLING_LEVEL_FRACTION = 0.3
 PARENT_LEVEL_FRACTION = 0.2
@@ -54,6 +56,7 @@ class SkillVectorizer:
         related competencies.
         """
         vector = np.zeros(len(self.skill_index))
+        graph = get_skill_graph()
 
         for skill, level in skills.items():
             if skill in self.skill_index:
@@ -64,7 +67,6 @@ class SkillVectorizer:
             if not expand:
                 continue
 
-            graph = get_skill_graph()
             for sibling in graph.get_siblings(skill):
                 if sibling in self.skill_index:
                     implied = level * SIBLING_LEVEL_FRACTION
@@ -80,3 +82,246 @@ class SkillVectorizer:
                 )
 
         return vector
+
+
+# ============================================================================
+# Global skill space (sparse, comparable across calls)
+# ============================================================================
+
+class SkillMatrix:
+    """
+    Precomputed CSR skill rows (one per item) with their L2 norms.
+
+    *extras* holds the skills the graph doesn't know, as skill -> {row:
+    value}; they have no column in the space but still count toward the
+    norm and match the same name on the other side.
+    """
+
+    def __init__(
+        self, rows: sparse.csr_matrix, space: "SkillSpace",
+        norms: Optional[np.ndarray] = None,
+        extras: Optional[Dict[str, Dict[int, float]]] = None,
+    ) -> None:
+        self.rows = rows
+        # Rows are only comparable with vectors from the same space
+        self.space = space
+        self.extras: Dict[str, Dict[int, float]] = extras or {}
+        if norms is None:
+            norm_sq = np.asarray(rows.multiply(rows).sum(axis=1), dtype=float).ravel()
+            for values in self.extras.values():
+                for r, value in values.items():
+                    norm_sq[r] += value * value
+            norms = np.sqrt(norm_sq)
+        self.norms = norms
+
+    def __len__(self) -> int:
+        return self.rows.shape[0]
+
+
+class SkillSpace:
+    """
+    One fixed vocabulary for every skill vector in the process.
+
+    ``SkillVectorizer.build_index`` makes a fresh index per student /
+    internship pair, so vectors can't be reused across calls.  Here the
+    columns are every canonical skill and category in the SkillGraph, and
+    each skill's sibling/parent expansion is computed once and cached.
+    Internship rows are built once into a CSR matrix; scoring a student
+    against all of them is one sparse product.
+
+    Scores match the pairwise SkillVectorizer path: the pairwise index
+    always contains every coordinate either vector touches, so the extra
+    zero columns don't change the cosine.  Skills the graph doesn't know
+    have no siblings or parent and get no column: the vocabulary stays
+    fixed however much free text requests bring in, and those skills are
+    scored by name on the side (see ``SkillMatrix.extras``).
+    """
+
+    def __init__(self, graph: Optional[SkillGraph] = None) -> None:
+        self.graph = graph or get_skill_graph()
+
+        vocab: Set[str] = set()
+        for skill in self.graph.all_canonical_skills():
+            vocab.add(skill)
+            parent = self.graph.get_parent(skill)
+            if parent:
+                vocab.add(parent)
+        self.index: Dict[str, int] = {s: i for i, s in enumerate(sorted(vocab))}
+
+        # skill -> [(column, fraction of level)]
+        self._expansions: Dict[str, List[Tuple[int, float]]] = {}
+
+    def _expansion(self, skill: str) -> List[Tuple[int, float]]:
+        """Columns for a skill already in the index (siblings and parents
+        of canonical skills always are)."""
+        cached = self._expansions.get(skill)
+        if cached is not None:
+            return cached
+
+        expansion = [(self.index[skill], 1.0)]
+        for sibling in self.graph.get_siblings(skill):
+            expansion.append((self.index[sibling], SIBLING_LEVEL_FRACTION))
+        parent = self.graph.get_parent(skill)
+        if parent:
+            expansion.append((self.index[parent], PARENT_LEVEL_FRACTION))
+
+        self._expansions[skill] = expansion
+        return expansion
+
+    def row(
+        self, skills: Dict[str, int], expand: bool = True,
+    ) -> Tuple[Dict[int, float], Dict[str, float]]:
+        """
+        Sparse vector {column: value}, same rules as SkillVectorizer.vectorize,
+        plus {skill: level} for the skills outside the index.
+        """
+        row: Dict[int, float] = {}
+        unknown: Dict[str, float] = {}
+        for skill, level in skills.items():
+            if skill not in self.index:
+                unknown[skill] = max(unknown.get(skill, 0.0), float(level))
+                continue
+            expansion = self._expansion(skill) if expand else [(self.index[skill], 1.0)]
+            for col, fraction in expansion:
+                row[col] = max(row.get(col, 0.0), level * fraction)
+        return row, unknown
+
+    def matrix(self, skill_sets: List[Dict[str, int]]) -> SkillMatrix:
+        """Build CSR rows for many skill dicts (e.g. the whole catalog)."""
+        indptr = [0]
+        indices: List[int] = []
+        data: List[float] = []
+        extras: Dict[str, Dict[int, float]] = {}
+        for r, skills in enumerate(skill_sets):
+            row, unknown = self.row(skills)
+            indices.extend(row.keys())
+            data.extend(row.values())
+            indptr.append(len(indices))
+            for skill, value in unknown.items():
+                extras.setdefault(skill, {})[r] = value
+        rows = sparse.csr_matrix(
+            (np.asarray(data, dtype=np.float64), indices, indptr),
+            shape=(len(skill_sets), len(self.index)),
+        )
+        return SkillMatrix(rows, self, extras=extras)
+
+    def splice(
+        self, matrix: SkillMatrix, start: int, stop: int,
+        skill_sets: List[Dict[str, int]],
+    ) -> SkillMatrix:
+        """
+        Copy of *matrix* with rows [start, stop) replaced by *skill_sets*.
+
+        Append: start == stop == len(matrix).  Delete: skill_sets == [].
+        The input matrix is left untouched (readers may still hold it).
+        """
+        new = self.matrix(skill_sets)
+        old = matrix.rows
+
+        # Stitch the CSR arrays directly instead of slicing + vstack, and
+        # carry the untouched norms over rather than rescanning every row
+        head, tail = old.indptr[start], old.indptr[stop]
+        indptr = np.concatenate([
+            old.indptr[:start + 1],
+            head + new.rows.indptr[1:],
+            old.indptr[stop + 1:] - tail + head + new.rows.nnz,
+        ])
+        rows = sparse.csr_matrix(
+            (
+                np.concatenate([old.data[:head], new.rows.data, old.data[tail:]]),
+                np.concatenate([old.indices[:head], new.rows.indices, old.indices[tail:]]),
+                indptr,
+            ),
+            shape=(len(indptr) - 1, old.shape[1]),
+        )
+        norms = np.concatenate([matrix.norms[:start], new.norms, matrix.norms[stop:]])
+
+        shift = len(new) - (stop - start)
+        extras: Dict[str, Dict[int, float]] = {}
+        for skill, values in matrix.extras.items():
+            kept = {
+                r if r < start else r + shift: value
+                for r, value in values.items() if r < start or r >= stop
+            }
+            if kept:
+                extras[skill] = kept
+        for skill, values in new.extras.items():
+            extras.setdefault(skill, {}).update(
+                (start + r, value) for r, value in values.items()
+            )
+        return SkillMatrix(rows, self, norms, extras)
+
+    def similarities(self, skills: Dict[str, int], matrix: SkillMatrix) -> np.ndarray:
+        """Cosine of *skills* against every row of *matrix* (0..1, 4 d.p.)."""
+        if len(matrix) == 0:
+            return np.zeros(0)
+
+        row, unknown = self.row(skills)
+        vec = np.zeros(matrix.rows.shape[1])
+        norm_sq = 0.0
+        for col, value in row.items():
+            norm_sq += value * value
+            vec[col] = value
+
+        dots = matrix.rows @ vec
+        for skill, value in unknown.items():
+            norm_sq += value * value
+            for r, other in matrix.extras.get(skill, {}).items():
+                dots[r] += value * other
+        denom = np.sqrt(norm_sq) * matrix.norms
+        sims = np.divide(dots, denom, out=np.zeros_like(dots), where=denom > 0)
+        return np.round(sims, 4)
+
+    def similarity_matrix(self, a: SkillMatrix, b: SkillMatrix) -> np.ndarray:
+        """Cosine of every row of *a* against every row of *b* (len(a), len(b))."""
+        if len(a) == 0 or len(b) == 0:
+            return np.zeros((len(a), len(b)))
+
+        dots = (a.rows @ b.rows.T).toarray()
+        for skill in a.extras.keys() & b.extras.keys():
+            for i, value in a.extras[skill].items():
+                for j, other in b.extras[skill].items():
+                    dots[i, j] += value * other
+        denom = np.outer(a.norms, b.norms)
+        sims = np.divide(dots, denom, out=np.zeros_like(dots), where=denom > 0)
+        return np.round(sims, 4)
+
+    def pair_similarities(
+        self, a: SkillMatrix, b: SkillMatrix, cells: Sequence[Tuple[int, int]],
+    ) -> np.ndarray:
+        """Cosine of a[i] against b[j] for each (i, j) in *cells* only.
+
+        Same values as ``similarity_matrix(a, b)[i, j]`` without the dense
+        len(a) x len(b) array.
+        """
+        if not cells:
+            return np.zeros(0)
+
+        ia = np.fromiter((i for i, _ in cells), dtype=np.intp, count=len(cells))
+        ib = np.fromiter((j for _, j in cells), dtype=np.intp, count=len(cells))
+
+        dots = np.asarray(a.rows[ia].multiply(b.rows[ib]).sum(axis=1), dtype=float).ravel()
+        shared = a.extras.keys() & b.extras.keys()
+        if shared:
+            for k, (i, j) in enumerate(cells):
+                for skill in shared:
+                    dots[k] += a.extras[skill].get(i, 0.0) * b.extras[skill].get(j, 0.0)
+        denom = a.norms[ia] * b.norms[ib]
+        sims = np.divide(dots, denom, out=np.zeros_like(dots), where=denom > 0)
+        return np.round(sims, 4)
+
+    def similarity(self, a: Dict[str, int], b: Dict[str, int]) -> float:
+        """Pairwise cosine in the global space."""
+        return float(self.similarities(a, self.matrix([b]))[0])
+
+
+_space: Optional[SkillSpace] = None
+
+
+def get_skill_space() -> SkillSpace:
+    """SkillSpace for the current SkillGraph (rebuilt after a reload)."""
+    global _space
+    graph = get_skill_graph()
+    if _space is None or _space.graph is not graph:
+        _space = SkillSpace(graph)
+    return _space
@@ -0,0 +1,98 @@
+"""
+Memory per 100k entities: dataclass objects vs the columnar stores.
+
+    python -m benchmarks.bench_columnar_memory
+    python -m benchmarks.bench_columnar_memory --count 1000000
+
+Records go through json.loads first, the same path data_loader takes, so
+the dataclass side pays for the per-record strings it would hold in
+production.  Memory is what tracemalloc sees retained after the raw
+records are dropped.
+"""
+
+import argparse
+import gc
+import json
+import random
+import tracemalloc
+
+from app.models.columnar import InternshipStore, StudentStore
+from app.models.internship import Internship
+from app.models.students import Student
+
+SKILL_POOL = [f"Skill {i}" for i in range(400)]
+CITY_POOL = [f"City {i}" for i in range(60)]
+
+
+def _raw(count: int, kind: str, seed: int = 7) -> bytes:
+    rnd = random.Random(seed)
+    rows = []
+    for i in range(count):
+        skills = {s: rnd.randint(1, 5) for s in rnd.sample(SKILL_POOL, rnd.randint(3, 8))}
+        row = {"id": i, "location": rnd.choice(CITY_POOL)}
+        if kind == "students":
+            row.update(skills=skills, year=rnd.randint(1, 4))
+        else:
+            row.update(required_skills=skills, min_year=rnd.randint(1, 4),
+                       is_remote=rnd.random() < 0.3)
+        rows.append(row)
+    return json.dumps(rows).encode()
+
+
+def _students_dataclass(raw):
+    return {
+        r["id"]: Student(id=r["id"], skills=r["skills"], year=r["year"], location=r["location"])
+        for r in raw
+    }
+
+
+def _internships_dataclass(raw):
+    return [
+        Internship(
+            id=r["id"], required_skills=r["required_skills"], min_year=r["min_year"],
+            location=r["location"], is_remote=r["is_remote"],
+        )
+        for r in raw
+    ]
+
+
+def _internships_columnar(raw):
+    return list(InternshipStore(raw))
+
+
+def _measure(payload: bytes, build):
+    gc.collect()
+    tracemalloc.start()
+    raw = json.loads(payload)
+    built = build(raw)
+    del raw
+    gc.collect()
+    retained = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del built
+    return retained
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--count", type=int, default=100_000)
+    args = parser.parse_args()
+
+    scale = 100_000 / args.count
+    print(f"{args.count} entities, MB per 100k (retained after load):")
+    print(f"{'':12} {'dataclass':>10} {'columnar':>10} {'ratio':>7}")
+    for label, before, after in [
+        ("students", _students_dataclass, StudentStore),
+        ("internships", _internships_dataclass, _internships_columnar),
+    ]:
+        payload = _raw(args.count, label)
+        old = _measure(payload, before)
+        new = _measure(payload, after)
+        print(
+            f"{label:12} {old * scale / 2**20:10.1f} {new * scale / 2**20:10.1f}"
+            f" {old / new:6.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
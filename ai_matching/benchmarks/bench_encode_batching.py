@@ -0,0 +1,79 @@
+"""
+Throughput of direct per-request encode vs the EncodeBatcher.
+
+    python -m benchmarks.bench_encode_batching            # synthetic model
+    python -m benchmarks.bench_encode_batching --real     # all-MiniLM-L6-v2
+
+The synthetic model charges a fixed per-forward-pass overhead plus a small
+per-item cost and releases the GIL while "computing", which is how torch
+behaves on CPU.  --real uses the actual sentence-transformer.
+"""
+
+import argparse
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from app.embeddings.batcher import EncodeBatcher
+
+CALLER_COUNTS = [1, 2, 4, 8, 16, 32, 64]
+REQUESTS_PER_CALLER = 40
+
+
+class SyntheticModel:
+    """Forward pass = overhead + per-item cost; one pass at a time."""
+
+    def __init__(self, overhead_ms: float = 4.0, per_item_ms: float = 0.25):
+        self.overhead_ms = overhead_ms
+        self.per_item_ms = per_item_ms
+        self._lock = threading.Lock()
+
+    def encode(self, texts):
+        single = isinstance(texts, str)
+        batch = [texts] if single else texts
+        with self._lock:
+            time.sleep((self.overhead_ms + self.per_item_ms * len(batch)) / 1000)
+        vectors = np.ones((len(batch), 384), dtype=np.float32)
+        return vectors[0] if single else vectors
+
+
+def _run(encode_one, callers: int) -> float:
+    def worker(caller_id: int):
+        for i in range(REQUESTS_PER_CALLER):
+            encode_one(f"python django sql caller{caller_id} req{i}")
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=callers) as pool:
+        list(pool.map(worker, range(callers)))
+    elapsed = time.perf_counter() - start
+    return callers * REQUESTS_PER_CALLER / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--real", action="store_true")
+    parser.add_argument("--max-wait-ms", type=float, default=5.0)
+    parser.add_argument("--max-batch", type=int, default=32)
+    args = parser.parse_args()
+
+    if args.real:
+        from sentence_transformers import SentenceTransformer
+        model = SentenceTransformer("all-MiniLM-L6-v2")
+    else:
+        model = SyntheticModel()
+
+    batcher = EncodeBatcher(
+        model.encode, max_batch_size=args.max_batch, max_wait_ms=args.max_wait_ms
+    )
+
+    print(f"{'callers':>8} {'direct req/s':>14} {'batched req/s':>14} {'speedup':>8}")
+    for callers in CALLER_COUNTS:
+        direct = _run(model.encode, callers)
+        batched = _run(batcher.encode, callers)
+        print(f"{callers:>8} {direct:>14.1f} {batched:>14.1f} {batched / direct:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""
+Fuzzy skill matching over a long resume: per-candidate extractOne (the old
+_fuzzy_match) vs FuzzySkillMatcher (bucketed cdist + per-document memo).
+
+    python -m benchmarks.bench_fuzzy_skills
+    python -m benchmarks.bench_fuzzy_skills --pages 10 --workers 4
+
+The resume is synthetic: experience bullets drawn from the taxonomy with
+~10% of skill mentions misspelt, split into sections and windows exactly
+as _traditional_parse does.  Both paths must find the same skills.
+"""
+
+import argparse
+import os
+import random
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "resume_parser"))
+
+from rapidfuzz import fuzz, process as rfprocess  # noqa: E402
+
+from app.skills.skill_graph import get_skill_graph  # noqa: E402
+from fuzzy_matcher import FuzzySkillMatcher  # noqa: E402
+from section_detector import SectionDetector  # noqa: E402
+from segmented_processor import SegmentedProcessor  # noqa: E402
+
+VERBS = ["Built", "Designed", "Migrated", "Maintained", "Optimised", "Shipped", "Led"]
+NOUNS = ["pipelines", "services", "dashboards", "APIs", "models", "tooling", "infrastructure"]
+
+
+def _typo(word: str, rnd: random.Random) -> str:
+    if len(word) < 5:
+        return word
+    i = rnd.randrange(1, len(word) - 1)
+    return word[:i] + word[i + 1:]
+
+
+def long_resume(pages: int, seed: int = 11) -> str:
+    rnd = random.Random(seed)
+    skills = get_skill_graph().all_canonical_skills()
+    lines = ["Jane Roe", "jane@example.com", "", "WORK EXPERIENCE", ""]
+    for job in range(pages * 3):
+        lines += [f"Software Engineer {job}", f"Company {job}", "2019 - 2021"]
+        for _ in range(8):
+            used = [s if rnd.random() > 0.1 else _typo(s, rnd) for s in rnd.sample(skills, 3)]
+            lines.append(
+                f"- {rnd.choice(VERBS)} {rnd.choice(NOUNS)} using {used[0]}, "
+                f"{used[1]} and {used[2]} for {rnd.randint(2, 40)} teams."
+            )
+        lines.append("")
+    lines += ["SKILLS", ", ".join(rnd.sample(skills, 30))]
+    return "\n".join(lines)
+
+
+def legacy_fuzzy(text: str, skill_list, cutoff=85, min_len=3) -> set:
+    """The pre-cdist _fuzzy_match, minus the set-order truncation."""
+    lower_map = {s.lower(): s for s in skill_list}
+    tokens = re.findall(r"[A-Za-z0-9#+.]+", text)
+    candidates = []
+    for i, tok in enumerate(tokens):
+        if len(tok) >= min_len:
+            candidates.append(tok)
+        if i + 1 < len(tokens):
+            bigram = f"{tok} {tokens[i + 1]}"
+            if len(bigram) >= min_len + 2:
+                candidates.append(bigram)
+    candidates = list(dict.fromkeys(c.lower() for c in candidates))[:300]
+    found = set()
+    for candidate in candidates:
+        result = rfprocess.extractOne(
+            candidate, list(lower_map), scorer=fuzz.WRatio, score_cutoff=cutoff
+        )
+        if result and result[0] != candidate:
+            found.add(lower_map[result[0]])
+    return found
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--pages", type=int, default=5)
+    parser.add_argument("--workers", type=int, default=-1)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    text = long_resume(args.pages)
+    windows = SegmentedProcessor().create_windows_from_sections(SectionDetector().detect(text))
+    skills = get_skill_graph().all_canonical_skills()
+    matcher = FuzzySkillMatcher(skills, workers=args.workers)
+
+    def old():
+        return set().union(*(legacy_fuzzy(w.text, skills) for w in windows))
+
+    def new():
+        memo = {}
+        return set().union(*(matcher.match(w.text, memo) for w in windows))
+
+    assert old() == new(), "fuzzy results differ"
+    print(f"{len(text)} chars, {len(windows)} windows, {len(skills)} skills")
+    for label, fn in [("extractOne loop", old), ("cdist + memo", new)]:
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            fn()
+        print(f"{label:16} {(time.perf_counter() - start) / args.repeat * 1000:8.1f} ms/doc")
+
+
+if __name__ == "__main__":
+    main()
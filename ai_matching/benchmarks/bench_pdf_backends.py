@@ -0,0 +1,130 @@
+"""
+PDF text extraction per backend: speed, and how close each backend's text
+is to pdfplumber's (the reference the parser was tuned on).
+
+    python -m benchmarks.bench_pdf_backends
+    python -m benchmarks.bench_pdf_backends --dir path/to/pdfs --synthetic-pages 24
+
+The corpus is every PDF in --dir (default resume_parser/test_data) plus, if
+reportlab is installed, one synthetic resume of --synthetic-pages pages.
+Documents of MIN_PAGES+ pages go through page-parallel extraction with
+--page-workers and are timed separately ("long ms").
+
+Equivalence is reported two ways against pdfplumber:
+  text   rapidfuzz ratio of the whitespace-normalised text (0-100)
+  skills Jaccard of the taxonomy skills SkillMatcher finds in each text
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "resume_parser"))
+
+from rapidfuzz import fuzz  # noqa: E402
+
+from app.skills.skill_graph import get_skill_graph  # noqa: E402
+from pdf_backends import BACKENDS, looks_garbled  # noqa: E402
+from pdf_processor import PDFProcessor  # noqa: E402
+from skill_matcher import SkillMatcher  # noqa: E402
+
+TEST_DATA = os.path.join(os.path.dirname(__file__), "..", "resume_parser", "test_data")
+MIN_PAGES = 8
+
+
+def synthetic_pdf(pages: int, path: str) -> None:
+    from reportlab.lib.pagesizes import A4
+    from reportlab.pdfgen import canvas
+
+    from benchmarks.bench_fuzzy_skills import long_resume
+
+    lines = long_resume(max(1, pages // 2)).split("\n")
+    per_page = -(-len(lines) // pages)
+    pdf = canvas.Canvas(path, pagesize=A4)
+    for start in range(0, len(lines), per_page):
+        y = 800
+        for line in lines[start:start + per_page]:
+            pdf.drawString(40, y, line[:110])
+            y -= 14
+        pdf.showPage()
+    pdf.save()
+
+
+def _mean(values) -> float:
+    return sum(values) / len(values) if values else float("nan")
+
+
+def _jaccard(a: set, b: set) -> float:
+    return len(a & b) / len(a | b) if a | b else 1.0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--dir", default=TEST_DATA)
+    parser.add_argument("--synthetic-pages", type=int, default=16)
+    parser.add_argument("--page-workers", type=int, default=2)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    corpus = {
+        name: open(os.path.join(args.dir, name), "rb").read()
+        for name in sorted(os.listdir(args.dir)) if name.lower().endswith(".pdf")
+    }
+    if args.synthetic_pages:
+        try:
+            with tempfile.TemporaryDirectory() as tmp:
+                path = os.path.join(tmp, "synthetic.pdf")
+                synthetic_pdf(args.synthetic_pages, path)
+                corpus[f"synthetic ({args.synthetic_pages} pages)"] = open(path, "rb").read()
+        except ImportError:
+            print("reportlab not installed, skipping the synthetic resume")
+    if not corpus:
+        sys.exit(f"No PDFs in {args.dir} and no synthetic resume")
+
+    installed = [name for name, backend in BACKENDS.items() if backend.available()]
+    if "pdfplumber" not in installed:
+        sys.exit("pdfplumber (the reference backend) is not installed")
+    print(f"{len(corpus)} documents; backends: {', '.join(installed)}")
+
+    matcher = SkillMatcher.from_graph(get_skill_graph())
+    reference = {}
+    long_docs = {d for d, data in corpus.items() if BACKENDS["pdfplumber"]().page_count(data) >= MIN_PAGES}
+    print(f"{len(long_docs)} of them have {MIN_PAGES}+ pages (extracted page-parallel)\n")
+    print(
+        f"{'backend':12} {'workers':>7} {'short ms':>9} {'long ms':>9}"
+        f" {'garbled':>7} {'text':>6} {'skills':>6}"
+    )
+    for name in ["pdfplumber"] + [b for b in installed if b != "pdfplumber"]:
+        for workers in sorted({1, args.page_workers}):
+            proc = PDFProcessor(backend=name, page_workers=workers, parallel_min_pages=MIN_PAGES)
+            proc.fallback = None  # time the backend itself
+            texts = {doc: proc.extract_text_from_bytes(data) or "" for doc, data in corpus.items()}
+            ms = {}
+            for doc, data in corpus.items():
+                start = time.perf_counter()
+                for _ in range(args.repeat):
+                    proc.extract_text_from_bytes(data)
+                ms[doc] = (time.perf_counter() - start) / args.repeat * 1000
+            short = [ms[d] for d in corpus if d not in long_docs]
+            long = [ms[d] for d in long_docs]
+            if proc._page_pool is not None:
+                proc._page_pool.shutdown()
+
+            reference = reference or texts
+            ratio = sum(
+                fuzz.ratio(" ".join(texts[d].split()), " ".join(reference[d].split())) for d in corpus
+            ) / len(corpus)
+            skills = sum(
+                _jaccard(set(matcher.skills(texts[d])), set(matcher.skills(reference[d]))) for d in corpus
+            ) / len(corpus)
+            garbled = sum(looks_garbled(t) for t in texts.values())
+            print(
+                f"{name:12} {workers:>7} {_mean(short):>9.1f} {_mean(long):>9.1f}"
+                f" {garbled:>7} {ratio:>6.1f} {skills:>6.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
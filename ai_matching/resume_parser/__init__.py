@@ -10,6 +10,7 @@ from .pdf_processor import PDFProcessor
 from .entity_extractor import EntityExtractor
 from .experience_extractor import ExperienceExtractor
 from .skills_extractor import SkillsExtractor
+from .skill_matcher import SkillMatcher, SkillMatch
 from .education_extractor import EducationExtractor
 from .section_detector import SectionDetector, SectionLabel, Section
 from .segmented_processor import SegmentedProcessor
@@ -24,6 +25,8 @@ __all__ = [
     "EntityExtractor",
     "ExperienceExtractor",
     "SkillsExtractor",
+    "SkillMatcher",
+    "SkillMatch",
     "EducationExtractor",
     "SectionDetector",
     "SectionLabel",
@@ -0,0 +1,62 @@
+"""
+Batch Runner  (/parse-batch scheduling)
+
+Runs one async parse per upload with at most *concurrency* in flight and
+yields results as each one finishes, so a client streaming the response
+sees the first resumes while the rest of the batch is still parsing.
+
+Uploads with identical bytes share a single parse; every copy after the
+first is reported with ``duplicate=True``.  Uploads need not be bytes: pass
+*key* to say how to hash whatever handle the caller keeps (e.g. a spooled
+file whose digest was taken while it was written).  Closing the generator early
+(client disconnect) cancels whatever is still queued or running.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Sequence, Tuple, TypeVar
+
+from parse_cache import content_hash
+
+T = TypeVar("T")
+
+Upload = Tuple[str, Any]                    # (filename, content or handle)
+BatchResult = Tuple[int, str, T, bool]      # (index, filename, result, duplicate)
+
+
+async def run_batch(
+    uploads: Sequence[Upload],
+    parse: Callable[[str, Any], Awaitable[T]],
+    concurrency: int,
+    key: Callable[[Any], str] = content_hash,
+) -> AsyncIterator[BatchResult]:
+    """Yield ``(index, filename, result, duplicate)`` in completion order.
+
+    *parse* must not raise; failures should come back as results.
+    """
+    gate = asyncio.Semaphore(max(1, concurrency))
+
+    async def gated(filename: str, content: Any) -> T:
+        async with gate:
+            return await parse(filename, content)
+
+    async def report(job: "asyncio.Future[T]", index: int, filename: str, duplicate: bool):
+        # shield: a cancelled waiter must not cancel the parse other copies share
+        return index, filename, await asyncio.shield(job), duplicate
+
+    jobs: Dict[str, "asyncio.Future[T]"] = {}
+    waiters: List["asyncio.Future[BatchResult]"] = []
+    for index, (filename, content) in enumerate(uploads):
+        digest = key(content)
+        duplicate = digest in jobs
+        if not duplicate:
+            jobs[digest] = asyncio.ensure_future(gated(filename, content))
+        waiters.append(asyncio.ensure_future(report(jobs[digest], index, filename, duplicate)))
+
+    try:
+        for done in asyncio.as_completed(waiters):
+            yield await done
+    finally:
+        for task in waiters + list(jobs.values()):
+            task.cancel()
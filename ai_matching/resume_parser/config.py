@@ -31,13 +31,41 @@ _graph = get_skill_graph()
 
 # Model Configuration
 SPACY_MODEL = "en_core_web_trf"
+# "accurate": SPACY_MODEL throughout.  "fast": SPACY_FAST_MODEL, with
+# SPACY_MODEL re-run over the header only when no PERSON is found there
+SPACY_FAST_MODEL = "en_core_web_sm"
+SPACY_MODEL_TIER = os.getenv("SPACY_MODEL_TIER", "accurate")
 SENTENCE_TRANSFORMER_MODEL = "all-MiniLM-L6-v2"
 FAISS_INDEX_DIM = 384
 
+# Part of the parse-cache key: bump when parsing logic changes so cached
+# results are recomputed (PDF_BACKEND and the skill taxonomy hash are
+# appended at runtime)
+PARSER_PIPELINE_VERSION = "2.1.0"
+
+# PDF text extraction: backend tried first ("auto" = fastest installed of
+# pypdfium2, pymupdf, pdfplumber; pdfplumber is the fallback for empty or
+# garbled output), and processes for page-parallel extraction of documents
+# with PDF_PARALLEL_MIN_PAGES+ pages (1 = off; only pays off for pdfplumber
+# on multi-core hosts)
+PDF_BACKEND = os.getenv("PDF_BACKEND", "auto")
+PDF_PAGE_WORKERS = int(os.getenv("PDF_PAGE_WORKERS", "1"))
+PDF_PARALLEL_MIN_PAGES = int(os.getenv("PDF_PARALLEL_MIN_PAGES", "8"))
+
 # File Upload Configuration
 MAX_FILE_SIZE_MB = 10
 ALLOWED_EXTENSIONS = {".pdf"}
 
+# /parse-batch: files per request, and how many of them parse at once
+PARSE_BATCH_MAX_FILES = int(os.getenv("PARSE_BATCH_MAX_FILES", "500"))
+PARSE_BATCH_CONCURRENCY = int(os.getenv("PARSE_BATCH_CONCURRENCY", "4"))
+
+# Parse worker processes (0 = parse in-process on threads), how many jobs
+# may be queued or running before requests get a 503, and the per-job limit
+PARSE_WORKERS = int(os.getenv("PARSE_WORKERS", "2"))
+PARSE_POOL_MAX_PENDING = int(os.getenv("PARSE_POOL_MAX_PENDING", "32"))
+PARSE_JOB_TIMEOUT_S = float(os.getenv("PARSE_JOB_TIMEOUT_S", "60"))
+
 # Regex Patterns
 EMAIL_PATTERN = re.compile(
     r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
@@ -80,6 +108,12 @@ SKILL_NORMALIZATION: Dict[str, str] = _graph.get_synonym_map()
 # FAISS Configuration
 FAISS_SIMILARITY_THRESHOLD = 0.75
 
+# Threads per rapidfuzz cdist call in fuzzy skill matching (-1 = all cores)
+FUZZY_CDIST_WORKERS = int(os.getenv("FUZZY_CDIST_WORKERS", "-1"))
+
+# Chunk embeddings kept across resumes for semantic skill matching
+SEMANTIC_CHUNK_CACHE_SIZE = int(os.getenv("SEMANTIC_CHUNK_CACHE_SIZE", "4096"))
+
 # Entity Extraction Configuration
 MAX_NAME_WORDS = 4
 MIN_NAME_WORDS = 2
@@ -66,8 +66,9 @@ class EducationExtractor:
     def __init__(self, nlp=None):
         self._relation_extractor = RelationExtractor(nlp=nlp)
 
-    def extract(self, text: str) -> List[EducationEntry]:
-        groups = self._relation_extractor.extract_education_groups(text)
+    def extract(self, text: str, ents=None) -> List[EducationEntry]:
+        """*ents*: entities in *text* from the shared spaCy pass, if any."""
+        groups = self._relation_extractor.extract_education_groups(text, ents)
 
         entries: List[EducationEntry] = []
         lines = text.split("\n")
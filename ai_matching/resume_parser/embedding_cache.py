@@ -0,0 +1,63 @@
+"""
+Chunk Embedding Cache  (semantic stage of skills extraction)
+
+Bounded LRU of sentence embeddings keyed by a hash of the chunk text.
+Resume boilerplate ("Responsible for day-to-day operations", "References
+available on request") recurs across documents, so those chunks are
+encoded once per process rather than once per resume.
+
+``encode(chunks)`` dedupes its input, serves hits from the cache and sends
+every miss to the model in a single batch.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, List, Sequence
+
+import numpy as np
+
+
+def _chunk_key(chunk: str) -> bytes:
+    return hashlib.blake2b(chunk.encode("utf-8"), digest_size=16).digest()
+
+
+class ChunkEmbeddingCache:
+    def __init__(self, encode: Callable[[List[str]], np.ndarray], maxsize: int = 4096):
+        self._encode = encode
+        self._maxsize = maxsize
+        self._lru: "OrderedDict[bytes, np.ndarray]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._lru)
+
+    def encode(self, chunks: Sequence[str]) -> np.ndarray:
+        """float32 embeddings for *chunks*, one row per input (in order)."""
+        keys = [_chunk_key(c) for c in chunks]
+        found: Dict[bytes, np.ndarray] = {}
+        with self._lock:
+            for key in keys:
+                vec = self._lru.get(key)
+                if vec is not None:
+                    self._lru.move_to_end(key)
+                    found[key] = vec
+
+        missing = {k: c for k, c in zip(keys, chunks) if k not in found}
+        if missing:
+            vectors = np.asarray(self._encode(list(missing.values())), dtype=np.float32)
+            with self._lock:
+                for key, vec in zip(missing, vectors):
+                    found[key] = self._lru[key] = vec
+                while len(self._lru) > self._maxsize:
+                    self._lru.popitem(last=False)
+
+        self.hits += len(keys) - len(missing)
+        self.misses += len(missing)
+        if not keys:
+            return np.zeros((0, 0), dtype=np.float32)
+        return np.stack([found[k] for k in keys])
@@ -2,11 +2,11 @@
 Entity Extraction Module
 Extracts name, email, and phone using spaCy NER and regex patterns
 """
-import spacy
 import logging
-from typing import Optional, Tuple
+from typing import Optional, Sequence, Tuple
 import re
 from config import EMAIL_PATTERN, PHONE_PATTERN, MIN_NAME_WORDS, MAX_NAME_WORDS
+from spacy_pipeline import Entity, load_spacy_model
 
 logger = logging.getLogger(__name__)
 
@@ -14,25 +14,18 @@ logger = logging.getLogger(__name__)
 class EntityExtractor:
     """Extracts personal information entities from resume text"""
     
-    def __init__(self, model_name: str = "en_core_web_trf"):
+    def __init__(self, model_name: str = "en_core_web_trf", nlp=None):
         """
         Initialize entity extractor with spaCy model
         
         Args:
             model_name: spaCy model to use (default: transformer-based)
+            nlp: Already-loaded spaCy Language to share instead of loading one
         """
-        try:
-            logger.info(f"Loading spaCy model: {model_name}")
-            self.nlp = spacy.load(model_name)
-            logger.info("spaCy model loaded successfully")
-        except OSError:
-            logger.warning(f"Model {model_name} not found. Attempting to download...")
-            import subprocess
-            subprocess.run(["python", "-m", "spacy", "download", model_name], check=True)
-            self.nlp = spacy.load(model_name)
-            logger.info("spaCy model downloaded and loaded successfully")
+        self.nlp = nlp if nlp is not None else load_spacy_model(model_name)
+        logger.info("spaCy model loaded successfully")
     
-    def extract_name(self, text: str) -> Optional[str]:
+    def extract_name(self, text: str, ents: Optional[Sequence[Entity]] = None) -> Optional[str]:
         """
         Extract person name using spaCy NER
         
@@ -43,16 +36,19 @@ class EntityExtractor:
         
         Args:
             text: Resume text
+            ents: Entities already found in ``text[:1000]`` (from the shared
+                  document pass); spaCy is only run when this is None
             
         Returns:
             Extracted name or None
         """
         try:
-            # Process first 1000 characters (name usually in header)
-            doc = self.nlp(text[:1000])
-            
-            # Find all PERSON entities
-            person_entities = [ent.text for ent in doc.ents if ent.label_ == "PERSON"]
+            if ents is None:
+                # Process first 1000 characters (name usually in header)
+                doc = self.nlp(text[:1000])
+                person_entities = [ent.text for ent in doc.ents if ent.label_ == "PERSON"]
+            else:
+                person_entities = [ent.text for ent in ents if ent.label == "PERSON"]
             
             if not person_entities:
                 logger.warning("No PERSON entities found")
@@ -137,17 +133,20 @@ class EntityExtractor:
             logger.error(f"Error extracting phone: {e}")
             return None
     
-    def extract_all_entities(self, text: str) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+    def extract_all_entities(
+        self, text: str, ents: Optional[Sequence[Entity]] = None
+    ) -> Tuple[Optional[str], Optional[str], Optional[str]]:
         """
         Extract all entities (name, email, phone) in one pass
         
         Args:
             text: Resume text
+            ents: Entities in ``text[:1000]``, see extract_name
             
         Returns:
             Tuple of (name, email, phone)
         """
-        name = self.extract_name(text)
+        name = self.extract_name(text, ents)
         email = self.extract_email(text)
         phone = self.extract_phone(text)
         
@@ -4,6 +4,7 @@ Measures field-level accuracy of resume parsing
 """
 import json
 import logging
+import time
 from pathlib import Path
 from typing import List, Dict, Tuple
 import argparse
@@ -13,6 +14,8 @@ from pdf_processor import PDFProcessor
 from entity_extractor import EntityExtractor
 from experience_extractor import ExperienceExtractor
 from skills_extractor import SkillsExtractor
+from spacy_pipeline import SpacyPipeline
+from config import SPACY_MODEL_TIER
 
 logger = logging.getLogger(__name__)
 
@@ -20,11 +23,18 @@ logger = logging.getLogger(__name__)
 class ResumeEvaluator:
     """Evaluates resume parsing accuracy against ground truth"""
     
-    def __init__(self):
-        """Initialize evaluator with extractors"""
+    def __init__(self, tier: str = SPACY_MODEL_TIER):
+        """
+        Initialize evaluator with extractors
+
+        Args:
+            tier: spaCy model tier to evaluate ("fast" or "accurate")
+        """
+        self.tier = tier
         self.pdf_processor = PDFProcessor()
-        self.entity_extractor = EntityExtractor()
-        self.experience_extractor = ExperienceExtractor()
+        self.spacy_pipeline = SpacyPipeline.for_tier(tier)
+        self.entity_extractor = EntityExtractor(nlp=self.spacy_pipeline.nlp)
+        self.experience_extractor = ExperienceExtractor(nlp=self.spacy_pipeline.nlp)
         self.skills_extractor = SkillsExtractor()
     
     def evaluate_field(self, predicted: str, ground_truth: str, 
@@ -207,6 +217,7 @@ class ResumeEvaluator:
         
         all_metrics = []
         detailed_results = []
+        latencies = []
         
         for pdf_file in pdf_files:
             # Find corresponding ground truth file
@@ -228,10 +239,14 @@ class ResumeEvaluator:
                 logger.error(f"Failed to extract text from {pdf_file.name}")
                 continue
             
-            # Extract all fields
-            name, email, phone = self.entity_extractor.extract_all_entities(text)
+            # Extract all fields (one shared spaCy pass, timed per resume)
+            start = time.perf_counter()
+            doc_ents = self.spacy_pipeline.entities(text, name_span=(0, 1000))
+            name, email, phone = self.entity_extractor.extract_all_entities(text, ents=doc_ents.within(0, 1000))
             skills = self.skills_extractor.extract_skills(text)
-            experience = self.experience_extractor.extract_experiences(text)
+            experience = self.experience_extractor.extract_experiences(text, ents=doc_ents.within(0, len(text)))
+            latency_ms = (time.perf_counter() - start) * 1000
+            latencies.append(latency_ms)
             
             predicted = ResumeData(
                 name=name,
@@ -247,6 +262,7 @@ class ResumeEvaluator:
             
             detailed_results.append({
                 "filename": pdf_file.name,
+                "latency_ms": latency_ms,
                 "metrics": metrics.model_dump(),
                 "predicted": predicted.model_dump(exclude={"raw_text"}),
                 "ground_truth": ground_truth.model_dump()
@@ -260,8 +276,11 @@ class ResumeEvaluator:
             return {}
         
         avg_metrics = self._aggregate_metrics(all_metrics)
+        avg_metrics["avg_latency_ms"] = sum(latencies) / len(latencies)
         
         return {
+            "tier": self.tier,
+            "trf_fallbacks": self.spacy_pipeline.fallbacks,
             "summary": avg_metrics,
             "detailed_results": detailed_results,
             "total_resumes": len(all_metrics)
@@ -308,6 +327,8 @@ def print_metrics(results: Dict):
         
         print(f"\n📊 Overall Accuracy: {summary['overall_accuracy']:.2%}")
         print(f"📝 Total Resumes Evaluated: {results['total_resumes']}")
+        print(f"⏱  spaCy tier: {results['tier']}, avg latency {summary['avg_latency_ms']:.0f} ms/resume"
+              f" ({results['trf_fallbacks']} trf fallbacks)")
         
         print("\n" + "-"*60)
         print("Field-Level Metrics:")
@@ -329,10 +350,12 @@ def main():
     parser = argparse.ArgumentParser(description="Evaluate Resume Parser")
     parser.add_argument("--test-dir", required=True, help="Directory containing test PDFs and ground truth")
     parser.add_argument("--output", default="evaluation_results.json", help="Output JSON file")
+    parser.add_argument("--tier", choices=["fast", "accurate"], default=SPACY_MODEL_TIER,
+                        help="spaCy model tier (run once per tier to compare)")
     
     args = parser.parse_args()
     
-    evaluator = ResumeEvaluator()
+    evaluator = ResumeEvaluator(tier=args.tier)
     results = evaluator.evaluate_dataset(args.test_dir)
     
     if results:
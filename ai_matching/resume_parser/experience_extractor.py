@@ -26,9 +26,10 @@ class ExperienceExtractor:
         self._relation = RelationExtractor(nlp=nlp)
         logger.info("ExperienceExtractor initialized (relation-extraction mode)")
 
-    def extract_experiences(self, text: str) -> List[Experience]:
+    def extract_experiences(self, text: str, ents=None) -> List[Experience]:
+        """*ents*: entities in *text* from the shared spaCy pass, if any."""
         try:
-            groups = self._relation.extract_experience_groups(text)
+            groups = self._relation.extract_experience_groups(text, ents)
 
             if groups:
                 experiences = [self._group_to_experience(g, text) for g in groups]
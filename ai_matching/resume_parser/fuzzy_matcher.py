@@ -0,0 +1,125 @@
+"""
+Fuzzy Skill Matcher  (typo stage of skills extraction)
+
+Scores every token / bigram candidate of a text against every canonical
+skill with rapidfuzz WRatio in bulk ``process.cdist`` calls instead of one
+``extractOne`` per candidate.
+
+  - Candidates are bucketed by length.  WRatio can't exceed 60 when one
+    string is more than 8x longer than the other, so with the default cutoff those
+    pairs are never scored; choices are kept sorted by length and each
+    bucket is scored against the contiguous slice it can still match.
+  - ``match(text, memo)`` takes a dict owned by the caller: one per
+    document, so overlapping windows don't score the same candidate twice.
+
+Results are the same as ``extractOne`` per candidate, including its
+tie-break (earliest skill in taxonomy order wins).
+"""
+
+from __future__ import annotations
+
+import bisect
+import logging
+import re
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+import numpy as np
+from rapidfuzz import fuzz, process as rfprocess
+
+logger = logging.getLogger(__name__)
+
+# candidate text (lower-cased) -> canonical skill, or None for no match
+FuzzyMemo = Dict[str, Optional[str]]
+
+
+def _wratio_ceiling(len_a: int, len_b: int) -> float:
+    """Highest WRatio any pair of strings with these lengths can reach."""
+    if not len_a or not len_b:
+        return 0.0
+    ratio = max(len_a, len_b) / min(len_a, len_b)
+    if ratio < 1.5:
+        return 100.0
+    return 90.0 if ratio <= 8 else 60.0
+
+
+class FuzzySkillMatcher:
+    def __init__(
+        self,
+        skills: Iterable[str],
+        score_cutoff: float = 85,
+        min_token_len: int = 3,
+        max_candidates: int = 300,
+        workers: int = -1,
+    ):
+        lower_map: Dict[str, Tuple[int, str]] = {}
+        for skill in skills:
+            lower_map.setdefault(skill.lower(), (len(lower_map), skill))
+        by_length = sorted(lower_map.items(), key=lambda kv: len(kv[0]))
+        self._choices = [k for k, _ in by_length]
+        self._canonical = [v[1] for _, v in by_length]
+        self._rank = np.array([v[0] for _, v in by_length])   # taxonomy order
+        self._lengths = [len(k) for k in self._choices]
+        self.score_cutoff = score_cutoff
+        self.min_token_len = min_token_len
+        self.max_candidates = max_candidates
+        self.workers = workers
+
+    def candidates(self, text: str) -> List[str]:
+        """Distinct lower-cased tokens and bigrams, in order of appearance."""
+        tokens = re.findall(r"[A-Za-z0-9#+.]+", text)
+        out: Dict[str, None] = {}
+        for i, tok in enumerate(tokens):
+            if len(tok) >= self.min_token_len:
+                out[tok.lower()] = None
+            if i + 1 < len(tokens):
+                bigram = f"{tok} {tokens[i + 1]}"
+                if len(bigram) >= self.min_token_len + 2:
+                    out[bigram.lower()] = None
+        return list(out)[: self.max_candidates]
+
+    def match(self, text: str, memo: Optional[FuzzyMemo] = None) -> Set[str]:
+        """Canonical skills that some candidate in *text* is a near-miss of."""
+        memo = {} if memo is None else memo
+        candidates = self.candidates(text)
+        todo = [c for c in candidates if c not in memo]
+        if todo:
+            memo.update(self.score(todo))
+        return {memo[c] for c in candidates if memo[c] is not None}
+
+    def _feasible_slice(self, length: int) -> Tuple[int, int]:
+        """Range of (length-sorted) choices whose WRatio ceiling passes the cutoff."""
+        lo = bisect.bisect_left(self._lengths, 1)
+        while lo < len(self._lengths) and _wratio_ceiling(length, self._lengths[lo]) < self.score_cutoff:
+            lo = bisect.bisect_right(self._lengths, self._lengths[lo])
+        hi = lo
+        while hi < len(self._lengths) and _wratio_ceiling(length, self._lengths[hi]) >= self.score_cutoff:
+            hi = bisect.bisect_right(self._lengths, self._lengths[hi])
+        return lo, hi
+
+    def score(self, candidates: List[str]) -> FuzzyMemo:
+        """Best fuzzy (non-exact) skill for each lower-cased candidate."""
+        buckets: Dict[Tuple[int, int], List[str]] = defaultdict(list)
+        for c in candidates:
+            buckets[self._feasible_slice(len(c))].append(c)
+
+        result: FuzzyMemo = {}
+        for (lo, hi), group in buckets.items():
+            if lo >= hi:
+                result.update(dict.fromkeys(group))
+                continue
+            scores = rfprocess.cdist(
+                group, self._choices[lo:hi], scorer=fuzz.WRatio,
+                score_cutoff=self.score_cutoff, workers=self.workers, dtype=np.float64,
+            )
+            best = scores.max(axis=1)
+            # extractOne keeps the first best choice in taxonomy order
+            rank = np.where(scores == best[:, None], self._rank[lo:hi], np.iinfo(np.int64).max)
+            picks = lo + rank.argmin(axis=1)
+            for c, score, pick in zip(group, best.tolist(), picks.tolist()):
+                if score < self.score_cutoff or self._choices[pick] == c:
+                    result[c] = None
+                    continue
+                result[c] = self._canonical[pick]
+                logger.debug(f"Fuzzy match: '{c}' -> {result[c]} (score: {score:.0f})")
+        return result
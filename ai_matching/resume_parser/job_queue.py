@@ -0,0 +1,431 @@
+"""
+Parse Job Queue  (durable, sqlite)
+
+A synchronous /parse keeps the caller's connection open for the whole
+parse. With an LLM provider in the loop, that can come close to the
+backend's 45 s client timeout.  Jobs decouple the two.  POST /parse/jobs
+stores the upload here and returns a job id at once.  The caller then
+polls GET /parse/jobs/{id}, or gets a POST to its callback URL.  Callback
+URLs must sit under one of the PARSE_JOB_CALLBACK_ALLOWLIST base URLs (e.g.
+the backend's), so a caller can't point the parser at internal hosts or
+have parse results sent somewhere else.
+
+Jobs live in a local sqlite table, so a restart loses nothing:
+
+    queued -> running -> done      (result holds the ParseResponse JSON,
+                                    which may itself be success=false)
+                      -> failed    (could not be run: crashed or retried out)
+
+JobRunner tasks claim the oldest queued job with a lease (PARSE_JOB_LEASE_S).
+If the service dies mid-parse, the job stays "running" until its lease
+expires.  The next claim then picks it up again, up to PARSE_JOB_MAX_ATTEMPTS
+times.  A claim's attempt number is its token: finish/fail/release only
+touch a job still running under that attempt, so a runner whose lease ran
+out (and whose job was claimed again) can't overwrite the newer run.  A graceful shutdown hands in-flight jobs back to the queue straight
+away.  Claims run under BEGIN IMMEDIATE, so several service processes can
+share one database file.
+
+The runners are asyncio tasks inside the API process, not worker processes
+of their own: the parsing happens wherever the runner's *parse* callable
+sends it.  In main.py that is _parse_file, whose CPU-bound stages run on
+the parse worker pool's processes.  Upload bytes are dropped once a job finishes, and finished
+jobs are deleted after PARSE_JOB_RETENTION_S.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Sequence
+from urllib.parse import urlsplit
+
+logger = logging.getLogger(__name__)
+
+PARSE_JOB_DB = Path(os.getenv(
+    "PARSE_JOB_DB", Path(__file__).resolve().parent / ".cache" / "parse_jobs.sqlite3"
+))
+PARSE_JOB_LEASE_S = float(os.getenv("PARSE_JOB_LEASE_S", "300"))
+PARSE_JOB_MAX_ATTEMPTS = int(os.getenv("PARSE_JOB_MAX_ATTEMPTS", "3"))
+PARSE_JOB_RETENTION_S = float(os.getenv("PARSE_JOB_RETENTION_S", str(24 * 3600)))
+PARSE_JOB_RUNNERS = int(os.getenv("PARSE_JOB_RUNNERS", "2"))
+PARSE_JOB_POLL_S = float(os.getenv("PARSE_JOB_POLL_S", "1.0"))
+# Resend unacknowledged callbacks and purge old jobs this often
+PARSE_JOB_HOUSEKEEPING_S = float(os.getenv("PARSE_JOB_HOUSEKEEPING_S", "30"))
+# Comma-separated base URLs callbacks may go to; empty disables callbacks
+PARSE_JOB_CALLBACK_ALLOWLIST = [
+    url.strip() for url in os.getenv("PARSE_JOB_CALLBACK_ALLOWLIST", "").split(",") if url.strip()
+]
+
+_COLUMNS = (
+    "id, status, filename, callback_url, client_ref, result, error,"
+    " attempts, created_at, updated_at"
+)
+
+
+@dataclass
+class Job:
+    id: str
+    status: str
+    filename: str
+    callback_url: Optional[str]
+    client_ref: Optional[str]
+    result: Optional[str]
+    error: Optional[str]
+    attempts: int
+    created_at: float
+    updated_at: float
+    content: Optional[bytes] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "job_id": self.id,
+            "status": self.status,
+            "filename": self.filename,
+            "client_ref": self.client_ref,
+            "attempts": self.attempts,
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
+            "error": self.error,
+            "result": json.loads(self.result) if self.result else None,
+        }
+
+
+class JobQueue:
+    def __init__(
+        self,
+        path: Path = PARSE_JOB_DB,
+        lease_s: float = PARSE_JOB_LEASE_S,
+        max_attempts: int = PARSE_JOB_MAX_ATTEMPTS,
+        retention_s: float = PARSE_JOB_RETENTION_S,
+    ) -> None:
+        self.lease_s = lease_s
+        self.max_attempts = max_attempts
+        self.retention_s = retention_s
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        try:
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+            # Autocommit; multi-statement updates open their own transactions
+            self._conn = sqlite3.connect(
+                str(path), timeout=5, check_same_thread=False, isolation_level=None
+            )
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS parse_jobs ("
+                " id TEXT PRIMARY KEY,"
+                " status TEXT NOT NULL,"
+                " filename TEXT NOT NULL,"
+                " content BLOB,"
+                " callback_url TEXT,"
+                " client_ref TEXT,"
+                " result TEXT,"
+                " error TEXT,"
+                " attempts INTEGER NOT NULL DEFAULT 0,"
+                " lease_until REAL,"
+                " notified INTEGER NOT NULL DEFAULT 0,"
+                " created_at REAL NOT NULL,"
+                " updated_at REAL NOT NULL)"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS parse_jobs_status"
+                " ON parse_jobs (status, created_at)"
+            )
+        except sqlite3.Error as e:
+            logger.warning(f"Parse job queue disabled ({path}): {e}")
+            self._conn = None
+
+    @property
+    def enabled(self) -> bool:
+        return self._conn is not None
+
+    # ---------- producer / reader ----------
+
+    def submit(
+        self,
+        filename: str,
+        content: bytes,
+        callback_url: Optional[str] = None,
+        client_ref: Optional[str] = None,
+    ) -> str:
+        job_id = uuid.uuid4().hex
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO parse_jobs (id, status, filename, content, callback_url,"
+                " client_ref, created_at, updated_at) VALUES (?, 'queued', ?, ?, ?, ?, ?, ?)",
+                (job_id, filename, content, callback_url, client_ref, now, now),
+            )
+        return job_id
+
+    def get(self, job_id: str) -> Optional[Job]:
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT {_COLUMNS} FROM parse_jobs WHERE id = ?", (job_id,)
+            ).fetchone()
+        return Job(*row) if row else None
+
+    def counts(self) -> Dict[str, int]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT status, COUNT(*) FROM parse_jobs GROUP BY status"
+            ).fetchall()
+        return dict(rows)
+
+    # ---------- runner side ----------
+
+    def claim(self) -> Optional[Job]:
+        """Lease the oldest runnable job (queued, or running past its lease)."""
+        now = time.time()
+        with self._lock:
+            conn = self._conn
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                conn.execute(
+                    "UPDATE parse_jobs SET status = 'failed', content = NULL, lease_until = NULL,"
+                    " error = 'Parser stopped while running this job ' || attempts || ' times',"
+                    " updated_at = ?"
+                    " WHERE status = 'running' AND lease_until < ? AND attempts >= ?",
+                    (now, now, self.max_attempts),
+                )
+                row = conn.execute(
+                    f"SELECT {_COLUMNS}, content FROM parse_jobs"
+                    " WHERE status = 'queued' OR (status = 'running' AND lease_until < ?)"
+                    " ORDER BY created_at LIMIT 1",
+                    (now,),
+                ).fetchone()
+                if row is not None:
+                    conn.execute(
+                        "UPDATE parse_jobs SET status = 'running', attempts = attempts + 1,"
+                        " lease_until = ?, updated_at = ? WHERE id = ?",
+                        (now + self.lease_s, now, row[0]),
+                    )
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+        if row is None:
+            return None
+        job = Job(*row)
+        job.status = "running"
+        job.attempts += 1
+        return job
+
+    # finish/fail/release take the claimed Job and return False when its
+    # claim is stale (the job was claimed again or already closed); the
+    # caller's result is then dropped.
+
+    def finish(self, job: Job, result: str) -> bool:
+        return self._close(job, "done", result=result)
+
+    def fail(self, job: Job, error: str, retry: bool = True) -> bool:
+        """Requeue the job if it has attempts left (and *retry*), else fail it."""
+        if retry and job.attempts < self.max_attempts:
+            with self._lock:
+                cur = self._conn.execute(
+                    "UPDATE parse_jobs SET status = 'queued', lease_until = NULL, error = ?,"
+                    " updated_at = ? WHERE id = ? AND status = 'running' AND attempts = ?",
+                    (error, time.time(), job.id, job.attempts),
+                )
+            return cur.rowcount > 0
+        return self._close(job, "failed", error=error)
+
+    def release(self, jobs: Iterable[Job]) -> None:
+        """Hand running jobs back to the queue without using up an attempt."""
+        with self._lock:
+            self._conn.executemany(
+                "UPDATE parse_jobs SET status = 'queued', lease_until = NULL,"
+                " attempts = attempts - 1, updated_at = ?"
+                " WHERE id = ? AND status = 'running' AND attempts = ?",
+                [(time.time(), job.id, job.attempts) for job in jobs],
+            )
+
+    def _close(self, job: Job, status: str, result: Optional[str] = None, error: Optional[str] = None) -> bool:
+        with self._lock:
+            cur = self._conn.execute(
+                "UPDATE parse_jobs SET status = ?, result = ?, error = ?, content = NULL,"
+                " lease_until = NULL, updated_at = ?"
+                " WHERE id = ? AND status = 'running' AND attempts = ?",
+                (status, result, error, time.time(), job.id, job.attempts),
+            )
+        return cur.rowcount > 0
+
+    # ---------- callbacks / housekeeping ----------
+
+    def pending_callbacks(self, limit: int = 50) -> List[Job]:
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT {_COLUMNS} FROM parse_jobs"
+                " WHERE status IN ('done', 'failed') AND callback_url IS NOT NULL AND notified = 0"
+                " ORDER BY updated_at LIMIT ?",
+                (limit,),
+            ).fetchall()
+        return [Job(*row) for row in rows]
+
+    def mark_notified(self, job_id: str) -> None:
+        with self._lock:
+            self._conn.execute("UPDATE parse_jobs SET notified = 1 WHERE id = ?", (job_id,))
+
+    def purge(self) -> int:
+        """Delete finished jobs older than the retention period."""
+        with self._lock:
+            cur = self._conn.execute(
+                "DELETE FROM parse_jobs WHERE status IN ('done', 'failed') AND updated_at < ?",
+                (time.time() - self.retention_s,),
+            )
+        return cur.rowcount
+
+
+def callback_allowed(url: str, allowlist: Sequence[str] = PARSE_JOB_CALLBACK_ALLOWLIST) -> bool:
+    """Is *url* under one of the *allowlist* base URLs?  Scheme and host:port
+    must match exactly and the path must be the base path or below it."""
+    try:
+        target = urlsplit(url)
+        target_port = target.port
+    except ValueError:
+        return False
+    if target.scheme not in ("http", "https") or not target.hostname or target.username:
+        return False
+    for base_url in allowlist:
+        base = urlsplit(base_url)
+        if (
+            (target.scheme, target.hostname, target_port) == (base.scheme, base.hostname, base.port)
+            and (target.path + "/").startswith(base.path.rstrip("/") + "/")
+        ):
+            return True
+    return False
+
+
+async def post_callback(job: Job) -> bool:
+    """POST the finished job to its callback URL; True once acknowledged (2xx).
+
+    A URL that is no longer allowlisted (the config changed since submit)
+    is dropped and reported as True so it isn't retried.
+    """
+    import httpx
+
+    if not callback_allowed(job.callback_url):
+        logger.warning(f"Callback for job {job.id} dropped: URL not in PARSE_JOB_CALLBACK_ALLOWLIST")
+        return True
+    try:
+        async with httpx.AsyncClient(timeout=10) as client:
+            response = await client.post(job.callback_url, json=job.to_dict())
+        return response.is_success
+    except httpx.HTTPError as e:
+        logger.info(f"Callback for job {job.id} failed: {e}")
+        return False
+
+
+class JobRunner:
+    """*concurrency* asyncio tasks draining a JobQueue through *parse*.
+
+    *parse(filename, content)* returns the result JSON to store.  If it
+    raises, the job is retried until the queue's max_attempts is used up.
+    """
+
+    def __init__(
+        self,
+        queue: JobQueue,
+        parse: Callable[[str, bytes], Awaitable[str]],
+        concurrency: int = PARSE_JOB_RUNNERS,
+        poll_s: float = PARSE_JOB_POLL_S,
+        housekeeping_s: float = PARSE_JOB_HOUSEKEEPING_S,
+        notify: Callable[[Job], Awaitable[bool]] = post_callback,
+    ) -> None:
+        self.queue = queue
+        self._parse = parse
+        self._concurrency = max(1, concurrency)
+        self._poll_s = poll_s
+        self._housekeeping_s = housekeeping_s
+        self._notify = notify
+        self._wake = asyncio.Event()
+        self._tasks: List[asyncio.Task] = []
+        self._in_flight: Dict[str, Job] = {}
+
+    def start(self) -> None:
+        self._tasks = [asyncio.ensure_future(self._work()) for _ in range(self._concurrency)]
+        self._tasks.append(asyncio.ensure_future(self._housekeeping()))
+
+    def wake(self) -> None:
+        """A job was just submitted: skip the rest of the idle poll."""
+        self._wake.set()
+
+    async def stop(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        if self._in_flight:
+            self.queue.release(list(self._in_flight.values()))
+            self._in_flight.clear()
+
+    async def _work(self) -> None:
+        while True:
+            try:
+                job = await asyncio.to_thread(self.queue.claim)
+            except sqlite3.Error as e:
+                logger.warning(f"Could not claim a parse job: {e}")
+                job = None
+            if job is None:
+                self._wake.clear()
+                try:
+                    await asyncio.wait_for(self._wake.wait(), self._poll_s)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+            await self._run(job)
+
+    async def _run(self, job: Job) -> None:
+        self._in_flight[job.id] = job
+        try:
+            result = await self._parse(job.filename, job.content)
+        except asyncio.CancelledError:
+            raise   # stop() releases it
+        except Exception as e:
+            logger.warning(f"Parse job {job.id} attempt {job.attempts} failed: {e}")
+            self._in_flight.pop(job.id, None)
+            recorded = await asyncio.to_thread(self.queue.fail, job, str(e))
+        else:
+            self._in_flight.pop(job.id, None)
+            recorded = await asyncio.to_thread(self.queue.finish, job, result)
+        if not recorded:
+            logger.warning(
+                f"Parse job {job.id} attempt {job.attempts} outlived its lease; result dropped"
+            )
+        elif job.callback_url:
+            await self._send_callback(job.id)
+
+    async def _send_callback(self, job_id: str) -> None:
+        job = await asyncio.to_thread(self.queue.get, job_id)
+        if job is not None and job.status in ("done", "failed") and await self._notify(job):
+            await asyncio.to_thread(self.queue.mark_notified, job_id)
+
+    async def _housekeeping(self) -> None:
+        while True:
+            await asyncio.sleep(self._housekeeping_s)
+            try:
+                for job in await asyncio.to_thread(self.queue.pending_callbacks):
+                    if await self._notify(job):
+                        await asyncio.to_thread(self.queue.mark_notified, job.id)
+                purged = await asyncio.to_thread(self.queue.purge)
+                if purged:
+                    logger.info(f"Purged {purged} finished parse jobs")
+            except sqlite3.Error as e:
+                logger.warning(f"Parse job housekeeping failed: {e}")
+
+
+_queue: Optional[JobQueue] = None
+
+
+def get_job_queue() -> JobQueue:
+    global _queue
+    if _queue is None:
+        _queue = JobQueue()
+    return _queue
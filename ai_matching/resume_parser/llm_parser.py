@@ -26,6 +26,9 @@ import logging
 import os
 from typing import Any, Dict, List, Optional
 
+from llm_resilience import CircuitOpenError, get_llm_cache, get_provider_guard, llm_flights
+from parse_cache import content_hash
+
 logger = logging.getLogger(__name__)
 
 # --------------------------------------------------------------------------
@@ -106,11 +109,44 @@ RESUME TEXT:
 """
 
 
+# Part of every LLM cache key: editing the prompt retires old completions
+PROMPT_VERSION = content_hash(EXTRACTION_PROMPT.encode())[:12]
+
+PROVIDER_MODELS = {
+    "openai": "gpt-4o-mini",
+    "gemini": "gemini-2.0-flash",
+    "ollama": "llama3.1",
+}
+
+
 class LLMParserError(Exception):
     """Raised when LLM parsing fails."""
     pass
 
 
+def resolve_provider(provider: str = "auto") -> str:
+    """The provider *provider* means right now: "auto" picks OpenAI, then
+    Gemini by which API key is set, and Ollama (no key needed) otherwise."""
+    if provider != "auto":
+        return provider
+    if os.getenv("OPENAI_API_KEY", ""):
+        return "openai"
+    if os.getenv("GEMINI_API_KEY", "") or os.getenv("GOOGLE_API_KEY", ""):
+        return "gemini"
+    return "ollama"
+
+
+def provider_cache_key(provider: str = "auto") -> str:
+    """``provider:model`` that results from *provider* are cached under, so a
+    completion from one provider is never served once another is in use."""
+    provider = resolve_provider(provider)
+    return f"{provider}:{PROVIDER_MODELS.get(provider, '')}"
+
+
+class LLMOutputError(LLMParserError):
+    """The provider answered, but not with usable JSON (not an outage)."""
+
+
 async def parse_with_openai(text: str, api_key: str, model: str = "gpt-4o-mini") -> Dict[str, Any]:
     """Parse resume text using OpenAI API with structured output."""
     try:
@@ -146,7 +182,7 @@ async def parse_with_openai(text: str, api_key: str, model: str = "gpt-4o-mini")
 
     except json.JSONDecodeError as e:
         logger.error(f"Failed to parse OpenAI JSON response: {e}")
-        raise LLMParserError(f"Invalid JSON from OpenAI: {e}")
+        raise LLMOutputError(f"Invalid JSON from OpenAI: {e}")
     except Exception as e:
         logger.error(f"OpenAI API error: {e}")
         raise LLMParserError(f"OpenAI API error: {e}")
@@ -196,7 +232,7 @@ async def parse_with_gemini(text: str, api_key: str, model: str = "gemini-2.0-fl
 
     except json.JSONDecodeError as e:
         logger.error(f"Failed to parse Gemini JSON response: {e}")
-        raise LLMParserError(f"Invalid JSON from Gemini: {e}")
+        raise LLMOutputError(f"Invalid JSON from Gemini: {e}")
     except Exception as e:
         logger.error(f"Gemini API error: {e}")
         raise LLMParserError(f"Gemini API error: {e}")
@@ -210,7 +246,8 @@ async def parse_with_ollama(text: str, model: str = "llama3.1", base_url: str =
         raise LLMParserError("httpx package not installed. Run: pip install httpx")
 
     try:
-        async with httpx.AsyncClient(timeout=120.0) as client:
+        # Short connect timeout: an absent Ollama should fail fast, not after 120 s
+        async with httpx.AsyncClient(timeout=httpx.Timeout(120.0, connect=5.0)) as client:
             response = await client.post(
                 f"{base_url}/api/generate",
                 json={
@@ -232,7 +269,7 @@ async def parse_with_ollama(text: str, model: str = "llama3.1", base_url: str =
             return json.loads(content)
 
     except json.JSONDecodeError as e:
-        raise LLMParserError(f"Invalid JSON from Ollama: {e}")
+        raise LLMOutputError(f"Invalid JSON from Ollama: {e}")
     except Exception as e:
         raise LLMParserError(f"Ollama error: {e}")
 
@@ -254,6 +291,9 @@ async def llm_parse_resume(
       3. Ollama  (if running locally — free, no API key)
       4. Fallback to None (caller should use traditional parser)
 
+    Completions are cached by text, provider, model and PROMPT_VERSION, and
+    a provider that keeps failing is skipped for a while (llm_resilience.py).
+
     Args:
         text: Cleaned resume text
         provider: "openai", "gemini", "ollama", or "auto"
@@ -264,33 +304,54 @@ async def llm_parse_resume(
     openai_key = os.getenv("OPENAI_API_KEY", "")
     gemini_key = os.getenv("GEMINI_API_KEY", "") or os.getenv("GOOGLE_API_KEY", "")
 
-    if provider == "auto":
-        if openai_key:
-            provider = "openai"
-        elif gemini_key:
-            provider = "gemini"
-        else:
-            # Try Ollama as free fallback
-            provider = "ollama"
+    provider = resolve_provider(provider)
 
     logger.info(f"Using LLM provider: {provider}")
 
     if provider == "openai":
         if not openai_key:
             raise LLMParserError("OPENAI_API_KEY not set")
-        return await parse_with_openai(text, openai_key)
+        call = lambda model: parse_with_openai(text, openai_key, model)
 
     elif provider == "gemini":
         if not gemini_key:
             raise LLMParserError("GEMINI_API_KEY not set")
-        return await parse_with_gemini(text, gemini_key)
+        call = lambda model: parse_with_gemini(text, gemini_key, model)
 
     elif provider == "ollama":
-        return await parse_with_ollama(text)
+        call = lambda model: parse_with_ollama(text, model)
 
     else:
         raise LLMParserError(f"Unknown LLM provider: {provider}")
 
+    return await _guarded_call(provider, text, call)
+
+
+async def _guarded_call(provider: str, text: str, call) -> Dict[str, Any]:
+    """Cache, coalesce, rate-limit and circuit-break one provider call
+    (see llm_resilience.py).  *call(model)* makes the actual request."""
+    model = PROVIDER_MODELS[provider]
+    digest = content_hash(text.encode("utf-8"))
+    cache_pipeline = f"{provider}:{model}"
+
+    cached = get_llm_cache().get(digest, cache_pipeline, PROMPT_VERSION)
+    if cached is not None:
+        logger.info(f"LLM cache hit ({provider}, {digest[:12]})")
+        return json.loads(cached)
+
+    async def fetch() -> Dict[str, Any]:
+        try:
+            data = await get_provider_guard(provider).call(
+                lambda: call(model),
+                is_failure=lambda e: not isinstance(e, LLMOutputError),
+            )
+        except CircuitOpenError as e:
+            raise LLMParserError(str(e)) from e
+        get_llm_cache().put(digest, cache_pipeline, PROMPT_VERSION, json.dumps(data))
+        return data
+
+    return await llm_flights.do((cache_pipeline, digest), fetch)
+
 
 # --------------------------------------------------------------------------
 # Normalize LLM output to match existing schema
@@ -0,0 +1,215 @@
+"""
+LLM Call Guards  (cache, coalescing, concurrency limit, circuit breaker)
+
+llm_parse_resume runs on every /parse.  Without these guards, each call
+went straight to the provider.  That meant:
+  - the same resume text was sent again on every re-parse (e.g. after a
+    taxonomy reload invalidated the parse cache);
+  - identical concurrent uploads each paid for their own completion;
+  - with no API key set, auto mode tried Ollama on localhost:11434 for
+    every request and waited for the connection to fail first.
+
+Each provider call is now wrapped as follows:
+
+    cache (sqlite, by text hash + provider + model + prompt version)
+      -> SingleFlight (identical in-flight calls share one result)
+        -> CircuitBreaker (skip a provider that keeps failing)
+          -> Semaphore (LLM_CONCURRENCY_<PROVIDER> calls at once)
+
+Breaker states:
+  closed     calls go through; LLM_BREAKER_FAILURES failures in a row open it
+  open       calls fail at once with CircuitOpenError for LLM_BREAKER_RESET_S
+  half-open  one probe call goes through; success closes the breaker,
+             failure re-opens it
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional
+
+from parse_cache import ParseCache
+
+logger = logging.getLogger(__name__)
+
+LLM_CACHE_DB = Path(os.getenv(
+    "LLM_CACHE_DB", Path(__file__).resolve().parent / ".cache" / "llm_cache.sqlite3"
+))
+LLM_CACHE_TTL_S = float(os.getenv("LLM_CACHE_TTL_S", str(30 * 24 * 3600)))
+LLM_CACHE_MAX_ENTRIES = int(os.getenv("LLM_CACHE_MAX_ENTRIES", "20000"))
+LLM_BREAKER_FAILURES = int(os.getenv("LLM_BREAKER_FAILURES", "3"))
+LLM_BREAKER_RESET_S = float(os.getenv("LLM_BREAKER_RESET_S", "30"))
+LLM_CONCURRENCY = {
+    "openai": int(os.getenv("LLM_CONCURRENCY_OPENAI", "8")),
+    "gemini": int(os.getenv("LLM_CONCURRENCY_GEMINI", "4")),
+    # A local Ollama generates one completion at a time anyway
+    "ollama": int(os.getenv("LLM_CONCURRENCY_OLLAMA", "1")),
+}
+
+
+class CircuitOpenError(RuntimeError):
+    """The provider's circuit breaker is open; the call was not made."""
+
+
+class CircuitBreaker:
+    CLOSED, OPEN, HALF_OPEN = "closed", "open", "half_open"
+
+    def __init__(
+        self,
+        failure_threshold: int = LLM_BREAKER_FAILURES,
+        reset_after_s: float = LLM_BREAKER_RESET_S,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.failure_threshold = max(1, failure_threshold)
+        self.reset_after_s = reset_after_s
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._probing = False
+        self.rejected = 0
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._state()
+
+    def _state(self) -> str:
+        if self._opened_at is None:
+            return self.CLOSED
+        if self._clock() - self._opened_at < self.reset_after_s:
+            return self.OPEN
+        return self.HALF_OPEN
+
+    def allow(self) -> bool:
+        """May a call go out now?  In half-open, only the first caller (the
+        probe) gets True until it reports back."""
+        with self._lock:
+            state = self._state()
+            if state == self.CLOSED:
+                return True
+            if state == self.HALF_OPEN and not self._probing:
+                self._probing = True
+                return True
+            self.rejected += 1
+            return False
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._probing = False
+
+    def record_failure(self) -> bool:
+        """Count a failure; True if this one opened (or re-opened) the breaker."""
+        with self._lock:
+            self._failures += 1
+            opened = self._probing or self._failures >= self.failure_threshold
+            if opened:
+                self._opened_at = self._clock()
+            self._probing = False
+            return opened
+
+    def release(self) -> None:
+        """The call was abandoned (cancelled) before it could tell either way."""
+        with self._lock:
+            self._probing = False
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {"state": self._state(), "failures": self._failures, "rejected": self.rejected}
+
+
+class SingleFlight:
+    """Concurrent ``do(key, fn)`` calls with the same key share one ``fn()``."""
+
+    def __init__(self) -> None:
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+        self.coalesced = 0
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        future = self._inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(fn())
+            self._inflight[key] = future
+            future.add_done_callback(lambda f: self._finished(key, f))
+        else:
+            self.coalesced += 1
+        # Shielded: one caller going away must not cancel the call for the rest
+        return await asyncio.shield(future)
+
+    def _finished(self, key: Hashable, future: asyncio.Future) -> None:
+        self._inflight.pop(key, None)
+        if not future.cancelled():
+            future.exception()  # retrieved, even if every caller went away
+
+
+class ProviderGuard:
+    """Breaker + concurrency limit for one LLM provider."""
+
+    def __init__(self, name: str, concurrency: int, breaker: Optional[CircuitBreaker] = None) -> None:
+        self.name = name
+        self.breaker = breaker or CircuitBreaker()
+        self._semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def call(
+        self,
+        fn: Callable[[], Awaitable[Any]],
+        is_failure: Callable[[BaseException], bool] = lambda e: True,
+    ) -> Any:
+        """``await fn()`` under the limit.  Exceptions for which *is_failure*
+        is False (e.g. a bad completion from a healthy provider) don't
+        count against the breaker."""
+        if not self.breaker.allow():
+            raise CircuitOpenError(
+                f"LLM provider {self.name} unavailable after repeated failures, "
+                f"retrying in {self.breaker.reset_after_s:.0f}s"
+            )
+        try:
+            async with self._semaphore:
+                result = await fn()
+        except Exception as e:
+            if is_failure(e):
+                if self.breaker.record_failure():
+                    logger.warning(
+                        f"LLM provider {self.name} circuit open for "
+                        f"{self.breaker.reset_after_s:.0f}s: {e}"
+                    )
+            else:
+                self.breaker.record_success()
+            raise
+        except BaseException:
+            self.breaker.release()
+            raise
+        self.breaker.record_success()
+        return result
+
+
+_guards: Dict[str, ProviderGuard] = {}
+_cache: Optional[ParseCache] = None
+llm_flights = SingleFlight()
+
+
+def get_provider_guard(provider: str) -> ProviderGuard:
+    if provider not in _guards:
+        _guards[provider] = ProviderGuard(provider, LLM_CONCURRENCY.get(provider, 4))
+    return _guards[provider]
+
+
+def get_llm_cache() -> ParseCache:
+    global _cache
+    if _cache is None:
+        _cache = ParseCache(LLM_CACHE_DB, LLM_CACHE_TTL_S, LLM_CACHE_MAX_ENTRIES)
+    return _cache
+
+
+def llm_stats() -> Dict[str, Any]:
+    return {
+        "providers": {name: guard.breaker.stats() for name, guard in _guards.items()},
+        "coalesced": llm_flights.coalesced,
+    }
@@ -13,12 +13,18 @@ Pipeline:
   8. Confidence scoring & tech-stack detection
 """
 
-from fastapi import FastAPI, File, UploadFile, HTTPException, Body
+from fastapi import FastAPI, File, Form, UploadFile, HTTPException, Body
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, StreamingResponse
+import asyncio
+import hashlib
+import json
 import logging
+import tempfile
 import time
 import os
-from typing import Optional
+from pathlib import Path
+from typing import NamedTuple, Optional
 
 # Load environment variables from .env file (GEMINI_API_KEY, OPENAI_API_KEY, etc.)
 try:
@@ -40,7 +46,18 @@ from education_extractor import EducationExtractor
 from section_detector import SectionDetector, SectionLabel
 from segmented_processor import SegmentedProcessor
 from production_monitor import get_monitor
-from config import MAX_FILE_SIZE_MB, ALLOWED_EXTENSIONS, SPACY_MODEL
+from parse_cache import content_hash, get_parse_cache
+from batch_runner import run_batch
+from job_queue import JobRunner, callback_allowed, get_job_queue
+from llm_parser import provider_cache_key
+from llm_resilience import llm_stats
+from parse_pool import ParsePool, PoolError, PoolSaturated, PoolTimeout
+from spacy_pipeline import SpacyPipeline
+from config import (
+    MAX_FILE_SIZE_MB, ALLOWED_EXTENSIONS, SPACY_MODEL_TIER, PARSER_PIPELINE_VERSION,
+    PARSE_BATCH_MAX_FILES, PARSE_BATCH_CONCURRENCY,
+    PARSE_WORKERS, PARSE_POOL_MAX_PENDING, PARSE_JOB_TIMEOUT_S, PDF_BACKEND,
+)
 
 import re as _re
 
@@ -78,21 +95,66 @@ skills_extractor: Optional[SkillsExtractor] = None
 education_extractor: Optional[EducationExtractor] = None
 section_detector: Optional[SectionDetector] = None
 segmented_processor: Optional[SegmentedProcessor] = None
+spacy_pipeline: Optional[SpacyPipeline] = None
 _spacy_nlp = None
+# With PARSE_WORKERS > 0, PDF extraction and the traditional pipeline run in
+# worker processes and the API process never loads the models itself
+parse_pool: Optional[ParsePool] = None
+# Drains POST /parse/jobs uploads in the background (see job_queue.py)
+job_runner: Optional[JobRunner] = None
 
 
 @app.on_event("startup")
 async def startup_event():
-    global pdf_processor, entity_extractor, experience_extractor, skills_extractor, education_extractor, section_detector, segmented_processor, _spacy_nlp
+    global parse_pool, job_runner
 
     logger.info("Initializing Resume Parser API v2.0 ...")
 
+    if PARSE_WORKERS > 0:
+        logger.info(f"Starting {PARSE_WORKERS} parse workers ...")
+        parse_pool = ParsePool(
+            workers=PARSE_WORKERS,
+            max_pending=PARSE_POOL_MAX_PENDING,
+            timeout_s=PARSE_JOB_TIMEOUT_S,
+            initializer=_load_extractors,
+        )
+        await parse_pool.warm()
+        logger.info("Parse workers ready")
+    else:
+        _load_extractors()
+
+    if get_job_queue().enabled:
+        job_runner = JobRunner(get_job_queue(), _run_parse_job)
+        job_runner.start()
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    if job_runner is not None:
+        await job_runner.stop()
+    if parse_pool is not None:
+        parse_pool.shutdown()
+
+
+@app.exception_handler(PoolError)
+async def pool_error_handler(request, exc: PoolError):
+    if isinstance(exc, PoolTimeout):
+        return JSONResponse(status_code=504, content={"detail": str(exc)})
+    headers = {"Retry-After": "5"} if isinstance(exc, PoolSaturated) else None
+    return JSONResponse(status_code=503, content={"detail": str(exc)}, headers=headers)
+
+
+def _load_extractors() -> None:
+    """Load every model once (in the API process, or in each parse worker)."""
+    global pdf_processor, entity_extractor, experience_extractor, skills_extractor, education_extractor, section_detector, segmented_processor, spacy_pipeline, _spacy_nlp
+
     try:
         pdf_processor = PDFProcessor()
 
-        logger.info(f"Loading spaCy model: {SPACY_MODEL} ...")
-        entity_extractor = EntityExtractor(SPACY_MODEL)
-        _spacy_nlp = entity_extractor.nlp
+        logger.info(f"Loading spaCy ({SPACY_MODEL_TIER} tier) ...")
+        spacy_pipeline = SpacyPipeline.for_tier(SPACY_MODEL_TIER)
+        _spacy_nlp = spacy_pipeline.nlp
+        entity_extractor = EntityExtractor(nlp=_spacy_nlp)
 
         experience_extractor = ExperienceExtractor(nlp=_spacy_nlp)
         education_extractor = EducationExtractor(nlp=_spacy_nlp)
@@ -120,8 +182,11 @@ async def root():
 
 @app.get("/health", tags=["Health"])
 async def health_check():
+    if parse_pool is not None:
+        return {"status": "healthy", "parse_pool": parse_pool.stats(), "llm": llm_stats()}
     return {
         "status": "healthy",
+        "llm": llm_stats(),
         "extractors": {
             "pdf_processor": pdf_processor is not None,
             "entity_extractor": entity_extractor is not None,
@@ -277,26 +342,107 @@ def _extract_certifications(text: str) -> list:
 
     return certifications
 
+# ---------------------------------------------------------------------------
+# Parse result cache
+# ---------------------------------------------------------------------------
+
+PIPELINES = ("hybrid", "llm", "traditional")
+_SHA256_HEX = _re.compile(r"^[0-9a-f]{64}$")
+
+
+def _pipeline_version() -> str:
+    from app.skills.skill_graph import get_skill_graph
+    return f"{PARSER_PIPELINE_VERSION}+{PDF_BACKEND}+{get_skill_graph().content_hash}"
+
+
+def _cached_response(digest: str, pipeline: str, start_time: float) -> Optional[ParseResponse]:
+    payload = get_parse_cache().get(digest, pipeline, _pipeline_version())
+    if payload is None:
+        return None
+    response = ParseResponse.parse_raw(payload)
+    response.cached = True
+    response.processing_time_ms = (time.time() - start_time) * 1000
+    return response
+
+
+def _store_response(digest: str, pipeline: str, response: ParseResponse) -> ParseResponse:
+    response.content_hash = digest
+    if response.success and response.data is not None:
+        get_parse_cache().put(digest, pipeline, _pipeline_version(), response.json())
+    return response
+
+
+def _cache_pipeline(pipeline: str) -> str:
+    """Cache key for *pipeline*'s results.  "hybrid" and "llm" hold LLM
+    results only, keyed by the provider auto mode resolves to right now
+    (Ollama when no API key is set), so switching providers never serves
+    another provider's parse."""
+    if pipeline in ("hybrid", "llm"):
+        return f"{pipeline}:{provider_cache_key()}"
+    return pipeline
+
+
+async def _offload(fn, *args):
+    """Run a CPU-bound stage on the parse pool, or a thread without one.
+
+    *fn* must be a module-level function so it pickles by name.
+    PoolError propagates (see pool_error_handler).
+    """
+    if parse_pool is None:
+        return await asyncio.to_thread(fn, *args)
+    return await parse_pool.run(fn, *args)
+
+
+def _pool_extract_text(file_content: bytes) -> str:
+    return pdf_processor.extract_text_from_bytes(file_content)
+
+
+def _pool_traditional_parse(text: str) -> ResumeData:
+    return _traditional_parse(text)
+
+
+@app.get("/parse/cached/{digest}", response_model=ParseResponse, tags=["Resume Parsing"])
+async def get_cached_parse(digest: str, pipeline: str = "hybrid"):
+    """
+    Look up a parse by the SHA-256 of the file, without uploading it.
+    404 means "not cached": upload the file to the matching endpoint.
+    """
+    digest = digest.lower()
+    if not _SHA256_HEX.match(digest) or pipeline not in PIPELINES:
+        raise HTTPException(status_code=400, detail="Expected a SHA-256 hex digest and a known pipeline")
+    response = _cached_response(digest, _cache_pipeline(pipeline), time.time())
+    if response is None:
+        raise HTTPException(status_code=404, detail="Not cached")
+    return response
+
+
 @app.post("/parse", response_model=ParseResponse, tags=["Resume Parsing"])
 async def parse_resume(file: UploadFile = File(...)):
     """
     Hybrid resume parser: tries LLM-based extraction first (handles ANY format),
     falls back to traditional NLP pipeline if LLM is not configured or fails.
     """
-    start_time = time.time()
+    if not file.filename:
+        raise HTTPException(status_code=400, detail="No file provided")
+    _check_extension(file.filename)
+    return await _parse_file(file.filename, await file.read())
+
+
+def _check_extension(filename: str) -> None:
+    file_ext = filename.split(".")[-1].lower()
+    if f".{file_ext}" not in ALLOWED_EXTENSIONS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid file type. Allowed: {', '.join(ALLOWED_EXTENSIONS)}",
+        )
 
-    try:
-        if not file.filename:
-            raise HTTPException(status_code=400, detail="No file provided")
 
-        file_ext = file.filename.split(".")[-1].lower()
-        if f".{file_ext}" not in ALLOWED_EXTENSIONS:
-            raise HTTPException(
-                status_code=400,
-                detail=f"Invalid file type. Allowed: {', '.join(ALLOWED_EXTENSIONS)}",
-            )
+async def _parse_file(filename: str, file_content: bytes) -> ParseResponse:
+    """/parse for one already-read upload (shared with /parse-batch)."""
+    start_time = time.time()
 
-        file_content = await file.read()
+    try:
+        _check_extension(filename)
         file_size_mb = len(file_content) / (1024 * 1024)
         if file_size_mb > MAX_FILE_SIZE_MB:
             raise HTTPException(
@@ -304,10 +450,17 @@ async def parse_resume(file: UploadFile = File(...)):
                 detail=f"File too large ({file_size_mb:.1f}MB > {MAX_FILE_SIZE_MB}MB)",
             )
 
-        logger.info(f"Processing: {file.filename} ({file_size_mb:.2f} MB)")
+        digest = content_hash(file_content)
+        hybrid = _cache_pipeline("hybrid")
+        cached = _cached_response(digest, hybrid, start_time)
+        if cached is not None:
+            logger.info(f"Cache hit: {filename} ({digest[:12]})")
+            return cached
+
+        logger.info(f"Processing: {filename} ({file_size_mb:.2f} MB)")
 
         # 1. PDF -> text (always needed)
-        text = pdf_processor.extract_text_from_bytes(file_content)
+        text = await _offload(_pool_extract_text, file_content)
         if not text:
             raise HTTPException(status_code=400, detail="Could not extract text from PDF")
 
@@ -350,14 +503,18 @@ async def parse_resume(file: UploadFile = File(...)):
                 raw_text=text[:500],
             )
         else:
-            # 3. Fallback: Traditional NLP pipeline
-            resume_data = _traditional_parse(text)
+            # 3. Fallback: Traditional NLP pipeline (its result may be cached
+            # from an earlier fallback; only the LLM attempt is repeated)
+            cached = _cached_response(digest, "traditional", start_time)
+            if cached is not None:
+                return cached
+            resume_data = await _offload(_pool_traditional_parse, text)
 
         processing_time_ms = (time.time() - start_time) * 1000
 
         monitor = get_monitor()
         monitor.log_parse_result(
-            filename=file.filename,
+            filename=filename,
             resume_data=resume_data,
             processing_time_ms=processing_time_ms,
             success=True,
@@ -365,21 +522,25 @@ async def parse_resume(file: UploadFile = File(...)):
         )
 
         logger.info(f"Parsed resume in {processing_time_ms:.0f}ms")
-        return ParseResponse(
+        response = ParseResponse(
             success=True,
             data=resume_data,
             error=None,
             processing_time_ms=processing_time_ms,
         )
+        # Cached under the pipeline that produced it: a fallback caused by a
+        # failing LLM provider stays out of "hybrid", so the next upload gets
+        # another chance at the LLM result
+        return _store_response(digest, hybrid if llm_result else "traditional", response)
 
-    except HTTPException:
+    except (HTTPException, PoolError):
         raise
     except Exception as e:
         logger.error(f"Error parsing resume: {e}", exc_info=True)
         processing_time_ms = (time.time() - start_time) * 1000
         monitor = get_monitor()
         monitor.log_parse_result(
-            filename=file.filename if file and file.filename else "unknown",
+            filename=filename or "unknown",
             resume_data=None,
             processing_time_ms=processing_time_ms,
             success=False,
@@ -397,7 +558,13 @@ async def parse_resume_llm(file: UploadFile = File(...)):
     start_time = time.time()
     try:
         file_content = await file.read()
-        text = pdf_processor.extract_text_from_bytes(file_content)
+        digest = content_hash(file_content)
+        pipeline = _cache_pipeline("llm")
+        cached = _cached_response(digest, pipeline, start_time)
+        if cached is not None:
+            return cached
+
+        text = await _offload(_pool_extract_text, file_content)
         if not text:
             raise HTTPException(status_code=400, detail="Could not extract text from PDF")
 
@@ -433,8 +600,10 @@ async def parse_resume_llm(file: UploadFile = File(...)):
         )
 
         processing_time_ms = (time.time() - start_time) * 1000
-        return ParseResponse(success=True, data=resume_data, processing_time_ms=processing_time_ms)
+        return _store_response(digest, pipeline, ParseResponse(success=True, data=resume_data, processing_time_ms=processing_time_ms))
 
+    except PoolError:
+        raise
     except Exception as e:
         processing_time_ms = (time.time() - start_time) * 1000
         return ParseResponse(success=False, data=None, error=str(e), processing_time_ms=processing_time_ms)
@@ -446,14 +615,21 @@ async def parse_resume_traditional(file: UploadFile = File(...)):
     start_time = time.time()
     try:
         file_content = await file.read()
-        text = pdf_processor.extract_text_from_bytes(file_content)
+        digest = content_hash(file_content)
+        cached = _cached_response(digest, "traditional", start_time)
+        if cached is not None:
+            return cached
+
+        text = await _offload(_pool_extract_text, file_content)
         if not text:
             raise HTTPException(status_code=400, detail="Could not extract text from PDF")
 
-        resume_data = _traditional_parse(text)
+        resume_data = await _offload(_pool_traditional_parse, text)
         processing_time_ms = (time.time() - start_time) * 1000
-        return ParseResponse(success=True, data=resume_data, processing_time_ms=processing_time_ms)
+        return _store_response(digest, "traditional", ParseResponse(success=True, data=resume_data, processing_time_ms=processing_time_ms))
 
+    except PoolError:
+        raise
     except Exception as e:
         processing_time_ms = (time.time() - start_time) * 1000
         return ParseResponse(success=False, data=None, error=str(e), processing_time_ms=processing_time_ms)
@@ -467,20 +643,33 @@ def _traditional_parse(text: str) -> ResumeData:
         for s in sections
     ]
 
+    # One NER pass over the whole document; each extractor below gets the
+    # entities inside its own section's character span
     header_sec = section_detector.get_section(sections, SectionLabel.HEADER)
     header_text = header_sec.text if header_sec else text[:1500]
-    name, email, phone = entity_extractor.extract_all_entities(header_text)
+    header_start = section_detector.char_span(text, header_sec)[0] if header_sec else 0
+    name_span = (header_start, header_start + min(len(header_text), 1000))
+    doc_ents = spacy_pipeline.entities(text, name_span=name_span)
+
+    name, email, phone = entity_extractor.extract_all_entities(header_text, ents=doc_ents.within(*name_span))
     if not name:
-        name, _, _ = entity_extractor.extract_all_entities(text[:1500])
+        name, _, _ = entity_extractor.extract_all_entities(text[:1500], ents=doc_ents.within(0, 1000))
 
     skills_sec = section_detector.get_section(sections, SectionLabel.SKILLS)
     skills_text = skills_sec.text if skills_sec else ""
     windows = segmented_processor.create_windows_from_sections(sections)
-    all_skill_lists = []
-    if skills_text:
-        all_skill_lists.append(skills_extractor.extract_skills(skills_text, use_semantic=True, use_fuzzy=True))
-    for w in windows:
-        all_skill_lists.append(skills_extractor.extract_skills(w.text, use_semantic=True, use_fuzzy=True))
+    # Exact/synonym and semantic matching run once over the whole document;
+    # the per-section and per-window calls below only add fuzzy hits,
+    # sharing one fuzzy memo so overlapping windows aren't re-scored
+    doc_matches = skills_extractor.find_skill_spans(text)
+    fuzzy_memo = {}
+    skill_texts = ([skills_text] if skills_text else []) + [w.text for w in windows]
+    all_skill_lists = [
+        sorted({m.skill for m in doc_matches}),
+        sorted(skills_extractor.semantic_match_document(skill_texts)),
+    ]
+    for chunk_text in skill_texts:
+        all_skill_lists.append(skills_extractor.extract_skills(chunk_text, use_semantic=False, use_fuzzy=True, exact_matches=(), fuzzy_memo=fuzzy_memo))
     skills = SegmentedProcessor.merge_skill_lists(*all_skill_lists)
     skills_categorized = skills_extractor.get_skill_categories(skills)
 
@@ -489,12 +678,14 @@ def _traditional_parse(text: str) -> ResumeData:
 
     exp_sec = section_detector.get_section(sections, SectionLabel.EXPERIENCE)
     exp_text = exp_sec.text if exp_sec else text
-    experience = experience_extractor.extract_experiences(exp_text)
+    exp_span = section_detector.char_span(text, exp_sec) if exp_sec else (0, len(text))
+    experience = experience_extractor.extract_experiences(exp_text, ents=doc_ents.within(*exp_span))
     total_years = ExperienceExtractor.extract_total_years_experience(experience)
 
     edu_sec = section_detector.get_section(sections, SectionLabel.EDUCATION)
     edu_text = edu_sec.text if edu_sec else text
-    edu_entries = education_extractor.extract(edu_text)
+    edu_span = section_detector.char_span(text, edu_sec) if edu_sec else (0, len(text))
+    edu_entries = education_extractor.extract(edu_text, ents=doc_ents.within(*edu_span))
     education = [Education(**e.to_dict()) for e in edu_entries]
 
     projects = []
@@ -535,15 +726,147 @@ def _traditional_parse(text: str) -> ResumeData:
 
 @app.post("/parse-batch", tags=["Resume Parsing"])
 async def parse_batch(files: list[UploadFile] = File(...)):
-    if len(files) > 10:
-        raise HTTPException(status_code=400, detail="Maximum 10 files per batch")
-    results = []
-    for f in files:
-        try:
-            results.append(await parse_resume(f))
-        except Exception as e:
-            results.append(ParseResponse(success=False, data=None, error=str(e)))
-    return results
+    """
+    Parse many resumes, streaming one NDJSON line per file as it finishes:
+
+        {"index": 3, "filename": "a.pdf", "result": {...ParseResponse...}}
+
+    Up to PARSE_BATCH_CONCURRENCY files are parsed at once; lines arrive in
+    completion order, ``index`` is the file's position in the upload.
+    Duplicate files in a batch are parsed once.
+    """
+    if len(files) > PARSE_BATCH_MAX_FILES:
+        raise HTTPException(status_code=400, detail=f"Maximum {PARSE_BATCH_MAX_FILES} files per batch")
+
+    # Upload files are closed once this handler returns, before the
+    # stream is consumed, so each one is copied to disk here and only read
+    # back into memory once its parse gets a batch slot
+    spool = tempfile.TemporaryDirectory(prefix="parse-batch-")
+    try:
+        uploads = [(f.filename or "", await _spool_upload(f, spool.name)) for f in files]
+    except BaseException:
+        spool.cleanup()
+        raise
+    return StreamingResponse(_stream_batch(uploads, spool), media_type="application/x-ndjson")
+
+
+UPLOAD_CHUNK_BYTES = 1024 * 1024
+
+
+class _SpooledUpload(NamedTuple):
+    path: str
+    digest: str      # content_hash of the bytes at *path*
+    too_large: bool  # copying stopped at MAX_FILE_SIZE_MB
+
+
+async def _spool_upload(upload: UploadFile, directory: str) -> _SpooledUpload:
+    limit = MAX_FILE_SIZE_MB * 1024 * 1024
+    digest = hashlib.sha256()
+    size = 0
+    fd, path = tempfile.mkstemp(dir=directory)
+    with os.fdopen(fd, "wb") as out:
+        while chunk := await upload.read(UPLOAD_CHUNK_BYTES):
+            size += len(chunk)
+            if size > limit:
+                break
+            digest.update(chunk)
+            out.write(chunk)
+    return _SpooledUpload(path, digest.hexdigest(), size > limit)
+
+
+async def _parse_batch_item(filename: str, upload: _SpooledUpload) -> ParseResponse:
+    if upload.too_large:
+        return ParseResponse(success=False, data=None, error=f"File too large (> {MAX_FILE_SIZE_MB}MB)")
+    try:
+        content = await asyncio.to_thread(Path(upload.path).read_bytes)
+        return await _parse_file(filename, content)
+    except HTTPException as e:
+        return ParseResponse(success=False, data=None, error=str(e.detail))
+    except Exception as e:
+        return ParseResponse(success=False, data=None, error=str(e))
+
+
+def _spooled_key(upload: _SpooledUpload) -> str:
+    # An oversized upload was only partly hashed, so it never counts as a copy
+    return upload.path if upload.too_large else upload.digest
+
+
+async def _stream_batch(uploads, spool: tempfile.TemporaryDirectory):
+    try:
+        async for index, filename, response, duplicate in run_batch(
+            uploads, _parse_batch_item, PARSE_BATCH_CONCURRENCY, key=_spooled_key,
+        ):
+            if duplicate:
+                response = response.copy(update={"cached": True})
+            yield (
+                f'{{"index": {index}, "filename": {json.dumps(filename)}, '
+                f'"result": {response.json()}}}\n'
+            )
+    finally:
+        spool.cleanup()
+
+
+# ---------------------------------------------------------------------------
+# Parse jobs (asynchronous /parse)
+# ---------------------------------------------------------------------------
+
+@app.post("/parse/jobs", status_code=202, tags=["Resume Parsing"])
+async def submit_parse_job(
+    file: UploadFile = File(...),
+    callback_url: Optional[str] = Form(None),
+    client_ref: Optional[str] = Form(None),
+):
+    """
+    Queue a /parse and return its job id at once.  Poll GET /parse/jobs/{id},
+    or pass *callback_url* to get the finished job POSTed there; it must be
+    under a PARSE_JOB_CALLBACK_ALLOWLIST base URL.  *client_ref* is stored
+    and handed back untouched.
+    """
+    if not file.filename:
+        raise HTTPException(status_code=400, detail="No file provided")
+    _check_extension(file.filename)
+    if callback_url and not callback_allowed(callback_url):
+        raise HTTPException(
+            status_code=400,
+            detail="callback_url is not under a PARSE_JOB_CALLBACK_ALLOWLIST base URL",
+        )
+    content = await file.read()
+    if len(content) > MAX_FILE_SIZE_MB * 1024 * 1024:
+        raise HTTPException(status_code=400, detail=f"File too large (> {MAX_FILE_SIZE_MB}MB)")
+
+    queue = get_job_queue()
+    if not queue.enabled:
+        raise HTTPException(status_code=503, detail="Parse job queue unavailable")
+    job_id = await asyncio.to_thread(queue.submit, file.filename, content, callback_url, client_ref)
+    if job_runner is not None:
+        job_runner.wake()
+    return {"job_id": job_id, "status": "queued"}
+
+
+@app.get("/parse/jobs/{job_id}", tags=["Resume Parsing"])
+async def get_parse_job(job_id: str):
+    """
+    Job status: queued, running, done or failed.  A done job carries the
+    ParseResponse in ``result`` (which can itself be success=false, e.g. for
+    an unreadable PDF); failed means the parse could not be run at all.
+    """
+    queue = get_job_queue()
+    if not queue.enabled:
+        raise HTTPException(status_code=503, detail="Parse job queue unavailable")
+    job = await asyncio.to_thread(queue.get, job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Unknown or expired job")
+    return job.to_dict()
+
+
+async def _run_parse_job(filename: str, content: bytes) -> str:
+    """JobRunner's parse step.  PoolError and crashes propagate, so the job
+    is retried; a rejected upload is a finished job with an error result."""
+    try:
+        response = await _parse_file(filename, content)
+    except HTTPException as e:
+        response = ParseResponse(success=False, data=None, error=str(e.detail))
+    return response.json()
 
 
 # ---------------------------------------------------------------------------
@@ -0,0 +1,166 @@
+"""
+Parse Result Cache  (content-addressed)
+
+Students re-upload the same PDF, and /parse-batch often carries duplicates.
+Parsed responses are stored in sqlite keyed by
+
+    (SHA-256 of the uploaded bytes, pipeline, pipeline version)
+
+where *pipeline* is the one that produced the result: "hybrid" (an LLM
+result from /parse) or "llm", both suffixed with the provider and model
+(e.g. "hybrid:ollama:llama3.1"), or "traditional" (also /parse's
+fallback).  The version covers both the parser release and the skill taxonomy hash, so a
+taxonomy reload or a parser upgrade never serves stale skills.
+
+Entries expire after PARSE_CACHE_TTL_S and the table is trimmed to
+PARSE_CACHE_MAX_ENTRIES, least recently used first.  Clients that already
+hold the bytes can look a hash up (GET /parse/cached/{sha256}) before
+uploading anything.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+PARSE_CACHE_DB = Path(os.getenv(
+    "PARSE_CACHE_DB", Path(__file__).resolve().parent / ".cache" / "parse_cache.sqlite3"
+))
+PARSE_CACHE_TTL_S = float(os.getenv("PARSE_CACHE_TTL_S", str(7 * 24 * 3600)))
+PARSE_CACHE_MAX_ENTRIES = int(os.getenv("PARSE_CACHE_MAX_ENTRIES", "20000"))
+# Trim once this many puts have happened since the last trim
+_TRIM_EVERY = 100
+
+
+def content_hash(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+class ParseCache:
+    """sqlite-backed (content_hash, pipeline, version) -> response JSON."""
+
+    def __init__(
+        self,
+        path: Path = PARSE_CACHE_DB,
+        ttl_s: float = PARSE_CACHE_TTL_S,
+        max_entries: int = PARSE_CACHE_MAX_ENTRIES,
+    ) -> None:
+        self.ttl_s = ttl_s
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._puts = 0
+        self._conn: Optional[sqlite3.Connection] = None
+        try:
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(path), timeout=5, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS parse_results ("
+                " content_hash TEXT NOT NULL,"
+                " pipeline TEXT NOT NULL,"
+                " version TEXT NOT NULL,"
+                " payload TEXT NOT NULL,"
+                " created_at REAL NOT NULL,"
+                " accessed_at REAL NOT NULL,"
+                " PRIMARY KEY (content_hash, pipeline, version))"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS parse_results_accessed"
+                " ON parse_results (accessed_at)"
+            )
+            self._conn.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"Parse cache disabled ({path}): {e}")
+            self._conn = None
+
+    @property
+    def enabled(self) -> bool:
+        return self._conn is not None
+
+    def get(self, digest: str, pipeline: str, version: str) -> Optional[str]:
+        """Cached payload JSON, or None on a miss / expired entry."""
+        if self._conn is None:
+            return None
+        now = time.time()
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT payload, created_at FROM parse_results"
+                    " WHERE content_hash = ? AND pipeline = ? AND version = ?",
+                    (digest, pipeline, version),
+                ).fetchone()
+                if row is None:
+                    return None
+                if now - row[1] > self.ttl_s:
+                    self._conn.execute(
+                        "DELETE FROM parse_results"
+                        " WHERE content_hash = ? AND pipeline = ? AND version = ?",
+                        (digest, pipeline, version),
+                    )
+                    self._conn.commit()
+                    return None
+                self._conn.execute(
+                    "UPDATE parse_results SET accessed_at = ?"
+                    " WHERE content_hash = ? AND pipeline = ? AND version = ?",
+                    (now, digest, pipeline, version),
+                )
+                self._conn.commit()
+            return row[0]
+        except sqlite3.Error as e:
+            logger.warning(f"Parse cache lookup failed: {e}")
+            return None
+
+    def put(self, digest: str, pipeline: str, version: str, payload: str) -> None:
+        if self._conn is None:
+            return
+        now = time.time()
+        try:
+            with self._lock:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO parse_results VALUES (?, ?, ?, ?, ?, ?)",
+                    (digest, pipeline, version, payload, now, now),
+                )
+                self._puts += 1
+                if self._puts >= _TRIM_EVERY:
+                    self._trim(now)
+                self._conn.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"Could not store parse result {digest[:12]}: {e}")
+
+    def trim(self) -> None:
+        """Drop expired entries, then the least recently used past the cap."""
+        if self._conn is None:
+            return
+        with self._lock:
+            self._trim(time.time())
+            self._conn.commit()
+
+    def _trim(self, now: float) -> None:
+        self._puts = 0
+        self._conn.execute(
+            "DELETE FROM parse_results WHERE created_at < ?", (now - self.ttl_s,)
+        )
+        self._conn.execute(
+            "DELETE FROM parse_results WHERE rowid IN ("
+            " SELECT rowid FROM parse_results ORDER BY accessed_at DESC"
+            " LIMIT -1 OFFSET ?)",
+            (self.max_entries,),
+        )
+
+
+_cache: Optional[ParseCache] = None
+
+
+def get_parse_cache() -> ParseCache:
+    global _cache
+    if _cache is None:
+        _cache = ParseCache()
+    return _cache
@@ -0,0 +1,179 @@
+"""
+Parse Worker Pool  (CPU-bound parsing off the event loop)
+
+pdfplumber, spaCy and FAISS keep the GIL for most of a parse. If they run
+on the event loop, or on its default thread pool, every other request
+stalls behind them, /health included.  ParsePool runs them in a
+ProcessPoolExecutor instead. Each worker loads the models once, in
+*initializer*, and then takes jobs sent as plain bytes or text:
+
+    pool = ParsePool(workers=2, max_pending=32, timeout_s=60,
+                     initializer=_init_parse_worker)
+    await pool.warm()
+    text = await pool.run(_pool_extract_text, pdf_bytes)
+
+- Bounded queue: at most *max_pending* jobs can be queued or running. One
+  more ``run`` raises PoolSaturated at once rather than waiting.
+- Per-job timeout: ``run`` raises PoolTimeout after *timeout_s*, counting
+  time spent queued. A worker can't be interrupted mid-job, so a timed-out
+  job keeps its slot until it really finishes. When every worker is stuck
+  on a timed-out job, the pool is recycled: the processes are killed and
+  fresh workers take over.
+- If a worker dies (OOM, a crash in a native library), the executor
+  breaks. The pool replaces it and the job that was running raises
+  PoolError.
+
+Workers start with the "spawn" method, because forking a process that
+already runs torch or tokenizer threads is not safe.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import multiprocessing
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class PoolError(RuntimeError):
+    """A job could not be run on the parse pool."""
+
+
+class PoolSaturated(PoolError):
+    """Every queue slot is taken; the caller should retry later."""
+
+
+class PoolTimeout(PoolError):
+    """The job did not finish within the pool's timeout."""
+
+
+def _noop() -> None:
+    return None
+
+
+class ParsePool:
+    def __init__(
+        self,
+        workers: int,
+        max_pending: int,
+        timeout_s: float,
+        initializer: Optional[Callable[..., None]] = None,
+        initargs: Tuple[Any, ...] = (),
+    ) -> None:
+        self.workers = max(1, workers)
+        self.max_pending = max(self.workers, max_pending)
+        self.timeout_s = timeout_s
+        self._initializer = initializer
+        self._initargs = initargs
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._stuck = 0
+        self.rejected = 0
+        self.timeouts = 0
+        self.restarts = 0
+        self._executor = self._new_executor()
+
+    def _new_executor(self) -> ProcessPoolExecutor:
+        return ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=self._initializer,
+            initargs=self._initargs,
+        )
+
+    # ---------- jobs ----------
+
+    async def run(self, fn: Callable[..., Any], *args: Any) -> Any:
+        """``fn(*args)`` in a worker; *fn* and its arguments must pickle."""
+        with self._lock:
+            if self._pending >= self.max_pending:
+                self.rejected += 1
+                raise PoolSaturated(
+                    f"Parser busy: {self._pending} jobs queued or running, retry later"
+                )
+            self._pending += 1
+
+        stuck = [False]
+
+        def finished(_: Future) -> None:
+            with self._lock:
+                self._pending -= 1
+                if stuck[0]:
+                    self._stuck -= 1
+
+        try:
+            executor, job = self._submit(fn, args)
+        except BaseException:
+            with self._lock:
+                self._pending -= 1
+            raise
+        job.add_done_callback(finished)
+
+        try:
+            return await asyncio.wait_for(asyncio.wrap_future(job), self.timeout_s)
+        except asyncio.TimeoutError:
+            with self._lock:
+                self.timeouts += 1
+                if not job.done():
+                    stuck[0] = True
+                    self._stuck += 1
+                wedged = self._stuck >= self.workers
+            if wedged:
+                logger.warning("All parse workers stuck on timed-out jobs, restarting pool")
+                self._restart(kill=True)
+            raise PoolTimeout(f"Parsing took longer than {self.timeout_s:.0f}s") from None
+        except BrokenProcessPool as e:
+            self._restart(broken=executor)
+            raise PoolError("Parse worker crashed") from e
+
+    def _submit(
+        self, fn: Callable[..., Any], args: Tuple[Any, ...]
+    ) -> Tuple[ProcessPoolExecutor, Future]:
+        executor = self._executor
+        try:
+            return executor, executor.submit(fn, *args)
+        except BrokenProcessPool:
+            self._restart(broken=executor)
+            executor = self._executor
+            return executor, executor.submit(fn, *args)
+
+    def _restart(self, broken: Optional[ProcessPoolExecutor] = None, kill: bool = False) -> None:
+        with self._lock:
+            if broken is not None and broken is not self._executor:
+                return  # another job already replaced it
+            old = self._executor
+            self._executor = self._new_executor()
+            self.restarts += 1
+        if kill:
+            # ProcessPoolExecutor has no public way to stop a running job
+            for proc in list((old._processes or {}).values()):
+                proc.terminate()
+        old.shutdown(wait=False, cancel_futures=True)
+
+    # ---------- lifecycle ----------
+
+    async def warm(self) -> None:
+        """Start every worker (running *initializer*) now, not on first use."""
+        await asyncio.gather(*(
+            asyncio.wrap_future(self._submit(_noop, ())[1]) for _ in range(self.workers)
+        ))
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "workers": self.workers,
+                "pending": self._pending,
+                "max_pending": self.max_pending,
+                "stuck": self._stuck,
+                "rejected": self.rejected,
+                "timeouts": self.timeouts,
+                "restarts": self.restarts,
+            }
@@ -0,0 +1,187 @@
+"""
+PDF Text Backends
+
+pdfplumber rebuilds every line from individual character boxes in pure
+Python. That is accurate but slow on multi-page or graphics-heavy resumes.
+pypdfium2 (PDFium, already installed as a pdfplumber dependency) and
+PyMuPDF (MuPDF, optional) do the same job in C.
+
+Each backend turns PDF bytes into raw text for a range of pages:
+
+    backend = get_backend("pymupdf")
+    pages = backend.extract_pages(pdf_bytes, 0, backend.page_count(pdf_bytes))
+
+``PDF_BACKEND`` picks the backend PDFProcessor tries first.  "auto" means
+the first one installed of pypdfium2, pymupdf and pdfplumber, fastest first
+(benchmarks/bench_pdf_backends.py).  When a fast
+backend's output is empty or looks_garbled, PDFProcessor re-extracts with
+pdfplumber.
+
+None of the three libraries is safe to share across threads, so page-range
+functions run in separate processes (see _extract_page_range).
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import io
+import logging
+import re
+from typing import Dict, List, Type
+
+logger = logging.getLogger(__name__)
+
+
+class PDFBackend:
+    """Raw (uncleaned) text per page; a page that fails comes back as ""."""
+
+    name = ""
+    module = ""
+
+    @classmethod
+    def available(cls) -> bool:
+        return importlib.util.find_spec(cls.module) is not None
+
+    def page_count(self, data: bytes) -> int:
+        raise NotImplementedError
+
+    def extract_pages(self, data: bytes, start: int, stop: int) -> List[str]:
+        raise NotImplementedError
+
+
+class PdfplumberBackend(PDFBackend):
+    name = "pdfplumber"
+    module = "pdfplumber"
+
+    def page_count(self, data: bytes) -> int:
+        import pdfplumber
+
+        with pdfplumber.open(io.BytesIO(data)) as pdf:
+            return len(pdf.pages)
+
+    def extract_pages(self, data: bytes, start: int, stop: int) -> List[str]:
+        import pdfplumber
+
+        texts = []
+        with pdfplumber.open(io.BytesIO(data)) as pdf:
+            for page_num, page in enumerate(pdf.pages[start:stop], start=start + 1):
+                try:
+                    # Try standard extraction first
+                    page_text = page.extract_text()
+
+                    # If standard extraction yields very little text,
+                    # try layout-preserving mode which handles complex PDFs better
+                    if not page_text or len(page_text.strip()) < 50:
+                        try:
+                            layout_text = page.extract_text(layout=True, x_density=3, y_density=3)
+                            if layout_text and len(layout_text.strip()) > len((page_text or "").strip()):
+                                page_text = layout_text
+                        except Exception:
+                            pass  # layout mode not available in older pdfplumber
+                    texts.append(page_text or "")
+                except Exception as page_error:
+                    logger.error(f"Error extracting text from page {page_num}: {page_error}")
+                    texts.append("")
+        return texts
+
+
+class PdfiumBackend(PDFBackend):
+    name = "pypdfium2"
+    module = "pypdfium2"
+
+    def page_count(self, data: bytes) -> int:
+        import pypdfium2 as pdfium
+
+        pdf = pdfium.PdfDocument(data)
+        try:
+            return len(pdf)
+        finally:
+            pdf.close()
+
+    def extract_pages(self, data: bytes, start: int, stop: int) -> List[str]:
+        import pypdfium2 as pdfium
+
+        texts = []
+        pdf = pdfium.PdfDocument(data)
+        try:
+            for i in range(start, min(stop, len(pdf))):
+                try:
+                    text = pdf[i].get_textpage().get_text_range()
+                    texts.append(text.replace("\r\n", "\n").replace("\r", "\n"))
+                except Exception as page_error:
+                    logger.error(f"Error extracting text from page {i + 1}: {page_error}")
+                    texts.append("")
+        finally:
+            pdf.close()
+        return texts
+
+
+class PyMuPDFBackend(PDFBackend):
+    name = "pymupdf"
+    module = "pymupdf"
+
+    def page_count(self, data: bytes) -> int:
+        import pymupdf
+
+        with pymupdf.open(stream=data, filetype="pdf") as doc:
+            return doc.page_count
+
+    def extract_pages(self, data: bytes, start: int, stop: int) -> List[str]:
+        import pymupdf
+
+        texts = []
+        with pymupdf.open(stream=data, filetype="pdf") as doc:
+            for i in range(start, min(stop, doc.page_count)):
+                try:
+                    # sort=True: reading order by position, as pdfplumber does
+                    texts.append(doc[i].get_text("text", sort=True))
+                except Exception as page_error:
+                    logger.error(f"Error extracting text from page {i + 1}: {page_error}")
+                    texts.append("")
+        return texts
+
+
+BACKENDS: Dict[str, Type[PDFBackend]] = {
+    b.name: b for b in (PdfiumBackend, PyMuPDFBackend, PdfplumberBackend)
+}
+
+
+def get_backend(name: str = "auto") -> PDFBackend:
+    """Backend by name; "auto" is the fastest one installed."""
+    if name == "auto":
+        for backend in BACKENDS.values():
+            if backend.available():
+                return backend()
+        raise RuntimeError("No PDF backend installed (pypdfium2, pymupdf or pdfplumber)")
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown PDF backend {name!r} (expected one of {', '.join(BACKENDS)} or 'auto')")
+    if not BACKENDS[name].available():
+        raise RuntimeError(f"PDF backend {name!r} is not installed")
+    return BACKENDS[name]()
+
+
+def _extract_page_range(backend_name: str, data: bytes, start: int, stop: int) -> List[str]:
+    """Process-pool entry point: open the PDF in this process, extract pages."""
+    return BACKENDS[backend_name]().extract_pages(data, start, stop)
+
+
+# ---------- output sanity ----------
+
+_CID = re.compile(r"\(cid:\d+\)")
+_JUNK = re.compile(r"[\ufffd\ue000-\uf8ff\x00-\x08\x0b\x0c\x0e-\x1f]")
+
+
+def looks_garbled(text: str, min_chars: int = 50) -> bool:
+    """True for text too short, or too full of unmapped glyphs, to parse.
+
+    Fonts without a usable ToUnicode map come out as "(cid:123)"
+    placeholders, U+FFFD, private-use code points, or punctuation soup.
+    """
+    visible = "".join(text.split())
+    if len(visible) < min_chars:
+        return True
+    junk = len(_JUNK.findall(visible)) + sum(len(m) for m in _CID.findall(visible))
+    if junk / len(visible) > 0.05:
+        return True
+    alnum = sum(c.isalnum() for c in visible)
+    return alnum / len(visible) < 0.5
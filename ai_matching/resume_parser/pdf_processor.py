@@ -1,21 +1,52 @@
 """
 PDF Processing Module
-Extracts text from PDF files using pdfplumber with error handling
+Extracts text from PDF files through a pluggable backend (see pdf_backends),
+falling back to pdfplumber when a fast backend's text is empty or garbled.
+Pages of long documents are extracted in parallel worker processes.
 """
-import pdfplumber
 import logging
-from typing import Optional
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import List, Optional, Union
 from pathlib import Path
 
+from config import PDF_BACKEND, PDF_PAGE_WORKERS, PDF_PARALLEL_MIN_PAGES
+from pdf_backends import (
+    PDFBackend, PdfplumberBackend, _extract_page_range, get_backend, looks_garbled,
+)
+
 logger = logging.getLogger(__name__)
 
 
 class PDFProcessor:
     """Handles PDF text extraction with robust error handling"""
     
-    def __init__(self):
-        """Initialize PDF processor"""
-        logger.info("PDFProcessor initialized")
+    def __init__(
+        self,
+        backend: Union[str, PDFBackend] = PDF_BACKEND,
+        page_workers: int = PDF_PAGE_WORKERS,
+        parallel_min_pages: int = PDF_PARALLEL_MIN_PAGES,
+    ):
+        """
+        Initialize PDF processor
+        
+        Args:
+            backend: "pdfplumber", "pypdfium2", "pymupdf", "auto" (fastest
+                     installed) or a PDFBackend instance
+            page_workers: Processes for page-parallel extraction (< 2 disables it)
+            parallel_min_pages: Documents shorter than this are extracted serially
+        """
+        self.backend: PDFBackend = backend if isinstance(backend, PDFBackend) else get_backend(backend)
+        self.fallback: Optional[PDFBackend] = None
+        if self.backend.name != PdfplumberBackend.name and PdfplumberBackend.available():
+            self.fallback = PdfplumberBackend()
+        self.page_workers = page_workers
+        self.parallel_min_pages = parallel_min_pages
+        self._page_pool: Optional[ProcessPoolExecutor] = None
+        self._pool_lock = threading.Lock()
+        logger.info(f"PDFProcessor initialized (backend: {self.backend.name})")
     
     def extract_text(self, pdf_path: str) -> Optional[str]:
         """
@@ -27,55 +58,18 @@ class PDFProcessor:
         Returns:
             Extracted text as a single string, or None if extraction fails
         """
-        try:
-            pdf_file = Path(pdf_path)
-            
-            if not pdf_file.exists():
-                logger.error(f"PDF file not found: {pdf_path}")
-                return None
-            
-            if not pdf_file.suffix.lower() == '.pdf':
-                logger.error(f"File is not a PDF: {pdf_path}")
-                return None
-            
-            text_content = []
-            
-            with pdfplumber.open(pdf_path) as pdf:
-                total_pages = len(pdf.pages)
-                logger.info(f"Processing {total_pages} pages from {pdf_file.name}")
-                
-                for page_num, page in enumerate(pdf.pages, start=1):
-                    try:
-                        page_text = page.extract_text()
-                        
-                        if page_text:
-                            # Clean and normalize whitespace
-                            page_text = self._clean_text(page_text)
-                            text_content.append(page_text)
-                            logger.debug(f"Page {page_num}/{total_pages}: Extracted {len(page_text)} characters")
-                        else:
-                            logger.warning(f"Page {page_num}/{total_pages}: No text extracted (empty page)")
-                    
-                    except Exception as page_error:
-                        logger.error(f"Error extracting text from page {page_num}: {page_error}")
-                        continue
-            
-            if not text_content:
-                logger.error("No text extracted from any page")
-                return None
-            
-            full_text = "\n\n".join(text_content)
-            logger.info(f"Successfully extracted {len(full_text)} characters from {total_pages} pages")
-            
-            return full_text
+        pdf_file = Path(pdf_path)
         
-        except pdfplumber.pdfminer.pdfparser.PDFSyntaxError as e:
-            logger.error(f"Corrupted PDF file: {e}")
+        if not pdf_file.exists():
+            logger.error(f"PDF file not found: {pdf_path}")
             return None
         
-        except Exception as e:
-            logger.error(f"Unexpected error processing PDF: {e}")
+        if not pdf_file.suffix.lower() == '.pdf':
+            logger.error(f"File is not a PDF: {pdf_path}")
             return None
+        
+        logger.info(f"Processing {pdf_file.name}")
+        return self.extract_text_from_bytes(pdf_file.read_bytes())
     
     def _clean_text(self, text: str) -> str:
         """
@@ -120,7 +114,6 @@ class PDFProcessor:
     def extract_text_from_bytes(self, pdf_bytes: bytes) -> Optional[str]:
         """
         Extract text from PDF bytes (for FastAPI file uploads).
-        Uses layout-preserving extraction to maintain line structure.
         
         Args:
             pdf_bytes: PDF file content as bytes
@@ -128,57 +121,68 @@ class PDFProcessor:
         Returns:
             Extracted text as a single string, or None if extraction fails
         """
+        text = self._extract(self.backend, pdf_bytes)
+        if self.fallback is not None and (text is None or looks_garbled(text)):
+            logger.info(f"{self.backend.name} text unusable, re-extracting with {self.fallback.name}")
+            text = self._extract(self.fallback, pdf_bytes) or text
+        return text
+    
+    def _extract(self, backend: PDFBackend, pdf_bytes: bytes) -> Optional[str]:
         try:
-            import io
-            text_content = []
-            
-            with pdfplumber.open(io.BytesIO(pdf_bytes)) as pdf:
-                total_pages = len(pdf.pages)
-                logger.info(f"Processing {total_pages} pages from uploaded PDF")
-                
-                for page_num, page in enumerate(pdf.pages, start=1):
-                    try:
-                        # Try standard extraction first
-                        page_text = page.extract_text()
-                        
-                        # If standard extraction yields very little text,
-                        # try layout-preserving mode which handles complex PDFs better
-                        if not page_text or len(page_text.strip()) < 50:
-                            try:
-                                layout_text = page.extract_text(
-                                    layout=True,
-                                    x_density=3,
-                                    y_density=3,
-                                )
-                                if layout_text and len(layout_text.strip()) > len((page_text or "").strip()):
-                                    page_text = layout_text
-                            except Exception:
-                                pass  # layout mode not available in older pdfplumber
-                        
-                        if page_text:
-                            page_text = self._clean_text(page_text)
-                            text_content.append(page_text)
-                            logger.debug(f"Page {page_num}/{total_pages}: Extracted {len(page_text)} characters")
-                        else:
-                            logger.warning(f"Page {page_num}/{total_pages}: No text extracted (empty page)")
-                    
-                    except Exception as page_error:
-                        logger.error(f"Error extracting text from page {page_num}: {page_error}")
-                        continue
-            
-            if not text_content:
-                logger.error("No text extracted from any page")
-                return None
-            
-            full_text = "\n\n".join(text_content)
-            logger.info(f"Successfully extracted {len(full_text)} characters from {total_pages} pages")
-            
-            return full_text
-        
+            total_pages = backend.page_count(pdf_bytes)
+            logger.info(f"Processing {total_pages} pages with {backend.name}")
+            pages = self._extract_pages(backend, pdf_bytes, total_pages)
         except Exception as e:
-            logger.error(f"Error processing PDF bytes: {e}")
+            logger.error(f"Error processing PDF bytes with {backend.name}: {e}")
             return None
-
+        
+        text_content = []
+        for page_num, page_text in enumerate(pages, start=1):
+            page_text = self._clean_text(page_text)
+            if page_text:
+                text_content.append(page_text)
+                logger.debug(f"Page {page_num}/{total_pages}: Extracted {len(page_text)} characters")
+            else:
+                logger.warning(f"Page {page_num}/{total_pages}: No text extracted (empty page)")
+        
+        if not text_content:
+            logger.error("No text extracted from any page")
+            return None
+        
+        full_text = "\n\n".join(text_content)
+        logger.info(f"Successfully extracted {len(full_text)} characters from {total_pages} pages")
+        return full_text
+    
+    def _extract_pages(self, backend: PDFBackend, pdf_bytes: bytes, total_pages: int) -> List[str]:
+        """Raw page texts, split into contiguous page ranges across processes
+        for documents of at least parallel_min_pages pages."""
+        if self.page_workers < 2 or total_pages < self.parallel_min_pages:
+            return backend.extract_pages(pdf_bytes, 0, total_pages)
+        
+        step = -(-total_pages // self.page_workers)
+        try:
+            pool = self._get_page_pool()
+            futures = [
+                pool.submit(_extract_page_range, backend.name, pdf_bytes, start, min(start + step, total_pages))
+                for start in range(0, total_pages, step)
+            ]
+            return [text for future in futures for text in future.result()]
+        except BrokenProcessPool as e:
+            logger.error(f"Page worker crashed ({e}), extracting serially")
+            with self._pool_lock:
+                self._page_pool = None
+            return backend.extract_pages(pdf_bytes, 0, total_pages)
+    
+    def _get_page_pool(self) -> ProcessPoolExecutor:
+        with self._pool_lock:
+            if self._page_pool is None:
+                # spawn: the parse workers that own this processor may run torch threads
+                self._page_pool = ProcessPoolExecutor(
+                    max_workers=self.page_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            return self._page_pool
+    
 
 # Module-level function for direct usage
 def extract_text_from_pdf(pdf_path: str) -> Optional[str]:
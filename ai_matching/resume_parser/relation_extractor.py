@@ -23,7 +23,10 @@ from __future__ import annotations
 import re
 import logging
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Set, Tuple
+from typing import TYPE_CHECKING, Dict, List, Optional, Sequence, Set, Tuple
+
+if TYPE_CHECKING:
+    from spacy_pipeline import Entity
 
 logger = logging.getLogger(__name__)
 
@@ -110,12 +113,18 @@ class RelationExtractor:
         """
         self._nlp = nlp
 
-    def extract_experience_groups(self, text: str) -> List[EntityGroup]:
-        mentions = self._detect_entities(text, mode="experience")
+    # *ents*: spaCy entities already found in *text* by the shared document
+    # pass (offsets relative to *text*); when given, nlp is not run again
+    def extract_experience_groups(
+        self, text: str, ents: Optional[Sequence["Entity"]] = None
+    ) -> List[EntityGroup]:
+        mentions = self._detect_entities(text, mode="experience", ents=ents)
         return self._cluster(mentions)
 
-    def extract_education_groups(self, text: str) -> List[EntityGroup]:
-        mentions = self._detect_entities(text, mode="education")
+    def extract_education_groups(
+        self, text: str, ents: Optional[Sequence["Entity"]] = None
+    ) -> List[EntityGroup]:
+        mentions = self._detect_entities(text, mode="education", ents=ents)
         return self._cluster(mentions)
 
     # ------------------------------------------------------------------
@@ -123,7 +132,8 @@ class RelationExtractor:
     # ------------------------------------------------------------------
 
     def _detect_entities(
-        self, text: str, mode: str = "experience"
+        self, text: str, mode: str = "experience",
+        ents: Optional[Sequence["Entity"]] = None,
     ) -> List[EntityMention]:
         mentions: List[EntityMention] = []
         lines = text.split("\n")
@@ -136,7 +146,9 @@ class RelationExtractor:
                 mentions.extend(self._detect_education_entities(line, line_num, char_offset))
             char_offset += len(line) + 1
 
-        if self._nlp:
+        if ents is not None:
+            mentions.extend(self._org_mentions(text, ents))
+        elif self._nlp:
             mentions.extend(self._spacy_entities(text, lines))
 
         mentions.sort(key=lambda m: (m.line_num, m.char_start))
@@ -222,6 +234,17 @@ class RelationExtractor:
             logger.warning(f"spaCy NER fallback failed: {e}")
         return ents
 
+    @staticmethod
+    def _org_mentions(text: str, ents: Sequence["Entity"]) -> List[EntityMention]:
+        return [
+            EntityMention(
+                text=ent.text.strip(), label="ORG",
+                line_num=text[:ent.start_char].count("\n"),
+                char_start=ent.start_char, char_end=ent.end_char,
+            )
+            for ent in ents if ent.label == "ORG"
+        ]
+
     # ------------------------------------------------------------------
     # Clustering -- greedy proximity grouping
     # ------------------------------------------------------------------
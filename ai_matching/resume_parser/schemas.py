@@ -139,6 +139,8 @@ class ParseResponse(BaseModel):
     error: Optional[str] = Field(None, description="Error message if parsing failed")
     processing_time_ms: Optional[float] = Field(None)
     timestamp: datetime = Field(default_factory=datetime.utcnow)
+    content_hash: Optional[str] = Field(None, description="SHA-256 of the uploaded file")
+    cached: bool = Field(False, description="Served from the parse result cache")
 
 
 # ---------------------------------------------------------------------------
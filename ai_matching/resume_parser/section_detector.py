@@ -193,6 +193,15 @@ class SectionDetector:
 
         return sections
 
+    @staticmethod
+    def char_span(text: str, section: Section) -> Tuple[int, int]:
+        """(start, end) of ``section.text`` within the *text* it was detected in."""
+        line_start = sum(len(line) + 1 for line in text.split("\n")[: section.start_line])
+        start = text.find(section.text, line_start)
+        if start < 0:
+            start = line_start
+        return start, start + len(section.text)
+
     def get_section(
         self, sections: List[Section], label: SectionLabel
     ) -> Optional[Section]:
@@ -0,0 +1,132 @@
+"""
+Skill Matcher  (exact + synonym stages of skills extraction)
+
+One Aho-Corasick automaton over every canonical skill name and every
+synonym variant, built once per SkillGraph version.  A single left-to-right
+pass over the document reports every occurrence with its character span,
+including overlapping ones ("React" inside "React Native").
+
+Matching is case-insensitive and whitespace-insensitive ("Machine\\nLearning"
+matches "machine learning"), and a pattern edge that is a word character
+must not touch another word character -- ``\\b`` semantics, except that
+edges like the "+" in "C++" need no word neighbour.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Tuple
+
+
+@dataclass(frozen=True)
+class SkillMatch:
+    """One occurrence of a skill in the scanned text."""
+    skill: str      # canonical name
+    start: int      # character span in the original text
+    end: int
+    text: str       # surface form as written
+
+
+def _is_word(c: str) -> bool:
+    return c.isalnum() or c == "_"
+
+
+def _normalize(pattern: str) -> str:
+    return " ".join(pattern.lower().split())
+
+
+class SkillMatcher:
+    """Precompiled multi-pattern matcher: surface form -> canonical skill."""
+
+    def __init__(self, patterns: Iterable[Tuple[str, str]]):
+        self._patterns: List[Tuple[str, str]] = []
+        seen = set()
+        for surface, canonical in patterns:
+            key = (_normalize(surface), canonical)
+            if key[0] and key not in seen:
+                seen.add(key)
+                self._patterns.append(key)
+
+        goto: List[Dict[str, int]] = [{}]
+        out: List[List[int]] = [[]]
+        for idx, (surface, _) in enumerate(self._patterns):
+            state = 0
+            for ch in surface:
+                nxt = goto[state].get(ch)
+                if nxt is None:
+                    nxt = goto[state][ch] = len(goto)
+                    goto.append({})
+                    out.append([])
+                state = nxt
+            out[state].append(idx)
+
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in goto[state].items():
+                queue.append(nxt)
+                f = fail[state]
+                while f and ch not in goto[f]:
+                    f = fail[f]
+                fail[nxt] = goto[f].get(ch, 0)
+                out[nxt] = out[nxt] + out[fail[nxt]]
+
+        self._goto = goto
+        self._fail = fail
+        self._out = out
+
+    @classmethod
+    def from_graph(cls, graph) -> "SkillMatcher":
+        """Canonical skills plus every synonym variant of *graph*."""
+        pairs = [(s, s) for s in graph.all_canonical_skills()]
+        pairs.extend(graph.get_synonym_map().items())
+        return cls(pairs)
+
+    def __len__(self) -> int:
+        return len(self._patterns)
+
+    def find(self, text: str) -> List[SkillMatch]:
+        """Every skill occurrence in *text*, ordered by start offset."""
+        goto, fail, out, patterns = self._goto, self._fail, self._out, self._patterns
+        lowered = text.lower()
+        if len(lowered) != len(text):
+            # a few characters lower-case to two code points; keep offsets aligned
+            lowered = "".join(c.lower()[0] for c in text)
+
+        origin: List[int] = []   # normalized position -> original offset
+        matches: List[SkillMatch] = []
+        state = 0
+        prev_space = False
+        for i, ch in enumerate(lowered):
+            if ch.isspace():
+                if prev_space:
+                    continue
+                ch, prev_space = " ", True
+            else:
+                prev_space = False
+            origin.append(i)
+
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if not out[state]:
+                continue
+
+            end = i + 1
+            for idx in out[state]:
+                surface, canonical = patterns[idx]
+                start = origin[len(origin) - len(surface)]
+                if _is_word(surface[0]) and start > 0 and _is_word(text[start - 1]):
+                    continue
+                if _is_word(surface[-1]) and end < len(text) and _is_word(text[end]):
+                    continue
+                matches.append(SkillMatch(canonical, start, end, text[start:end]))
+
+        matches.sort(key=lambda m: (m.start, -m.end))
+        return matches
+
+    def skills(self, text: str) -> List[str]:
+        """Distinct canonical skills found in *text*, sorted."""
+        return sorted({m.skill for m in self.find(text)})
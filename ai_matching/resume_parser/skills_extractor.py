@@ -4,20 +4,22 @@ Hybrid approach: Exact matching + Fuzzy/typo matching + Semantic similarity (FAI
 """
 import re
 import logging
-from typing import Dict, List, Set, Tuple
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Set, Tuple
 
-import numpy as np
-from sentence_transformers import SentenceTransformer
 import faiss
-from rapidfuzz import fuzz, process as rfprocess
 
 from config import (
-    SKILL_LIST,
-    SKILL_NORMALIZATION,
     SENTENCE_TRANSFORMER_MODEL,
     FAISS_SIMILARITY_THRESHOLD,
-    FAISS_INDEX_DIM,
+    FUZZY_CDIST_WORKERS,
+    SEMANTIC_CHUNK_CACHE_SIZE,
 )
+from app.model_server.client import SharedSentenceEncoder
+from app.skills.skill_graph import get_skill_graph
+from embedding_cache import ChunkEmbeddingCache
+from fuzzy_matcher import FuzzyMemo, FuzzySkillMatcher
+from skill_matcher import SkillMatch, SkillMatcher
 
 logger = logging.getLogger(__name__)
 
@@ -25,39 +27,91 @@ FUZZY_SCORE_THRESHOLD = 85
 FUZZY_MIN_TOKEN_LEN = 3
 
 
+@dataclass(frozen=True)
+class _SkillIndex:
+    """Everything derived from one SkillGraph version, swapped as a unit."""
+    content_hash: str
+    skill_list: List[str]
+    normalization: Dict[str, str]
+    matcher: SkillMatcher
+    fuzzy: FuzzySkillMatcher
+    faiss_index: object
+
+
 class SkillsExtractor:
     """Extracts skills using exact + fuzzy + semantic matching."""
 
     def __init__(self):
         try:
             logger.info(f"Loading embedding model: {SENTENCE_TRANSFORMER_MODEL}")
-            self.model = SentenceTransformer(SENTENCE_TRANSFORMER_MODEL)
-
-            self.skill_list = SKILL_LIST
-            self.skill_embeddings = self.model.encode(self.skill_list)
-
-            self.index = faiss.IndexFlatIP(FAISS_INDEX_DIM)
-            faiss.normalize_L2(self.skill_embeddings)
-            self.index.add(np.array(self.skill_embeddings).astype("float32"))
-
-            self._skill_lower_map: Dict[str, str] = {
-                s.lower(): s for s in self.skill_list
-            }
-
-            logger.info(f"FAISS index built with {len(self.skill_list)} skills")
+            # Shared model server when MODEL_SERVER_URL is set, else in-process
+            self.model = SharedSentenceEncoder(SENTENCE_TRANSFORMER_MODEL)
+            self._chunk_cache = ChunkEmbeddingCache(
+                self.model.encode, SEMANTIC_CHUNK_CACHE_SIZE
+            )
+            self._state = self._build_skill_index()
         except Exception as e:
             logger.error(f"Error initializing SkillsExtractor: {e}")
             raise
 
+    def _build_skill_index(self) -> _SkillIndex:
+        """
+        Skill list, lookup maps and FAISS index for the current SkillGraph.
+
+        Embeddings and the index come from the graph's on-disk artifact
+        cache, so only the first start after a taxonomy change re-encodes.
+        """
+        graph = get_skill_graph()
+        skill_list = graph.all_canonical_skills()
+        artifacts = graph.artifacts
+        embeddings = artifacts.skill_embeddings(
+            SENTENCE_TRANSFORMER_MODEL, skill_list, self.model.encode
+        )
+        index = artifacts.faiss_index(SENTENCE_TRANSFORMER_MODEL, embeddings)
+        logger.info(
+            f"FAISS index ready with {len(skill_list)} skills "
+            f"(taxonomy {graph.content_hash})"
+        )
+        return _SkillIndex(
+            content_hash=graph.content_hash,
+            skill_list=skill_list,
+            normalization=graph.get_synonym_map(),
+            matcher=SkillMatcher.from_graph(graph),
+            fuzzy=FuzzySkillMatcher(
+                skill_list,
+                score_cutoff=FUZZY_SCORE_THRESHOLD,
+                min_token_len=FUZZY_MIN_TOKEN_LEN,
+                workers=FUZZY_CDIST_WORKERS,
+            ),
+            faiss_index=index,
+        )
+
+    def _current(self) -> _SkillIndex:
+        """Current skill index, rebuilt if the taxonomy was reloaded."""
+        state = self._state
+        if state.content_hash != get_skill_graph().content_hash:
+            state = self._state = self._build_skill_index()
+        return state
+
+    @property
+    def skill_list(self) -> List[str]:
+        return self._state.skill_list
+
     # ------------------------------------------------------------------
     # Public API
     # ------------------------------------------------------------------
 
+    def find_skill_spans(self, text: str) -> List[SkillMatch]:
+        """Exact and synonym matches in *text* with their character spans."""
+        return self._current().matcher.find(text)
+
     def extract_skills(
         self,
         text: str,
         use_semantic: bool = True,
         use_fuzzy: bool = True,
+        exact_matches: Optional[Iterable[SkillMatch]] = None,
+        fuzzy_memo: Optional[FuzzyMemo] = None,
     ) -> List[str]:
         """
         Extract skills from text using a four-stage pipeline:
@@ -65,31 +119,31 @@ class SkillsExtractor:
         2. Synonym / normalization mapping
         3. Fuzzy / typo matching via rapidfuzz
         4. Semantic matching via FAISS embeddings
+
+        Stages 1 and 2 are one pass of the SkillMatcher automaton.  Callers
+        that already scanned the whole document pass those matches as
+        *exact_matches* (``()`` for windows whose matches are merged in
+        elsewhere) so the text isn't scanned again.  Passing the same
+        *fuzzy_memo* dict for every window of one document scores each
+        fuzzy candidate once.
         """
         try:
+            state = self._current()
             found_skills: Set[str] = set()
-            text_lower = text.lower()
-
-            # Stage 1: exact match
-            for skill in self.skill_list:
-                pattern = r"\b" + re.escape(skill.lower()) + r"\b"
-                if re.search(pattern, text_lower):
-                    found_skills.add(skill)
 
-            # Stage 2: synonym / normalization
-            for variant, canonical in SKILL_NORMALIZATION.items():
-                pattern = r"\b" + re.escape(variant.lower()) + r"\b"
-                if re.search(pattern, text_lower):
-                    found_skills.add(canonical)
+            # Stages 1 + 2: exact and synonym matches
+            if exact_matches is None:
+                exact_matches = state.matcher.find(text)
+            found_skills.update(m.skill for m in exact_matches)
 
             # Stage 3: fuzzy / typo matching
             if use_fuzzy:
-                fuzzy_skills = self._fuzzy_match(text)
+                fuzzy_skills = self._fuzzy_match(text, state, fuzzy_memo)
                 found_skills.update(fuzzy_skills)
 
             # Stage 4: semantic matching
             if use_semantic:
-                semantic_skills = self._semantic_match(text)
+                semantic_skills = self._semantic_match(text, state)
                 found_skills.update(semantic_skills)
 
             skills_list = sorted(found_skills)
@@ -103,48 +157,17 @@ class SkillsExtractor:
     # Fuzzy matching  (Phase 5 -- typo correction)
     # ------------------------------------------------------------------
 
-    def _fuzzy_match(self, text: str) -> Set[str]:
+    def _fuzzy_match(
+        self, text: str, state: _SkillIndex, memo: Optional[FuzzyMemo] = None
+    ) -> Set[str]:
         """
-        Tokenize the resume text and compare each token (and bigram) against
-        the canonical skill list using rapidfuzz weighted-ratio.
+        Compare each token (and bigram) of the text against the canonical
+        skill list using rapidfuzz weighted-ratio, in bulk cdist calls.
 
         Catches typos like "Pyton" -> "Python", "Kuberntes" -> "Kubernetes".
         """
         try:
-            fuzzy_skills: Set[str] = set()
-            tokens = re.findall(r"[A-Za-z0-9#+.]+", text)
-
-            candidates: List[str] = []
-            for i, tok in enumerate(tokens):
-                if len(tok) >= FUZZY_MIN_TOKEN_LEN:
-                    candidates.append(tok)
-                if i + 1 < len(tokens):
-                    bigram = f"{tok} {tokens[i + 1]}"
-                    if len(bigram) >= FUZZY_MIN_TOKEN_LEN + 2:
-                        candidates.append(bigram)
-
-            candidates = list(set(candidates))[:300]
-
-            skill_choices = list(self._skill_lower_map.keys())
-
-            for candidate in candidates:
-                result = rfprocess.extractOne(
-                    candidate.lower(),
-                    skill_choices,
-                    scorer=fuzz.WRatio,
-                    score_cutoff=FUZZY_SCORE_THRESHOLD,
-                )
-                if result:
-                    matched_lower, score, _ = result
-                    canonical = self._skill_lower_map[matched_lower]
-                    if canonical.lower() != candidate.lower():
-                        fuzzy_skills.add(canonical)
-                        logger.debug(
-                            f"Fuzzy match: '{candidate}' -> {canonical} "
-                            f"(score: {score:.0f})"
-                        )
-
-            return fuzzy_skills
+            return state.fuzzy.match(text, memo)
         except Exception as e:
             logger.error(f"Error in fuzzy matching: {e}")
             return set()
@@ -153,31 +176,47 @@ class SkillsExtractor:
     # Semantic matching  (Phase 5 -- FAISS vector DB)
     # ------------------------------------------------------------------
 
-    def _semantic_match(self, text: str) -> Set[str]:
+    @staticmethod
+    def _chunks(text: str) -> List[str]:
+        chunks = re.split(r"[,.\n]+", text)
+        return [c.strip() for c in chunks if len(c.strip()) > 5][:100]
+
+    def semantic_match_document(self, texts: Iterable[str]) -> Set[str]:
+        """
+        Semantic stage for a whole document at once.
+
+        Chunks from every text (skills section, each window) are
+        deduplicated, embedded in one batch -- cached chunks skip the
+        model -- and looked up with a single FAISS search.
+        """
+        chunks = list(dict.fromkeys(c for text in texts for c in self._chunks(text)))
+        return self._semantic_search(chunks, self._current())
+
+    def _semantic_match(self, text: str, state: _SkillIndex) -> Set[str]:
         """
         Split text into chunks, embed, and search the FAISS skill index.
         """
+        return self._semantic_search(self._chunks(text), state)
+
+    def _semantic_search(self, chunks: List[str], state: _SkillIndex) -> Set[str]:
         try:
             semantic_skills: Set[str] = set()
 
-            chunks = re.split(r"[,.\n]+", text)
-            chunks = [c.strip() for c in chunks if len(c.strip()) > 5][:100]
-
             if not chunks:
                 return semantic_skills
 
-            chunk_embeddings = self.model.encode(chunks)
-            chunk_embeddings = np.array(chunk_embeddings).astype("float32")
+            # fresh array from the cache, safe to normalize in place
+            chunk_embeddings = self._chunk_cache.encode(chunks)
             faiss.normalize_L2(chunk_embeddings)
 
             k = 3
-            distances, indices = self.index.search(chunk_embeddings, k)
+            distances, indices = state.faiss_index.search(chunk_embeddings, k)
 
             for i, (dist_row, idx_row) in enumerate(zip(distances, indices)):
                 for dist, idx in zip(dist_row, idx_row):
                     similarity = float(dist)
                     if similarity >= FAISS_SIMILARITY_THRESHOLD:
-                        skill = self.skill_list[idx]
+                        skill = state.skill_list[idx]
                         semantic_skills.add(skill)
                         logger.debug(
                             f"Semantic match: '{chunks[i][:30]}...' -> "
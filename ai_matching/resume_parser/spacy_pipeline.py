@@ -0,0 +1,134 @@
+"""
+Shared spaCy Pass  (one NER run per document)
+
+Name, experience and education extraction each used to call ``nlp(...)``
+on their own slice of the resume: the header, the experience section, the
+education section, and ``text[:1500]`` again when no name was found.  That
+is up to four transformer passes over overlapping text.  SpacyPipeline
+runs NER once over the whole document, using ``nlp.pipe`` with every
+component NER doesn't need disabled.  Each extractor then reads the
+entities inside its own character span from DocEntities.
+
+Model tiers (SPACY_MODEL_TIER):
+  accurate  en_core_web_trf for everything (default)
+  fast      en_core_web_sm.  If it finds no PERSON in the name span, the
+            trf model (loaded on first need) re-runs over that span only.
+"""
+
+from __future__ import annotations
+
+import logging
+import subprocess
+import sys
+import threading
+from bisect import bisect_left
+from dataclasses import dataclass
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Tuple
+
+from config import SPACY_FAST_MODEL, SPACY_MODEL, SPACY_MODEL_TIER
+
+logger = logging.getLogger(__name__)
+
+# Everything else (tagger, parser, lemmatizer, ...) is skipped
+NER_COMPONENTS = ("transformer", "tok2vec", "ner")
+
+
+def load_spacy_model(model_name: str):
+    """spacy.load, downloading the model first if it isn't installed."""
+    import spacy
+
+    try:
+        logger.info(f"Loading spaCy model: {model_name}")
+        return spacy.load(model_name)
+    except OSError:
+        logger.warning(f"Model {model_name} not found. Attempting to download...")
+        subprocess.run([sys.executable, "-m", "spacy", "download", model_name], check=True)
+        return spacy.load(model_name)
+
+
+@dataclass(frozen=True)
+class Entity:
+    text: str
+    label: str
+    start_char: int
+    end_char: int
+
+
+class DocEntities:
+    """A document's entities, sorted by offset, queryable by char span."""
+
+    def __init__(self, ents: Iterable[Entity] = ()) -> None:
+        self._ents = sorted(ents, key=lambda e: e.start_char)
+        self._starts = [e.start_char for e in self._ents]
+
+    @classmethod
+    def from_doc(cls, doc, offset: int = 0) -> "DocEntities":
+        return cls(
+            Entity(e.text, e.label_, e.start_char + offset, e.end_char + offset)
+            for e in doc.ents
+        )
+
+    def __len__(self) -> int:
+        return len(self._ents)
+
+    def __iter__(self) -> Iterator[Entity]:
+        return iter(self._ents)
+
+    def within(self, start: int, end: int, label: Optional[str] = None) -> List[Entity]:
+        """Entities wholly inside [start, end), with offsets relative to *start*."""
+        found = []
+        for e in self._ents[bisect_left(self._starts, start):]:
+            if e.start_char >= end:
+                break
+            if e.end_char <= end and (label is None or e.label == label):
+                found.append(Entity(e.text, e.label, e.start_char - start, e.end_char - start))
+        return found
+
+
+def run_ner(nlp, texts: Iterable[str]) -> List[DocEntities]:
+    disabled = [name for name in nlp.pipe_names if name not in NER_COMPONENTS]
+    return [DocEntities.from_doc(doc) for doc in nlp.pipe(texts, disable=disabled)]
+
+
+class SpacyPipeline:
+    def __init__(self, nlp, fallback: Optional[Callable[[], Any]] = None) -> None:
+        """
+        Args:
+            nlp: Model that runs over every document.
+            fallback: Loads the model used when *nlp* finds no PERSON in the
+                      name span; called once, on first need.
+        """
+        self.nlp = nlp
+        self._load_fallback = fallback
+        self._fallback_nlp = None
+        self._lock = threading.Lock()
+        self.fallbacks = 0
+
+    @classmethod
+    def for_tier(cls, tier: str = SPACY_MODEL_TIER) -> "SpacyPipeline":
+        if tier == "accurate":
+            return cls(load_spacy_model(SPACY_MODEL))
+        if tier == "fast":
+            return cls(load_spacy_model(SPACY_FAST_MODEL), fallback=lambda: load_spacy_model(SPACY_MODEL))
+        raise ValueError(f"Unknown SPACY_MODEL_TIER {tier!r} (expected 'fast' or 'accurate')")
+
+    def entities(self, text: str, name_span: Optional[Tuple[int, int]] = None) -> DocEntities:
+        """NER over *text*, once.  *name_span* is where the candidate's name
+        should be; in the fast tier it gets the fallback model if empty."""
+        ents = run_ner(self.nlp, [text])[0]
+        if self._load_fallback is None or name_span is None:
+            return ents
+        start, end = name_span
+        if ents.within(start, end, "PERSON"):
+            return ents
+
+        with self._lock:
+            if self._fallback_nlp is None:
+                self._fallback_nlp = self._load_fallback()
+            self.fallbacks += 1
+        persons = [
+            Entity(e.text, e.label, e.start_char + start, e.end_char + start)
+            for e in run_ner(self._fallback_nlp, [text[start:end]])[0]
+            if e.label == "PERSON"
+        ]
+        return DocEntities(list(ents) + persons)
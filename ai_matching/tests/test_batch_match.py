@@ -0,0 +1,157 @@
+"""
+Tests for batch pair scoring (/match/batch).
+"""
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.analytics import logger as match_logger
+from app.api.routes import router
+from app.matching import batch
+from app.matching.batch import score_pairs
+from app.matching.matcher import match_student_to_internship
+from app.skills.vectorizer import get_skill_space
+from tests.conftest import make_internship, make_student
+
+STUDENTS = [
+    {"id": 1, "skills": {"Python": 4, "SQL": 3}, "year": 3, "location": "Delhi"},
+    {"id": 2, "skills": {"React": 4, "js": 3}, "year": 2, "location": "Pune"},
+    {"id": 3, "skills": {"PyTorch": 4}, "year": 1, "location": "Delhi"},
+]
+INTERNSHIPS = [
+    {"id": 10, "required_skills": {"Python": 3}, "min_year": 2,
+     "location": "Delhi", "is_remote": False},
+    {"id": 20, "required_skills": {"JavaScript": 3, "React": 2}, "min_year": 1,
+     "location": "Delhi", "is_remote": True},
+]
+
+
+@pytest.fixture(scope="module")
+def client():
+    app = FastAPI()
+    app.include_router(router)
+    return TestClient(app)
+
+
+class TestScorePairs:
+    def test_similarity_matrix_matches_pairwise(self):
+        space = get_skill_space()
+        a = [{"Python": 4, "SQL": 3}, {"PyTorch": 2}, {}]
+        b = [{"Python": 3}, {"Deep Learning": 3, "Cobol": 1}]
+        matrix = space.similarity_matrix(space.matrix(a), space.matrix(b))
+        for i, sa in enumerate(a):
+            for j, sb in enumerate(b):
+                assert matrix[i, j] == space.similarity(sa, sb)
+
+    def test_pair_similarities_match_matrix(self):
+        space = get_skill_space()
+        a = space.matrix([{"Python": 4, "SQL": 3}, {"PyTorch": 2}, {}])
+        b = space.matrix([{"Python": 3}, {"Deep Learning": 3, "Cobol": 1}])
+        cells = [(0, 1), (2, 0), (1, 1), (0, 0)]
+        dense = space.similarity_matrix(a, b)
+        assert list(space.pair_similarities(a, b, cells)) == [dense[c] for c in cells]
+
+    def test_explicit_pairs_skip_dense_matrix(self, monkeypatch):
+        def no_dense(*args):
+            raise AssertionError("dense matrix built for explicit pairs")
+
+        monkeypatch.setattr(type(get_skill_space()), "similarity_matrix", no_dense)
+        students = [make_student({"Python": 4}, id=i) for i in range(50)]
+        internships = [make_internship({"Python": 3}, id=i) for i in range(50)]
+        assert list(score_pairs(students, internships, [(3, 7), (3, 7)])) == [(3, 7)]
+
+    def test_oversized_batch_rejected_before_scoring(self, monkeypatch):
+        monkeypatch.setattr(batch, "get_skill_space", lambda: pytest.fail("scored"))
+        students = [make_student({"Python": 4}, id=i) for i in range(200)]
+        internships = [make_internship({"Python": 3}, id=i) for i in range(200)]
+        with pytest.raises(batch.BatchTooLarge):
+            score_pairs(students, internships)
+
+    def test_matches_single_pair_scoring(self):
+        students = [
+            make_student({"Python": 4, "SQL": 3}, id=1),
+            make_student({"PyTorch": 4}, id=2),
+        ]
+        internships = [
+            make_internship({"Python": 3}, id=10),
+            make_internship({"Deep Learning": 3}, id=20),
+        ]
+        results = score_pairs(students, internships)
+        assert len(results) == 4
+        for (si, ii), result in results.items():
+            single = match_student_to_internship(students[si], internships[ii])
+            assert result["final_score"] == single["final_score"]
+
+    def test_explicit_pairs_and_limit(self, monkeypatch):
+        students = [make_student({"Python": 4}, id=1)]
+        internships = [make_internship({"Python": 3}, id=10)]
+        assert list(score_pairs(students, internships, [(1, 10)])) == [(0, 0)]
+        with pytest.raises(batch.UnknownPairId):
+            score_pairs(students, internships, [(1, 99)])
+        monkeypatch.setattr(batch, "MAX_BATCH_PAIRS", 0)
+        with pytest.raises(batch.BatchTooLarge):
+            score_pairs(students, internships)
+
+    def test_decisions_logged_in_one_append(self, monkeypatch, tmp_path):
+        log_file = tmp_path / "decisions.jsonl"
+        monkeypatch.setattr(match_logger, "MATCH_LOG_FILE", log_file)
+        writes = []
+        real_open = open
+
+        def counting_open(path, *args, **kwargs):
+            if path == log_file:
+                writes.append(path)
+            return real_open(path, *args, **kwargs)
+
+        monkeypatch.setattr("builtins.open", counting_open)
+        students = [make_student({"Python": 4}, id=i) for i in range(3)]
+        internships = [make_internship({"Python": 3}, id=i) for i in range(4)]
+        score_pairs(students, internships)
+        assert len(writes) == 1
+        assert len(log_file.read_text().splitlines()) == 12
+
+
+class TestEndpoint:
+    def test_matrix_output(self, client):
+        resp = client.post(
+            "/match/batch", json={"students": STUDENTS, "internships": INTERNSHIPS}
+        )
+        body = resp.json()
+        assert body["student_ids"] == [1, 2, 3]
+        assert body["internship_ids"] == [10, 20]
+        assert body["scores"][0][0] > 0
+        # Student 3 is in year 1, internship 10 needs year 2
+        assert body["scores"][2][0] is None
+
+    def test_pairs_output_with_fields(self, client):
+        resp = client.post(
+            "/match/batch?fields=student_id,internship_id,final_score",
+            json={
+                "students": STUDENTS,
+                "internships": INTERNSHIPS,
+                "pairs": [[1, 10], [2, 20]],
+                "output": "pairs",
+            },
+        )
+        body = resp.json()
+        assert body["count"] == 2
+        assert [(p["student_id"], p["internship_id"]) for p in body["pairs"]] == [
+            (1, 10), (2, 20)
+        ]
+        assert set(body["pairs"][0]) == {"student_id", "internship_id", "final_score"}
+
+    def test_request_lists_are_capped(self, client):
+        pairs = [[1, 10]] * (batch.MAX_BATCH_PAIRS + 1)
+        resp = client.post(
+            "/match/batch",
+            json={"students": STUDENTS, "internships": INTERNSHIPS, "pairs": pairs},
+        )
+        assert resp.status_code == 422
+
+    def test_unknown_pair_id_is_400(self, client):
+        resp = client.post(
+            "/match/batch",
+            json={"students": STUDENTS, "internships": INTERNSHIPS, "pairs": [[1, 99]]},
+        )
+        assert resp.status_code == 400
@@ -0,0 +1,89 @@
+"""
+Tests for bitset skill sets (stack detection, overlap, missing skills).
+"""
+
+import random
+
+import pytest
+
+from app.matching.matcher import match_student_to_internship
+from app.skills.bitset import SkillBitIndex
+from app.skills.skill_graph import TECH_STACKS, get_skill_graph
+from tests.conftest import make_internship, make_student
+
+
+def _reference_stacks(graph, skills):
+    normalized = {graph.normalize(s) for s in skills}
+    return sorted(n for n, req in TECH_STACKS.items() if req <= normalized)
+
+
+@pytest.fixture(scope="module")
+def bits():
+    return SkillBitIndex(get_skill_graph())
+
+
+@pytest.fixture(scope="module")
+def random_sets():
+    rng = random.Random(3)
+    pool = sorted(get_skill_graph().all_canonical_skills())
+    stack_members = sorted(set().union(*TECH_STACKS.values()))
+    sets = []
+    for _ in range(200):
+        skills = set(rng.sample(pool, rng.randint(0, 8)))
+        skills |= set(rng.sample(stack_members, rng.randint(0, 6)))
+        sets.append(skills)
+    return sets
+
+
+class TestScalar:
+    def test_stacks_match_frozenset_reference(self, bits, random_sets):
+        graph = get_skill_graph()
+        for skills in random_sets:
+            assert bits.detect_stacks(bits.mask(skills)) == _reference_stacks(graph, skills)
+
+    def test_graph_detect_stacks_normalizes_synonyms(self):
+        stacks = get_skill_graph().detect_stacks({"python", "django", "postgres"})
+        assert "Django Stack" in stacks
+
+    def test_overlap_and_missing(self, bits):
+        student = bits.mask({"Python", "SQL", "Docker"}, normalized=True)
+        required = bits.mask({"Python", "SQL", "Kubernetes"}, normalized=True)
+        assert bits.overlap_count(student, required) == 2
+        assert bits.names(bits.missing(student, required)) == ["Kubernetes"]
+
+    def test_unknown_skills_get_bits(self, bits):
+        a = bits.mask({"Cobol", "Python"}, normalized=True)
+        b = bits.mask({"Cobol"}, normalized=True)
+        assert bits.overlap_count(a, b) == 1
+
+    def test_grow_false_skips_unknown(self, bits):
+        before = len(bits)
+        assert bits.mask({"Never Seen Skill"}, normalized=True, grow=False) == 0
+        assert len(bits) == before
+
+    def test_match_does_not_grow_index(self):
+        graph = get_skill_graph()
+        before = len(graph.bit_index)
+        result = match_student_to_internship(
+            make_student({"Python": 3, "Quux Framework 7": 3}),
+            make_internship({"Quux Framework 7": 2}),
+        )
+        assert len(graph.bit_index) == before
+        assert "Exact skill matches: 1 of 1 required" in result["explanation"]
+
+
+class TestVectorized:
+    def test_stacks_many_matches_scalar(self, bits, random_sets):
+        masks = [bits.mask(s) for s in random_sets]
+        assert bits.detect_stacks_many(masks) == [bits.detect_stacks(m) for m in masks]
+
+    def test_overlap_and_missing_counts_match_scalar(self, bits, random_sets):
+        masks = [bits.mask(s) for s in random_sets]
+        required = bits.mask({"Python", "Django", "PostgreSQL", "Zig Lang"})
+        words = bits.to_words(masks)
+        assert list(bits.overlap_counts(words, required)) == [
+            bits.overlap_count(m, required) for m in masks
+        ]
+        assert list(bits.missing_counts(words, required)) == [
+            bits.missing(m, required).bit_count() for m in masks
+        ]
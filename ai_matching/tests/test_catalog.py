@@ -0,0 +1,106 @@
+"""
+Tests for the live, copy-on-write internship catalog.
+"""
+
+import numpy as np
+import pytest
+
+from app.catalog import Catalog, build_snapshot
+from app.sharding.partition import ShardConfig, internship_shard_key, shard_for_key
+from tests.conftest import make_internship
+
+
+def _base():
+    return [
+        make_internship({"Python": 3, "SQL": 2}, id=1),
+        make_internship({"React": 3}, id=2),
+        make_internship({"Docker": 2}, id=3),
+    ]
+
+
+@pytest.fixture
+def journal(tmp_path):
+    return tmp_path / "updates.jsonl"
+
+
+def _assert_matches_rebuild(snap):
+    fresh = build_snapshot(list(snap.internships))
+    student = {"Python": 4, "React": 2, "Cobol": 1}
+    space = snap.skill_matrix.space
+    assert np.array_equal(
+        space.similarities(student, snap.skill_matrix),
+        space.similarities(student, fresh.skill_matrix),
+    )
+    assert snap.positions == fresh.positions
+    assert snap.skills == fresh.skills
+
+
+class TestUpdates:
+    def test_insert_replace_delete(self, journal):
+        catalog = Catalog(_base(), journal=journal)
+
+        snap = catalog.upsert(make_internship({"Kubernetes": 2, "Zig Lang": 1}, id=4))
+        assert [i.id for i in snap.internships] == [1, 2, 3, 4]
+        _assert_matches_rebuild(snap)
+
+        snap = catalog.upsert(make_internship({"Vue": 3}, id=2))
+        assert snap.get(2).required_skills == {"Vue": 3}
+        _assert_matches_rebuild(snap)
+
+        snap = catalog.delete(1)
+        assert snap.get(1) is None
+        assert [i.id for i in snap.internships] == [2, 3, 4]
+        _assert_matches_rebuild(snap)
+
+    def test_readers_keep_their_snapshot(self, journal):
+        catalog = Catalog(_base(), journal=journal)
+        before = catalog.current()
+        catalog.upsert(make_internship({"Vue": 3}, id=2))
+        catalog.delete(3)
+        assert before.get(2).required_skills == {"React": 3}
+        assert len(before) == 3 and len(before.skill_matrix) == 3
+        assert catalog.current().version == before.version + 2
+
+    def test_delete_unknown_is_noop(self, journal):
+        catalog = Catalog(_base(), journal=journal)
+        assert len(catalog.delete(99)) == 3
+
+
+class TestJournal:
+    def test_sibling_worker_converges(self, journal):
+        a = Catalog(_base(), journal=journal)
+        b = Catalog(_base(), journal=journal)
+        a.upsert(make_internship({"Go": 3}, id=7))
+        a.delete(2)
+
+        b.refresh(force=True)
+        assert [i.id for i in b.current().internships] == [1, 3, 7]
+
+    def test_restart_replays_journal(self, journal):
+        Catalog(_base(), journal=journal).upsert(make_internship({"Go": 3}, id=7))
+        assert Catalog(_base(), journal=journal).current().get(7) is not None
+
+    def test_partial_line_waits(self, journal):
+        catalog = Catalog(_base(), journal=journal)
+        journal.write_text('{"op":"delete","id":1}\n{"op":"del')
+        catalog.refresh(force=True)
+        assert catalog.current().get(1) is None
+        assert len(catalog.current()) == 2
+
+
+class TestSharding:
+    def test_only_owned_internships_are_kept(self, journal):
+        config = ShardConfig(count=4, index=0)
+        candidates = [
+            make_internship({"Python": 3}, id=i, location=f"City {i}", is_remote=False)
+            for i in range(20)
+        ]
+        owned = {
+            i.id for i in candidates
+            if shard_for_key(internship_shard_key(i, config.strategy), 4) == 0
+        }
+        assert 0 < len(owned) < len(candidates)
+        catalog = Catalog([], shard_config=config, journal=journal)
+        for internship in candidates:
+            catalog.upsert(internship)
+        assert {i.id for i in catalog.current().internships} == owned
@@ -0,0 +1,92 @@
+"""
+Tests for the columnar student / internship stores and their row views.
+"""
+
+import pytest
+
+from app.data_loader import load_internships, load_students
+from app.matching.matcher import match_student_to_internship
+from app.models.columnar import InternshipStore, StudentStore
+from tests.conftest import make_internship, make_student
+
+STUDENTS = [
+    {"id": 30, "skills": {"Python": 3, "SQL": 2}, "year": 3, "location": "Delhi"},
+    {"id": 4, "skills": {}, "year": 1, "location": "Pune"},
+    {"id": 12, "skills": {"React": 4}, "year": 2, "location": "Delhi"},
+]
+
+INTERNSHIPS = [
+    {"id": 1, "required_skills": {"Python": 2}, "min_year": 2, "location": "Delhi", "is_remote": False},
+    {"id": 2, "required_skills": {"React": 3, "CSS": 1}, "min_year": 1, "location": "Pune", "is_remote": True},
+]
+
+
+class TestStudentStore:
+    def test_mapping_interface(self):
+        store = StudentStore(STUDENTS)
+        assert len(store) == 3
+        assert list(store) == [30, 4, 12]
+        assert 12 in store and 5 not in store and "12" not in store
+        assert store.get(5) is None
+        with pytest.raises(KeyError):
+            store[99]
+
+    def test_view_matches_record(self):
+        store = StudentStore(STUDENTS)
+        for record in STUDENTS:
+            view = store[record["id"]]
+            assert (view.id, view.skills, view.year, view.location) == (
+                record["id"], record["skills"], record["year"], record["location"]
+            )
+        assert store[30].has_skill("python") and store[30].skill_level("SQL") == 2
+        assert store[4].skill_level("Python") == 0
+
+    def test_view_builds_skills_once(self, monkeypatch):
+        store = StudentStore(STUDENTS)
+        calls = []
+        skills_of = store.skills_of
+        monkeypatch.setattr(store, "skills_of", lambda row: calls.append(row) or skills_of(row))
+        view = store[30]
+        assert view.has_skill("Python") and view.skill_level("SQL") == 2
+        assert view.skills is view.skills
+        assert calls == [view._row]
+
+    def test_strings_are_interned(self):
+        store = StudentStore(STUDENTS)
+        assert store.location_names == ["Delhi", "Pune"]
+        assert store.location_codes.tolist() == [0, 1, 0]
+        assert store.skill_indptr.tolist() == [0, 2, 2, 3]
+        assert store.skill_code("React") == 2 and store.skill_code("Go") == -1
+
+
+class TestInternshipStore:
+    def test_sequence_of_views(self):
+        store = InternshipStore(INTERNSHIPS)
+        assert [i.id for i in store] == [1, 2]
+        second = store[-1]
+        assert second.required_skills == {"React": 3, "CSS": 1}
+        assert second.is_remote is True and second.min_year == 1
+        assert second.requires_skill("CSS") and second.required_skill_level("Go") == 0
+        assert second.to_internship() == make_internship(
+            {"React": 3, "CSS": 1}, id=2, min_year=1, location="Pune", is_remote=True
+        )
+        with pytest.raises(IndexError):
+            store[2]
+
+
+def test_views_score_like_dataclasses():
+    students, internships = StudentStore(STUDENTS), InternshipStore(INTERNSHIPS)
+    for view in students.values():
+        student = make_student(view.skills, id=view.id, year=view.year, location=view.location)
+        for iview in internships:
+            assert match_student_to_internship(view, iview) == match_student_to_internship(
+                student, iview.to_internship()
+            )
+
+
+def test_loaders_return_columnar_data():
+    students = load_students()
+    internships = load_internships()
+    first = next(iter(students.values()))
+    assert isinstance(first.skills, dict) and first.id in students
+    assert all(isinstance(i.required_skills, dict) for i in internships)
@@ -0,0 +1,91 @@
+"""
+Tests for the encode micro-batcher.
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from app.embeddings.batcher import EncodeBatcher
+
+
+class RecordingEncoder:
+    def __init__(self, delay: float = 0.0):
+        self.calls = []
+        self.delay = delay
+        self._lock = threading.Lock()
+
+    def __call__(self, texts):
+        with self._lock:
+            self.calls.append(list(texts))
+            if self.delay:
+                threading.Event().wait(self.delay)
+        return [f"vec:{t}" for t in texts]
+
+
+class TestEncodeBatcher:
+    def test_each_caller_gets_its_own_row(self):
+        batcher = EncodeBatcher(RecordingEncoder())
+        assert batcher.encode("python", timeout=2) == "vec:python"
+
+    def test_concurrent_requests_share_forward_passes(self):
+        encoder = RecordingEncoder(delay=0.01)
+        batcher = EncodeBatcher(encoder, max_wait_ms=20)
+        texts = [f"skill{i}" for i in range(24)]
+        with ThreadPoolExecutor(max_workers=24) as pool:
+            out = list(pool.map(lambda t: batcher.encode(t, timeout=5), texts))
+        assert out == [f"vec:{t}" for t in texts]
+        assert len(encoder.calls) < len(texts)
+
+    def test_duplicate_texts_in_a_window_are_encoded_once(self):
+        encoder = RecordingEncoder(delay=0.02)
+        batcher = EncodeBatcher(encoder, max_wait_ms=50)
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            out = list(pool.map(lambda _: batcher.encode("sql", timeout=5), range(8)))
+        assert out == ["vec:sql"] * 8
+        assert all(batch.count("sql") == 1 for batch in encoder.calls)
+
+    def test_batch_size_is_capped(self):
+        encoder = RecordingEncoder(delay=0.01)
+        batcher = EncodeBatcher(encoder, max_batch_size=4, max_wait_ms=20)
+        with ThreadPoolExecutor(max_workers=16) as pool:
+            list(pool.map(lambda i: batcher.encode(f"t{i}", timeout=5), range(16)))
+        assert max(len(batch) for batch in encoder.calls) <= 4
+
+    def test_errors_propagate_to_callers(self):
+        def boom(texts):
+            raise RuntimeError("model unavailable")
+
+        batcher = EncodeBatcher(boom)
+        with pytest.raises(RuntimeError, match="model unavailable"):
+            batcher.encode("python", timeout=2)
+
+    def test_cancelled_async_caller_does_not_kill_worker(self):
+        import asyncio
+
+        encoder = RecordingEncoder(delay=0.05)
+        batcher = EncodeBatcher(encoder)
+
+        async def go():
+            # Occupy the worker so the next request sits in the queue
+            busy = asyncio.ensure_future(batcher.encode_async("busy"))
+            await asyncio.sleep(0.01)
+            doomed = asyncio.ensure_future(batcher.encode_async("doomed"))
+            await asyncio.sleep(0)
+            doomed.cancel()
+            assert await busy == "vec:busy"
+            return await asyncio.wait_for(batcher.encode_async("after"), 2)
+
+        assert asyncio.run(go()) == "vec:after"
+        assert batcher._thread.is_alive()
+        assert all("doomed" not in batch for batch in encoder.calls)
+
+    def test_dead_worker_is_restarted(self):
+        batcher = EncodeBatcher(RecordingEncoder())
+        dead = threading.Thread(target=lambda: None)
+        dead.start()
+        dead.join()
+        batcher._thread = dead
+        assert batcher.encode("b", timeout=2) == "vec:b"
+        assert batcher._thread.is_alive()
@@ -0,0 +1,145 @@
+"""
+Tests for the bounded inference executor (singleflight + 503 shedding).
+"""
+
+import asyncio
+import threading
+
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+
+from app.inference import InferenceExecutor, InferenceOverloaded
+
+
+def _blocking(event: threading.Event, calls: list, value):
+    calls.append(value)
+    event.wait(5)
+    return value
+
+
+class TestExecutor:
+    def test_same_key_shares_one_call(self):
+        executor = InferenceExecutor(max_workers=2, max_queue=0)
+        calls, gate = [], threading.Event()
+
+        async def main():
+            first = asyncio.ensure_future(
+                executor.run(_blocking, gate, calls, "a", key="k")
+            )
+            await asyncio.sleep(0.05)
+            second = asyncio.ensure_future(
+                executor.run(_blocking, gate, calls, "b", key="k")
+            )
+            await asyncio.sleep(0.05)
+            gate.set()
+            return await asyncio.gather(first, second)
+
+        assert asyncio.run(main()) == ["a", "a"]
+        assert calls == ["a"]
+        assert executor.pending == 0
+
+    def test_different_keys_run_separately(self):
+        executor = InferenceExecutor(max_workers=2, max_queue=0)
+        calls, gate = [], threading.Event()
+        gate.set()
+
+        async def main():
+            return await asyncio.gather(
+                executor.run(_blocking, gate, calls, 1, key="x"),
+                executor.run(_blocking, gate, calls, 2, key="y"),
+            )
+
+        assert asyncio.run(main()) == [1, 2]
+        assert sorted(calls) == [1, 2]
+
+    def test_full_queue_is_rejected(self):
+        executor = InferenceExecutor(max_workers=1, max_queue=1, retry_after=7)
+        calls, gate = [], threading.Event()
+
+        async def main():
+            running = [
+                asyncio.ensure_future(executor.run(_blocking, gate, calls, i))
+                for i in range(2)
+            ]
+            await asyncio.sleep(0.05)
+            with pytest.raises(InferenceOverloaded) as exc:
+                await executor.run(_blocking, gate, calls, 3)
+            gate.set()
+            await asyncio.gather(*running)
+            return exc.value.retry_after
+
+        assert asyncio.run(main()) == 7
+        assert executor.pending == 0
+
+    def test_errors_reach_every_waiter_and_free_the_slot(self):
+        executor = InferenceExecutor(max_workers=1, max_queue=0)
+
+        def boom():
+            raise RuntimeError("model failed")
+
+        async def main():
+            return await asyncio.gather(
+                executor.run(boom, key="k"),
+                executor.run(boom, key="k"),
+                return_exceptions=True,
+            )
+
+        results = asyncio.run(main())
+        assert all(isinstance(r, RuntimeError) for r in results)
+        assert executor.pending == 0
+
+
+class TestOverloadResponse:
+    def test_503_with_retry_after(self, monkeypatch):
+        from app import main
+
+        async def overloaded(*args, **kwargs):
+            raise InferenceOverloaded(retry_after=3)
+
+        monkeypatch.setattr(main.inference, "run", overloaded)
+        student_id = next(iter(main.students_db))
+        resp = TestClient(main.app).get(f"/recommend?student_id={student_id}")
+        assert resp.status_code == 503
+        assert resp.headers["retry-after"] == "3"
+
+
+class TestHybridShadow:
+    def test_coalesced_requests_queue_one_shadow_job(self, monkeypatch):
+        from app import main
+
+        gate, submitted = threading.Event(), []
+
+        def match(student, internship):
+            gate.wait(5)
+            return {"status": "MATCHED", "final_score": 50.0,
+                    "explanation": {"embedding_score": 0.5}}
+
+        def rerank(student, results, top_n, budget_ms, queue_depth=None):
+            return results, {"path": "full", "budget_exceeded": False}
+
+        monkeypatch.setattr(main, "inference", InferenceExecutor(max_workers=2, max_queue=0))
+        monkeypatch.setattr(main.matcher, "match", match)
+        monkeypatch.setattr(main.reranker, "rerank_within_budget", rerank)
+        monkeypatch.setattr(main.shadow_scorer, "configs", [object()])
+        monkeypatch.setattr(
+            main.shadow_scorer, "submit_hybrid",
+            lambda student, results, top_n: submitted.append(student.id),
+        )
+        student_id = next(iter(main.students_db))
+
+        async def run():
+            transport = httpx.ASGITransport(app=main.app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+                url = f"/recommend/hybrid?student_id={student_id}"
+                first = asyncio.ensure_future(client.get(url))
+                await asyncio.sleep(0.05)
+                second = asyncio.ensure_future(client.get(url))
+                await asyncio.sleep(0.05)
+                gate.set()
+                return await asyncio.gather(first, second)
+
+        responses = asyncio.run(run())
+        assert [r.status_code for r in responses] == [200, 200]
+        assert responses[0].json() == responses[1].json()
+        assert submitted == [student_id]
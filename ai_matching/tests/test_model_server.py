@@ -0,0 +1,180 @@
+"""
+Tests for the shared model server and its fallback client.
+"""
+
+import httpx
+import numpy as np
+import pytest
+from fastapi.testclient import TestClient
+
+from app.model_server import server
+from app.model_server.client import (
+    ModelClient,
+    ModelServerUnavailable,
+    SharedCrossEncoder,
+    SharedSentenceEncoder,
+)
+from app.model_server.codec import decode_matrix, encode_matrix
+
+
+class FakeSentenceModel:
+    def __init__(self, name):
+        self.name = name
+        self.calls = 0
+
+    def encode(self, texts, normalize_embeddings=False):
+        self.calls += 1
+        out = np.array([[len(t), 1.0, 0.0] for t in texts], dtype=np.float32)
+        if normalize_embeddings:
+            out /= np.linalg.norm(out, axis=1, keepdims=True)
+        return out
+
+
+class FakeCrossEncoder:
+    def __init__(self, name):
+        self.name = name
+
+    def predict(self, pairs):
+        return np.array([float(len(a) - len(b)) for a, b in pairs])
+
+
+@pytest.fixture
+def model_client(monkeypatch):
+    loaded = []
+
+    def load(name):
+        loaded.append(name)
+        return FakeSentenceModel(name)
+
+    registry = server.ModelRegistry(sentence_loader=load, cross_loader=FakeCrossEncoder)
+    monkeypatch.setattr(server, "registry", registry)
+    client = ModelClient(http_client=TestClient(server.app))
+    client.loaded = loaded
+    return client
+
+
+def _unreachable_client():
+    def refuse(request):
+        raise httpx.ConnectError("connection refused", request=request)
+
+    return ModelClient(
+        http_client=httpx.Client(
+            base_url="http://model-server", transport=httpx.MockTransport(refuse)
+        )
+    )
+
+
+class TestCodec:
+    def test_round_trip_is_writable(self):
+        matrix = np.arange(6, dtype=np.float32).reshape(2, 3)
+        decoded = decode_matrix(encode_matrix(matrix))
+        assert np.array_equal(decoded, matrix)
+        decoded[0, 0] = 9.0
+
+
+class TestModelServer:
+    def test_encode_returns_one_row_per_text(self, model_client):
+        out = model_client.encode("all-MiniLM-L6-v2", ["python", "sql"])
+        assert out.shape == (2, 3)
+        assert out[0, 0] == 6.0
+
+    def test_model_is_loaded_once(self, model_client):
+        for _ in range(3):
+            model_client.encode("all-MiniLM-L6-v2", ["react"])
+        model_client.encode("all-MiniLM-L6-v2", ["react"], normalize=True)
+        assert model_client.loaded == ["all-MiniLM-L6-v2"]
+
+    def test_unknown_model_is_rejected(self, model_client):
+        with pytest.raises(ModelServerUnavailable):
+            model_client.encode("bert-large", ["x"])
+
+    def test_cross_encode(self, model_client):
+        scores = model_client.cross_encode(
+            "cross-encoder/ms-marco-MiniLM-L-6-v2", [("abcd", "ab"), ("a", "abc")]
+        )
+        assert scores == [2.0, -2.0]
+
+    def test_health_reports_loaded_models(self, model_client):
+        model_client.encode("all-mpnet-base-v2", ["docker"])
+        health = model_client.health()
+        assert health["models_loaded"] == ["all-mpnet-base-v2"]
+
+
+    def test_cancelled_request_leaves_batcher_working(self, monkeypatch):
+        import asyncio
+        import time
+
+        class SlowModel(FakeSentenceModel):
+            def encode(self, texts, normalize_embeddings=False):
+                time.sleep(0.05)
+                return super().encode(texts, normalize_embeddings)
+
+        registry = server.ModelRegistry(sentence_loader=SlowModel, cross_loader=FakeCrossEncoder)
+        monkeypatch.setattr(server, "registry", registry)
+        request = server.EncodeRequest(model="all-MiniLM-L6-v2", texts=["python", "sql"])
+
+        async def go():
+            # A client disconnect cancels the handler while its rows are queued
+            busy = asyncio.ensure_future(server.encode(request))
+            await asyncio.sleep(0.01)
+            dropped = asyncio.ensure_future(server.encode(request))
+            await asyncio.sleep(0.01)
+            dropped.cancel()
+            await busy
+            return await asyncio.wait_for(server.encode(request), 2)
+
+        out = decode_matrix(asyncio.run(go())["embeddings"])
+        assert out.shape == (2, 3)
+
+    def test_model_load_does_not_block_the_event_loop(self, monkeypatch):
+        import asyncio
+        import threading
+
+        released = threading.Event()
+        waited = []
+
+        def load(name):
+            # Only released if /health gets served while this load runs
+            waited.append(released.wait(2))
+            return FakeSentenceModel(name)
+
+        registry = server.ModelRegistry(sentence_loader=load, cross_loader=FakeCrossEncoder)
+        monkeypatch.setattr(server, "registry", registry)
+
+        async def go():
+            transport = httpx.ASGITransport(app=server.app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+                encoding = asyncio.ensure_future(client.post(
+                    "/encode", json={"model": "all-MiniLM-L6-v2", "texts": ["python"]}
+                ))
+                await asyncio.sleep(0.05)
+                health = await client.get("/health")
+                released.set()
+                return health, await encoding
+
+        health, encoded = asyncio.run(go())
+        assert health.status_code == 200
+        assert encoded.status_code == 200
+        assert waited == [True]
+
+
+class TestFallback:
+    def test_sentence_encoder_uses_server(self, model_client):
+        encoder = SharedSentenceEncoder("all-MiniLM-L6-v2", client=model_client)
+        assert encoder.encode("python").shape == (3,)
+        assert encoder._local is None
+
+    def test_sentence_encoder_falls_back_in_process(self, monkeypatch):
+        encoder = SharedSentenceEncoder("all-MiniLM-L6-v2", client=_unreachable_client())
+        monkeypatch.setattr(encoder, "_load_local", lambda: FakeSentenceModel("local"))
+        out = encoder.encode(["python", "go"])
+        assert out.shape == (2, 3)
+        assert encoder.local.name == "local"
+        assert not encoder._remote_ok()
+
+    def test_cross_encoder_falls_back_in_process(self, monkeypatch):
+        encoder = SharedCrossEncoder(
+            "cross-encoder/ms-marco-MiniLM-L-6-v2", client=_unreachable_client()
+        )
+        monkeypatch.setattr(encoder, "_load_local", lambda: FakeCrossEncoder("local"))
+        assert list(encoder.predict([("abc", "a")])) == [2.0]
@@ -0,0 +1,182 @@
+"""
+Tests for latency-budgeted rerank planning (pure planner, no model load).
+"""
+
+import pytest
+
+from app.matching.rerank_budget import (
+    PATH_BUDGET_CUT,
+    PATH_BUDGET_SKIP,
+    PATH_EMPTY,
+    PATH_FULL,
+    PATH_GAP_SKIP,
+    PATH_QUEUE_CUT,
+    QUEUE_SOFT_LIMIT,
+    RERANK_MAX_DEPTH,
+    max_rerank_swing,
+    plan_rerank,
+)
+from tests.conftest import make_internship, make_student
+
+WEIGHT = 0.3
+CLOSE_SCORES = [80, 79, 78, 77, 76, 75, 74, 73, 72, 71, 70, 69]
+
+
+def _plan(scores, top_n=5, budget_ms=1000.0, queue_depth=0, pair_cost_ms=1.0):
+    return plan_rerank(
+        scores, top_n=top_n, budget_ms=budget_ms,
+        queue_depth=queue_depth, pair_cost_ms=pair_cost_ms, weight=WEIGHT,
+    )
+
+
+class TestSwing:
+    def test_swing_grows_with_weight(self):
+        assert max_rerank_swing(0.5) > max_rerank_swing(0.3) > max_rerank_swing(0.1)
+
+    def test_full_weight_is_unbounded(self):
+        assert max_rerank_swing(1.0) == float("inf")
+
+
+class TestPlanRerank:
+    def test_close_scores_take_full_path(self):
+        plan = _plan(CLOSE_SCORES)
+        assert plan.path == PATH_FULL
+        assert plan.depth == 10
+
+    def test_large_gap_at_cut_skips_reranking(self):
+        swing = max_rerank_swing(WEIGHT)
+        scores = [90, 89, 88, 87, 86, 86 - swing - 1, 50]
+        plan = _plan(scores, top_n=5)
+        assert plan.path == PATH_GAP_SKIP
+        assert plan.depth == 0
+
+    def test_unreachable_tail_is_not_scored(self):
+        swing = max_rerank_swing(WEIGHT)
+        scores = [90, 89, 88, 87, 86, 85, 86 - swing - 5, 10]
+        plan = _plan(scores, top_n=5)
+        assert plan.path == PATH_FULL
+        assert plan.depth == 6
+
+    def test_long_queue_cuts_to_top_n(self):
+        plan = _plan(CLOSE_SCORES, top_n=3, queue_depth=QUEUE_SOFT_LIMIT)
+        assert plan.path == PATH_QUEUE_CUT
+        assert plan.depth == 3
+
+    def test_budget_limits_depth(self):
+        plan = _plan(CLOSE_SCORES, budget_ms=40.0, pair_cost_ms=10.0)
+        assert plan.path == PATH_BUDGET_CUT
+        assert plan.depth == 4
+        assert plan.estimated_ms <= 40.0
+
+    def test_budget_too_small_skips(self):
+        plan = _plan(CLOSE_SCORES, budget_ms=5.0, pair_cost_ms=10.0)
+        assert plan.path == PATH_BUDGET_SKIP
+        assert plan.depth == 0
+
+    @pytest.mark.parametrize("scores, top_n", [([], 5), ([50.0], 0)])
+    def test_nothing_to_rerank(self, scores, top_n):
+        assert _plan(scores, top_n=top_n).path == PATH_EMPTY
+
+    def test_fewer_candidates_than_top_n(self):
+        plan = _plan([60, 40, 20], top_n=5)
+        assert plan.path == PATH_FULL
+        assert plan.depth == 3
+
+
+
+class TestQueuePressure:
+    def test_inference_backlog_cuts_rerank_to_top_n(self):
+        """Rerank planned inside an inference job sees the executor's backlog
+        (as /recommend/hybrid passes ``inference.queued``): saturated workers
+        alone keep full depth, jobs waiting behind them cut it."""
+        import asyncio
+        import threading
+
+        from app.inference import InferenceExecutor
+        from app.matching.reranker import ReRanker
+
+        class FakeCrossEncoder:
+            def score_batch(self, pairs):
+                return [0.0] * len(pairs)
+
+        reranker = ReRanker()
+        reranker.cross_encoder = FakeCrossEncoder()
+        executor = InferenceExecutor(max_workers=QUEUE_SOFT_LIMIT)
+        student = make_student({"Python": 3}, id=1)
+        candidates = [
+            {"internship": make_internship({"Python": 3}, id=i), "final_score": float(s)}
+            for i, s in enumerate(CLOSE_SCORES)
+        ]
+
+        def plan(start=None):
+            if start is not None:
+                start.wait()
+            return reranker.rerank_within_budget(
+                student, [dict(c) for c in candidates], top_n=3,
+                budget_ms=10_000.0, queue_depth=executor.queued,
+            )[1]
+
+        async def go():
+            idle = await executor.run(plan)
+
+            release = threading.Event()
+            # Every other worker busy, nothing waiting
+            busy = [
+                asyncio.ensure_future(executor.run(release.wait))
+                for _ in range(QUEUE_SOFT_LIMIT - 1)
+            ]
+            await asyncio.sleep(0.05)
+            saturated = await executor.run(plan)
+
+            # Same, plus QUEUE_SOFT_LIMIT jobs queued behind this one
+            start = threading.Event()
+            planned = asyncio.ensure_future(executor.run(plan, start))
+            await asyncio.sleep(0.05)
+            busy += [
+                asyncio.ensure_future(executor.run(release.wait))
+                for _ in range(QUEUE_SOFT_LIMIT)
+            ]
+            await asyncio.sleep(0.05)
+            start.set()
+            try:
+                backlog = await planned
+            finally:
+                release.set()
+                await asyncio.gather(*busy)
+            return idle, saturated, backlog
+
+        idle, saturated, backlog = asyncio.run(go())
+        assert (idle["path"], idle["depth"]) == (PATH_FULL, RERANK_MAX_DEPTH)
+        assert (saturated["path"], saturated["depth"]) == (PATH_FULL, RERANK_MAX_DEPTH)
+        assert (backlog["path"], backlog["depth"]) == (PATH_QUEUE_CUT, 3)
+
+
+class TestRerankScores:
+    def test_final_score_is_hybrid_on_every_path(self):
+        from app.matching.reranker import ReRanker
+
+        class FakeCrossEncoder:
+            def score_batch(self, pairs):
+                # Strongly prefers whatever came last
+                return [-12.0] * (len(pairs) - 1) + [12.0]
+
+        reranker = ReRanker()
+        reranker.cross_encoder = FakeCrossEncoder()
+        student = make_student({"Python": 3}, id=1)
+        candidates = [
+            {"internship": make_internship({"Python": 3}, id=i), "final_score": float(s)}
+            for i, s in enumerate(CLOSE_SCORES)
+        ]
+
+        results, info = reranker.rerank_within_budget(
+            student, candidates, top_n=3, budget_ms=40.0,
+        )
+        head, tail = results[:info["depth"]], results[info["depth"]:]
+        assert info["path"] == PATH_BUDGET_CUT and tail
+        assert {r["final_score"] for r in results} == set(map(float, CLOSE_SCORES))
+        assert [r["rerank_score"] for r in head] == sorted(
+            (r["rerank_score"] for r in head), reverse=True
+        )
+        # Reordered by the cross-encoder, yet final_score is still hybrid
+        assert head[0]["final_score"] == 76.0
+        assert all(r["rerank_score"] is None for r in tail)
@@ -0,0 +1,84 @@
+"""
+Tests for fields= selection and compact response encoding.
+"""
+
+import json
+
+import numpy as np
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.api import encoding
+from app.api.routes import router
+
+STUDENT = {"id": 1, "skills": {"Python": 4, "SQL": 3}, "year": 3, "location": "Delhi"}
+INTERNSHIPS = [
+    {"id": i, "required_skills": {"Python": 3}, "min_year": 2,
+     "location": "Delhi", "is_remote": False}
+    for i in range(1, 4)
+]
+
+
+@pytest.fixture(scope="module")
+def client():
+    app = FastAPI()
+    app.include_router(router)
+    return TestClient(app)
+
+
+class TestHelpers:
+    def test_parse_fields(self):
+        assert encoding.parse_fields(" a, b ,,c") == ["a", "b", "c"]
+        assert encoding.parse_fields("") is None
+        assert encoding.parse_fields(None) is None
+
+    def test_select_fields_skips_missing_keys(self):
+        items = [{"a": 1, "b": 2}, {"a": 3}]
+        assert encoding.select_fields(items, ["a", "b"]) == [{"a": 1, "b": 2}, {"a": 3}]
+        assert encoding.select_fields(items, None) == items
+
+    def test_numpy_values_serialize(self):
+        body = encoding.encode({"score": np.float32(0.5), "ids": np.arange(2)})
+        assert json.loads(body) == {"score": 0.5, "ids": [0, 1]}
+
+    def test_msgpack_needs_the_package(self, monkeypatch):
+        monkeypatch.setattr(encoding, "msgpack", None)
+        assert encoding.negotiate("application/msgpack") == encoding.MEDIA_JSON
+        monkeypatch.setattr(encoding, "msgpack", object())
+        assert encoding.negotiate("application/x-msgpack;q=1, */*") == encoding.MEDIA_MSGPACK
+        assert encoding.negotiate("application/json") == encoding.MEDIA_JSON
+
+
+class TestEndpoints:
+    def test_match_unchanged_by_default(self, client):
+        resp = client.post("/match", json={"student": STUDENT, "internship": INTERNSHIPS[0]})
+        assert resp.headers["content-type"] == "application/json"
+        assert resp.headers["server-timing"].startswith("serialize;dur=")
+        assert {"status", "final_score", "breakdown", "explanation"} <= set(resp.json())
+
+    def test_match_fields(self, client):
+        resp = client.post(
+            "/match?fields=status,final_score",
+            json={"student": STUDENT, "internship": INTERNSHIPS[0]},
+        )
+        assert set(resp.json()) == {"status", "final_score"}
+
+    def test_recommend_fields_keep_envelope(self, client):
+        resp = client.post(
+            "/recommend?fields=internship_id",
+            json={"student": STUDENT, "internships": INTERNSHIPS, "top_n": 2},
+        )
+        body = resp.json()
+        assert body["count"] == 2
+        assert all(set(r) == {"internship_id"} for r in body["recommendations"])
+
+    def test_msgpack_roundtrip(self, client):
+        msgpack = pytest.importorskip("msgpack")
+        resp = client.post(
+            "/recommend?fields=internship_id,final_score",
+            json={"student": STUDENT, "internships": INTERNSHIPS, "top_n": 2},
+            headers={"Accept": "application/msgpack"},
+        )
+        assert resp.headers["content-type"] == "application/msgpack"
+        assert msgpack.unpackb(resp.content)["count"] == 2
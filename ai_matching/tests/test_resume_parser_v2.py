@@ -359,6 +359,132 @@ class TestFuzzyMatching:
         assert result is None
 
 
+class TestFuzzySkillMatcher:
+    """Bulk cdist scoring must agree with extractOne per candidate."""
+
+    SKILLS = ["Python", "R", "Go", "Kubernetes", "JavaScript", "React", "Docker", "PostgreSQL"]
+
+    def test_agrees_with_extract_one(self):
+        from rapidfuzz import fuzz, process as rfprocess
+        from fuzzy_matcher import FuzzySkillMatcher
+
+        matcher = FuzzySkillMatcher(self.SKILLS)
+        text = "Pyton kuberntes Javscript react dockr postgre sql, software engineer, ab"
+        lower_map = {s.lower(): s for s in self.SKILLS}
+        for candidate, got in matcher.score(matcher.candidates(text)).items():
+            best = rfprocess.extractOne(
+                candidate, list(lower_map), scorer=fuzz.WRatio, score_cutoff=85
+            )
+            expected = None if not best or best[0] == candidate else lower_map[best[0]]
+            assert got == expected, candidate
+
+    def test_finds_typos_not_exact_hits(self):
+        from fuzzy_matcher import FuzzySkillMatcher
+
+        matcher = FuzzySkillMatcher(self.SKILLS)
+        assert {"Python", "Kubernetes"} <= matcher.match("Pyton and Kuberntes")
+        assert matcher.score(["docker"]) == {"docker": None}
+
+    def test_memo_skips_seen_candidates(self, monkeypatch):
+        from fuzzy_matcher import FuzzySkillMatcher
+
+        matcher = FuzzySkillMatcher(self.SKILLS)
+        scored = []
+        original = matcher.score
+        monkeypatch.setattr(
+            matcher, "score", lambda cands: scored.extend(cands) or original(cands)
+        )
+        memo = {}
+        matcher.match("pyton kuberntes", memo)
+        matcher.match("kuberntes javscript", memo)
+        assert sorted(scored) == sorted(set(scored))
+        assert "kuberntes" in memo and scored.count("kuberntes") == 1
+
+
+class TestChunkEmbeddingCache:
+    def _cache(self, maxsize=8):
+        import numpy as np
+        from embedding_cache import ChunkEmbeddingCache
+
+        calls = []
+
+        def encode(chunks):
+            calls.append(list(chunks))
+            return np.array([[len(c), i] for i, c in enumerate(chunks)], dtype=np.float32)
+
+        return ChunkEmbeddingCache(encode, maxsize=maxsize), calls
+
+    def test_dedupes_and_batches_misses(self):
+        cache, calls = self._cache()
+        out = cache.encode(["alpha one", "beta two", "alpha one"])
+        assert calls == [["alpha one", "beta two"]]
+        assert out.shape == (3, 2) and (out[0] == out[2]).all()
+
+    def test_hits_skip_the_model(self):
+        cache, calls = self._cache()
+        cache.encode(["alpha one", "beta two"])
+        out = cache.encode(["beta two", "gamma three"])
+        assert calls[-1] == ["gamma three"]
+        assert out[0].tolist() == [8, 1]
+        assert (cache.hits, cache.misses) == (1, 3)
+
+    def test_bounded_lru(self):
+        cache, calls = self._cache(maxsize=2)
+        cache.encode(["aaaaaa"])
+        cache.encode(["bbbbbb"])
+        cache.encode(["aaaaaa"])          # refresh a
+        cache.encode(["cccccc"])          # evicts b
+        assert len(cache) == 2
+        cache.encode(["aaaaaa", "bbbbbb"])
+        assert calls[-1] == ["bbbbbb"]
+
+
+# ===================================================================
+# Skill Matcher  (single-pass exact + synonym stage)
+# ===================================================================
+
+from skill_matcher import SkillMatcher
+
+
+def _matcher():
+    return SkillMatcher([
+        ("Python", "Python"), ("React", "React"), ("React Native", "React Native"),
+        ("C++", "C++"), ("Machine Learning", "Machine Learning"),
+        ("node.js", "Node.js"), ("nodejs", "Node.js"), ("Java", "Java"),
+    ])
+
+
+class TestSkillMatcher:
+    def test_spans_point_into_original_text(self):
+        text = "Built with PYTHON and React Native."
+        matches = _matcher().find(text)
+        assert [(m.skill, text[m.start:m.end]) for m in matches] == [
+            ("Python", "PYTHON"), ("React Native", "React Native"), ("React", "React"),
+        ]
+
+    def test_word_boundaries(self):
+        assert _matcher().skills("JavaScript, Pythonic, xreact") == []
+        assert _matcher().skills("Java; C++, nodejs") == ["C++", "Java", "Node.js"]
+
+    def test_whitespace_insensitive(self):
+        text = "Interests: Machine\n   Learning"
+        (match,) = _matcher().find(text)
+        assert match.skill == "Machine Learning"
+        assert match.text == "Machine\n   Learning"
+
+    def test_matches_legacy_regex_on_sample_resume(self, graph):
+        import re
+
+        text_lower = SAMPLE_RESUME.lower()
+        legacy = {
+            canonical
+            for variant, canonical in [(s, s) for s in graph.all_canonical_skills()]
+            + list(graph.get_synonym_map().items())
+            if re.search(r"\b" + re.escape(variant.lower()) + r"\b", text_lower)
+        }
+        assert set(SkillMatcher.from_graph(graph).skills(SAMPLE_RESUME)) == legacy
+
+
 # ===================================================================
 # Schemas
 # ===================================================================
@@ -387,3 +513,649 @@ class TestSchemas:
     def test_skill_dedup(self):
         data = ResumeData(skills=["Python", "python", "PYTHON", "React"])
         assert len(data.skills) == 2
+
+
+# ===================================================================
+# Parse Result Cache
+# ===================================================================
+
+from parse_cache import ParseCache, content_hash
+
+
+class TestParseCache:
+    def _response(self):
+        from schemas import ParseResponse
+
+        return ParseResponse(
+            success=True,
+            data=ResumeData(name="Jane Roe", skills=["Python"]),
+            processing_time_ms=1200.0,
+        )
+
+    def test_round_trip_keyed_by_hash_pipeline_version(self, tmp_path):
+        from schemas import ParseResponse
+
+        cache = ParseCache(tmp_path / "c.sqlite3")
+        digest = content_hash(b"%PDF-1.4 same bytes")
+        cache.put(digest, "hybrid", "v1", self._response().json())
+
+        restored = ParseResponse.parse_raw(cache.get(digest, "hybrid", "v1"))
+        assert restored.data.skills == ["Python"]
+        assert cache.get(digest, "llm", "v1") is None
+        assert cache.get(digest, "hybrid", "v2") is None
+
+    def test_persists_across_instances(self, tmp_path):
+        path = tmp_path / "c.sqlite3"
+        ParseCache(path).put("a" * 64, "hybrid", "v1", "{}")
+        assert ParseCache(path).get("a" * 64, "hybrid", "v1") == "{}"
+
+    def test_ttl_expiry(self, tmp_path, monkeypatch):
+        import parse_cache
+
+        cache = ParseCache(tmp_path / "c.sqlite3", ttl_s=60)
+        cache.put("a" * 64, "hybrid", "v1", "{}")
+        now = parse_cache.time.time()
+        monkeypatch.setattr(parse_cache.time, "time", lambda: now + 61)
+        assert cache.get("a" * 64, "hybrid", "v1") is None
+
+    def test_trim_keeps_most_recently_used(self, tmp_path, monkeypatch):
+        import parse_cache
+
+        clock = [1000.0]
+        monkeypatch.setattr(parse_cache.time, "time", lambda: clock[0])
+        cache = ParseCache(tmp_path / "c.sqlite3", max_entries=2)
+        for key in "abc":
+            clock[0] += 1
+            cache.put(key * 64, "hybrid", "v1", key)
+        clock[0] += 1
+        cache.get("a" * 64, "hybrid", "v1")
+        cache.trim()
+        assert cache.get("b" * 64, "hybrid", "v1") is None
+        assert cache.get("a" * 64, "hybrid", "v1") == "a"
+        assert cache.get("c" * 64, "hybrid", "v1") == "c"
+
+
+
+# ===================================================================
+# Batch Runner
+# ===================================================================
+
+import asyncio
+
+from batch_runner import run_batch
+
+
+class TestBatchRunner:
+    def _collect(self, uploads, parse, concurrency, **kwargs):
+        async def go():
+            return [item async for item in run_batch(uploads, parse, concurrency, **kwargs)]
+        return asyncio.run(go())
+
+    def test_yields_in_completion_order(self):
+        delays = {b"slow": 0.05, b"fast": 0.0}
+
+        async def parse(name, content):
+            await asyncio.sleep(delays[content])
+            return name
+
+        results = self._collect([("a", b"slow"), ("b", b"fast")], parse, 2)
+        assert [(i, r) for i, _, r, _ in results] == [(1, "b"), (0, "a")]
+
+    def test_bounded_concurrency(self):
+        running, peak = [0], [0]
+
+        async def parse(name, content):
+            running[0] += 1
+            peak[0] = max(peak[0], running[0])
+            await asyncio.sleep(0.01)
+            running[0] -= 1
+            return name
+
+        uploads = [(f"{i}.pdf", bytes([i])) for i in range(10)]
+        results = self._collect(uploads, parse, 3)
+        assert peak[0] == 3
+        assert sorted(i for i, *_ in results) == list(range(10))
+
+    def test_duplicates_parsed_once(self):
+        calls = []
+
+        async def parse(name, content):
+            calls.append(name)
+            return content
+
+        uploads = [("a.pdf", b"x"), ("b.pdf", b"y"), ("c.pdf", b"x")]
+        results = {i: (f, r, dup) for i, f, r, dup in self._collect(uploads, parse, 2)}
+        assert sorted(calls) == ["a.pdf", "b.pdf"]
+        assert results[2] == ("c.pdf", b"x", True)
+        assert results[0][2] is False
+
+    def test_key_dedups_handles(self):
+        calls = []
+
+        async def parse(name, handle):
+            calls.append(name)
+            return handle["path"]
+
+        uploads = [
+            ("a.pdf", {"path": "/t/1", "digest": "d1"}),
+            ("b.pdf", {"path": "/t/2", "digest": "d1"}),
+        ]
+        results = self._collect(uploads, parse, 2, key=lambda h: h["digest"])
+        assert calls == ["a.pdf"]
+        assert sorted((i, r, dup) for i, _, r, dup in results) == [(0, "/t/1", False), (1, "/t/1", True)]
+
+    def test_early_close_cancels_pending(self):
+        started = []
+
+        async def parse(name, content):
+            started.append(name)
+            await asyncio.sleep(0 if name == "0" else 10)
+            return name
+
+        async def go():
+            stream = run_batch([(str(i), bytes([i])) for i in range(5)], parse, 2)
+            first = await stream.__anext__()
+            await stream.aclose()
+            await asyncio.sleep(0)
+            return first
+
+        assert asyncio.run(go())[2] == "0"
+        assert len(started) < 5
+
+
+# ===================================================================
+# Parse Worker Pool
+# ===================================================================
+
+import time
+
+import pytest
+
+from parse_pool import ParsePool, PoolError, PoolSaturated, PoolTimeout
+
+
+class TestParsePool:
+    def _run(self, pool, coro_fn):
+        async def go():
+            try:
+                return await coro_fn()
+            finally:
+                pool.shutdown()
+        return asyncio.run(go())
+
+    def test_runs_job_in_worker(self):
+        pool = ParsePool(workers=1, max_pending=2, timeout_s=30)
+
+        async def go():
+            await pool.warm()
+            return await pool.run(len, b"abc")
+
+        assert self._run(pool, go) == 3
+        assert pool.stats()["pending"] == 0
+
+    def test_saturation_rejects_immediately(self):
+        pool = ParsePool(workers=1, max_pending=1, timeout_s=30)
+
+        async def go():
+            await pool.warm()
+            busy = asyncio.ensure_future(pool.run(time.sleep, 0.2))
+            await asyncio.sleep(0)
+            with pytest.raises(PoolSaturated):
+                await pool.run(len, b"")
+            await busy
+
+        self._run(pool, go)
+        assert pool.stats()["rejected"] == 1
+
+    def test_timeout_restarts_wedged_pool(self):
+        pool = ParsePool(workers=1, max_pending=2, timeout_s=0.3)
+
+        async def go():
+            await pool.warm()
+            with pytest.raises(PoolTimeout):
+                await pool.run(time.sleep, 30)
+            return await pool.run(len, b"ab")
+
+        assert self._run(pool, go) == 2
+        assert pool.stats()["restarts"] == 1
+
+    def test_crashed_worker_is_replaced(self):
+        pool = ParsePool(workers=1, max_pending=2, timeout_s=30)
+
+        async def go():
+            with pytest.raises(PoolError):
+                await pool.run(os._exit, 1)
+            return await pool.run(len, b"a")
+
+        assert self._run(pool, go) == 1
+
+
+# ===================================================================
+# Shared spaCy pass
+# ===================================================================
+
+from spacy_pipeline import DocEntities, Entity, SpacyPipeline
+
+
+class _FakeSpan:
+    def __init__(self, text, label, start):
+        self.text, self.label_ = text, label
+        self.start_char, self.end_char = start, start + len(text)
+
+
+class _FakeNlp:
+    """Tags every occurrence of the given phrases; records pipe() calls."""
+
+    pipe_names = ["transformer", "tagger", "parser", "ner", "lemmatizer"]
+
+    def __init__(self, phrases):
+        self.phrases = phrases
+        self.calls = []
+
+    def pipe(self, texts, disable=()):
+        for text in texts:
+            self.calls.append((text, list(disable)))
+            ents = []
+            for phrase, label in self.phrases.items():
+                start = text.find(phrase)
+                if start >= 0:
+                    ents.append(_FakeSpan(phrase, label, start))
+            yield type("Doc", (), {"ents": ents})()
+
+
+class TestSharedSpacyPass:
+    TEXT = "Jane Roe\njane@x.com\n\nEXPERIENCE\n\nEngineer\nAcme Corp\n2019 - 2021\n"
+
+    def test_within_rebases_offsets(self):
+        ents = DocEntities([Entity("Acme", "ORG", 40, 44), Entity("Jane", "PERSON", 0, 4)])
+        assert ents.within(30, 50) == [Entity("Acme", "ORG", 10, 14)]
+        assert ents.within(0, 42) == [Entity("Jane", "PERSON", 0, 4)]
+        assert ents.within(0, 50, "ORG") == [Entity("Acme", "ORG", 40, 44)]
+
+    def test_one_ner_pass_with_other_components_disabled(self):
+        nlp = _FakeNlp({"Jane Roe": "PERSON", "Acme Corp": "ORG"})
+        ents = SpacyPipeline(nlp).entities(self.TEXT, name_span=(0, 20))
+        assert len(nlp.calls) == 1
+        assert nlp.calls[0][1] == ["tagger", "parser", "lemmatizer"]
+        assert {e.label for e in ents} == {"PERSON", "ORG"}
+
+    def test_fast_tier_falls_back_only_without_person(self):
+        fast = _FakeNlp({"Acme Corp": "ORG"})
+        accurate = _FakeNlp({"Jane Roe": "PERSON", "Acme Corp": "ORG"})
+        pipeline = SpacyPipeline(fast, fallback=lambda: accurate)
+        ents = pipeline.entities("x\n" + self.TEXT, name_span=(2, 20))
+        assert accurate.calls == [(("x\n" + self.TEXT)[2:20], ["tagger", "parser", "lemmatizer"])]
+        assert ents.within(2, 20) == [Entity("Jane Roe", "PERSON", 0, 8)]
+        assert [e.label for e in ents.within(0, 100)].count("ORG") == 1
+
+        fast.phrases["Jane Roe"] = "PERSON"
+        pipeline.entities(self.TEXT, name_span=(0, 20))
+        assert pipeline.fallbacks == 1
+
+    def test_section_char_span(self):
+        sections = SectionDetector().detect(self.TEXT)
+        exp = SectionDetector().get_section(sections, SectionLabel.EXPERIENCE)
+        start, end = SectionDetector.char_span(self.TEXT, exp)
+        assert self.TEXT[start:end] == exp.text
+
+    def test_extractors_use_shared_entities(self):
+        from entity_extractor import EntityExtractor
+        from relation_extractor import RelationExtractor
+
+        ents = DocEntities([Entity("Jane Roe", "PERSON", 0, 8), Entity("Acme Corp", "ORG", 42, 51)])
+        extractor = EntityExtractor(nlp=object())   # never called
+        assert extractor.extract_name(self.TEXT, ents.within(0, 1000)) == "Jane Roe"
+
+        exp_text = "Engineer\nAcme Corp\n2019 - 2021"
+        start = self.TEXT.find(exp_text)
+        groups = RelationExtractor(nlp=object()).extract_experience_groups(
+            exp_text, ents.within(start, start + len(exp_text))
+        )
+        assert groups[0].get("ORG") == "Acme Corp"
+
+
+# ===================================================================
+# PDF backends
+# ===================================================================
+
+from pdf_backends import BACKENDS, PDFBackend, looks_garbled
+
+
+class _FakeBackend(PDFBackend):
+    def __init__(self, name, pages):
+        self.name, self.pages, self.calls = name, pages, 0
+
+    def page_count(self, data):
+        return len(self.pages)
+
+    def extract_pages(self, data, start, stop):
+        self.calls += 1
+        return self.pages[start:stop]
+
+
+class TestPDFBackends:
+    GOOD = "Jane Roe\nSoftware Engineer at Acme Corp, building Python services since 2019."
+
+    def _processor(self, fast, fallback):
+        from pdf_processor import PDFProcessor
+
+        proc = PDFProcessor(backend=fast, page_workers=1)
+        proc.fallback = fallback
+        return proc
+
+    def test_looks_garbled(self):
+        assert not looks_garbled(self.GOOD)
+        assert looks_garbled("")
+        assert looks_garbled("Jane Roe")
+        assert looks_garbled("(cid:12)(cid:34)(cid:56) " * 10 + self.GOOD)
+        assert looks_garbled("�" * 10 + self.GOOD)
+        assert looks_garbled("•··—|–" * 30)
+
+    def test_fast_backend_text_is_used_when_clean(self):
+        fast = _FakeBackend("fast", [self.GOOD, "", "  page   three  "])
+        slow = _FakeBackend("slow", ["unused"])
+        text = self._processor(fast, slow).extract_text_from_bytes(b"%PDF")
+        assert text == self.GOOD + "\n\npage three"
+        assert slow.calls == 0
+
+    def test_garbled_output_falls_back(self):
+        fast = _FakeBackend("fast", ["(cid:3)(cid:4)" * 20])
+        slow = _FakeBackend("slow", [self.GOOD])
+        assert self._processor(fast, slow).extract_text_from_bytes(b"%PDF") == self.GOOD
+
+    def test_backends_agree_on_generated_pdf(self, tmp_path):
+        pytest.importorskip("pdfplumber")
+        canvas = pytest.importorskip("reportlab.pdfgen.canvas")
+        from pdf_processor import PDFProcessor
+
+        path = str(tmp_path / "r.pdf")
+        pdf = canvas.Canvas(path)
+        for page in range(3):
+            pdf.drawString(40, 800, f"Page {page} Jane Roe")
+            pdf.drawString(40, 780, "Python, Docker and PostgreSQL at Acme Corp")
+            pdf.showPage()
+        pdf.save()
+        data = open(path, "rb").read()
+
+        texts = {
+            name: PDFProcessor(backend=name, page_workers=1).extract_text_from_bytes(data)
+            for name, backend in BACKENDS.items() if backend.available()
+        }
+        assert texts["pdfplumber"].startswith("Page 0 Jane Roe\nPython, Docker")
+        assert len(set(texts.values())) == 1
+
+        parallel = PDFProcessor(backend="pdfplumber", page_workers=2, parallel_min_pages=2)
+        try:
+            assert parallel.extract_text_from_bytes(data) == texts["pdfplumber"]
+        finally:
+            parallel._page_pool.shutdown()
+
+
+# ===================================================================
+# Parse Job Queue
+# ===================================================================
+
+from job_queue import JobQueue, JobRunner, callback_allowed, post_callback
+
+
+class TestJobQueue:
+    def test_submit_claim_finish(self, tmp_path):
+        queue = JobQueue(tmp_path / "jobs.sqlite3")
+        job_id = queue.submit("a.pdf", b"%PDF", client_ref="u1")
+        assert queue.get(job_id).status == "queued"
+
+        job = queue.claim()
+        assert (job.id, job.content, job.attempts) == (job_id, b"%PDF", 1)
+        assert queue.claim() is None  # leased
+
+        assert queue.finish(job, '{"success": true}')
+        done = queue.get(job_id).to_dict()
+        assert done["status"] == "done"
+        assert done["result"] == {"success": True}
+        assert done["client_ref"] == "u1"
+
+    def test_claims_oldest_first(self, tmp_path):
+        queue = JobQueue(tmp_path / "jobs.sqlite3")
+        first = queue.submit("a.pdf", b"a")
+        queue.submit("b.pdf", b"b")
+        assert queue.claim().id == first
+
+    def test_expired_lease_survives_restart(self, tmp_path):
+        path = tmp_path / "jobs.sqlite3"
+        job_id = JobQueue(path, lease_s=0).submit("a.pdf", b"a")
+        JobQueue(path, lease_s=0).claim()  # this process "dies" mid-parse
+
+        job = JobQueue(path, lease_s=60).claim()
+        assert (job.id, job.attempts) == (job_id, 2)
+
+    def test_stale_claim_cannot_close_reclaimed_job(self, tmp_path):
+        queue = JobQueue(tmp_path / "jobs.sqlite3", lease_s=0)
+        queue.submit("a.pdf", b"a")
+        stale = queue.claim()
+        fresh = queue.claim()  # lease ran out, another runner took it
+        assert fresh.attempts == stale.attempts + 1
+
+        assert not queue.finish(stale, '{"late": true}')
+        assert not queue.fail(stale, "late error")
+        assert queue.get(fresh.id).status == "running"
+
+        assert queue.finish(fresh, '{"ok": true}')
+        # A late fail() can't put a completed job back in the queue either
+        assert not queue.fail(stale, "late error")
+        assert not queue.fail(fresh, "after finish")
+        done = queue.get(fresh.id)
+        assert (done.status, done.result) == ("done", '{"ok": true}')
+
+    def test_retries_until_max_attempts(self, tmp_path):
+        queue = JobQueue(tmp_path / "jobs.sqlite3", max_attempts=2)
+        job_id = queue.submit("a.pdf", b"a")
+        queue.fail(queue.claim(), "boom")
+        assert queue.get(job_id).status == "queued"
+        queue.fail(queue.claim(), "boom again")
+        job = queue.get(job_id)
+        assert (job.status, job.error) == ("failed", "boom again")
+
+    def test_runner_parses_and_calls_back(self, tmp_path):
+        queue = JobQueue(tmp_path / "jobs.sqlite3")
+        notified = []
+
+        async def parse(filename, content):
+            return f'{{"name": "{filename}"}}'
+
+        async def notify(job):
+            notified.append(job.to_dict())
+            return True
+
+        async def go():
+            runner = JobRunner(queue, parse, concurrency=1, poll_s=5, notify=notify)
+            runner.start()
+            job_id = queue.submit("a.pdf", b"a", callback_url="http://backend/cb")
+            runner.wake()
+            for _ in range(100):
+                if notified:
+                    break
+                await asyncio.sleep(0.01)
+            await runner.stop()
+            return job_id
+
+        job_id = asyncio.run(go())
+        assert notified[0]["job_id"] == job_id
+        assert notified[0]["result"] == {"name": "a.pdf"}
+        assert queue.pending_callbacks() == []
+
+    def test_callback_allowlist(self):
+        allow = ["http://backend.internal/hooks", "https://api.example.com:8443"]
+        assert callback_allowed("http://backend.internal/hooks/parsed", allow)
+        assert callback_allowed("https://api.example.com:8443/any/path", allow)
+        for url in [
+            "http://backend.internal/admin",
+            "http://backend.internal/hooksx",
+            "https://backend.internal/hooks/parsed",
+            "http://backend.internal.evil.com/hooks/parsed",
+            "http://backend.internal@169.254.169.254/hooks/parsed",
+            "https://api.example.com/any/path",
+            "file:///etc/passwd",
+            "not a url",
+        ]:
+            assert not callback_allowed(url, allow), url
+        assert not callback_allowed("http://backend.internal/hooks/parsed", [])
+
+    def test_disallowed_callback_is_not_posted(self, tmp_path):
+        queue = JobQueue(tmp_path / "jobs.sqlite3")
+        job_id = queue.submit("a.pdf", b"a", callback_url="http://169.254.169.254/latest")
+        queue.finish(queue.claim(), "{}")
+        # Dropped (not retried) without any network call
+        assert asyncio.run(post_callback(queue.get(job_id))) is True
+
+    def test_stop_requeues_in_flight_job(self, tmp_path):
+        queue = JobQueue(tmp_path / "jobs.sqlite3")
+        job_id = queue.submit("a.pdf", b"a")
+
+        async def go():
+            begun = asyncio.Event()
+
+            async def parse(filename, content):
+                begun.set()
+                await asyncio.sleep(10)
+
+            runner = JobRunner(queue, parse, concurrency=1)
+            runner.start()
+            await asyncio.wait_for(begun.wait(), 5)
+            await runner.stop()
+
+        asyncio.run(go())
+        job = queue.get(job_id)
+        assert (job.status, job.attempts) == ("queued", 0)
+
+
+# ===================================================================
+# LLM Call Guards
+# ===================================================================
+
+import llm_parser
+import llm_resilience
+from llm_resilience import CircuitBreaker, CircuitOpenError, ProviderGuard, SingleFlight
+
+
+class TestLLMResilience:
+    def test_breaker_opens_then_half_open_probe(self):
+        now = [0.0]
+        breaker = CircuitBreaker(failure_threshold=2, reset_after_s=10, clock=lambda: now[0])
+        breaker.record_failure()
+        assert breaker.allow()
+        assert breaker.record_failure() is True
+        assert breaker.state == "open" and not breaker.allow()
+
+        now[0] = 10.0
+        assert breaker.state == "half_open"
+        assert breaker.allow()          # the probe
+        assert not breaker.allow()      # everyone else waits for it
+        breaker.record_failure()        # probe failed: open again
+        assert breaker.state == "open"
+
+        now[0] = 20.0
+        assert breaker.allow()
+        breaker.record_success()
+        assert breaker.state == "closed"
+
+    def test_guard_skips_open_provider(self):
+        calls = []
+
+        async def down():
+            calls.append(1)
+            raise ConnectionError("refused")
+
+        async def go():
+            guard = ProviderGuard("ollama", 1, CircuitBreaker(failure_threshold=2, reset_after_s=60))
+            for _ in range(2):
+                with pytest.raises(ConnectionError):
+                    await guard.call(down)
+            with pytest.raises(CircuitOpenError):
+                await guard.call(down)
+            return guard
+
+        guard = asyncio.run(go())
+        assert len(calls) == 2
+        assert guard.breaker.stats()["rejected"] == 1
+
+    def test_bad_output_does_not_trip_breaker(self):
+        async def bad_json():
+            raise llm_parser.LLMOutputError("Invalid JSON")
+
+        async def go():
+            guard = ProviderGuard("openai", 1, CircuitBreaker(failure_threshold=1))
+            with pytest.raises(llm_parser.LLMOutputError):
+                await guard.call(bad_json, is_failure=lambda e: not isinstance(e, llm_parser.LLMOutputError))
+            return guard.breaker.state
+
+        assert asyncio.run(go()) == "closed"
+
+    def test_guard_limits_concurrency(self):
+        running, peak = [0], [0]
+
+        async def call():
+            running[0] += 1
+            peak[0] = max(peak[0], running[0])
+            await asyncio.sleep(0.01)
+            running[0] -= 1
+            return True
+
+        async def go():
+            guard = ProviderGuard("gemini", 2)
+            return await asyncio.gather(*(guard.call(call) for _ in range(6)))
+
+        assert all(asyncio.run(go()))
+        assert peak[0] == 2
+
+    def test_singleflight_coalesces(self):
+        calls = []
+
+        async def fetch():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return {"name": "Jane"}
+
+        async def go():
+            flights = SingleFlight()
+            results = await asyncio.gather(*(flights.do("k", fetch) for _ in range(5)))
+            return flights, results
+
+        flights, results = asyncio.run(go())
+        assert len(calls) == 1 and flights.coalesced == 4
+        assert all(r == {"name": "Jane"} for r in results)
+
+    def test_cache_key_follows_auto_provider(self, monkeypatch):
+        for key in ("OPENAI_API_KEY", "GEMINI_API_KEY", "GOOGLE_API_KEY"):
+            monkeypatch.delenv(key, raising=False)
+        # No API key: auto mode parses with Ollama, so results are keyed to it
+        assert llm_parser.resolve_provider() == "ollama"
+        assert llm_parser.provider_cache_key() == "ollama:llama3.1"
+
+        monkeypatch.setenv("GOOGLE_API_KEY", "k")
+        assert llm_parser.provider_cache_key() == "gemini:gemini-2.0-flash"
+        monkeypatch.setenv("OPENAI_API_KEY", "k")
+        assert llm_parser.provider_cache_key() == "openai:gpt-4o-mini"
+        assert llm_parser.provider_cache_key("ollama") == "ollama:llama3.1"
+
+    def test_llm_parse_resume_caches_by_text(self, tmp_path, monkeypatch):
+        calls = []
+
+        async def fake_ollama(text, model="llama3.1", base_url=""):
+            calls.append(model)
+            return {"name": "Jane Roe"}
+
+        for key in ("OPENAI_API_KEY", "GEMINI_API_KEY", "GOOGLE_API_KEY"):
+            monkeypatch.delenv(key, raising=False)
+        monkeypatch.setattr(llm_parser, "parse_with_ollama", fake_ollama)
+        monkeypatch.setattr(llm_resilience, "_cache", llm_resilience.ParseCache(tmp_path / "llm.sqlite3"))
+        monkeypatch.setattr(llm_resilience, "_guards", {})
+
+        async def go():
+            first = await llm_parser.llm_parse_resume("Jane Roe\nPython")
+            again = await llm_parser.llm_parse_resume("Jane Roe\nPython")
+            other = await llm_parser.llm_parse_resume("John Doe\nJava")
+            return first, again, other
+
+        first, again, other = asyncio.run(go())
+        assert first == again == other == {"name": "Jane Roe"}
+        assert calls == ["llama3.1", "llama3.1"]
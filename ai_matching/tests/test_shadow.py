@@ -0,0 +1,97 @@
+"""
+Tests for shadow scoring of alternative hybrid configs.
+"""
+
+import json
+
+import pytest
+
+from app.analytics import metrics
+from app.matching.shadow import (
+    ShadowCandidate,
+    ShadowConfig,
+    ShadowJob,
+    ShadowScorer,
+    load_shadow_configs,
+    rank_diff,
+)
+
+
+def _job():
+    # PyTorch -> Deep Learning is a child match (0.7),
+    # PyTorch -> TensorFlow a sibling match (0.5)
+    return ShadowJob(
+        student_id=1,
+        student_skills=["pytorch"],
+        candidates=[
+            ShadowCandidate(10, ["Deep Learning"], 50.0, 0.0),
+            ShadowCandidate(20, ["TensorFlow"], 50.0, 0.0),
+            ShadowCandidate(30, ["Photoshop"], 50.0, 0.0),
+        ],
+        top_n=2,
+    )
+
+
+@pytest.fixture
+def log_file(tmp_path):
+    return tmp_path / "shadow.jsonl"
+
+
+class TestConfigs:
+    def test_inline_json_with_credit_override(self):
+        [cfg] = load_shadow_configs('[{"name": "x", "credits": {"sibling": 0.9}}]')
+        assert cfg.credits["sibling"] == 0.9
+        assert cfg.credits["child"] == 0.7
+
+    def test_unknown_relation_is_rejected(self):
+        with pytest.raises(ValueError):
+            load_shadow_configs('[{"name": "x", "credits": {"cousin": 0.1}}]')
+
+    def test_unset_means_disabled(self, log_file):
+        assert load_shadow_configs("") == []
+        assert not ShadowScorer([], log_file=log_file).enabled
+
+
+class TestScoring:
+    def test_live_config_produces_no_moves(self, log_file):
+        [record] = ShadowScorer([ShadowConfig("same")], log_file=log_file).score(_job())
+        assert record["moves"] == []
+        assert not record["top_n_changed"]
+
+    def test_credit_change_reorders(self, log_file):
+        config = ShadowConfig.from_dict({"name": "sib", "credits": {"sibling": 0.9}})
+        [record] = ShadowScorer([config], log_file=log_file).score(_job())
+        assert record["config"] == "sib"
+        assert record["top_n_changed"]
+        assert record["moves"] == [[10, 0, 1], [20, 1, 0]]
+
+    def test_rank_diff_window(self):
+        diff = rank_diff([1, 2, 3, 4], [1, 2, 4, 3], top_n=2, window=3)
+        assert diff["top_n_overlap"] == 2
+        assert diff["moves"] == [[3, 2, 3], [4, 3, 2]]
+        assert diff["max_move"] == 1
+
+
+class TestQueue:
+    def test_jobs_are_scored_in_background(self, log_file):
+        configs = [ShadowConfig("a"), ShadowConfig("b", rule_weight=0.9)]
+        scorer = ShadowScorer(configs, log_file=log_file, max_load=float("inf"))
+        assert scorer.submit(_job())
+        assert scorer.join()
+        records = [json.loads(line) for line in log_file.read_text().splitlines()]
+        assert [r["config"] for r in records] == ["a", "b"]
+
+    def test_full_queue_drops(self, log_file, monkeypatch):
+        scorer = ShadowScorer(
+            [ShadowConfig("a")], log_file=log_file, maxsize=1, max_load=float("inf")
+        )
+        monkeypatch.setattr(scorer, "_ensure_worker", lambda: None)
+        before = metrics.shadow_events["dropped_full"]
+        assert scorer.submit(_job())
+        assert not scorer.submit(_job())
+        assert metrics.shadow_events["dropped_full"] == before + 1
+
+    def test_high_load_drops(self, log_file):
+        scorer = ShadowScorer([ShadowConfig("a")], log_file=log_file, max_load=-1.0)
+        assert not scorer.submit(_job())
+        assert not log_file.exists()
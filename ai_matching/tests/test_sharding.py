@@ -0,0 +1,125 @@
+"""
+Tests for catalog sharding and the scatter-gather merge.
+"""
+
+import asyncio
+
+import httpx
+import pytest
+
+from app.sharding.partition import (
+    REMOTE_KEY,
+    STRATEGY_DOMAIN,
+    STRATEGY_LOCATION,
+    ShardConfig,
+    internship_shard_key,
+    local_partition,
+    partition_internships,
+    shard_for_key,
+    shards_for_student,
+)
+from app.sharding.router import merge_top_k, scatter_gather
+from tests.conftest import make_student, make_internship
+
+
+CATALOG = [
+    make_internship({"Python": 2, "Django": 2}, id=1, location="Delhi", is_remote=False),
+    make_internship({"React": 2}, id=2, location="Remote", is_remote=True),
+    make_internship({"PyTorch": 2, "Pandas": 1}, id=3, location="Mumbai", is_remote=False),
+    make_internship({"Docker": 2}, id=4, location="Delhi", is_remote=False),
+    make_internship({"Figma": 1}, id=5, location="Pune", is_remote=False),
+]
+
+
+class TestPartition:
+    @pytest.mark.parametrize("strategy", [STRATEGY_LOCATION, STRATEGY_DOMAIN])
+    def test_every_internship_lands_in_exactly_one_shard(self, strategy):
+        shards = partition_internships(CATALOG, 3, strategy)
+        ids = sorted(i.id for part in shards.values() for i in part)
+        assert ids == [1, 2, 3, 4, 5]
+
+    def test_shard_assignment_is_stable(self):
+        assert shard_for_key("delhi", 4) == shard_for_key("delhi", 4)
+
+    def test_remote_roles_share_a_key(self):
+        assert internship_shard_key(CATALOG[1], STRATEGY_LOCATION) == REMOTE_KEY
+
+    def test_domain_key_uses_dominant_domain(self):
+        assert internship_shard_key(CATALOG[2], STRATEGY_DOMAIN) == "data science"
+
+    def test_local_partition_disabled_returns_everything(self):
+        assert local_partition(CATALOG, ShardConfig()) == CATALOG
+
+    def test_local_partitions_cover_catalog(self):
+        parts = [
+            local_partition(CATALOG, ShardConfig(count=3, index=i))
+            for i in range(3)
+        ]
+        assert sum(len(p) for p in parts) == len(CATALOG)
+
+
+class TestStudentRouting:
+    def test_location_routing_includes_remote_shard(self):
+        student = make_student({"Python": 3}, location="Delhi")
+        targets = shards_for_student(student, 4, STRATEGY_LOCATION)
+        assert shard_for_key("delhi", 4) in targets
+        assert shard_for_key(REMOTE_KEY, 4) in targets
+
+    def test_every_eligible_internship_is_reachable(self):
+        student = make_student({"Python": 3}, location="Delhi")
+        shards = partition_internships(CATALOG, 4, STRATEGY_LOCATION)
+        targets = shards_for_student(student, 4, STRATEGY_LOCATION)
+        reachable = {i.id for t in targets for i in shards[t]}
+        assert {1, 2, 4} <= reachable
+
+
+class TestMerge:
+    def test_merge_top_k_orders_across_shards(self):
+        merged = merge_top_k(
+            [
+                {"recommendations": [{"internship_id": 1, "final_score": 70}]},
+                {"recommendations": [
+                    {"internship_id": 2, "final_score": 90},
+                    {"internship_id": 3, "final_score": 10},
+                ]},
+            ],
+            top_n=2,
+        )
+        assert [r["internship_id"] for r in merged] == [2, 1]
+
+    def test_merge_ranks_reranked_heads_by_final_score(self):
+        reranked = {"recommendations": [
+            # Cross-encoder put the 70 ahead of the 90 on this shard
+            {"internship_id": 1, "final_score": 70, "rerank_score": 50.0},
+            {"internship_id": 2, "final_score": 90, "rerank_score": 48.0},
+        ]}
+        skipped = {"recommendations": [
+            {"internship_id": 3, "final_score": 80, "rerank_score": None},
+        ]}
+        assert [r["internship_id"] for r in merge_top_k([reranked, skipped], top_n=1)] == [2]
+        merged = merge_top_k([reranked, skipped], top_n=3)
+        assert [r["internship_id"] for r in merged] == [2, 3, 1]
+
+    def test_scatter_gather_returns_partial_results(self):
+        async def handler(request):
+            if request.url.host == "slow":
+                await asyncio.sleep(1)
+            if request.url.host == "broken":
+                return httpx.Response(500)
+            return httpx.Response(
+                200, json={"recommendations": [{"internship_id": 7, "final_score": 50}]}
+            )
+
+        async def run():
+            client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            async with client:
+                return await scatter_gather(
+                    {0: "http://ok", 1: "http://slow", 2: "http://broken"},
+                    "/recommend/hybrid", {"student_id": 1}, timeout_ms=100,
+                    client=client,
+                )
+
+        gathered = asyncio.run(run())
+        assert len(gathered["payloads"]) == 1
+        assert gathered["timed_out"] == [1]
+        assert gathered["failed"] == [2]
@@ -0,0 +1,111 @@
+"""
+Tests for the file-backed taxonomy, cached artifacts and hot reload.
+"""
+
+import copy
+import json
+import os
+
+import numpy as np
+import pytest
+
+from app.skills import artifacts, skill_graph as sg
+from app.skills.artifacts import GraphArtifacts
+from app.skills.skill_graph import SkillGraph, load_taxonomy, taxonomy_hash
+
+
+@pytest.fixture
+def taxonomy():
+    return copy.deepcopy(load_taxonomy())
+
+
+@pytest.fixture
+def restore_graph(monkeypatch, tmp_path):
+    # Keep artifacts of throwaway taxonomies out of the real cache
+    monkeypatch.setattr(artifacts, "ARTIFACT_ROOT", tmp_path / "cache")
+    yield
+    sg.reload_skill_graph()
+
+
+class TestTaxonomyFile:
+    def test_default_graph_matches_file(self, graph):
+        assert graph.content_hash == taxonomy_hash(load_taxonomy())
+
+    def test_hash_changes_with_content(self, taxonomy):
+        before = taxonomy_hash(taxonomy)
+        taxonomy["synonyms"]["pytorch lightning"] = "PyTorch"
+        assert taxonomy_hash(taxonomy) != before
+
+    def test_missing_section_is_rejected(self, tmp_path):
+        path = tmp_path / "taxonomy.json"
+        path.write_text(json.dumps({"domains": {}}))
+        with pytest.raises(ValueError):
+            load_taxonomy(path)
+
+
+class TestArtifacts:
+    def test_credit_matrix_matches_hierarchy(self, graph):
+        ids = graph.artifacts.ids()
+        matrix = graph.artifacts.credit_matrix()
+        for s in ["PyTorch", "React", "Deep Learning", "Python"]:
+            for r in ["TensorFlow", "Vue", "Deep Learning", "Docker"]:
+                assert matrix[ids[s]][ids[r]] == graph.compute_credit(s, r)
+
+    def test_artifacts_are_reused_from_disk(self, graph, tmp_path):
+        calls = []
+
+        def encode(skills):
+            calls.append(len(skills))
+            return np.ones((len(skills), 4), dtype=np.float32)
+
+        skills = graph.all_canonical_skills()
+        first = GraphArtifacts(graph, root=tmp_path)
+        first.credit_matrix()
+        first.skill_embeddings("all-MiniLM-L6-v2", skills, encode)
+
+        second = GraphArtifacts(graph, root=tmp_path)
+        vectors = second.skill_embeddings("all-MiniLM-L6-v2", skills, encode)
+        assert calls == [len(skills)]
+        assert np.allclose(np.linalg.norm(vectors, axis=1), 1.0)
+        assert (tmp_path / graph.content_hash / "credit.npy").exists()
+
+    def test_different_taxonomy_gets_its_own_directory(self, graph, taxonomy, tmp_path):
+        taxonomy["synonyms"]["pytorch lightning"] = "PyTorch"
+        other = SkillGraph(taxonomy)
+        assert GraphArtifacts(other, root=tmp_path).dir != GraphArtifacts(graph, root=tmp_path).dir
+
+
+class TestReload:
+    def test_reload_swaps_graph(self, taxonomy, tmp_path, restore_graph):
+        taxonomy["domains"]["Web Development"]["Frontend"].append("Solid.js")
+        path = tmp_path / "taxonomy.json"
+        path.write_text(json.dumps(taxonomy))
+
+        old = sg.get_skill_graph()
+        new = sg.reload_skill_graph(path)
+        assert sg.get_skill_graph() is new
+        assert new.content_hash != old.content_hash
+        assert new.get_parent("Solid.js") == "Frontend"
+
+    def test_invalid_file_keeps_current_graph(self, tmp_path, restore_graph):
+        path = tmp_path / "taxonomy.json"
+        path.write_text("{not json")
+        current = sg.get_skill_graph()
+        with pytest.raises(ValueError):
+            sg.reload_skill_graph(path)
+        assert sg.get_skill_graph() is current
+
+    def test_file_edit_is_picked_up(self, taxonomy, tmp_path, monkeypatch, restore_graph):
+        path = tmp_path / "taxonomy.json"
+        path.write_text(json.dumps(taxonomy))
+        monkeypatch.setattr(sg, "TAXONOMY_PATH", path)
+        monkeypatch.setattr(sg, "RELOAD_CHECK_INTERVAL_S", 0.0)
+        before = sg.reload_skill_graph()
+
+        taxonomy["synonyms"]["pytorch lightning"] = "PyTorch"
+        path.write_text(json.dumps(taxonomy))
+        os.utime(path, (1, 1))
+        monkeypatch.setattr(sg, "_next_check", 0.0)
+
+        assert sg.get_skill_graph().content_hash != before.content_hash
+        assert sg.get_skill_graph().normalize("pytorch lightning") == "PyTorch"
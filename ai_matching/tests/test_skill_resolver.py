@@ -0,0 +1,153 @@
+"""
+Tests for the memoised fallback skill resolver.
+"""
+
+import numpy as np
+import pytest
+
+from app.skills import artifacts
+from app.skills.resolver import (
+    EMBEDDING_RETRY_S,
+    SOURCE_EMBEDDING,
+    SOURCE_EXACT,
+    SOURCE_FUZZY,
+    SOURCE_MISS,
+    SkillResolver,
+)
+from app.skills.skill_graph import SkillGraph
+
+
+class FakeEncoder:
+    """Maps a few phrases onto the direction of a canonical skill."""
+
+    def __init__(self, skills, aliases):
+        self.skills = skills
+        self.aliases = aliases
+        self.calls = []
+
+    def __call__(self, texts):
+        self.calls.append(list(texts))
+        out = np.zeros((len(texts), len(self.skills)), dtype=np.float32)
+        for i, text in enumerate(texts):
+            target = self.aliases.get(text, text)
+            if target in self.skills:
+                out[i, self.skills.index(target)] = 1.0
+            else:
+                out[i, :] = 1.0
+        return out
+
+
+@pytest.fixture
+def graph(monkeypatch, tmp_path):
+    # Fresh graph so fake embeddings land in tmp, not the real artifact cache
+    monkeypatch.setattr(artifacts, "ARTIFACT_ROOT", tmp_path / "cache")
+    return SkillGraph()
+
+
+@pytest.fixture
+def db(tmp_path):
+    return tmp_path / "resolver.sqlite3"
+
+
+def _fuzzy_only(graph, db):
+    return SkillResolver(graph, db_path=db, use_embeddings=False)
+
+
+class TestStages:
+    def test_exact_and_synonym(self, graph, db):
+        r = _fuzzy_only(graph, db)
+        assert r.resolve_with_source("js").source == SOURCE_EXACT
+        assert r.resolve("js") == "JavaScript"
+        assert r.resolve("deep learning") == "Deep Learning"
+
+    @pytest.mark.parametrize("raw, canon", [
+        ("pyton", "Python"),
+        ("Kuberntes", "Kubernetes"),
+        ("postgre sql", "PostgreSQL"),
+        ("machin learning", "Machine Learning"),
+    ])
+    def test_fuzzy_typos(self, graph, db, raw, canon):
+        res = _fuzzy_only(graph, db).resolve_with_source(raw)
+        assert res.source == SOURCE_FUZZY
+        assert res.canonical == canon
+
+    @pytest.mark.parametrize("raw", ["c", "solid.js", "Some Random Tech"])
+    def test_no_loose_fuzzy_matches(self, graph, db, raw):
+        r = _fuzzy_only(graph, db)
+        assert r.resolve_with_source(raw).source == SOURCE_MISS
+        assert r.resolve(raw) == raw
+
+    def test_embedding_nearest_neighbour(self, graph, db):
+        encoder = FakeEncoder(
+            graph.all_canonical_skills(),
+            {"neural net training": "Deep Learning", "container orchestration": "Kubernetes"},
+        )
+        r = SkillResolver(graph, db_path=db, encode=encoder)
+        res = r.resolve_with_source("Container Orchestration")
+        assert res.source == SOURCE_EMBEDDING
+        assert res.canonical == "Kubernetes"
+        # Below the similarity threshold -> unresolved
+        assert r.resolve("quantum basket weaving") == "quantum basket weaving"
+
+    def test_broken_encoder_falls_back_to_fuzzy(self, graph, db):
+        def broken(texts):
+            raise RuntimeError("no model")
+
+        r = SkillResolver(graph, db_path=db, encode=broken)
+        assert r.resolve("Some Random Tech") == "Some Random Tech"
+        assert r.resolve("pyton") == "Python"
+
+    def test_encoder_error_only_pauses_embeddings(self, graph, db):
+        encoder = FakeEncoder(
+            graph.all_canonical_skills(), {"container orchestration": "Kubernetes"},
+        )
+        down, now = [True], [0.0]
+
+        def flaky(texts):
+            if down[0]:
+                raise RuntimeError("model server unreachable")
+            return encoder(texts)
+
+        r = SkillResolver(graph, db_path=db, encode=flaky, clock=lambda: now[0])
+        assert r.resolve_with_source("container orchestration").source == SOURCE_MISS
+
+        down[0] = False
+        # Still cooling down: no encoder call, and the miss above wasn't pinned
+        assert r.resolve_with_source("container orchestration").source == SOURCE_MISS
+        assert encoder.calls == []
+
+        now[0] += EMBEDDING_RETRY_S
+        res = r.resolve_with_source("container orchestration")
+        assert (res.source, res.canonical) == (SOURCE_EMBEDDING, "Kubernetes")
+
+
+class TestMemo:
+    def test_misses_are_memoised(self, graph, db):
+        encoder = FakeEncoder(graph.all_canonical_skills(), {})
+        r = SkillResolver(graph, db_path=db, encode=encoder)
+        r.resolve("quantum basket weaving")
+        r.resolve("Quantum  Basket Weaving")
+        assert encoder.calls.count(["quantum basket weaving"]) == 1
+
+    def test_persisted_across_instances(self, graph, db):
+        encoder = FakeEncoder(graph.all_canonical_skills(), {"k8s orchestration": "Kubernetes"})
+        SkillResolver(graph, db_path=db, encode=encoder).resolve("k8s orchestration")
+        SkillResolver(graph, db_path=db, encode=encoder).resolve("quantum basket weaving")
+        calls = len(encoder.calls)
+
+        again = SkillResolver(graph, db_path=db, encode=encoder)
+        assert again.resolve("k8s orchestration") == "Kubernetes"
+        assert again.resolve_with_source("quantum basket weaving").source == SOURCE_MISS
+        assert len(encoder.calls) == calls
+
+    def test_lru_is_bounded(self, graph, db):
+        r = SkillResolver(graph, db_path=db, lru_size=2, use_embeddings=False)
+        for raw in ["pyton", "kuberntes", "dockr"]:
+            r.resolve(raw)
+        assert list(r._lru) == ["kuberntes", "dockr"]
+
+
+class TestIntegration:
+    def test_taxonomy_normalize_uses_resolver(self, taxonomy):
+        assert taxonomy.normalize("pyton") == "Python"
+        assert taxonomy.normalize_skills({"pyton": 3, "Python": 4}) == {"Python": 4}
@@ -0,0 +1,104 @@
+"""
+Tests for the global sparse SkillSpace.
+
+The key property: scores are the same as the old per-pair
+SkillVectorizer + cosine_similarity path.
+"""
+
+import random
+
+import pytest
+
+from app.matching.similarity import cosine_similarity
+from app.matching.recommender import recommend_top_internships
+from app.skills.skill_graph import get_skill_graph
+from app.skills.vectorizer import SkillSpace, SkillVectorizer
+from tests.conftest import make_student, make_internship
+
+
+def _pairwise(a, b):
+    index = SkillVectorizer.build_index(a, b)
+    vectorizer = SkillVectorizer(index)
+    return cosine_similarity(vectorizer.vectorize(a), vectorizer.vectorize(b))
+
+
+def _random_skills(rng, pool, unknown):
+    skills = {s: rng.randint(1, 5) for s in rng.sample(pool, rng.randint(1, 6))}
+    if rng.random() < 0.3:
+        skills[rng.choice(unknown)] = rng.randint(1, 5)
+    return skills
+
+
+@pytest.fixture(scope="module")
+def space():
+    return SkillSpace()
+
+
+class TestSkillSpace:
+    def test_matches_pairwise_scores(self, space):
+        rng = random.Random(7)
+        pool = get_skill_graph().all_canonical_skills()
+        unknown = ["Cobol", "Fortran", "Basket Weaving"]
+        for _ in range(300):
+            a = _random_skills(rng, pool, unknown)
+            b = _random_skills(rng, pool, unknown)
+            assert space.similarity(a, b) == pytest.approx(_pairwise(a, b), abs=1e-4)
+
+    def test_catalog_product_matches_per_row(self, space):
+        catalog = [{"Python": 3, "Django": 2}, {"React": 4}, {"Figma": 1}, {}]
+        matrix = space.matrix(catalog)
+        student = {"Python": 4, "Flask": 2}
+        sims = space.similarities(student, matrix)
+        assert list(sims) == [space.similarity(student, row) for row in catalog]
+
+    def test_unknown_skill_added_after_matrix_is_built(self, space):
+        matrix = space.matrix([{"Python": 3}])
+        sims = space.similarities({"Python": 3, "Zig Lang": 3}, matrix)
+        assert sims[0] == pytest.approx(_pairwise({"Python": 3, "Zig Lang": 3}, {"Python": 3}), abs=1e-4)
+
+    def test_unknown_skills_leave_vocabulary_alone(self, space):
+        before = len(space.index)
+        student = {"Python": 3, "Quux Lang": 4}
+        matrix = space.matrix([{"Quux Lang": 2}, {"Python": 2, "Frobnicate": 1}])
+        sims = space.similarities(student, matrix)
+        assert len(space.index) == before
+        assert matrix.rows.shape[1] == before
+        assert sims[0] == pytest.approx(_pairwise(student, {"Quux Lang": 2}), abs=1e-4)
+        assert sims[0] > 0
+
+    def test_matrix_paths_score_unknown_skills(self, space):
+        a_sets = [{"Cobol": 3, "Python": 2}, {"React": 1}, {"Fortran": 2}]
+        b_sets = [{"Cobol": 1}, {"Fortran": 4, "Python": 1}, {}]
+        a, b = space.matrix(a_sets), space.matrix(b_sets)
+        dense = space.similarity_matrix(a, b)
+        cells = [(i, j) for i in range(len(a_sets)) for j in range(len(b_sets))]
+        pairs = space.pair_similarities(a, b, cells)
+        for k, (i, j) in enumerate(cells):
+            expected = space.similarity(a_sets[i], b_sets[j])
+            assert dense[i, j] == pytest.approx(expected, abs=1e-4)
+            assert pairs[k] == pytest.approx(expected, abs=1e-4)
+
+    def test_splice_keeps_unknown_skills_on_their_rows(self, space):
+        rows = [{"Cobol": 2}, {"Python": 3}, {"Fortran": 1}, {"Cobol": 4}]
+        matrix = space.matrix(rows)
+        spliced = space.splice(matrix, 1, 2, [{"Fortran": 2}, {"Cobol": 1}])
+        expected_rows = [rows[0], {"Fortran": 2}, {"Cobol": 1}, rows[2], rows[3]]
+        student = {"Cobol": 3, "Fortran": 2}
+        assert list(space.similarities(student, spliced)) == list(
+            space.similarities(student, space.matrix(expected_rows))
+        )
+
+    def test_empty_skills_score_zero(self, space):
+        assert space.similarity({}, {"Python": 2}) == 0.0
+
+
+class TestRecommenderUsesSpace:
+    def test_ranking_unchanged(self):
+        student = make_student({"python": 4, "django": 3, "sql": 2})
+        internships = [
+            make_internship({"Python": 2, "Django": 2}, id=1),
+            make_internship({"React": 3}, id=2),
+            make_internship({"Flask": 2, "SQL": 1}, id=3),
+        ]
+        ranked = recommend_top_internships(student, internships, top_n=3)
+        assert [r["internship_id"] for r in ranked][0] == 1
@@ -0,0 +1,94 @@
+"""
+Tests for the decayed per-internship trending counter.
+"""
+
+import numpy as np
+import pytest
+from fastapi.testclient import TestClient
+
+from app.feedback import trending as trending_module
+from app.feedback.trending import TrendingCounter
+
+HOUR = 3600.0
+
+
+@pytest.fixture
+def counter():
+    return TrendingCounter(half_life_s=HOUR)
+
+
+class TestCounter:
+    def test_halves_every_half_life(self, counter):
+        t0 = counter._landmark
+        counter.record(1, 8, t=t0)
+        assert counter.score(1, now=t0) == pytest.approx(8)
+        assert counter.score(1, now=t0 + HOUR) == pytest.approx(4)
+        assert counter.score(1, now=t0 + 3 * HOUR) == pytest.approx(1)
+
+    def test_recent_events_outrank_old_ones(self, counter):
+        t0 = counter._landmark
+        counter.record(1, 5, t=t0)
+        counter.record(2, 2, t=t0 + 2 * HOUR)
+        now = t0 + 2 * HOUR
+        assert counter.score(2, now=now) > counter.score(1, now=now)
+        assert [k for k, _ in counter.top(2, now=now)] == [2, 1]
+
+    def test_bulk_matches_single_lookups(self, counter):
+        t0 = counter._landmark
+        for i, w in [(1, 5), (2, 1), (1, 2), (3, -1)]:
+            counter.record(i, w, t=t0 + i * 60)
+        now = t0 + HOUR
+        bulk = counter.scores([3, 99, 1, 2], now=now)
+        single = [counter.score(i, now=now) for i in [3, 99, 1, 2]]
+        assert np.allclose(bulk, single)
+        assert bulk[1] == 0.0
+
+    def test_rebase_keeps_scores(self, counter):
+        t0 = counter._landmark
+        counter.record(1, 4, t=t0)
+        late = t0 + 600 * HOUR
+        counter.record(2, 4, t=late)
+        assert counter._landmark == late
+        assert counter.score(2, now=late) == pytest.approx(4)
+        assert counter.score(1, now=late) == pytest.approx(0.0)
+
+
+class TestIntegration:
+    @pytest.fixture(autouse=True)
+    def fresh(self):
+        trending_module.trending.clear()
+        yield
+        trending_module.trending.clear()
+
+    def test_record_feedback_updates_trending(self):
+        from app.feedback.feedback_store import record_feedback
+
+        record_feedback(1, 42, "apply")
+        record_feedback(2, 42, "view")
+        record_feedback(3, 42, "bogus")
+        assert trending_module.trending.score(42) == pytest.approx(6, rel=1e-3)
+
+    def test_trending_endpoint_ranks_catalog(self):
+        from app import main
+
+        ids = [i.id for i in main.catalog.current().internships[:2]]
+        client = TestClient(main.app)
+        client.post("/feedback", json={"student_id": 1, "internship_id": ids[0], "action": "view"})
+        client.post("/feedback", json={"student_id": 1, "internship_id": ids[1], "action": "apply"})
+
+        body = client.get("/trending?top_n=5").json()
+        assert [r["internship_id"] for r in body["internships"]] == [ids[1], ids[0]]
+
+    def test_trend_breaks_score_ties(self, monkeypatch, tmp_path):
+        from app import main
+        from app.catalog import Catalog
+        from tests.conftest import make_internship, make_student
+
+        twins = [make_internship({"Python": 2}, id=i) for i in (901, 902)]
+        monkeypatch.setattr(main, "catalog", Catalog(twins, journal=tmp_path / "journal"))
+        trending_module.trending.record(902, 1.0)
+
+        results = main._rule_recommendations(make_student({"Python": 3}), top_n=2)
+        assert results[0]["score"] == results[1]["score"]
+        assert [r["internship_id"] for r in results] == [902, 901]
+        assert all("_trend" not in r for r in results)
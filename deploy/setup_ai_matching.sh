@@ -16,6 +16,8 @@ VENV_DIR="$APP_DIR/venv"
 SERVICE_NAME="praktiki-ai-matching"
 APP_PORT=8001
 APP_USER="ubuntu"
+MODEL_SERVICE="praktiki-model-server"
+MODEL_PORT=8010
 
 # Colors for output
 RED='\033[0;31m'
@@ -133,6 +135,37 @@ fi
 mkdir -p "$APP_DIR/model_cache"
 chown -R $APP_USER:$APP_USER "$APP_DIR/model_cache"
 
+#-------------------------------------------------------------------------------
+# Step 5b: Shared Model Server (hosts MiniLM / mpnet / cross-encoder once)
+#-------------------------------------------------------------------------------
+log_info "Creating systemd service for $MODEL_SERVICE..."
+
+cat > /etc/systemd/system/${MODEL_SERVICE}.service << EOF
+[Unit]
+Description=Praktiki Shared Model Server
+After=network.target
+
+[Service]
+Type=simple
+User=$APP_USER
+Group=$APP_USER
+WorkingDirectory=$APP_DIR
+Environment="PATH=$VENV_DIR/bin"
+Environment="TRANSFORMERS_CACHE=$APP_DIR/model_cache"
+Environment="HF_HOME=$APP_DIR/model_cache"
+Environment="MODEL_SERVER_PRELOAD=all-MiniLM-L6-v2,all-mpnet-base-v2,cross-encoder/ms-marco-MiniLM-L-6-v2"
+ExecStart=$VENV_DIR/bin/uvicorn app.model_server.server:app \\
+    --host 127.0.0.1 \\
+    --port $MODEL_PORT
+Restart=always
+RestartSec=10
+
+MemoryMax=2G
+
+[Install]
+WantedBy=multi-user.target
+EOF
+
 #-------------------------------------------------------------------------------
 # Step 6: Create Systemd Service
 #-------------------------------------------------------------------------------
@@ -141,7 +174,7 @@ log_info "Creating systemd service for $SERVICE_NAME..."
 cat > /etc/systemd/system/${SERVICE_NAME}.service << EOF
 [Unit]
 Description=Praktiki AI Matching Service
-After=network.target
+After=network.target ${MODEL_SERVICE}.service
 
 [Service]
 Type=simple
@@ -151,6 +184,7 @@ WorkingDirectory=$APP_DIR
 Environment="PATH=$VENV_DIR/bin"
 Environment="TRANSFORMERS_CACHE=$APP_DIR/model_cache"
 Environment="HF_HOME=$APP_DIR/model_cache"
+Environment="MODEL_SERVER_URL=http://127.0.0.1:$MODEL_PORT"
 EnvironmentFile=-$APP_DIR/.env
 ExecStart=$VENV_DIR/bin/gunicorn app.main:app \\
     --workers 2 \\
@@ -233,6 +267,8 @@ chown -R $APP_USER:$APP_USER $APP_DIR
 log_info "Starting AI Matching service..."
 
 systemctl daemon-reload
+systemctl enable ${MODEL_SERVICE}
+systemctl start ${MODEL_SERVICE}
 systemctl enable ${SERVICE_NAME}
 systemctl start ${SERVICE_NAME}
 
@@ -285,7 +321,7 @@ EOF
     cat > /etc/systemd/system/${RESUME_SERVICE}.service << EOF
 [Unit]
 Description=Praktiki Resume Parser Service
-After=network.target
+After=network.target ${MODEL_SERVICE}.service
 
 [Service]
 Type=simple
@@ -293,6 +329,7 @@ User=$APP_USER
 Group=$APP_USER
 WorkingDirectory=$RESUME_DIR
 Environment="PATH=$RESUME_VENV/bin"
+Environment="MODEL_SERVER_URL=http://127.0.0.1:$MODEL_PORT"
 EnvironmentFile=-$RESUME_DIR/.env
 ExecStart=$RESUME_VENV/bin/gunicorn main:app \\
     --workers 2 \\